@@ -0,0 +1,82 @@
+"""Latency of near-duplicate collapse and MMR reordering.
+
+Times ``diversify_chunks`` on synthetic candidates (``2 * top_k`` chunk
+vectors, a third of them near-copies of others) with an in-memory vector
+lookup, so only the NumPy work is measured.
+
+Usage:
+    uv run python benchmarks/diversification.py [--top-k 10 20 50] [--dim 1536]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from infrastructure.rag.diversification import diversify_chunks  # noqa: E402
+
+
+class _Vectors:
+    def __init__(self, vectors: dict[str, list[float]]) -> None:
+        self._vectors = vectors
+
+    async def get_vectors_by_ids(self, ids: list[str]) -> dict[str, list[float]]:
+        return {i: self._vectors[i] for i in ids}
+
+
+def make_candidates(n: int, dim: int, rng: np.random.Generator):
+    base = rng.normal(size=(n, dim)).astype(np.float32)
+    for i in range(0, n, 3):
+        base[i + 1 if i + 1 < n else i] = base[i] + 0.01 * rng.normal(size=dim)
+    vectors = {f"chunk-{i}": base[i].tolist() for i in range(n)}
+    chunks = [
+        {
+            "reference_id": "1",
+            "content": "",
+            "file_path": "a.pdf",
+            "chunk_id": f"chunk-{i}",
+        }
+        for i in range(n)
+    ]
+    return chunks, _Vectors(vectors), rng.normal(size=dim)
+
+
+async def run(top_k: int, dim: int, repeat: int) -> float:
+    rng = np.random.default_rng(0)
+    chunks, vdb, query = make_candidates(2 * top_k, dim, rng)
+    best = float("inf")
+    for _ in range(repeat):
+        result = {"data": {"chunks": list(chunks), "references": []}}
+        start = time.perf_counter()
+        await diversify_chunks(
+            result,
+            vdb,
+            top_k,
+            query_embedding=query,
+            diversity=0.3,
+            dedup_threshold=0.95,
+        )
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top-k", type=int, nargs="+", default=[10, 20, 50])
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'top_k':>6} {'candidates':>11} {'best ms':>8}")
+    for top_k in args.top_k:
+        ms = asyncio.run(run(top_k, args.dim, args.repeat))
+        print(f"{top_k:>6} {2 * top_k:>11} {ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
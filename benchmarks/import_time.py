@@ -0,0 +1,77 @@
+"""Import-time profile of the API entry point.
+
+Runs ``python -X importtime -c "import main"`` in a fresh interpreter and
+prints the wall-clock import time, the slowest top-level imports, and whether
+the heavy RAG stack was loaded eagerly.
+
+Usage:
+    uv run python benchmarks/import_time.py [--module main] [--top 15]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+HEAVY_MODULES = ("raganything", "lightrag", "docling")
+
+
+def profile(module: str) -> tuple[float, list[tuple[int, str]], list[str]]:
+    """Return (wall seconds, [(cumulative us, direct import)], heavy modules loaded)."""
+    check = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+
+    # -X importtime lists children before their parent, indenting two spaces
+    # per level; keep the direct imports of the profiled module.
+    imports: list[tuple[int, str]] = []
+    children: list[tuple[int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, raw_name = line[len("import time:") :].split("|")
+        name = raw_name.strip()
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        if depth == 0:
+            if name == module:
+                imports = children
+            children = []
+        elif depth == 1:
+            children.append((int(cumulative), name))
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    return wall, sorted(imports, reverse=True), loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    wall, imports, loaded = profile(args.module)
+    print(
+        f"import {args.module}: {wall * 1000:.0f} ms wall (including interpreter start)"
+    )
+    print(f"\n{'cumulative ms':>14}  imported by {args.module}")
+    for cumulative, name in imports[: args.top]:
+        print(f"{cumulative / 1000:>14.1f}  {name}")
+    print(f"\nheavy modules imported eagerly: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
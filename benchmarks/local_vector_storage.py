@@ -0,0 +1,99 @@
+"""Startup, save and query cost of the local vector storages.
+
+Fills ``NanoVectorDBStorage`` and ``MmapVectorStorage`` with the same random
+vectors, persists them, then times opening a fresh instance (a worker
+starting up), a top-k query and a save after a small upsert. Embeddings
+come from a stub, so only storage work is measured.
+
+Usage:
+    uv run python benchmarks/local_vector_storage.py [--rows 20000 100000] [--dim 1536]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from lightrag.kg.nano_vector_db_impl import NanoVectorDBStorage  # noqa: E402
+from lightrag.kg.shared_storage import initialize_share_data  # noqa: E402
+
+from infrastructure.rag.mmap_vector_storage import MmapVectorStorage  # noqa: E402
+
+
+class _Embed:
+    def __init__(self, dim: int) -> None:
+        self.embedding_dim = dim
+        self._rng = np.random.default_rng(0)
+
+    async def __call__(self, texts, **_kwargs):
+        return self._rng.normal(size=(len(texts), self.embedding_dim)).astype(
+            np.float32
+        )
+
+
+async def _open(cls, working_dir: str, embed: _Embed):
+    storage = cls(
+        namespace="chunks",
+        workspace="bench",
+        global_config={
+            "working_dir": working_dir,
+            "embedding_batch_num": 4096,
+            "vector_db_storage_cls_kwargs": {"cosine_better_than_threshold": 0.0},
+        },
+        embedding_func=embed,
+        meta_fields={"content"},
+    )
+    await storage.initialize()
+    return storage
+
+
+async def run(cls, rows: int, dim: int) -> tuple[float, float, float]:
+    embed = _Embed(dim)
+    with tempfile.TemporaryDirectory() as working_dir:
+        storage = await _open(cls, working_dir, embed)
+        await storage.upsert({f"chunk-{i}": {"content": str(i)} for i in range(rows)})
+        await storage.index_done_callback()
+
+        start = time.perf_counter()
+        storage = await _open(cls, working_dir, embed)
+        await storage.get_by_id("chunk-0")
+        open_ms = (time.perf_counter() - start) * 1e3
+
+        query = (await embed(["q"]))[0]
+        await storage.query("q", top_k=10, query_embedding=query)
+        start = time.perf_counter()
+        for _ in range(10):
+            await storage.query("q", top_k=10, query_embedding=query)
+        query_ms = (time.perf_counter() - start) * 1e2
+
+        await storage.upsert({f"new-{i}": {"content": str(i)} for i in range(10)})
+        start = time.perf_counter()
+        await storage.index_done_callback()
+        save_ms = (time.perf_counter() - start) * 1e3
+    return open_ms, query_ms, save_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[20_000, 100_000])
+    parser.add_argument("--dim", type=int, default=1536)
+    args = parser.parse_args()
+
+    initialize_share_data()
+    print(f"{'storage':>20} {'rows':>8} {'open ms':>9} {'query ms':>9} {'save ms':>9}")
+    for rows in args.rows:
+        for cls in (NanoVectorDBStorage, MmapVectorStorage):
+            open_ms, query_ms, save_ms = asyncio.run(run(cls, rows, args.dim))
+            print(
+                f"{cls.__name__:>20} {rows:>8} {open_ms:>9.1f} {query_ms:>9.2f} {save_ms:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
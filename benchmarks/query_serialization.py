@@ -0,0 +1,92 @@
+"""Serialization cost of the /query response body.
+
+Compares the previous path (build the full ``QueryResponse``, then let
+FastAPI re-validate the chunks against ``response_model`` and encode them)
+with the lean path used by the route (validate only the chunks as plain
+dicts, encode with orjson), for several ``top_k`` values.
+
+Usage:
+    uv run python benchmarks/query_serialization.py [--top-k 10 50 200] [--repeat 2000]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import orjson  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from application.responses.query_response import (  # noqa: E402
+    ChunkResponse,
+    QueryResponse,
+    chunks_from_result,
+)
+
+_RESPONSE_MODEL = TypeAdapter(list[ChunkResponse])
+
+
+def make_result(top_k: int) -> dict:
+    """Build an aquery_data-shaped result with top_k chunks of ~1 KB each."""
+    content = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 18
+    return {
+        "status": "success",
+        "message": "Query processed successfully",
+        "data": {
+            "entities": [],
+            "relationships": [],
+            "chunks": [
+                {
+                    "reference_id": str(i % 5 + 1),
+                    "content": content,
+                    "file_path": f"docs/report-{i % 5}.pdf",
+                    "chunk_id": f"chunk-{i:032x}",
+                }
+                for i in range(top_k)
+            ],
+            "references": [
+                {"reference_id": str(i + 1), "file_path": f"docs/report-{i}.pdf"}
+                for i in range(5)
+            ],
+        },
+        "metadata": {"query_mode": "naive", "keywords": {}, "processing_info": {}},
+    }
+
+
+def previous_path(result: dict) -> bytes:
+    chunks = QueryResponse(**result).data.chunks
+    return _RESPONSE_MODEL.dump_json(_RESPONSE_MODEL.validate_python(chunks))
+
+
+def lean_path(result: dict) -> bytes:
+    return orjson.dumps(chunks_from_result(result))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top-k", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'top_k':>6} {'previous us':>12} {'lean us':>9} {'speedup':>8}")
+    for top_k in args.top_k:
+        result = make_result(top_k)
+        assert orjson.loads(previous_path(result)) == orjson.loads(lean_path(result))
+        timings = []
+        for path in (previous_path, lean_path):
+            best = min(
+                timeit.repeat(
+                    lambda p=path, r=result: p(r), number=args.repeat, repeat=3
+                )
+            )
+            timings.append(best / args.repeat * 1e6)
+        print(
+            f"{top_k:>6} {timings[0]:>12.1f} {timings[1]:>9.1f} "
+            f"{timings[0] / timings[1]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Concurrent download throughput of MinioAdapter vs AsyncS3Adapter.
+
+Starts a local S3 stand-in (an in-memory ASGI app under uvicorn, in its own
+process, answering the requests both clients make for a download) and times
+``download_file`` of N objects at once through each adapter, as a folder
+index does. The stand-in does not check signatures, so only client-side
+concurrency is measured: MinioAdapter is bounded by the default executor's
+threads and urllib3's pool, AsyncS3Adapter by its own connection pool.
+
+Usage:
+    uv run python benchmarks/storage_clients.py [--concurrency 10 50 200] [--size-kb 256]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.ports.storage_port import StoragePort  # noqa: E402
+from infrastructure.storage.minio_adapter import MinioAdapter  # noqa: E402
+from infrastructure.storage.s3_adapter import AsyncS3Adapter  # noqa: E402
+
+BUCKET = "bench"
+
+
+def _serve(port: int, size: int) -> None:
+    import uvicorn
+
+    body = b"x" * size
+    location = (
+        b'<?xml version="1.0" encoding="UTF-8"?>'
+        b'<LocationConstraint xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        b"us-east-1</LocationConstraint>"
+    )
+
+    async def app(scope, _receive, send):
+        if scope["type"] != "http":
+            return
+        # minio-py looks up the bucket region once before its first request.
+        content = location if b"location" in scope["query_string"] else body
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-length", str(len(content)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    uvicorn.run(app, port=port, log_level="warning", backlog=4096)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(port: int) -> None:
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("S3 stand-in did not start")
+
+
+async def run(storage: StoragePort, concurrency: int) -> tuple[float, float]:
+    """Wall time of ``concurrency`` concurrent downloads and their p95 latency (ms)."""
+    latencies: list[float] = []
+
+    async def download(i: int, folder: str) -> None:
+        start = time.perf_counter()
+        await storage.download_file(BUCKET, f"docs/{i}.pdf", f"{folder}/{i}.pdf")
+        latencies.append((time.perf_counter() - start) * 1e3)
+
+    with tempfile.TemporaryDirectory() as folder:
+        await download(-1, folder)  # connect (and, for minio-py, region lookup)
+        latencies.clear()
+        start = time.perf_counter()
+        await asyncio.gather(*(download(i, folder) for i in range(concurrency)))
+        wall_ms = (time.perf_counter() - start) * 1e3
+    return wall_ms, statistics.quantiles(latencies, n=20)[-1]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--size-kb", type=int, default=256)
+    args = parser.parse_args()
+
+    port = _free_port()
+    server = multiprocessing.Process(
+        target=_serve, args=(port, args.size_kb * 1024), daemon=True
+    )
+    server.start()
+    try:
+        _wait_for(port)
+        host = f"127.0.0.1:{port}"
+        storages: dict[str, StoragePort] = {
+            "MinioAdapter": MinioAdapter(host, "bench", "bench-secret"),
+            "AsyncS3Adapter": AsyncS3Adapter(host, "bench", "bench-secret"),
+        }
+        print(f"{args.size_kb} KiB objects")
+        print(f"{'adapter':<16} {'concurrent':>10} {'wall ms':>9} {'p95 ms':>8}")
+        for concurrency in args.concurrency:
+            for name, storage in storages.items():
+                wall_ms, p95_ms = await run(storage, concurrency)
+                print(f"{name:<16} {concurrency:>10} {wall_ms:>9.1f} {p95_ms:>8.1f}")
+        for storage in storages.values():
+            await storage.aclose()
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
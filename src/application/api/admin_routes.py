@@ -0,0 +1,269 @@
+import asyncio
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from application.requests.embedding_migration_request import (
+    MigrateEmbeddingDimRequest,
+)
+from application.requests.snapshot_request import (
+    ExportSnapshotRequest,
+    ImportSnapshotRequest,
+)
+from application.requests.vector_index_request import (
+    CreateVectorIndexRequest,
+    RebuildVectorIndexRequest,
+)
+from application.use_cases.export_workspace_snapshot_use_case import (
+    ExportWorkspaceSnapshotUseCase,
+)
+from application.use_cases.import_workspace_snapshot_use_case import (
+    ImportWorkspaceSnapshotUseCase,
+)
+from application.use_cases.migrate_embedding_dim_use_case import (
+    MigrateEmbeddingDimUseCase,
+)
+from dependencies import (
+    get_export_snapshot_use_case,
+    get_import_snapshot_use_case,
+    get_migrate_embedding_dim_use_case,
+    get_vector_index_manager,
+    require_admin,
+)
+from domain.entities.embedding_migration import EmbeddingMigration
+from domain.entities.vector_index import VectorIndex, VectorIndexMethod, VectorIndexSpec
+from domain.ports.vector_index_port import VectorIndexPort
+
+logger = logging.getLogger(__name__)
+
+admin_router = APIRouter(
+    prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)]
+)
+
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def _run_in_background(coro, label: str) -> None:
+    try:
+        await coro
+    except Exception:
+        logger.exception("Background %s failed", label)
+
+
+def _require_manager(manager: VectorIndexPort | None) -> VectorIndexPort:
+    if manager is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Vector index management requires RAG_STORAGE_TYPE=postgres",
+        )
+    return manager
+
+
+@admin_router.get(
+    "/vector-indexes",
+    response_model=list[VectorIndex],
+    status_code=status.HTTP_200_OK,
+)
+async def list_vector_indexes(
+    working_dir: str,
+    manager: VectorIndexPort | None = Depends(get_vector_index_manager),
+) -> list[VectorIndex]:
+    return await _require_manager(manager).list_indexes(working_dir)
+
+
+@admin_router.post(
+    "/vector-indexes", response_model=dict, status_code=status.HTTP_202_ACCEPTED
+)
+async def create_vector_indexes(
+    request: CreateVectorIndexRequest,
+    manager: VectorIndexPort | None = Depends(get_vector_index_manager),
+):
+    manager = _require_manager(manager)
+    spec = VectorIndexSpec(**request.model_dump(exclude={"working_dir"}))
+    task = asyncio.create_task(
+        _run_in_background(
+            manager.create_indexes(request.working_dir, spec),
+            label=f"{spec.method.value} index build for {request.working_dir}",
+        )
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return {
+        "status": "accepted",
+        "message": f"{spec.method.value} index build started in background",
+    }
+
+
+@admin_router.post(
+    "/vector-indexes/rebuild",
+    response_model=dict,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def rebuild_vector_indexes(
+    request: RebuildVectorIndexRequest,
+    manager: VectorIndexPort | None = Depends(get_vector_index_manager),
+):
+    manager = _require_manager(manager)
+    task = asyncio.create_task(
+        _run_in_background(
+            manager.rebuild_indexes(request.working_dir, request.method),
+            label=f"index rebuild for {request.working_dir}",
+        )
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return {"status": "accepted", "message": "Index rebuild started in background"}
+
+
+@admin_router.delete(
+    "/vector-indexes", response_model=dict, status_code=status.HTTP_200_OK
+)
+async def drop_vector_indexes(
+    working_dir: str,
+    method: VectorIndexMethod | None = None,
+    manager: VectorIndexPort | None = Depends(get_vector_index_manager),
+):
+    dropped = await _require_manager(manager).drop_indexes(working_dir, method)
+    return {"status": "success", "dropped": dropped}
+
+
+def _require_migrations(
+    use_case: MigrateEmbeddingDimUseCase | None,
+) -> MigrateEmbeddingDimUseCase:
+    if use_case is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Embedding migrations require RAG_STORAGE_TYPE=postgres",
+        )
+    return use_case
+
+
+@admin_router.post(
+    "/embedding-migrations",
+    response_model=dict,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_embedding_migration(
+    request: MigrateEmbeddingDimRequest,
+    use_case: MigrateEmbeddingDimUseCase | None = Depends(
+        get_migrate_embedding_dim_use_case
+    ),
+):
+    use_case = _require_migrations(use_case)
+    try:
+        migration = await use_case.start(request)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    task = asyncio.create_task(
+        _run_in_background(
+            use_case.run(migration),
+            label=f"embedding migration for {request.working_dir}",
+        )
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return {
+        "status": "accepted",
+        "message": (
+            f"Migration from {migration.source_dim} to {migration.target_dim} "
+            "dimensions started in background"
+        ),
+    }
+
+
+@admin_router.get(
+    "/embedding-migrations",
+    response_model=EmbeddingMigration,
+    status_code=status.HTTP_200_OK,
+)
+async def get_embedding_migration(
+    working_dir: str,
+    use_case: MigrateEmbeddingDimUseCase | None = Depends(
+        get_migrate_embedding_dim_use_case
+    ),
+) -> EmbeddingMigration:
+    migration = _require_migrations(use_case).get(working_dir)
+    if migration is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No embedding migration for {working_dir}",
+        )
+    return migration
+
+
+def _snapshots_unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Workspace snapshots require RAG_STORAGE_TYPE=postgres",
+    )
+
+
+@admin_router.post(
+    "/snapshots/export", response_model=dict, status_code=status.HTTP_202_ACCEPTED
+)
+async def export_snapshot(
+    request: ExportSnapshotRequest,
+    use_case: ExportWorkspaceSnapshotUseCase | None = Depends(
+        get_export_snapshot_use_case
+    ),
+):
+    if use_case is None:
+        raise _snapshots_unavailable()
+    snapshot_key = use_case.snapshot_key(request.working_dir)
+    task = asyncio.create_task(
+        _run_in_background(
+            use_case.execute(request, snapshot_key),
+            label=f"snapshot export of {request.working_dir}",
+        )
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return {
+        "status": "accepted",
+        "message": "Snapshot export started in background",
+        "snapshot_key": snapshot_key,
+    }
+
+
+@admin_router.get(
+    "/snapshots", response_model=list[str], status_code=status.HTTP_200_OK
+)
+async def list_snapshots(
+    working_dir: str,
+    use_case: ExportWorkspaceSnapshotUseCase | None = Depends(
+        get_export_snapshot_use_case
+    ),
+) -> list[str]:
+    if use_case is None:
+        raise _snapshots_unavailable()
+    return await use_case.list_snapshots(working_dir)
+
+
+@admin_router.post(
+    "/snapshots/import", response_model=dict, status_code=status.HTTP_202_ACCEPTED
+)
+async def import_snapshot(
+    request: ImportSnapshotRequest,
+    use_case: ImportWorkspaceSnapshotUseCase | None = Depends(
+        get_import_snapshot_use_case
+    ),
+):
+    if use_case is None:
+        raise _snapshots_unavailable()
+    try:
+        await use_case.ensure_empty(request.working_dir)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    task = asyncio.create_task(
+        _run_in_background(
+            use_case.execute(request),
+            label=f"snapshot import into {request.working_dir}",
+        )
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return {"status": "accepted", "message": "Snapshot import started in background"}
@@ -1,4 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from application.use_cases.check_readiness_use_case import CheckReadinessUseCase
+from dependencies import get_check_readiness_use_case
 
 health_router = APIRouter(tags=["Health"])
 
@@ -12,3 +16,21 @@ def health_check():
         dict: Status message indicating the API is running.
     """
     return {"message": "RAG Anything API is running"}
+
+
+@health_router.get("/ready")
+async def readiness_check(
+    use_case: CheckReadinessUseCase = Depends(get_check_readiness_use_case),
+) -> JSONResponse:
+    """
+    Readiness endpoint for load balancers.
+
+    Returns:
+        JSONResponse: The readiness report, with status 200 when ready and
+        503 when a dependency is slow or down or a saturation threshold is
+        exceeded.
+    """
+    report = await use_case.execute()
+    return JSONResponse(
+        status_code=200 if report.ready else 503, content=report.model_dump()
+    )
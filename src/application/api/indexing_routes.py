@@ -1,12 +1,29 @@
 import asyncio
 import logging
+import uuid
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from application.requests.indexing_request import IndexFileRequest, IndexFolderRequest
+from application.use_cases.delete_document_use_case import DeleteDocumentUseCase
+from application.use_cases.enqueue_indexing_job_use_case import (
+    EnqueueIndexingJobUseCase,
+)
 from application.use_cases.index_file_use_case import IndexFileUseCase
 from application.use_cases.index_folder_use_case import IndexFolderUseCase
-from dependencies import get_index_file_use_case, get_index_folder_use_case
+from dependencies import (
+    get_delete_document_use_case,
+    get_enqueue_indexing_job_use_case,
+    get_index_file_use_case,
+    get_index_folder_use_case,
+    get_job_queue,
+    get_profiler,
+    profiling_requested,
+)
+from domain.entities.document_deletion import DeletionStatus, DocumentDeletionResult
+from domain.entities.indexing_job import IndexingJob
+from domain.ports.job_queue_port import JobQueuePort
+from domain.ports.profiler_port import ProfilerPort
 
 logger = logging.getLogger(__name__)
 
@@ -22,22 +39,96 @@ async def _run_in_background(coro, label: str) -> None:
         logger.exception("Background %s failed", label)
 
 
-@indexing_router.post(
-    "/file/index", response_model=dict, status_code=status.HTTP_202_ACCEPTED
-)
-async def index_file(
+async def _profiled(coro, profiler: ProfilerPort, key: str):
+    async with profiler.profile(key):
+        return await coro
+
+
+async def start_file_indexing(
     request: IndexFileRequest,
-    use_case: IndexFileUseCase = Depends(get_index_file_use_case),
-):
+    use_case: IndexFileUseCase,
+    enqueue_use_case: EnqueueIndexingJobUseCase | None,
+    profile: bool = False,
+    profiler: ProfilerPort | None = None,
+) -> dict:
+    """Queue ``request`` for the worker, or index it in a background task."""
+    if enqueue_use_case is not None:
+        job = await enqueue_use_case.execute(request, profile=profile)
+        response = {
+            "status": "accepted",
+            "message": "File indexing job queued for background worker",
+            "job_id": job.id,
+        }
+        if profile:
+            response["profile_key"] = profiler.profile_key(f"jobs/{job.id}")
+        return response
+    response = {"status": "accepted", "message": "File indexing started in background"}
+    coro = use_case.execute(
+        file_name=request.file_name,
+        working_dir=request.working_dir,
+        replace=request.replace,
+    )
+    if profile:
+        response["profile_key"] = profiler.profile_key(f"indexing/{uuid.uuid4().hex}")
+        coro = _profiled(coro, profiler, response["profile_key"])
     task = asyncio.create_task(
         _run_in_background(
-            use_case.execute(file_name=request.file_name, working_dir=request.working_dir),
+            coro,
             label=f"file indexing {request.file_name}",
         )
     )
     _background_tasks.add(task)
     task.add_done_callback(_background_tasks.discard)
-    return {"status": "accepted", "message": "File indexing started in background"}
+    return response
+
+
+@indexing_router.post(
+    "/file/index", response_model=dict, status_code=status.HTTP_202_ACCEPTED
+)
+async def index_file(
+    request: IndexFileRequest,
+    use_case: IndexFileUseCase = Depends(get_index_file_use_case),
+    enqueue_use_case: EnqueueIndexingJobUseCase | None = Depends(
+        get_enqueue_indexing_job_use_case
+    ),
+    profile: bool = Depends(profiling_requested),
+    profiler: ProfilerPort = Depends(get_profiler),
+):
+    return await start_file_indexing(
+        request, use_case, enqueue_use_case, profile=profile, profiler=profiler
+    )
+
+
+_DELETION_ERRORS = {
+    DeletionStatus.NOT_FOUND: status.HTTP_404_NOT_FOUND,
+    DeletionStatus.BUSY: status.HTTP_409_CONFLICT,
+    DeletionStatus.AMBIGUOUS: status.HTTP_409_CONFLICT,
+    DeletionStatus.FAILED: status.HTTP_500_INTERNAL_SERVER_ERROR,
+}
+
+
+@indexing_router.delete(
+    "/file", response_model=DocumentDeletionResult, status_code=status.HTTP_200_OK
+)
+async def delete_file(
+    working_dir: str = Query(..., description="RAG workspace directory"),
+    file_name: str = Query(..., description="File name/path as it was indexed"),
+    delete_llm_cache: bool = Query(
+        default=True, description="Also drop the file's cached LLM extractions"
+    ),
+    use_case: DeleteDocumentUseCase = Depends(get_delete_document_use_case),
+) -> DocumentDeletionResult:
+    result = await use_case.execute(
+        file_name=file_name,
+        working_dir=working_dir,
+        delete_llm_cache=delete_llm_cache,
+    )
+    if result.status in _DELETION_ERRORS:
+        raise HTTPException(
+            status_code=_DELETION_ERRORS[result.status],
+            detail=result.error or result.message,
+        )
+    return result
 
 
 @indexing_router.post(
@@ -46,13 +137,56 @@ async def index_file(
 async def index_folder(
     request: IndexFolderRequest,
     use_case: IndexFolderUseCase = Depends(get_index_folder_use_case),
+    enqueue_use_case: EnqueueIndexingJobUseCase | None = Depends(
+        get_enqueue_indexing_job_use_case
+    ),
+    profile: bool = Depends(profiling_requested),
+    profiler: ProfilerPort = Depends(get_profiler),
 ):
+    if enqueue_use_case is not None:
+        job = await enqueue_use_case.execute(request, profile=profile)
+        response = {
+            "status": "accepted",
+            "message": "Folder indexing job queued for background worker",
+            "job_id": job.id,
+        }
+        if profile:
+            response["profile_key"] = profiler.profile_key(f"jobs/{job.id}")
+        return response
+    response = {
+        "status": "accepted",
+        "message": "Folder indexing started in background",
+    }
+    coro = use_case.execute(request=request)
+    if profile:
+        response["profile_key"] = profiler.profile_key(f"indexing/{uuid.uuid4().hex}")
+        coro = _profiled(coro, profiler, response["profile_key"])
     task = asyncio.create_task(
         _run_in_background(
-            use_case.execute(request=request),
+            coro,
             label=f"folder indexing {request.working_dir}",
         )
     )
     _background_tasks.add(task)
     task.add_done_callback(_background_tasks.discard)
-    return {"status": "accepted", "message": "Folder indexing started in background"}
+    return response
+
+
+@indexing_router.get(
+    "/jobs/{job_id}", response_model=IndexingJob, status_code=status.HTTP_200_OK
+)
+async def get_indexing_job(
+    job_id: str,
+    job_queue: JobQueuePort | None = Depends(get_job_queue),
+) -> IndexingJob:
+    if job_queue is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job tracking requires INDEXING_BACKEND=queue",
+        )
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Job '{job_id}' not found"
+        )
+    return job
@@ -5,33 +5,63 @@ These tools are registered with FastMCP for Claude Desktop integration.
 
 from fastmcp import FastMCP
 
+from application.api.indexing_routes import start_file_indexing
+from application.requests.indexing_request import IndexFileRequest
 from application.requests.query_request import MultimodalContentItem
-from application.responses.query_response import ChunkResponse, QueryResponse
-from dependencies import get_multimodal_query_use_case, get_query_use_case
+from application.responses.query_response import ChunkPayload, chunks_from_result
+from dependencies import (
+    get_delete_document_use_case,
+    get_enqueue_indexing_job_use_case,
+    get_index_file_use_case,
+    get_multimodal_query_use_case,
+    get_query_use_case,
+)
 
 mcp = FastMCP("RAGAnything")
 
 
 @mcp.tool()
 async def query_knowledge_base(
-    working_dir: str, query: str, mode: str = "hybrid", top_k: int = 5
-) -> list[ChunkResponse]:
+    working_dir: str,
+    query: str,
+    mode: str = "auto",
+    top_k: int = 5,
+    diversity: float | None = None,
+    dedup_threshold: float | None = None,
+    ef_search: int | None = None,
+    probes: int | None = None,
+) -> list[ChunkPayload]:
     """Search the RAGAnything knowledge base for relevant document chunks.
 
     Args:
         working_dir: RAG workspace directory for this project
         query: The user's question or search query
-        mode: Search mode - "naive" (default), "local", "global", "hybrid", "mix"
+        mode: Search mode - "auto" (default, picks the cheapest suitable mode),
+            "naive", "local", "global", "hybrid", "mix", or "fusion" (vector plus
+            full-text search, for part numbers, IDs or error codes)
         top_k: Number of chunks to retrieve (default 5)
+        diversity: Optional 0-1 weight favouring chunks unlike those already
+            returned (maximal marginal relevance)
+        dedup_threshold: Optional cosine similarity above which a chunk is
+            dropped as a near-duplicate of a better-ranked one (e.g. 0.95)
+        ef_search: Optional HNSW candidate list size (higher recall, slower)
+        probes: Optional IVFFlat lists to scan (higher recall, slower)
 
     Returns:
         Query response from LightRAG
     """
     use_case = get_query_use_case()
-    response = QueryResponse(**await use_case.execute(
-        working_dir=working_dir, query=query, mode=mode, top_k=top_k
-    ))
-    return response.data.chunks
+    result = await use_case.execute(
+        working_dir=working_dir,
+        query=query,
+        mode=mode,
+        top_k=top_k,
+        diversity=diversity,
+        dedup_threshold=dedup_threshold,
+        ef_search=ef_search,
+        probes=probes,
+    )
+    return chunks_from_result(result)
 
 
 @mcp.tool()
@@ -69,3 +99,49 @@ async def query_knowledge_base_multimodal(
         mode=mode,
         top_k=top_k,
     )
+
+
+@mcp.tool()
+async def delete_document(working_dir: str, file_name: str) -> dict:
+    """Remove an indexed file from the knowledge base.
+
+    Deletes the file's chunks, their vectors and the entities and relations
+    extracted only from it; entities shared with other files are rebuilt
+    from their remaining sources.
+
+    Args:
+        working_dir: RAG workspace directory for this project
+        file_name: File name/path in the MinIO bucket, as it was indexed
+
+    Returns:
+        Deletion status and the removed document ids
+    """
+    use_case = get_delete_document_use_case()
+    result = await use_case.execute(file_name=file_name, working_dir=working_dir)
+    return result.model_dump()
+
+
+@mcp.tool()
+async def replace_document(working_dir: str, file_name: str) -> dict:
+    """Re-index a file whose content changed in MinIO.
+
+    The new version is diffed against the indexed one chunk by chunk: only
+    new chunks are embedded and sent through entity extraction, and chunks
+    that disappeared are deleted, so the knowledge base keeps a single
+    version.
+
+    Like POST /file/index, the file is queued for the worker or indexed in
+    the background; with a job id, GET /jobs/{job_id} reports the result.
+
+    Args:
+        working_dir: RAG workspace directory for this project
+        file_name: File name/path in the MinIO bucket
+
+    Returns:
+        Acceptance status, with the job id when INDEXING_BACKEND=queue
+    """
+    return await start_file_indexing(
+        IndexFileRequest(file_name=file_name, working_dir=working_dir, replace=True),
+        get_index_file_use_case(),
+        get_enqueue_indexing_job_use_case(),
+    )
@@ -1,14 +1,24 @@
-from fastapi import APIRouter, Depends, status
+import contextlib
+import uuid
+
+import orjson
+from fastapi import APIRouter, Depends, Response, status
 
 from application.requests.query_request import MultimodalQueryRequest, QueryRequest
 from application.responses.query_response import (
     ChunkResponse,
     MultimodalQueryResponse,
-    QueryResponse,
+    chunks_from_result,
 )
 from application.use_cases.multimodal_query_use_case import MultimodalQueryUseCase
 from application.use_cases.query_use_case import QueryUseCase
-from dependencies import get_multimodal_query_use_case, get_query_use_case
+from dependencies import (
+    get_multimodal_query_use_case,
+    get_profiler,
+    get_query_use_case,
+    profiling_requested,
+)
+from domain.ports.profiler_port import ProfilerPort
 
 query_router = APIRouter(tags=["RAG Query"])
 
@@ -19,15 +29,37 @@ query_router = APIRouter(tags=["RAG Query"])
 async def query_knowledge_base(
     request: QueryRequest,
     use_case: QueryUseCase = Depends(get_query_use_case),
-) -> list[ChunkResponse]:
-    result = await use_case.execute(
-        working_dir=request.working_dir,
-        query=request.query,
-        mode=request.mode,
-        top_k=request.top_k,
+    profile: bool = Depends(profiling_requested),
+    profiler: ProfilerPort = Depends(get_profiler),
+) -> Response:
+    headers = {}
+    profiling: contextlib.AbstractAsyncContextManager = contextlib.nullcontext()
+    if profile:
+        headers["X-Profile-Key"] = profiler.profile_key(f"queries/{uuid.uuid4().hex}")
+        profiling = profiler.profile(headers["X-Profile-Key"])
+    async with profiling:
+        result = await use_case.execute(
+            working_dir=request.working_dir,
+            query=request.query,
+            mode=request.mode,
+            top_k=request.top_k,
+            hl_keywords=request.hl_keywords,
+            ll_keywords=request.ll_keywords,
+            diversity=request.diversity,
+            dedup_threshold=request.dedup_threshold,
+            ef_search=request.ef_search,
+            probes=request.probes,
+        )
+    # Returning a Response skips FastAPI's response_model validation and
+    # encoding; response_model above still documents the schema.
+    query_mode = (result.get("metadata") or {}).get("query_mode")
+    if query_mode:
+        headers["X-Query-Mode"] = query_mode
+    return Response(
+        content=orjson.dumps(chunks_from_result(result)),
+        media_type="application/json",
+        headers=headers,
     )
-    response = QueryResponse(**result)
-    return response.data.chunks
 
 
 @query_router.post(
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+
+from domain.entities.embedding_migration import EmbeddingMigrationMode
+
+
+class MigrateEmbeddingDimRequest(BaseModel):
+    working_dir: str = Field(
+        ..., description="RAG workspace directory whose vectors are migrated"
+    )
+    target_dim: int = Field(
+        ..., gt=0, description="Vector dimension to serve after cutover"
+    )
+    mode: EmbeddingMigrationMode = Field(
+        default=EmbeddingMigrationMode.TRUNCATE,
+        description=(
+            "truncate: shorten the stored vectors (no API calls); "
+            "reembed: embed the stored content again and truncate"
+        ),
+    )
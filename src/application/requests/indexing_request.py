@@ -6,6 +6,11 @@ class IndexFileRequest(BaseModel):
     working_dir: str = Field(
         ..., description="RAG workspace directory for this project"
     )
+    replace: bool = Field(
+        default=False,
+        description="Diff against the indexed version: embed and extract only new "
+        "chunks and delete removed ones",
+    )
 
 
 class IndexFolderRequest(BaseModel):
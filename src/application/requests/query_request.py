@@ -13,11 +13,14 @@ class QueryRequest(BaseModel):
         ...,
         description="The user's question or search query (e.g., 'What are the main findings?')",
     )
-    mode: QueryMode = Field(
+    mode: QueryMode | Literal["fusion", "auto"] = Field(
         default="naive",
         description=(
             "Search mode - 'naive' (default, recommended), 'local' (context-aware), "
             "'global' (document-level), or 'hybrid' (comprehensive) or 'mix' (automatic strategy). "
+            "'fusion' combines vector and full-text search, for exact identifiers "
+            "such as part numbers or error codes. "
+            "'auto' picks the cheapest of these likely to answer the query. "
         ),
     )
     top_k: int = Field(
@@ -27,6 +30,46 @@ class QueryRequest(BaseModel):
             "Use 10 for fast, focused results; use 20 for comprehensive search."
         ),
     )
+    hl_keywords: list[str] | None = Field(
+        default=None,
+        description=(
+            "High-level (thematic) keywords for graph modes. When either keyword "
+            "list is set, the LLM keyword-extraction call is skipped."
+        ),
+    )
+    ll_keywords: list[str] | None = Field(
+        default=None,
+        description="Low-level (entity) keywords for graph modes",
+    )
+    diversity: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Reorder chunks by maximal marginal relevance: 0 keeps relevance "
+            "order, 1 favours chunks least similar to those already returned"
+        ),
+    )
+    dedup_threshold: float | None = Field(
+        default=None,
+        gt=0.0,
+        le=1.0,
+        description=(
+            "Drop chunks whose embedding cosine similarity to a better-ranked "
+            "chunk is at least this value (e.g. 0.95 for repeated boilerplate)"
+        ),
+    )
+    ef_search: int | None = Field(
+        default=None,
+        ge=1,
+        le=1000,
+        description="HNSW candidate list size for this query (higher: better recall, slower)",
+    )
+    probes: int | None = Field(
+        default=None,
+        ge=1,
+        description="IVFFlat lists scanned for this query (higher: better recall, slower)",
+    )
 
 
 class MultimodalContentItem(BaseModel):
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class ExportSnapshotRequest(BaseModel):
+    working_dir: str = Field(..., description="RAG workspace directory to export")
+
+
+class ImportSnapshotRequest(BaseModel):
+    snapshot_key: str = Field(
+        ..., description="Object key of a snapshot written by an export"
+    )
+    working_dir: str = Field(
+        ..., description="RAG workspace directory to restore into (must be empty)"
+    )
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+from domain.entities.vector_index import VectorIndexMethod, VectorIndexSpec
+
+
+class CreateVectorIndexRequest(VectorIndexSpec):
+    working_dir: str = Field(
+        ..., description="RAG workspace directory whose vectors are indexed"
+    )
+
+
+class RebuildVectorIndexRequest(BaseModel):
+    working_dir: str = Field(
+        ..., description="RAG workspace directory whose indexes are rebuilt"
+    )
+    method: VectorIndexMethod | None = Field(
+        default=None, description="Only rebuild indexes of this type"
+    )
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import TypedDict
 
 
 class EntityResponse(BaseModel):
@@ -28,6 +29,29 @@ class ChunkResponse(BaseModel):
     chunk_id: str
 
 
+class ChunkPayload(TypedDict):
+    """Plain-dict form of ChunkResponse, validated without building models."""
+
+    reference_id: str
+    content: str
+    file_path: str
+    chunk_id: str
+
+
+_CHUNK_PAYLOADS = TypeAdapter(list[ChunkPayload])
+
+
+def chunks_from_result(result: dict) -> list[ChunkPayload]:
+    """Validate only the chunks of a raw query result.
+
+    Query endpoints return nothing but ``data.chunks``; validating the whole
+    ``QueryResponse`` (entities, relationships, metadata) is wasted work.
+    Extra keys on each chunk are dropped.
+    """
+    data = result.get("data") or {}
+    return _CHUNK_PAYLOADS.validate_python(data.get("chunks") or [])
+
+
 class ReferenceResponse(BaseModel):
     reference_id: str
     file_path: str
@@ -56,6 +80,8 @@ class ProcessingInfoResponse(BaseModel):
 
 class QueryMetadataResponse(BaseModel):
     query_mode: str = ""
+    requested_mode: str | None = None
+    mode_reason: str | None = None
     keywords: KeywordsResponse | None = None
     processing_info: ProcessingInfoResponse | None = None
 
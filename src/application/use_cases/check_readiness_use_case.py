@@ -0,0 +1,126 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from domain.entities.readiness import DependencyCheck, ReadinessReport
+from domain.ports.database_pool_port import DatabasePoolPort
+from domain.ports.rag_engine import RAGEnginePort
+from domain.ports.storage_port import StoragePort
+
+
+class CheckReadinessUseCase:
+    """Use case for deciding whether this process should receive traffic.
+
+    Dependencies must answer within the latency budget, and each saturation
+    signal must stay at or below its threshold. A threshold of ``None``
+    disables that check.
+    """
+
+    def __init__(
+        self,
+        rag_engine: RAGEnginePort,
+        storage: StoragePort,
+        bucket: str,
+        database: DatabasePoolPort | None = None,
+        latency_budget_ms: float = 500.0,
+        max_indexing_tasks: int | None = None,
+        max_engines: int | None = None,
+        max_db_pool_usage: float | None = 0.9,
+        max_llm_queue_depth: int | None = 50,
+        loop_stats: Callable[[], dict] | None = None,
+        max_loop_lag_ms: float | None = None,
+    ) -> None:
+        self.rag_engine = rag_engine
+        self.storage = storage
+        self.bucket = bucket
+        self.database = database
+        self.latency_budget_ms = latency_budget_ms
+        self.max_indexing_tasks = max_indexing_tasks
+        self.max_engines = max_engines
+        self.max_db_pool_usage = max_db_pool_usage
+        self.max_llm_queue_depth = max_llm_queue_depth
+        self.loop_stats = loop_stats
+        self.max_loop_lag_ms = max_loop_lag_ms
+
+    async def execute(self) -> ReadinessReport:
+        probes: dict[str, Callable[[], Awaitable[None]]] = {
+            "storage": lambda: self.storage.ping(self.bucket)
+        }
+        if self.database is not None:
+            probes["postgres"] = self.database.ping
+        results = await asyncio.gather(*[self._probe(p) for p in probes.values()])
+        dependencies = dict(zip(probes, results, strict=True))
+        reasons = [
+            f"{name}: {check.error}"
+            for name, check in dependencies.items()
+            if not check.ok
+        ]
+
+        engine_stats = self.rag_engine.stats()
+        indexing = engine_stats["indexing"]
+        llm = engine_stats["llm"]
+        saturation: dict = {
+            "indexing": {
+                "running": indexing["running"],
+                "waiting": indexing["waiting"],
+                "max_concurrency": indexing["max_concurrency"],
+            },
+            "engines": engine_stats["engines"],
+            "llm": llm,
+        }
+        if "embedding_cache" in engine_stats:
+            saturation["embedding_cache"] = engine_stats["embedding_cache"]
+        indexing_tasks = indexing["running"] + indexing["waiting"]
+        self._check_threshold(
+            reasons, "indexing tasks", indexing_tasks, self.max_indexing_tasks
+        )
+        self._check_threshold(
+            reasons, "engine cache", engine_stats["engines"], self.max_engines
+        )
+        self._check_threshold(
+            reasons, "LLM queue depth", llm["waiting"], self.max_llm_queue_depth
+        )
+
+        if self.loop_stats is not None:
+            loop = self.loop_stats()
+            saturation["event_loop"] = loop
+            self._check_threshold(
+                reasons, "event loop lag (ms)", loop["max_lag_ms"], self.max_loop_lag_ms
+            )
+
+        if self.database is not None:
+            pool = self.database.stats()
+            usage = pool["in_use"] / pool["max_size"] if pool["max_size"] else 0.0
+            saturation["db_pool"] = {**pool, "usage": round(usage, 3)}
+            self._check_threshold(
+                reasons, "DB pool usage", usage, self.max_db_pool_usage
+            )
+
+        return ReadinessReport(
+            ready=not reasons,
+            reasons=reasons,
+            dependencies=dependencies,
+            saturation=saturation,
+        )
+
+    async def _probe(self, ping: Callable[[], Awaitable[None]]) -> DependencyCheck:
+        budget_s = self.latency_budget_ms / 1000
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(ping(), timeout=budget_s)
+        except TimeoutError:
+            return DependencyCheck(
+                ok=False,
+                error=f"no response within {self.latency_budget_ms:g} ms",
+            )
+        except Exception as e:
+            return DependencyCheck(ok=False, error=str(e) or type(e).__name__)
+        latency_ms = round((time.perf_counter() - start) * 1000, 2)
+        return DependencyCheck(ok=True, latency_ms=latency_ms)
+
+    @staticmethod
+    def _check_threshold(
+        reasons: list[str], name: str, value: float, threshold: float | None
+    ) -> None:
+        if threshold is not None and value > threshold:
+            reasons.append(f"{name} {value:g} above threshold {threshold:g}")
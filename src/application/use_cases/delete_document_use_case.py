@@ -0,0 +1,19 @@
+from domain.entities.document_deletion import DocumentDeletionResult
+from domain.ports.rag_engine import RAGEnginePort
+
+
+class DeleteDocumentUseCase:
+    """Use case for removing an indexed file from a workspace."""
+
+    def __init__(self, rag_engine: RAGEnginePort) -> None:
+        self.rag_engine = rag_engine
+
+    async def execute(
+        self, file_name: str, working_dir: str, delete_llm_cache: bool = True
+    ) -> DocumentDeletionResult:
+        self.rag_engine.init_project(working_dir)
+        return await self.rag_engine.delete_document(
+            file_name=file_name,
+            working_dir=working_dir,
+            delete_llm_cache=delete_llm_cache,
+        )
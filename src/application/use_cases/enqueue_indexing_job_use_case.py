@@ -0,0 +1,33 @@
+from opentelemetry import propagate
+
+from application.requests.indexing_request import IndexFileRequest, IndexFolderRequest
+from domain.entities.indexing_job import IndexingJob, IndexingJobType
+from domain.ports.job_queue_port import JobQueuePort
+
+
+class EnqueueIndexingJobUseCase:
+    """Use case for handing an indexing request to the worker queue."""
+
+    def __init__(self, job_queue: JobQueuePort) -> None:
+        self.job_queue = job_queue
+
+    async def execute(
+        self, request: IndexFileRequest | IndexFolderRequest, profile: bool = False
+    ) -> IndexingJob:
+        """Queue ``request``; with ``profile``, the worker profiles the job."""
+        job_type = (
+            IndexingJobType.FILE
+            if isinstance(request, IndexFileRequest)
+            else IndexingJobType.FOLDER
+        )
+        payload = request.model_dump()
+        if profile:
+            payload["profile"] = True
+        # Lets the worker's job span continue this request's trace.
+        trace_context: dict[str, str] = {}
+        propagate.inject(trace_context)
+        if trace_context:
+            payload["trace_context"] = trace_context
+        return await self.job_queue.enqueue(
+            job_type=job_type, working_dir=request.working_dir, payload=payload
+        )
@@ -0,0 +1,61 @@
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+
+from application.requests.snapshot_request import ExportSnapshotRequest
+from domain.entities.workspace_snapshot import WorkspaceSnapshot
+from domain.ports.rag_engine import RAGEnginePort
+from domain.ports.storage_port import StoragePort
+from domain.ports.workspace_snapshot_port import WorkspaceSnapshotPort
+
+
+class ExportWorkspaceSnapshotUseCase:
+    """Use case for exporting a workspace's indexed data to object storage."""
+
+    def __init__(
+        self,
+        snapshotter: WorkspaceSnapshotPort,
+        rag_engine: RAGEnginePort,
+        storage: StoragePort,
+        bucket: str,
+        prefix: str,
+        embedding_model: str,
+    ) -> None:
+        self.snapshotter = snapshotter
+        self.rag_engine = rag_engine
+        self.storage = storage
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.embedding_model = embedding_model
+
+    def snapshots_prefix(self, working_dir: str) -> str:
+        """Object key prefix of a workspace's snapshots."""
+        return f"{self.prefix}/{working_dir.strip('/')}/"
+
+    def snapshot_key(self, working_dir: str) -> str:
+        """A new, timestamped object key for a snapshot of ``working_dir``."""
+        timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%fZ")
+        return f"{self.snapshots_prefix(working_dir)}{timestamp}.tar.gz"
+
+    async def execute(
+        self, request: ExportSnapshotRequest, snapshot_key: str
+    ) -> WorkspaceSnapshot:
+        """Export the workspace and upload the archive to ``snapshot_key``."""
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = Path(tmp) / "snapshot.tar.gz"
+            snapshot = await self.snapshotter.export_workspace(
+                request.working_dir,
+                archive,
+                embedding_model=self.embedding_model,
+                embedding_dim=await self.rag_engine.embedding_dim(request.working_dir),
+            )
+            await self.storage.upload_file(self.bucket, snapshot_key, str(archive))
+        return snapshot
+
+    async def list_snapshots(self, working_dir: str) -> list[str]:
+        """Object keys of the workspace's snapshots, oldest first."""
+        return sorted(
+            await self.storage.list_objects(
+                self.bucket, self.snapshots_prefix(working_dir)
+            )
+        )
@@ -0,0 +1,64 @@
+import tempfile
+from pathlib import Path
+
+from application.requests.snapshot_request import ImportSnapshotRequest
+from domain.entities.workspace_snapshot import WorkspaceSnapshot
+from domain.ports.rag_engine import RAGEnginePort
+from domain.ports.storage_port import StoragePort
+from domain.ports.workspace_snapshot_port import WorkspaceSnapshotPort
+
+
+class ImportWorkspaceSnapshotUseCase:
+    """Use case for restoring a workspace snapshot under a new working_dir."""
+
+    def __init__(
+        self,
+        snapshotter: WorkspaceSnapshotPort,
+        rag_engine: RAGEnginePort,
+        storage: StoragePort,
+        bucket: str,
+        embedding_model: str,
+    ) -> None:
+        self.snapshotter = snapshotter
+        self.rag_engine = rag_engine
+        self.storage = storage
+        self.bucket = bucket
+        self.embedding_model = embedding_model
+
+    async def ensure_empty(self, working_dir: str) -> None:
+        """
+        Raises:
+            RuntimeError: If the workspace already holds indexed data.
+        """
+        if await self.snapshotter.has_data(working_dir):
+            raise RuntimeError(
+                f"Workspace {working_dir} already has data; import into an empty one"
+            )
+
+    async def execute(self, request: ImportSnapshotRequest) -> WorkspaceSnapshot:
+        """
+        Raises:
+            RuntimeError: If the target workspace is not empty.
+            ValueError: If the snapshot was embedded with another model.
+            FileNotFoundError: If the snapshot does not exist.
+        """
+        await self.ensure_empty(request.working_dir)
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = Path(tmp) / "snapshot.tar.gz"
+            await self.storage.download_file(
+                self.bucket, request.snapshot_key, str(archive)
+            )
+            snapshot = await self.snapshotter.read_snapshot(archive)
+            if snapshot.embedding_model != self.embedding_model:
+                raise ValueError(
+                    f"Snapshot vectors come from {snapshot.embedding_model}, "
+                    f"not {self.embedding_model}"
+                )
+            # Serve the restored vectors at their own dimension.
+            if snapshot.embedding_dim != await self.rag_engine.embedding_dim(
+                request.working_dir
+            ):
+                await self.rag_engine.set_embedding_dim(
+                    request.working_dir, snapshot.embedding_dim
+                )
+            return await self.snapshotter.import_workspace(archive, request.working_dir)
@@ -1,13 +1,17 @@
+import hashlib
 import logging
 import os
 
 import aiofiles
+from opentelemetry import trace
 
-from domain.entities.indexing_result import FileIndexingResult
+from domain.entities.indexing_result import FileIndexingResult, IndexingStatus
+from domain.ports.document_lock_port import DocumentLockPort
 from domain.ports.rag_engine import RAGEnginePort
 from domain.ports.storage_port import StoragePort
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 
 
 class IndexFileUseCase:
@@ -19,29 +23,84 @@ class IndexFileUseCase:
         storage: StoragePort,
         bucket: str,
         output_dir: str,
+        document_lock: DocumentLockPort | None = None,
     ) -> None:
         self.rag_engine = rag_engine
         self.storage = storage
         self.bucket = bucket
         self.output_dir = output_dir
+        self.document_lock = document_lock
 
-    async def execute(self, file_name: str, working_dir: str) -> FileIndexingResult:
+    async def execute(
+        self, file_name: str, working_dir: str, replace: bool = False
+    ) -> FileIndexingResult:
+        with tracer.start_as_current_span(
+            "IndexFileUseCase.execute",
+            attributes={
+                "rag.working_dir": working_dir,
+                "rag.file_name": file_name,
+                "rag.replace": replace,
+            },
+        ) as span:
+            result = await self._execute(file_name, working_dir, replace)
+            span.set_attribute("rag.indexing_status", result.status.value)
+            return result
+
+    async def _execute(
+        self, file_name: str, working_dir: str, replace: bool
+    ) -> FileIndexingResult:
         os.makedirs(self.output_dir, exist_ok=True)
 
-        data = await self.storage.get_object(self.bucket, file_name)
+        with tracer.start_as_current_span("IndexFileUseCase.download"):
+            data = await self.storage.get_object(self.bucket, file_name)
         file_path = os.path.join(self.output_dir, file_name)
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(data)
+
+        if self.document_lock is None:
+            return await self._index(data, file_path, file_name, working_dir, replace)
+
+        content_hash = hashlib.sha256(data).hexdigest()
+        async with self.document_lock.hold(
+            working_dir, file_name, content_hash
+        ) as acquired:
+            if not acquired:
+                logger.info(
+                    f"Skipping '{file_name}' in '{working_dir}': already being indexed"
+                )
+                return FileIndexingResult(
+                    status=IndexingStatus.SKIPPED,
+                    message=f"File '{file_name}' is already being indexed",
+                    file_path=file_path,
+                    file_name=file_name,
+                )
+            return await self._index(data, file_path, file_name, working_dir, replace)
+
+    async def _index(
+        self,
+        data: bytes,
+        file_path: str,
+        file_name: str,
+        working_dir: str,
+        replace: bool,
+    ) -> FileIndexingResult:
+        with tracer.start_as_current_span("IndexFileUseCase.write"):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            async with aiofiles.open(file_path, "wb") as f:
+                await f.write(data)
 
         self.rag_engine.init_project(working_dir)
 
-        result = await self.rag_engine.index_document(
-            file_path=file_path,
-            file_name=file_name,
-            output_dir=self.output_dir,
-            working_dir=working_dir,
+        index = (
+            self.rag_engine.replace_document
+            if replace
+            else self.rag_engine.index_document
         )
+        with tracer.start_as_current_span("IndexFileUseCase.index"):
+            result = await index(
+                file_path=file_path,
+                file_name=file_name,
+                output_dir=self.output_dir,
+                working_dir=working_dir,
+            )
 
         logger.info(f"Indexation finished: {result.model_dump()}")
 
@@ -3,6 +3,7 @@ import logging
 import os
 
 import aiofiles
+from opentelemetry import trace
 
 from application.requests.indexing_request import IndexFolderRequest
 from domain.entities.indexing_result import FolderIndexingResult
@@ -10,6 +11,7 @@ from domain.ports.rag_engine import RAGEnginePort
 from domain.ports.storage_port import StoragePort
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 
 
 class IndexFolderUseCase:
@@ -28,13 +30,23 @@ class IndexFolderUseCase:
         self.output_dir = output_dir
 
     async def execute(self, request: IndexFolderRequest) -> FolderIndexingResult:
+        with tracer.start_as_current_span(
+            "IndexFolderUseCase.execute",
+            attributes={"rag.working_dir": request.working_dir},
+        ) as span:
+            result = await self._execute(request)
+            span.set_attribute("rag.indexing_status", result.status.value)
+            return result
+
+    async def _execute(self, request: IndexFolderRequest) -> FolderIndexingResult:
         local_folder = os.path.join(self.output_dir, request.working_dir)
 
         os.makedirs(local_folder, exist_ok=True)
 
-        files = await self.storage.list_objects(
-            self.bucket, prefix=request.working_dir, recursive=request.recursive
-        )
+        with tracer.start_as_current_span("IndexFolderUseCase.list"):
+            files = await self.storage.list_objects(
+                self.bucket, prefix=request.working_dir, recursive=request.recursive
+            )
 
         if request.file_extensions:
             exts = set(request.file_extensions)
@@ -49,17 +61,21 @@ class IndexFolderUseCase:
                 async with aiofiles.open(os.path.join(local_folder, local_name), "wb") as f:
                     await f.write(data)
 
-        await asyncio.gather(*[_download(f) for f in files])
+        with tracer.start_as_current_span(
+            "IndexFolderUseCase.download", attributes={"rag.files": len(files)}
+        ):
+            await asyncio.gather(*[_download(f) for f in files])
 
         self.rag_engine.init_project(request.working_dir)
 
-        result = await self.rag_engine.index_folder(
-            folder_path=local_folder,
-            output_dir=self.output_dir,
-            recursive=request.recursive,
-            file_extensions=request.file_extensions,
-            working_dir=request.working_dir,
-        )
+        with tracer.start_as_current_span("IndexFolderUseCase.index"):
+            result = await self.rag_engine.index_folder(
+                folder_path=local_folder,
+                output_dir=self.output_dir,
+                recursive=request.recursive,
+                file_extensions=request.file_extensions,
+                working_dir=request.working_dir,
+            )
 
         logger.info(f"Folder indexation finished: {result.model_dump()}")
         return result
@@ -0,0 +1,92 @@
+import logging
+from datetime import UTC, datetime
+
+from application.requests.embedding_migration_request import (
+    MigrateEmbeddingDimRequest,
+)
+from domain.entities.embedding_migration import (
+    EmbeddingMigration,
+    EmbeddingMigrationStatus,
+)
+from domain.ports.embedding_migration_port import EmbeddingMigrationPort
+from domain.ports.rag_engine import RAGEnginePort
+
+logger = logging.getLogger(__name__)
+
+
+class MigrateEmbeddingDimUseCase:
+    """Use case for moving a workspace to a smaller embedding dimension.
+
+    The workspace keeps serving its current vectors while they are copied;
+    the engine switches to the new dimension only once the copy has caught
+    up, in every process sharing the storage. Migrations are tracked in
+    memory, one per workspace.
+    """
+
+    def __init__(
+        self, rag_engine: RAGEnginePort, migrator: EmbeddingMigrationPort
+    ) -> None:
+        self.rag_engine = rag_engine
+        self.migrator = migrator
+        self._migrations: dict[str, EmbeddingMigration] = {}
+
+    async def start(self, request: MigrateEmbeddingDimRequest) -> EmbeddingMigration:
+        """Validate and register a migration; ``run`` performs it.
+
+        Raises:
+            ValueError: If the target is not smaller than the served dimension.
+            RuntimeError: If the workspace already has a running migration.
+        """
+        current = self._migrations.get(request.working_dir)
+        if current is not None and current.status is EmbeddingMigrationStatus.RUNNING:
+            raise RuntimeError(
+                f"A migration of {request.working_dir} to {current.target_dim} "
+                "dimensions is already running"
+            )
+        source_dim = await self.rag_engine.embedding_dim(request.working_dir)
+        if request.target_dim >= source_dim:
+            raise ValueError(
+                f"target_dim must be smaller than the current dimension ({source_dim})"
+            )
+        migration = EmbeddingMigration(
+            working_dir=request.working_dir,
+            source_dim=source_dim,
+            target_dim=request.target_dim,
+            mode=request.mode,
+            status=EmbeddingMigrationStatus.RUNNING,
+            started_at=datetime.now(UTC),
+        )
+        self._migrations[request.working_dir] = migration
+        return migration
+
+    async def run(self, migration: EmbeddingMigration) -> EmbeddingMigration:
+        def on_progress(table: str, rows: int) -> None:
+            migration.rows_copied[table] = rows
+
+        try:
+            migration.rows_copied = await self.migrator.copy_workspace(
+                migration.working_dir,
+                migration.source_dim,
+                migration.target_dim,
+                migration.mode,
+                on_progress=on_progress,
+            )
+        except Exception as e:
+            logger.exception(f"Embedding migration of {migration.working_dir} failed")
+            migration.status = EmbeddingMigrationStatus.FAILED
+            migration.error = str(e)
+        else:
+            await self.rag_engine.set_embedding_dim(
+                migration.working_dir, migration.target_dim
+            )
+            migration.status = EmbeddingMigrationStatus.COMPLETED
+            logger.info(
+                f"Workspace {migration.working_dir} now serves "
+                f"{migration.target_dim}-dimension vectors"
+            )
+        migration.finished_at = datetime.now(UTC)
+        return migration
+
+    def get(self, working_dir: str) -> EmbeddingMigration | None:
+        """The workspace's latest migration, if any."""
+        return self._migrations.get(working_dir)
@@ -1,4 +1,12 @@
+import logging
+
+from opentelemetry import trace
+
 from domain.ports.rag_engine import RAGEnginePort
+from domain.services.query_mode_router import choose_query_mode
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 
 
 class QueryUseCase:
@@ -8,9 +16,63 @@ class QueryUseCase:
         self.rag_engine = rag_engine
 
     async def execute(
-        self, working_dir: str, query: str, mode: str = "naive", top_k: int = 10
+        self,
+        working_dir: str,
+        query: str,
+        mode: str = "naive",
+        top_k: int = 10,
+        hl_keywords: list[str] | None = None,
+        ll_keywords: list[str] | None = None,
+        diversity: float | None = None,
+        dedup_threshold: float | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
     ) -> dict:
-        self.rag_engine.init_project(working_dir)
-        return await self.rag_engine.query(
-            query=query, mode=mode, top_k=top_k, working_dir=working_dir
-        )
+        with tracer.start_as_current_span(
+            "QueryUseCase.execute",
+            attributes={
+                "rag.working_dir": working_dir,
+                "rag.query_mode": mode,
+                "rag.top_k": top_k,
+            },
+        ) as span:
+            self.rag_engine.init_project(working_dir)
+            if mode != "auto":
+                return await self.rag_engine.query(
+                    query=query,
+                    mode=mode,
+                    top_k=top_k,
+                    working_dir=working_dir,
+                    hl_keywords=hl_keywords,
+                    ll_keywords=ll_keywords,
+                    diversity=diversity,
+                    dedup_threshold=dedup_threshold,
+                    ef_search=ef_search,
+                    probes=probes,
+                )
+
+            decision = choose_query_mode(query)
+            span.set_attribute("rag.routed_mode", decision.mode)
+            logger.info(
+                f"Auto mode routed query to '{decision.mode}' ({decision.reason})"
+            )
+            result = await self.rag_engine.query(
+                query=query,
+                mode=decision.mode,
+                top_k=top_k,
+                working_dir=working_dir,
+                hl_keywords=hl_keywords,
+                ll_keywords=ll_keywords,
+                diversity=diversity,
+                dedup_threshold=dedup_threshold,
+                ef_search=ef_search,
+                probes=probes,
+            )
+            metadata = result.get("metadata") or {}
+            result["metadata"] = {
+                **metadata,
+                "query_mode": decision.mode,
+                "requested_mode": "auto",
+                "mode_reason": decision.reason,
+            }
+            return result
@@ -0,0 +1,30 @@
+from application.requests.indexing_request import IndexFolderRequest
+from application.use_cases.index_file_use_case import IndexFileUseCase
+from application.use_cases.index_folder_use_case import IndexFolderUseCase
+from domain.entities.indexing_job import IndexingJob, IndexingJobType
+from domain.entities.indexing_result import FileIndexingResult, FolderIndexingResult
+
+
+class RunIndexingJobUseCase:
+    """Use case for running a queued indexing job inside a worker process."""
+
+    def __init__(
+        self,
+        index_file_use_case: IndexFileUseCase,
+        index_folder_use_case: IndexFolderUseCase,
+    ) -> None:
+        self.index_file_use_case = index_file_use_case
+        self.index_folder_use_case = index_folder_use_case
+
+    async def execute(
+        self, job: IndexingJob
+    ) -> FileIndexingResult | FolderIndexingResult:
+        if job.job_type == IndexingJobType.FILE:
+            return await self.index_file_use_case.execute(
+                file_name=job.payload["file_name"],
+                working_dir=job.working_dir,
+                replace=job.payload.get("replace", False),
+            )
+        return await self.index_folder_use_case.execute(
+            request=IndexFolderRequest(**job.payload)
+        )
@@ -1,5 +1,6 @@
 import os
 import tempfile
+from typing import Literal
 
 from dotenv import load_dotenv
 from pydantic import Field
@@ -22,6 +23,14 @@ class AppConfig(BaseSettings):
         default=os.path.join(tempfile.gettempdir(), "output"),
         description="Directory for temporary output file storage",
     )
+    RAG_WARMUP: bool = Field(
+        default=True,
+        description="Import the RAG stack in a background thread at startup",
+    )
+    ADMIN_API_KEY: str | None = Field(
+        default=None,
+        description="Key required in the X-Admin-Key header by /admin routes (unset disables them)",
+    )
 
 
 class DatabaseConfig(BaseSettings):
@@ -34,12 +43,30 @@ class DatabaseConfig(BaseSettings):
     POSTGRES_DATABASE: str = Field(default="raganything")
     POSTGRES_HOST: str = Field(default="localhost")
     POSTGRES_PORT: str = Field(default="5432")
+    POSTGRES_POOL_MIN_SIZE: int = Field(
+        default=1, description="Minimum connections in the service's asyncpg pool"
+    )
+    POSTGRES_POOL_MAX_SIZE: int = Field(
+        default=10, description="Maximum connections in the service's asyncpg pool"
+    )
+    POSTGRES_LOCK_POOL_MAX_SIZE: int = Field(
+        default=20,
+        description=(
+            "Maximum connections in the separate pool of document locks, each "
+            "held for a whole indexing run"
+        ),
+    )
 
     @property
     def DATABASE_URL(self) -> str:
         """Construct async PostgreSQL database URL."""
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DATABASE}"
 
+    @property
+    def ASYNCPG_DSN(self) -> str:
+        """Construct a plain PostgreSQL DSN for asyncpg."""
+        return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DATABASE}"
+
 
 class LLMConfig(BaseSettings):
     """
@@ -60,12 +87,53 @@ class LLMConfig(BaseSettings):
     EMBEDDING_DIM: int = Field(
         default=1536, description="Dimension of the embedding vectors"
     )
+    EMBEDDING_WORKSPACE_DIMS: dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "Reduced (Matryoshka-truncated) vector dimension per working_dir, "
+            'e.g. {"project-a": 512}; other workspaces store EMBEDDING_DIM'
+        ),
+    )
+    EMBEDDING_DIM_REFRESH_SECONDS: float = Field(
+        default=30.0,
+        description=(
+            "How long a process trusts its cached workspace dimension before "
+            "checking for a cutover made by another process"
+        ),
+    )
     MAX_TOKEN_SIZE: int = Field(
         default=8192, description="Maximum token size for the embedding model"
     )
     VISION_MODEL: str = Field(
         default="openai/gpt-4o", description="Model name for vision tasks"
     )
+    LLM_MAX_CONCURRENCY: int = Field(
+        default=16,
+        description="Concurrent LLM and embedding calls per process",
+    )
+    LLM_HTTP2: bool = Field(
+        default=True,
+        description="Multiplex provider calls over HTTP/2 connections (needs the h2 package)",
+    )
+    LLM_HTTP_MAX_CONNECTIONS: int = Field(
+        default=64, gt=0, description="Connections per provider base URL"
+    )
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=32, ge=0, description="Idle connections kept open per provider"
+    )
+    LLM_HTTP_KEEPALIVE_SECONDS: float = Field(
+        default=120.0,
+        gt=0,
+        description="How long an idle provider connection is kept for reuse",
+    )
+    LLM_HTTP_CONNECT_TIMEOUT_SECONDS: float = Field(
+        default=10.0, gt=0, description="Provider connect and TLS handshake timeout"
+    )
+    LLM_HTTP_READ_TIMEOUT_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="Provider read timeout; long completions need minutes",
+    )
 
     @property
     def api_key(self) -> str:
@@ -107,6 +175,218 @@ class RAGConfig(BaseSettings):
     RAG_STORAGE_TYPE: str = Field(
         default="postgres", description="Storage type for RAG system"
     )
+    LOCAL_VECTOR_STORAGE: Literal["nano", "mmap"] = Field(
+        default="nano",
+        description=(
+            "Vector backend for local storage: 'nano' (NanoVectorDB JSON file) or "
+            "'mmap' (memory-mapped NumPy matrix)"
+        ),
+    )
+    INDEXING_MAX_CONCURRENCY: int = Field(
+        default=4,
+        description="Files indexed concurrently across all workspaces",
+    )
+    INDEXING_WORKSPACE_CONCURRENCY: int = Field(
+        default=1,
+        description="Files indexed concurrently within a single workspace",
+    )
+    INDEXING_WORKSPACE_WEIGHTS: dict[str, float] = Field(
+        default_factory=dict,
+        description="Fair-queuing weight per working_dir (default weight is 1.0)",
+    )
+    DOCUMENT_DELETE_WAIT_SECONDS: float = Field(
+        default=300.0,
+        description=(
+            "How long a deletion waits for an insert running in the same "
+            "workspace to finish before giving up"
+        ),
+    )
+    QUERY_CHUNKS_ONLY: bool = Field(
+        default=True,
+        description="Retrieve chunks without building LightRAG's graph context",
+    )
+    KEYWORD_CACHE_TTL_SECONDS: float = Field(
+        default=3600.0,
+        description="Lifetime of cached query keyword extractions",
+    )
+    KEYWORD_CACHE_MAX_ENTRIES: int = Field(
+        default=10000,
+        description="Maximum cached keyword extractions (0 disables the cache)",
+    )
+    EMBEDDING_CACHE_ENABLED: bool = Field(
+        default=True,
+        description=(
+            "Reuse embeddings of identical texts across documents and workspaces"
+        ),
+    )
+    EMBEDDING_CACHE_MAX_ENTRIES: int = Field(
+        default=10000,
+        description="Maximum vectors held by the in-process cache of local mode",
+    )
+    EMBEDDING_CACHE_ACQUIRE_TIMEOUT_SECONDS: float = Field(
+        default=1.0,
+        description=(
+            "Wait for a database connection before skipping the embedding cache "
+            "and calling the provider"
+        ),
+    )
+    LEXICAL_TS_CONFIG: str = Field(
+        default="simple",
+        description=(
+            "PostgreSQL text search configuration for the full-text chunk index "
+            "('simple' keeps identifiers and codes unstemmed)"
+        ),
+    )
+    FUSION_RRF_K: int = Field(
+        default=60,
+        description="Reciprocal rank fusion constant for the 'fusion' query mode",
+    )
+    VECTOR_HNSW_EF_SEARCH: int | None = Field(
+        default=None,
+        description="hnsw.ef_search for chunk queries (unset keeps the server default, 40)",
+    )
+    VECTOR_IVFFLAT_PROBES: int | None = Field(
+        default=None,
+        description="ivfflat.probes for chunk queries (unset keeps the server default, 1)",
+    )
+    VECTOR_QUANTIZATION: Literal["halfvec", "binary"] | None = Field(
+        default=None,
+        description=(
+            "Search workspace quantized indexes and rescore on full precision "
+            "(build them first with POST /admin/vector-indexes)"
+        ),
+    )
+    VECTOR_RESCORE_FACTOR: int = Field(
+        default=4,
+        ge=1,
+        description="Quantized candidates rescored per requested result",
+    )
+    VECTOR_SEARCH_WORKSPACE_SETTINGS: dict[str, dict[str, int | str]] = Field(
+        default_factory=dict,
+        description=(
+            "Per-working_dir overrides of the search settings, e.g. "
+            '{"project-a": {"ef_search": 200, "probes": 20, "quantization": "binary"}}'
+        ),
+    )
+    VECTOR_INDEX_HNSW_M: int = Field(
+        default=16, description="Default m for workspace HNSW indexes"
+    )
+    VECTOR_INDEX_HNSW_EF_CONSTRUCTION: int = Field(
+        default=64, description="Default ef_construction for workspace HNSW indexes"
+    )
+    VECTOR_INDEX_MAINTENANCE_WORK_MEM: str | None = Field(
+        default=None,
+        description="maintenance_work_mem for index builds, e.g. '2GB' (unset keeps the server default)",
+    )
+
+
+class ReadinessConfig(BaseSettings):
+    """Thresholds for the /ready endpoint. Unset thresholds are not checked."""
+
+    READY_LATENCY_BUDGET_MS: float = Field(
+        default=500.0,
+        description="Maximum round-trip time for the PostgreSQL and MinIO probes",
+    )
+    READY_MAX_INDEXING_TASKS: int | None = Field(
+        default=None,
+        description="Maximum running plus waiting indexing tasks in this process",
+    )
+    READY_MAX_ENGINES: int | None = Field(
+        default=None, description="Maximum workspaces held in the RAG engine cache"
+    )
+    READY_MAX_DB_POOL_USAGE: float | None = Field(
+        default=0.9, description="Maximum fraction of DB pool connections in use"
+    )
+    READY_MAX_LLM_QUEUE_DEPTH: int | None = Field(
+        default=50, description="Maximum LLM calls waiting for a concurrency slot"
+    )
+    READY_MAX_LOOP_LAG_MS: float | None = Field(
+        default=None,
+        description="Maximum event loop lag over the last 10 seconds",
+    )
+
+
+class QueueConfig(BaseSettings):
+    """Indexing job queue and worker configuration."""
+
+    INDEXING_BACKEND: str = Field(
+        default="inprocess",
+        description="Where indexing runs: 'inprocess' (API background task) or 'queue' (worker process)",
+    )
+    WORKER_CONCURRENCY: int = Field(
+        default=2, description="Jobs a worker process runs concurrently"
+    )
+    WORKER_POLL_INTERVAL_SECONDS: float = Field(
+        default=2.0, description="Delay between polls when the queue is empty"
+    )
+    JOB_LEASE_SECONDS: int = Field(
+        default=300,
+        description="Seconds a claimed job stays leased without a heartbeat before it can be reclaimed",
+    )
+    JOB_MAX_ATTEMPTS: int = Field(
+        default=3, description="Claims allowed before a failing job is marked failed"
+    )
+
+
+class TracingConfig(BaseSettings):
+    """OpenTelemetry tracing. The OTLP exporter reads the standard OTEL_EXPORTER_OTLP_* variables."""
+
+    TRACING_ENABLED: bool = Field(
+        default=False, description="Record spans and export them"
+    )
+    TRACING_EXPORTER: Literal["otlp", "console"] = Field(
+        default="otlp",
+        description="Span exporter: 'otlp' (OTLP over HTTP) or 'console' (stdout, for local runs)",
+    )
+    TRACING_SAMPLE_RATIO: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of new traces recorded; requests with a sampled parent are always recorded",
+    )
+    OTEL_SERVICE_NAME: str = Field(
+        default="mcp-raganything", description="service.name resource attribute"
+    )
+
+
+class MetricsConfig(BaseSettings):
+    """OpenTelemetry metrics export and event loop lag monitoring."""
+
+    METRICS_ENABLED: bool = Field(
+        default=False, description="Export metrics such as event loop lag"
+    )
+    METRICS_EXPORTER: Literal["otlp", "console"] = Field(
+        default="otlp",
+        description="Metric exporter: 'otlp' (OTLP over HTTP) or 'console' (stdout)",
+    )
+    METRICS_EXPORT_INTERVAL_SECONDS: float = Field(
+        default=60.0, gt=0, description="Interval between metric exports"
+    )
+    LOOP_MONITOR_ENABLED: bool = Field(
+        default=True, description="Measure event loop lag in the API and worker"
+    )
+    LOOP_MONITOR_INTERVAL_MS: float = Field(
+        default=100.0, gt=0, description="How often event loop lag is measured"
+    )
+    LOOP_BLOCK_THRESHOLD_MS: float = Field(
+        default=250.0,
+        gt=0,
+        description="Log the loop thread's stack when a callback blocks the loop this long",
+    )
+
+
+class ProfilingConfig(BaseSettings):
+    """On-demand request and job profiling (X-Profile header, admin only)."""
+
+    PROFILE_FORMAT: Literal["speedscope", "pstats"] = Field(
+        default="speedscope",
+        description="Profile format: 'speedscope' (JSON for speedscope.app) or 'pstats'",
+    )
+    PROFILE_INTERVAL_SECONDS: float = Field(
+        default=0.01,
+        gt=0,
+        description="Sampling interval; long indexing jobs produce large profiles at short intervals",
+    )
 
 
 class MinioConfig(BaseSettings):
@@ -117,3 +397,24 @@ class MinioConfig(BaseSettings):
     MINIO_SECRET: str = Field(default="minioadmin")
     MINIO_BUCKET: str = Field(default="raganything")
     MINIO_SECURE: bool = Field(default=False)
+    MINIO_CLIENT: Literal["minio", "async"] = Field(
+        default="minio",
+        description=(
+            "Storage client: 'minio' (minio-py in the default thread pool) or "
+            "'async' (native asyncio S3 client with its own connection pool)"
+        ),
+    )
+    MINIO_REGION: str = Field(
+        default="us-east-1", description="Region the 'async' client signs for"
+    )
+    MINIO_MAX_CONNECTIONS: int = Field(
+        default=100, description="Connection pool size of the 'async' client"
+    )
+    SNAPSHOT_PREFIX: str = Field(
+        default="snapshots",
+        description="Key prefix of workspace snapshots in MINIO_BUCKET",
+    )
+    PROFILE_PREFIX: str = Field(
+        default="profiles",
+        description="Key prefix of request and job profiles in MINIO_BUCKET",
+    )
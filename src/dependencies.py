@@ -1,14 +1,65 @@
 """Dependency injection — module-level singletons following the pickpro pattern."""
 
 import os
+import secrets
 
+from fastapi import Header, HTTPException, status
+
+from application.use_cases.check_readiness_use_case import CheckReadinessUseCase
+from application.use_cases.delete_document_use_case import DeleteDocumentUseCase
+from application.use_cases.enqueue_indexing_job_use_case import (
+    EnqueueIndexingJobUseCase,
+)
+from application.use_cases.export_workspace_snapshot_use_case import (
+    ExportWorkspaceSnapshotUseCase,
+)
+from application.use_cases.import_workspace_snapshot_use_case import (
+    ImportWorkspaceSnapshotUseCase,
+)
 from application.use_cases.index_file_use_case import IndexFileUseCase
 from application.use_cases.index_folder_use_case import IndexFolderUseCase
+from application.use_cases.migrate_embedding_dim_use_case import (
+    MigrateEmbeddingDimUseCase,
+)
 from application.use_cases.multimodal_query_use_case import MultimodalQueryUseCase
 from application.use_cases.query_use_case import QueryUseCase
-from config import AppConfig, LLMConfig, MinioConfig, RAGConfig
+from application.use_cases.run_indexing_job_use_case import RunIndexingJobUseCase
+from config import (
+    AppConfig,
+    DatabaseConfig,
+    LLMConfig,
+    MetricsConfig,
+    MinioConfig,
+    ProfilingConfig,
+    QueueConfig,
+    RAGConfig,
+    ReadinessConfig,
+    TracingConfig,
+)
+from domain.ports.document_lock_port import DocumentLockPort
+from domain.ports.job_queue_port import JobQueuePort
+from domain.ports.profiler_port import ProfilerPort
+from domain.ports.storage_port import StoragePort
+from domain.ports.vector_index_port import VectorIndexPort
+from domain.ports.workspace_snapshot_port import WorkspaceSnapshotPort
+from infrastructure.database.pg_embedding_migrator import PgEmbeddingMigrator
+from infrastructure.database.pg_workspace_snapshot import PgWorkspaceSnapshotter
+from infrastructure.database.pgvector_index_manager import PgVectorIndexManager
+from infrastructure.database.postgres_pool import PostgresPool
+from infrastructure.locking.document_lock import (
+    InMemoryDocumentLock,
+    PostgresDocumentLock,
+)
+from infrastructure.observability.loop_monitor import EventLoopMonitor
+from infrastructure.observability.profiling import PyinstrumentProfiler
+from infrastructure.queue.postgres_job_queue import PostgresJobQueue
+from infrastructure.rag.embedding_cache import PostgresEmbeddingCache
+from infrastructure.rag.embedding_dims import PostgresEmbeddingDims
+from infrastructure.rag.lexical_index import PostgresLexicalIndex
 from infrastructure.rag.lightrag_adapter import LightRAGAdapter
+from infrastructure.scheduling.fair_scheduler import WeightedFairScheduler
 from infrastructure.storage.minio_adapter import MinioAdapter
+from infrastructure.storage.s3_adapter import AsyncS3Adapter
 
 # ============= CONFIG =============
 
@@ -16,25 +67,169 @@ app_config = AppConfig()  # type: ignore
 llm_config = LLMConfig()  # type: ignore
 rag_config = RAGConfig()  # type: ignore
 minio_config = MinioConfig()  # type: ignore
+db_config = DatabaseConfig()  # type: ignore
+queue_config = QueueConfig()  # type: ignore
+readiness_config = ReadinessConfig()  # type: ignore
+tracing_config = TracingConfig()  # type: ignore
+profiling_config = ProfilingConfig()  # type: ignore
+metrics_config = MetricsConfig()  # type: ignore
 
 os.makedirs(app_config.OUTPUT_DIR, exist_ok=True)
 
 # ============= ADAPTERS =============
 
-rag_adapter = LightRAGAdapter(llm_config, rag_config)
-minio_adapter = MinioAdapter(
-    host=minio_config.MINIO_HOST,
-    access=minio_config.MINIO_ACCESS,
-    secret=minio_config.MINIO_SECRET,
-    secure=minio_config.MINIO_SECURE,
+indexing_scheduler = WeightedFairScheduler(
+    max_concurrency=rag_config.INDEXING_MAX_CONCURRENCY,
+    workspace_concurrency=rag_config.INDEXING_WORKSPACE_CONCURRENCY,
+    weights=rag_config.INDEXING_WORKSPACE_WEIGHTS,
+)
+minio_adapter: StoragePort = (
+    AsyncS3Adapter(
+        host=minio_config.MINIO_HOST,
+        access=minio_config.MINIO_ACCESS,
+        secret=minio_config.MINIO_SECRET,
+        secure=minio_config.MINIO_SECURE,
+        region=minio_config.MINIO_REGION,
+        max_connections=minio_config.MINIO_MAX_CONNECTIONS,
+    )
+    if minio_config.MINIO_CLIENT == "async"
+    else MinioAdapter(
+        host=minio_config.MINIO_HOST,
+        access=minio_config.MINIO_ACCESS,
+        secret=minio_config.MINIO_SECRET,
+        secure=minio_config.MINIO_SECURE,
+    )
+)
+postgres_pool = PostgresPool(db_config)
+# Document locks hold their connection for a whole indexing run, including
+# the wait for a scheduler slot, so they get their own pool and cannot starve
+# the cache, queue, heartbeat and readiness queries of connections.
+lock_pool = PostgresPool(db_config, max_size=db_config.POSTGRES_LOCK_POOL_MAX_SIZE)
+lexical_index = (
+    PostgresLexicalIndex(rag_config.LEXICAL_TS_CONFIG, pool=postgres_pool)
+    if rag_config.RAG_STORAGE_TYPE == "postgres"
+    else None
+)
+rag_adapter = LightRAGAdapter(
+    llm_config,
+    rag_config,
+    scheduler=indexing_scheduler,
+    lexical_index=lexical_index,
+    embedding_dims=(
+        PostgresEmbeddingDims(postgres_pool, llm_config.EMBEDDING_MODEL)
+        if rag_config.RAG_STORAGE_TYPE == "postgres"
+        else None
+    ),
+    embedding_cache=(
+        PostgresEmbeddingCache(
+            postgres_pool,
+            acquire_timeout=rag_config.EMBEDDING_CACHE_ACQUIRE_TIMEOUT_SECONDS,
+        )
+        if rag_config.RAG_STORAGE_TYPE == "postgres"
+        and rag_config.EMBEDDING_CACHE_ENABLED
+        else None
+    ),
+)
+job_queue: JobQueuePort | None = (
+    PostgresJobQueue(
+        postgres_pool,
+        lease_seconds=queue_config.JOB_LEASE_SECONDS,
+        max_attempts=queue_config.JOB_MAX_ATTEMPTS,
+    )
+    if queue_config.INDEXING_BACKEND == "queue"
+    else None
 )
+document_lock: DocumentLockPort = (
+    PostgresDocumentLock(lock_pool)
+    if rag_config.RAG_STORAGE_TYPE == "postgres"
+    else InMemoryDocumentLock()
+)
+vector_index_manager: VectorIndexPort | None = (
+    PgVectorIndexManager(
+        postgres_pool,
+        workspace_for=LightRAGAdapter._make_workspace,
+        hnsw_m=rag_config.VECTOR_INDEX_HNSW_M,
+        hnsw_ef_construction=rag_config.VECTOR_INDEX_HNSW_EF_CONSTRUCTION,
+        maintenance_work_mem=rag_config.VECTOR_INDEX_MAINTENANCE_WORK_MEM,
+    )
+    if rag_config.RAG_STORAGE_TYPE == "postgres"
+    else None
+)
+workspace_snapshotter: WorkspaceSnapshotPort | None = (
+    PgWorkspaceSnapshotter(
+        postgres_pool,
+        workspace_for=LightRAGAdapter._make_workspace,
+        graph_for=rag_adapter.graph_storage,
+    )
+    if rag_config.RAG_STORAGE_TYPE == "postgres"
+    else None
+)
+profiler: ProfilerPort = PyinstrumentProfiler(
+    minio_adapter,
+    minio_config.MINIO_BUCKET,
+    minio_config.PROFILE_PREFIX,
+    app_config.OUTPUT_DIR,
+    profile_format=profiling_config.PROFILE_FORMAT,
+    interval=profiling_config.PROFILE_INTERVAL_SECONDS,
+)
+loop_monitor = EventLoopMonitor(
+    interval=metrics_config.LOOP_MONITOR_INTERVAL_MS / 1000,
+    block_threshold=metrics_config.LOOP_BLOCK_THRESHOLD_MS / 1000,
+)
+# Holds migration status across requests, so it is a singleton.
+migrate_embedding_dim_use_case: MigrateEmbeddingDimUseCase | None = (
+    MigrateEmbeddingDimUseCase(
+        rag_adapter,
+        PgEmbeddingMigrator(
+            postgres_pool,
+            workspace_for=LightRAGAdapter._make_workspace,
+            model_name=llm_config.EMBEDDING_MODEL,
+            model_dim=llm_config.EMBEDDING_DIM,
+            embed=rag_adapter.embed_texts,
+        ),
+    )
+    if rag_config.RAG_STORAGE_TYPE == "postgres"
+    else None
+)
+
+# ============= AUTH =============
+
+
+def require_admin(x_admin_key: str | None = Header(default=None)) -> None:
+    """Reject /admin requests unless X-Admin-Key matches ADMIN_API_KEY."""
+    if not app_config.ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin API is disabled; set ADMIN_API_KEY to enable it",
+        )
+    if x_admin_key is None or not secrets.compare_digest(
+        x_admin_key, app_config.ADMIN_API_KEY
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin key"
+        )
+
+
+def profiling_requested(
+    x_profile: bool = Header(default=False),
+    x_admin_key: str | None = Header(default=None),
+) -> bool:
+    """Whether an admin asked for this request to be profiled (X-Profile: true)."""
+    if x_profile:
+        require_admin(x_admin_key)
+    return x_profile
+
 
 # ============= USE CASE PROVIDERS =============
 
 
 def get_index_file_use_case() -> IndexFileUseCase:
     return IndexFileUseCase(
-        rag_adapter, minio_adapter, minio_config.MINIO_BUCKET, app_config.OUTPUT_DIR
+        rag_adapter,
+        minio_adapter,
+        minio_config.MINIO_BUCKET,
+        app_config.OUTPUT_DIR,
+        document_lock=document_lock,
     )
 
 
@@ -44,9 +239,83 @@ def get_index_folder_use_case() -> IndexFolderUseCase:
     )
 
 
+def get_delete_document_use_case() -> DeleteDocumentUseCase:
+    return DeleteDocumentUseCase(rag_adapter)
+
+
 def get_query_use_case() -> QueryUseCase:
     return QueryUseCase(rag_adapter)
 
 
 def get_multimodal_query_use_case() -> MultimodalQueryUseCase:
     return MultimodalQueryUseCase(rag_adapter)
+
+
+def get_job_queue() -> JobQueuePort | None:
+    return job_queue
+
+
+def get_profiler() -> ProfilerPort:
+    return profiler
+
+
+def get_vector_index_manager() -> VectorIndexPort | None:
+    return vector_index_manager
+
+
+def get_migrate_embedding_dim_use_case() -> MigrateEmbeddingDimUseCase | None:
+    return migrate_embedding_dim_use_case
+
+
+def get_export_snapshot_use_case() -> ExportWorkspaceSnapshotUseCase | None:
+    if workspace_snapshotter is None:
+        return None
+    return ExportWorkspaceSnapshotUseCase(
+        workspace_snapshotter,
+        rag_adapter,
+        minio_adapter,
+        minio_config.MINIO_BUCKET,
+        minio_config.SNAPSHOT_PREFIX,
+        embedding_model=llm_config.EMBEDDING_MODEL,
+    )
+
+
+def get_import_snapshot_use_case() -> ImportWorkspaceSnapshotUseCase | None:
+    if workspace_snapshotter is None:
+        return None
+    return ImportWorkspaceSnapshotUseCase(
+        workspace_snapshotter,
+        rag_adapter,
+        minio_adapter,
+        minio_config.MINIO_BUCKET,
+        embedding_model=llm_config.EMBEDDING_MODEL,
+    )
+
+
+def get_enqueue_indexing_job_use_case() -> EnqueueIndexingJobUseCase | None:
+    if job_queue is None:
+        return None
+    return EnqueueIndexingJobUseCase(job_queue)
+
+
+def get_check_readiness_use_case() -> CheckReadinessUseCase:
+    uses_postgres = rag_config.RAG_STORAGE_TYPE == "postgres" or job_queue is not None
+    return CheckReadinessUseCase(
+        rag_adapter,
+        minio_adapter,
+        minio_config.MINIO_BUCKET,
+        database=postgres_pool if uses_postgres else None,
+        latency_budget_ms=readiness_config.READY_LATENCY_BUDGET_MS,
+        max_indexing_tasks=readiness_config.READY_MAX_INDEXING_TASKS,
+        max_engines=readiness_config.READY_MAX_ENGINES,
+        max_db_pool_usage=readiness_config.READY_MAX_DB_POOL_USAGE,
+        max_llm_queue_depth=readiness_config.READY_MAX_LLM_QUEUE_DEPTH,
+        loop_stats=(
+            loop_monitor.stats if metrics_config.LOOP_MONITOR_ENABLED else None
+        ),
+        max_loop_lag_ms=readiness_config.READY_MAX_LOOP_LAG_MS,
+    )
+
+
+def get_run_indexing_job_use_case() -> RunIndexingJobUseCase:
+    return RunIndexingJobUseCase(get_index_file_use_case(), get_index_folder_use_case())
@@ -0,0 +1,29 @@
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class DeletionStatus(str, Enum):
+    """Outcome of deleting a document from a workspace."""
+
+    SUCCESS = "success"
+    NOT_FOUND = "not_found"
+    BUSY = "busy"
+    AMBIGUOUS = "ambiguous"
+    FAILED = "failed"
+
+
+class DocumentDeletionResult(BaseModel):
+    """Result of removing a document's chunks, vectors and graph data."""
+
+    status: DeletionStatus = Field(description="Deletion status")
+    message: str = Field(description="Status message")
+    file_name: str = Field(description="Name of the deleted file")
+    doc_ids: list[str] = Field(
+        default_factory=list,
+        description="Indexed versions (document ids) that were removed",
+    )
+    processing_time_ms: float | None = Field(
+        default=None, description="Processing time in milliseconds"
+    )
+    error: str | None = Field(default=None, description="Error message if failed")
@@ -0,0 +1,37 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class EmbeddingMigrationMode(str, Enum):
+    """How vectors are produced at the target dimension."""
+
+    TRUNCATE = "truncate"
+    REEMBED = "reembed"
+
+
+class EmbeddingMigrationStatus(str, Enum):
+    """Lifecycle status of a workspace embedding-dimension migration."""
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class EmbeddingMigration(BaseModel):
+    """Progress of moving a workspace's vectors to another dimension."""
+
+    working_dir: str = Field(description="RAG workspace directory being migrated")
+    source_dim: int = Field(description="Dimension served until cutover")
+    target_dim: int = Field(description="Dimension served after cutover")
+    mode: EmbeddingMigrationMode = Field(description="Truncate or re-embed")
+    status: EmbeddingMigrationStatus = Field(description="Current status")
+    rows_copied: dict[str, int] = Field(
+        default_factory=dict, description="Vectors written per target table"
+    )
+    error: str | None = Field(default=None, description="Error message if failed")
+    started_at: datetime = Field(description="Migration start time")
+    finished_at: datetime | None = Field(
+        default=None, description="Cutover or failure time"
+    )
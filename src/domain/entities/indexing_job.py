@@ -0,0 +1,40 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class IndexingJobType(str, Enum):
+    """Kind of indexing work carried by a queued job."""
+
+    FILE = "file"
+    FOLDER = "folder"
+
+
+class IndexingJobStatus(str, Enum):
+    """Lifecycle status of a queued indexing job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class IndexingJob(BaseModel):
+    """An indexing request persisted in the job queue."""
+
+    id: str = Field(description="Job identifier")
+    job_type: IndexingJobType = Field(description="Kind of indexing work")
+    working_dir: str = Field(description="RAG workspace directory for this job")
+    payload: dict[str, Any] = Field(
+        default_factory=dict, description="Request body used to run the job"
+    )
+    status: IndexingJobStatus = Field(description="Current job status")
+    attempts: int = Field(default=0, description="Number of times the job was claimed")
+    result: dict[str, Any] | None = Field(
+        default=None, description="Indexing result once the job has finished"
+    )
+    error: str | None = Field(default=None, description="Error message if failed")
+    created_at: datetime | None = Field(default=None, description="Enqueue time")
+    updated_at: datetime | None = Field(default=None, description="Last status change")
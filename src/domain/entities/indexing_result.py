@@ -11,6 +11,44 @@ class IndexingStatus(str, Enum):
     SUCCESS = "success"
     FAILED = "failed"
     PARTIAL = "partial"
+    SKIPPED = "skipped"
+
+
+class ModelCallKind(str, Enum):
+    """Kind of model call made while indexing."""
+
+    LLM = "llm"
+    VISION = "vision"
+    EMBEDDING = "embedding"
+
+
+class ModelUsage(BaseModel):
+    """Token, call and latency totals for one kind of model call."""
+
+    calls: int = Field(default=0, description="Number of calls")
+    prompt_tokens: int = Field(default=0, description="Prompt (input) tokens")
+    completion_tokens: int = Field(default=0, description="Completion (output) tokens")
+    cache_hits: int = Field(
+        default=0, description="Inputs served from a cache instead of the provider"
+    )
+    duration_ms: float = Field(
+        default=0.0, description="Time spent in calls in milliseconds"
+    )
+
+
+class IndexingUsage(BaseModel):
+    """Model usage of an indexing operation, tagged with what it was for."""
+
+    working_dir: str = Field(description="RAG workspace directory")
+    job_id: str | None = Field(default=None, description="Indexing job, if queued")
+    file_name: str | None = Field(default=None, description="Indexed file, if one")
+    llm: ModelUsage = Field(default_factory=ModelUsage, description="LLM calls")
+    vision: ModelUsage = Field(
+        default_factory=ModelUsage, description="Vision model calls"
+    )
+    embedding: ModelUsage = Field(
+        default_factory=ModelUsage, description="Embedding calls"
+    )
 
 
 class FileIndexingResult(BaseModel):
@@ -23,6 +61,9 @@ class FileIndexingResult(BaseModel):
     processing_time_ms: float | None = Field(
         default=None, description="Processing time in milliseconds"
     )
+    usage: IndexingUsage | None = Field(
+        default=None, description="Model calls made while indexing the file"
+    )
     error: str | None = Field(default=None, description=ERROR_MESSAGE_IF_FAILED)
 
 
@@ -32,6 +73,9 @@ class FileProcessingDetail(BaseModel):
     file_path: str = Field(description="Path to the file")
     file_name: str = Field(description="Name of the file")
     status: IndexingStatus = Field(description="Processing status")
+    usage: IndexingUsage | None = Field(
+        default=None, description="Model calls made while indexing the file"
+    )
     error: str | None = Field(default=None, description=ERROR_MESSAGE_IF_FAILED)
 
 
@@ -62,4 +106,7 @@ class FolderIndexingResult(BaseModel):
     file_results: list[FileProcessingDetail] | None = Field(
         default=None, description="Individual file results"
     )
+    usage: IndexingUsage | None = Field(
+        default=None, description="Model calls made while indexing the folder"
+    )
     error: str | None = Field(default=None, description="Error message if failed")
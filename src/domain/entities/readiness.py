@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+
+
+class DependencyCheck(BaseModel):
+    """Outcome of probing one external dependency."""
+
+    ok: bool = Field(description="Whether the dependency answered within budget")
+    latency_ms: float | None = Field(
+        default=None, description="Round-trip time of the probe in milliseconds"
+    )
+    error: str | None = Field(default=None, description="Error message if failed")
+
+
+class ReadinessReport(BaseModel):
+    """Readiness of this process to accept query traffic."""
+
+    ready: bool = Field(description="False when any check or threshold fails")
+    reasons: list[str] = Field(
+        default_factory=list, description="Why the process is not ready"
+    )
+    dependencies: dict[str, DependencyCheck] = Field(
+        default_factory=dict, description="Probe results per dependency"
+    )
+    saturation: dict = Field(
+        default_factory=dict,
+        description="Indexing, engine cache, DB pool, LLM limiter and event loop usage",
+    )
@@ -0,0 +1,86 @@
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class VectorIndexMethod(str, Enum):
+    """pgvector approximate nearest-neighbour index type."""
+
+    HNSW = "hnsw"
+    IVFFLAT = "ivfflat"
+
+
+class VectorQuantization(str, Enum):
+    """Compact representation indexed in place of the full-precision vectors.
+
+    ``halfvec`` stores 16-bit floats (2x smaller); ``binary`` stores one bit
+    per dimension (32x smaller) and is searched by Hamming distance.
+    Candidates found in the compact index are rescored on the full vectors.
+    """
+
+    HALFVEC = "halfvec"
+    BINARY = "binary"
+
+
+class VectorIndexSpec(BaseModel):
+    """Build parameters for a workspace's ANN indexes. Unset values use defaults."""
+
+    method: VectorIndexMethod = Field(
+        default=VectorIndexMethod.HNSW, description="Index type"
+    )
+    m: int | None = Field(
+        default=None, ge=2, le=100, description="HNSW: connections per layer"
+    )
+    ef_construction: int | None = Field(
+        default=None, ge=4, le=1000, description="HNSW: candidate list size at build"
+    )
+    lists: int | None = Field(
+        default=None,
+        ge=1,
+        description="IVFFlat: number of lists (default rows/1000, sqrt(rows) above 1M)",
+    )
+    quantization: VectorQuantization | None = Field(
+        default=None,
+        description="Index a quantized copy of the vectors instead of full precision",
+    )
+
+
+class VectorIndex(BaseModel):
+    """A managed ANN index covering one workspace in one vector table."""
+
+    name: str = Field(description="Index name")
+    table: str = Field(description="LightRAG vector table the index covers")
+    method: VectorIndexMethod = Field(description="Index type")
+    quantization: VectorQuantization | None = Field(
+        default=None, description="Quantized representation indexed, if any"
+    )
+    definition: str = Field(description="CREATE INDEX statement reported by PostgreSQL")
+    size_bytes: int = Field(default=0, description="On-disk size of the index")
+    valid: bool = Field(
+        description="False while a concurrent build or rebuild is in progress"
+    )
+
+
+class VectorSearchSettings(BaseModel):
+    """Query-time recall/latency knobs. Unset values keep the server defaults."""
+
+    ef_search: int | None = Field(
+        default=None, ge=1, le=1000, description="HNSW: candidate list size per query"
+    )
+    probes: int | None = Field(
+        default=None, ge=1, description="IVFFlat: lists scanned per query"
+    )
+    quantization: VectorQuantization | None = Field(
+        default=None,
+        description="Search the quantized index and rescore on full precision",
+    )
+    rescore_factor: int = Field(
+        default=4,
+        ge=1,
+        description="Quantized candidates fetched per requested result",
+    )
+
+    def is_default(self) -> bool:
+        return (
+            self.ef_search is None and self.probes is None and self.quantization is None
+        )
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class WorkspaceSnapshot(BaseModel):
+    """Contents of a workspace snapshot archive (its manifest)."""
+
+    format_version: int = Field(description="Archive layout version")
+    working_dir: str = Field(description="Workspace directory it was exported from")
+    workspace: str = Field(description="Storage workspace key of the source")
+    embedding_model: str = Field(description="Model the vectors were embedded with")
+    embedding_dim: int = Field(description="Dimension of the stored vectors")
+    tables: dict[str, int] = Field(
+        default_factory=dict, description="Rows per storage table"
+    )
+    columns: dict[str, list[str]] = Field(
+        default_factory=dict, description="Exported columns per storage table"
+    )
+    nodes: int = Field(default=0, description="Knowledge-graph nodes")
+    edges: int = Field(default=0, description="Knowledge-graph edges")
+    created_at: datetime = Field(description="Export time")
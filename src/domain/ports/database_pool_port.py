@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class DatabasePoolPort(ABC):
+    """Port for the service's own database connection pool."""
+
+    @abstractmethod
+    async def ping(self) -> None:
+        """Run a trivial query; raise if the database cannot be reached."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return pool usage: ``open``, ``size``, ``idle``, ``in_use``, ``max_size``."""
+        pass
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
+
+
+class DocumentLockPort(ABC):
+    """Port interface for coordinating indexing of the same document."""
+
+    @abstractmethod
+    def hold(
+        self, working_dir: str, object_key: str, content_hash: str
+    ) -> AbstractAsyncContextManager[bool]:
+        """
+        Hold the indexing lock for one version of a document in a workspace.
+
+        Args:
+            working_dir: RAG workspace directory the document is indexed into.
+            object_key: Object key of the document in storage.
+            content_hash: Hash of the document content.
+
+        Returns:
+            An async context manager yielding True when the caller owns the
+            lock and should index the document, or False when the same
+            document is already being indexed elsewhere.
+        """
+        pass
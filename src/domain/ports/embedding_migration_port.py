@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from domain.entities.embedding_migration import EmbeddingMigrationMode
+
+
+class EmbeddingMigrationPort(ABC):
+    """Port interface for copying a workspace's vectors to another dimension."""
+
+    @abstractmethod
+    async def copy_workspace(
+        self,
+        working_dir: str,
+        source_dim: int,
+        target_dim: int,
+        mode: EmbeddingMigrationMode,
+        on_progress: Callable[[str, int], None] | None = None,
+    ) -> dict[str, int]:
+        """
+        Write the workspace's vectors into the target-dimension storage while
+        the source keeps serving queries. Writes made to the source while the
+        copy runs are caught up before returning.
+
+        Args:
+            working_dir: RAG workspace directory.
+            source_dim: Dimension currently stored and served.
+            target_dim: Dimension to write.
+            mode: Truncate the stored vectors or re-embed their content.
+            on_progress: Called with (table, rows written so far) per batch.
+
+        Returns:
+            Rows written per target table.
+        """
+        pass
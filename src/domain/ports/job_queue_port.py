@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from domain.entities.indexing_job import IndexingJob, IndexingJobType
+
+
+class JobQueuePort(ABC):
+    """Port interface for a durable queue of indexing jobs."""
+
+    @abstractmethod
+    async def enqueue(
+        self, job_type: IndexingJobType, working_dir: str, payload: dict[str, Any]
+    ) -> IndexingJob:
+        """
+        Persist a new job in the queued state.
+
+        Args:
+            job_type: Kind of indexing work.
+            working_dir: RAG workspace directory the job indexes into.
+            payload: Request body needed to run the job.
+
+        Returns:
+            The queued job.
+        """
+        pass
+
+    @abstractmethod
+    async def claim(self, worker_id: str) -> IndexingJob | None:
+        """
+        Atomically claim the oldest runnable job for a worker.
+
+        Args:
+            worker_id: Identifier of the claiming worker.
+
+        Returns:
+            The claimed job, or None if the queue is empty.
+        """
+        pass
+
+    @abstractmethod
+    async def heartbeat(self, job_id: str, worker_id: str) -> None:
+        """Extend the lease of a running job still held by ``worker_id``."""
+        pass
+
+    @abstractmethod
+    async def complete(
+        self, job_id: str, worker_id: str, result: dict[str, Any]
+    ) -> None:
+        """Mark a job held by ``worker_id`` as succeeded and store its result."""
+        pass
+
+    @abstractmethod
+    async def fail(self, job_id: str, worker_id: str, error: str) -> None:
+        """Mark a job held by ``worker_id`` as failed, or requeue it if attempts remain."""
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: str) -> IndexingJob | None:
+        """Return a job by id, or None if it does not exist."""
+        pass
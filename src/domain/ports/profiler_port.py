@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
+
+
+class ProfilerPort(ABC):
+    """Port interface for profiling a single request or indexing job on demand."""
+
+    @abstractmethod
+    def profile_key(self, name: str) -> str:
+        """
+        Object key the profile named ``name`` is stored under.
+
+        Args:
+            name: Name of the profiled operation, e.g. ``jobs/<job_id>``.
+
+        Returns:
+            The object key, including the extension of the profile format.
+        """
+        pass
+
+    @abstractmethod
+    def profile(self, key: str) -> AbstractAsyncContextManager[None]:
+        """
+        Profile the code run inside the context and store the profile.
+
+        Args:
+            key: Object key to store the profile under, from ``profile_key``.
+
+        Returns:
+            An async context manager. The profile is stored when it exits,
+            whether or not the profiled code raised.
+        """
+        pass
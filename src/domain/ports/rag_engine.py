@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from application.requests.query_request import MultimodalContentItem
+from domain.entities.document_deletion import DocumentDeletionResult
 from domain.entities.indexing_result import FileIndexingResult, FolderIndexingResult
 
 
@@ -18,6 +19,28 @@ class RAGEnginePort(ABC):
     ) -> FileIndexingResult:
         pass
 
+    @abstractmethod
+    async def replace_document(
+        self, file_path: str, file_name: str, output_dir: str, working_dir: str = ""
+    ) -> FileIndexingResult:
+        """Index a new version of a file and remove the previous versions.
+
+        Only chunks the previous versions do not have are embedded and sent
+        through entity extraction; chunks that disappeared are deleted.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_document(
+        self, file_name: str, working_dir: str = "", delete_llm_cache: bool = True
+    ) -> DocumentDeletionResult:
+        """Remove a file's chunks, vectors and graph contributions.
+
+        Entities and relations shared with other documents are rebuilt from
+        the remaining documents; the rest are dropped.
+        """
+        pass
+
     @abstractmethod
     async def index_folder(
         self,
@@ -31,8 +54,26 @@ class RAGEnginePort(ABC):
 
     @abstractmethod
     async def query(
-        self, query: str, mode: str = "naive", top_k: int = 10, working_dir: str = ""
+        self,
+        query: str,
+        mode: str = "naive",
+        top_k: int = 10,
+        working_dir: str = "",
+        hl_keywords: list[str] | None = None,
+        ll_keywords: list[str] | None = None,
+        diversity: float | None = None,
+        dedup_threshold: float | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
     ) -> dict:
+        """Retrieve context for a query.
+
+        ``hl_keywords``/``ll_keywords`` are used instead of LLM keyword
+        extraction in graph modes when either is non-empty. ``dedup_threshold``
+        drops chunks at least that similar to a better-ranked chunk;
+        ``diversity`` (0-1) reorders chunks by maximal marginal relevance.
+        ``ef_search``/``probes`` override the ANN search settings for this query.
+        """
         pass
 
     @abstractmethod
@@ -45,3 +86,31 @@ class RAGEnginePort(ABC):
         working_dir: str = "",
     ) -> str:
         pass
+
+    @abstractmethod
+    async def embedding_dim(self, working_dir: str) -> int:
+        """Dimension of the vectors stored and searched for a workspace.
+
+        Includes cutovers recorded by other processes.
+        """
+        pass
+
+    @abstractmethod
+    async def set_embedding_dim(self, working_dir: str, dim: int) -> None:
+        """Serve a workspace from vectors of ``dim`` dimensions from now on.
+
+        Used to cut over after its vectors were migrated. The dimension is
+        recorded for every process sharing the storage; each rebuilds the
+        workspace's engine on next use.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Report load on the engine.
+
+        Returns a dict with ``engines`` (initialized workspaces), ``indexing``
+        (``running``, ``waiting``, ``max_concurrency``) and ``llm`` (the same
+        keys for LLM calls).
+        """
+        pass
@@ -37,3 +37,50 @@ class StoragePort(ABC):
             A list of object keys matching the prefix.
         """
         pass
+
+    @abstractmethod
+    async def upload_file(self, bucket: str, object_path: str, file_path: str) -> None:
+        """
+        Stream a local file to storage.
+
+        Args:
+            bucket: The bucket to write to.
+            object_path: The path/key of the object within the bucket.
+            file_path: The local file to upload.
+        """
+        pass
+
+    @abstractmethod
+    async def download_file(
+        self, bucket: str, object_path: str, file_path: str
+    ) -> None:
+        """
+        Stream an object to a local file.
+
+        Args:
+            bucket: The bucket name where the object is stored.
+            object_path: The path/key of the object within the bucket.
+            file_path: The local file to write.
+
+        Raises:
+            FileNotFoundError: If the object does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def ping(self, bucket: str) -> None:
+        """
+        Check that storage is reachable and the bucket exists.
+
+        Args:
+            bucket: The bucket the service reads from.
+
+        Raises:
+            FileNotFoundError: If the bucket does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        """Release the adapter's connections at shutdown."""
+        pass
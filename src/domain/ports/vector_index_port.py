@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+
+from domain.entities.vector_index import VectorIndex, VectorIndexMethod, VectorIndexSpec
+
+
+class VectorIndexPort(ABC):
+    """Port interface for the lifecycle of per-workspace ANN vector indexes."""
+
+    @abstractmethod
+    async def list_indexes(self, working_dir: str) -> list[VectorIndex]:
+        """Return the managed indexes of a workspace, across its vector tables."""
+        pass
+
+    @abstractmethod
+    async def create_indexes(
+        self, working_dir: str, spec: VectorIndexSpec
+    ) -> list[str]:
+        """
+        Build an index of ``spec.method`` on every vector table holding rows
+        for the workspace, without blocking writes.
+
+        Args:
+            working_dir: RAG workspace directory.
+            spec: Index type and build parameters.
+
+        Returns:
+            Names of the indexes built (existing ones are left unchanged).
+        """
+        pass
+
+    @abstractmethod
+    async def rebuild_indexes(
+        self, working_dir: str, method: VectorIndexMethod | None = None
+    ) -> list[str]:
+        """Rebuild the workspace's indexes (optionally of one type) without blocking writes."""
+        pass
+
+    @abstractmethod
+    async def drop_indexes(
+        self, working_dir: str, method: VectorIndexMethod | None = None
+    ) -> list[str]:
+        """Drop the workspace's indexes (optionally of one type) and return their names."""
+        pass
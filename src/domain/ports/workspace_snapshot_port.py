@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from domain.entities.workspace_snapshot import WorkspaceSnapshot
+
+
+class WorkspaceSnapshotPort(ABC):
+    """Port interface for dumping and restoring a workspace's indexed data."""
+
+    @abstractmethod
+    async def export_workspace(
+        self,
+        working_dir: str,
+        archive_path: Path,
+        embedding_model: str,
+        embedding_dim: int,
+    ) -> WorkspaceSnapshot:
+        """
+        Write the workspace's KV, vector, doc-status and graph data to a
+        compressed archive.
+
+        Args:
+            working_dir: RAG workspace directory to export.
+            archive_path: Local file the archive is written to.
+            embedding_model: Model the workspace's vectors come from.
+            embedding_dim: Dimension of the workspace's vectors.
+
+        Returns:
+            The snapshot manifest stored in the archive.
+        """
+        pass
+
+    @abstractmethod
+    async def read_snapshot(self, archive_path: Path) -> WorkspaceSnapshot:
+        """Return the manifest of an archive without restoring it."""
+        pass
+
+    @abstractmethod
+    async def import_workspace(
+        self, archive_path: Path, working_dir: str
+    ) -> WorkspaceSnapshot:
+        """
+        Restore an archive's data under another workspace directory.
+
+        Args:
+            archive_path: Archive written by ``export_workspace``.
+            working_dir: RAG workspace directory to restore into.
+
+        Returns:
+            The snapshot manifest.
+        """
+        pass
+
+    @abstractmethod
+    async def has_data(self, working_dir: str) -> bool:
+        """Whether any storage table already holds rows for the workspace."""
+        pass
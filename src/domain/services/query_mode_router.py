@@ -0,0 +1,73 @@
+"""Heuristic retrieval-mode selection for ``mode="auto"`` queries.
+
+Graph modes cost an LLM keyword-extraction call plus graph traversal, so
+``auto`` only picks them when the query wording asks for something vector
+search over chunks is unlikely to answer: relations between named things
+(``local``), corpus-wide themes (``global``) or both (``hybrid``). Exact
+identifiers and quoted phrases go to ``fusion``, which adds full-text search
+to vector search; anything else goes to ``naive``.
+"""
+
+import re
+from dataclasses import dataclass
+
+_RELATIONAL_PATTERNS = (
+    r"\brelationships?\b",
+    r"\brelated to\b",
+    r"\bconnect(?:ed|ion|ions)?\b",
+    r"\bbetween\b.+\band\b",
+    r"\bcompare[sd]?\b",
+    r"\bcomparison\b",
+    r"\bdifferences?\b",
+    r"\bvs\.?\b",
+    r"\bversus\b",
+    r"\b(?:affect|affects|impact|impacts|influence|influences|depend|depends)\b",
+    r"\bwho (?:works?|worked) (?:with|for)\b",
+)
+_THEMATIC_PATTERNS = (
+    r"\boverall\b",
+    r"\boverview\b",
+    r"\bsummar(?:y|ize|ise|izing|ising)\b",
+    r"\bmain (?:themes?|topics?|ideas?|points?|findings?|conclusions?)\b",
+    r"\bkey (?:themes?|topics?|ideas?|points?|findings?|takeaways?)\b",
+    r"\bacross (?:all|the) (?:documents?|files?|reports?)\b",
+    r"\btrends?\b",
+    r"\bbig picture\b",
+)
+_RELATIONAL = re.compile("|".join(_RELATIONAL_PATTERNS), re.IGNORECASE)
+_THEMATIC = re.compile("|".join(_THEMATIC_PATTERNS), re.IGNORECASE)
+# Quoted phrases, code-like tokens (snake_case, CamelCase, dotted names,
+# file names) and reference numbers are exact lookups.
+_EXACT_LOOKUP = re.compile(
+    r"[\"`][^\"`]+[\"`]"
+    r"|(?<!\w)'[^']+'(?!\w)"
+    r"|\b\w+_\w+\b"
+    r"|\b[A-Za-z][a-z]+[A-Z]\w*\b"
+    r"|\b\w+\.\w{2,4}\b"
+    r"|\b[A-Z]{2,}-?\d+\b"
+)
+
+
+@dataclass(frozen=True)
+class QueryModeDecision:
+    """Retrieval mode chosen for a query and the heuristic that chose it."""
+
+    mode: str
+    reason: str
+
+
+def choose_query_mode(query: str) -> QueryModeDecision:
+    """Pick the cheapest retrieval mode likely to answer ``query`` well."""
+    text = query.strip()
+    if _EXACT_LOOKUP.search(text):
+        return QueryModeDecision("fusion", "exact lookup")
+
+    relational = bool(_RELATIONAL.search(text))
+    thematic = bool(_THEMATIC.search(text))
+    if relational and thematic:
+        return QueryModeDecision("hybrid", "relational and thematic")
+    if relational:
+        return QueryModeDecision("local", "relational")
+    if thematic:
+        return QueryModeDecision("global", "thematic")
+    return QueryModeDecision("naive", "default")
@@ -0,0 +1,242 @@
+import logging
+import re
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from domain.entities.embedding_migration import EmbeddingMigrationMode
+from domain.ports.embedding_migration_port import EmbeddingMigrationPort
+from infrastructure.database.postgres_pool import PostgresPool
+from infrastructure.rag.matryoshka import collection_suffix, truncate_embeddings
+
+logger = logging.getLogger(__name__)
+
+# LightRAG's vector tables; a reduced dimension lives in <table>_<model>_<dim>d.
+VECTOR_TABLES = ("lightrag_vdb_chunks", "lightrag_vdb_entity", "lightrag_vdb_relation")
+
+_COLUMNS_SQL = """
+SELECT column_name, udt_name
+FROM information_schema.columns
+WHERE table_schema = current_schema() AND table_name = $1
+ORDER BY ordinal_position
+"""
+
+_IDENTIFIER = re.compile(r"^[a-z0-9_]+$")
+
+
+class PgEmbeddingMigrator(EmbeddingMigrationPort):
+    """Copies a workspace's rows between LightRAG's per-dimension vector tables.
+
+    The target table is created like the source (columns and defaults, no
+    indexes: LightRAG creates its own vector index when it first opens the
+    table) and filled in keyset-paginated batches. ``truncate`` rewrites the
+    stored vectors in SQL with ``l2_normalize(subvector(...))``; ``reembed``
+    sends each batch's ``content`` to ``embed`` and truncates the result.
+
+    Queries keep reading the source table throughout. After the first pass,
+    rows updated since it started are copied again and rows deleted from the
+    source are deleted from the target, so the target matches the source at
+    cutover up to writes made during the catch-up itself. Source rows are
+    never deleted, which keeps a rollback to the old dimension possible.
+    """
+
+    def __init__(
+        self,
+        pool: PostgresPool,
+        workspace_for: Callable[[str], str],
+        model_name: str,
+        model_dim: int,
+        embed: Callable[[list[str]], Awaitable[Any]] | None = None,
+        batch_size: int = 500,
+    ) -> None:
+        self._pool = pool
+        self._workspace_for = workspace_for
+        self._model_name = model_name
+        self._model_dim = model_dim
+        self._embed = embed
+        self._batch_size = batch_size
+
+    def table_name(self, base: str, dim: int) -> str:
+        """LightRAG's table for ``base`` at ``dim`` dimensions."""
+        if dim >= self._model_dim:
+            return base
+        return f"{base}_{collection_suffix(self._model_name, dim)}".lower()
+
+    async def copy_workspace(
+        self,
+        working_dir: str,
+        source_dim: int,
+        target_dim: int,
+        mode: EmbeddingMigrationMode,
+        on_progress: Callable[[str, int], None] | None = None,
+    ) -> dict[str, int]:
+        if mode is EmbeddingMigrationMode.REEMBED and self._embed is None:
+            raise ValueError("Re-embedding requires an embedding function")
+        if target_dim >= source_dim:
+            raise ValueError(
+                f"Cannot migrate from {source_dim} to {target_dim} dimensions; "
+                "only reducing the dimension is supported"
+            )
+        workspace = self._workspace_for(working_dir)
+        copied: dict[str, int] = {}
+        for base in VECTOR_TABLES:
+            source = self.table_name(base, source_dim)
+            target = self.table_name(base, target_dim)
+            if not (_IDENTIFIER.match(source) and _IDENTIFIER.match(target)):
+                raise ValueError(f"Unsupported table name: {source!r} -> {target!r}")
+            async with self._pool.acquire() as connection:
+                columns = dict(await connection.fetch(_COLUMNS_SQL, source))
+                if not columns:
+                    continue
+                await self._create_target(
+                    connection, source, target, columns, target_dim
+                )
+                started = await connection.fetchval("SELECT now()")
+
+            def progress(rows: int, table: str = target) -> None:
+                if on_progress is not None:
+                    on_progress(table, rows)
+
+            logger.info(f"Copying {workspace} vectors from {source} to {target}")
+            rows = await self._copy(
+                workspace, source, target, columns, target_dim, mode, None, progress
+            )
+            if "update_time" in columns:
+                rows += await self._copy(
+                    workspace,
+                    source,
+                    target,
+                    columns,
+                    target_dim,
+                    mode,
+                    started,
+                    lambda n, first=rows: progress(first + n),
+                )
+            async with self._pool.acquire() as connection:
+                await connection.execute(
+                    f"DELETE FROM {target} t WHERE t.workspace = $1 AND NOT EXISTS "
+                    f"(SELECT 1 FROM {source} s "
+                    "WHERE s.workspace = t.workspace AND s.id = t.id)",
+                    workspace,
+                )
+            copied[target] = rows
+        return copied
+
+    @staticmethod
+    async def _create_target(
+        connection: Any,
+        source: str,
+        target: str,
+        columns: dict[str, str],
+        dim: int,
+    ) -> None:
+        exists = await connection.fetchval("SELECT to_regclass($1)", target)
+        if exists is not None:
+            return
+        vector_type = columns.get("content_vector", "vector")
+        async with connection.transaction():
+            await connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {target} "
+                f"(LIKE {source} INCLUDING DEFAULTS)"
+            )
+            await connection.execute(
+                f"ALTER TABLE {target} "
+                f"ALTER COLUMN content_vector TYPE {vector_type}({dim}), "
+                "ADD PRIMARY KEY (workspace, id)"
+            )
+
+    async def _copy(
+        self,
+        workspace: str,
+        source: str,
+        target: str,
+        columns: dict[str, str],
+        dim: int,
+        mode: EmbeddingMigrationMode,
+        updated_since: Any,
+        on_progress: Callable[[int], None],
+    ) -> int:
+        """Copy the workspace's rows (or those updated since) in id order."""
+        names = list(columns)
+        vector_type = f"{columns.get('content_vector', 'vector')}({dim})"
+        updates = ", ".join(
+            f"{name} = EXCLUDED.{name}"
+            for name in names
+            if name not in ("workspace", "id")
+        )
+        upsert = f"ON CONFLICT (workspace, id) DO UPDATE SET {updates}"
+        since = " AND update_time >= $4" if updated_since is not None else ""
+        batch = (
+            f"SELECT * FROM {source} WHERE workspace = $1 AND id > $2{since} "
+            "ORDER BY id LIMIT $3"
+        )
+        params = [updated_since] if updated_since is not None else []
+        last_id = ""
+        total = 0
+        while True:
+            if mode is EmbeddingMigrationMode.TRUNCATE:
+                values = ", ".join(
+                    f"l2_normalize(subvector(content_vector, 1, {dim}))::{vector_type}"
+                    if name == "content_vector"
+                    else name
+                    for name in names
+                )
+                # The last id comes from PostgreSQL so the next page follows
+                # the index's collation order.
+                async with self._pool.acquire() as connection:
+                    last, written = await connection.fetchrow(
+                        f"WITH batch AS ({batch}), written AS ("
+                        f"INSERT INTO {target} ({', '.join(names)}) "
+                        f"SELECT {values} FROM batch {upsert} RETURNING id) "
+                        "SELECT (SELECT max(id) FROM batch), "
+                        "(SELECT count(*) FROM written)",
+                        workspace,
+                        last_id,
+                        self._batch_size,
+                        *params,
+                    )
+            else:
+                async with self._pool.acquire() as connection:
+                    rows = await connection.fetch(
+                        batch, workspace, last_id, self._batch_size, *params
+                    )
+                last = rows[-1]["id"] if rows else None
+                written = len(rows)
+                if rows:
+                    await self._reembed(rows, target, names, vector_type, dim, upsert)
+            if not written:
+                return total
+            total += written
+            last_id = last
+            on_progress(total)
+
+    async def _reembed(
+        self,
+        rows: list[Any],
+        target: str,
+        names: list[str],
+        vector_type: str,
+        dim: int,
+        upsert: str,
+    ) -> None:
+        embeddings = truncate_embeddings(
+            await self._embed([row["content"] or "" for row in rows]), dim
+        )
+        placeholders = ", ".join(
+            f"${i}::{vector_type}" if name == "content_vector" else f"${i}"
+            for i, name in enumerate(names, start=1)
+        )
+        records = [
+            [
+                "[" + ",".join(map(str, vector.tolist())) + "]"
+                if name == "content_vector"
+                else row[name]
+                for name in names
+            ]
+            for row, vector in zip(rows, embeddings, strict=True)
+        ]
+        async with self._pool.acquire() as connection:
+            await connection.executemany(
+                f"INSERT INTO {target} ({', '.join(names)}) "
+                f"VALUES ({placeholders}) {upsert}",
+                records,
+            )
@@ -0,0 +1,295 @@
+import asyncio
+import json
+import logging
+import re
+import tarfile
+import tempfile
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from domain.entities.workspace_snapshot import WorkspaceSnapshot
+from domain.ports.workspace_snapshot_port import WorkspaceSnapshotPort
+from infrastructure.database.postgres_pool import PostgresPool
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+# Every LightRAG table keyed by workspace: KV stores, doc status and the
+# vector tables of each dimension.
+_TABLES_SQL = """
+SELECT table_name, array_agg(column_name::text ORDER BY ordinal_position) AS columns
+FROM information_schema.columns
+WHERE table_schema = current_schema() AND table_name LIKE 'lightrag\\_%'
+GROUP BY table_name
+HAVING bool_or(column_name = 'workspace')
+ORDER BY table_name
+"""
+
+_IDENTIFIER = re.compile(r"^[a-z0-9_]+$")
+_MANIFEST = "manifest.json"
+_NODES = "graph/nodes.jsonl"
+_EDGES = "graph/edges.jsonl"
+_GRAPH_BATCH = 500
+
+# LightRAG's PGGraphStorage.get_all_nodes / get_all_edges, run on the
+# export's own connection so the graph is read in the same snapshot as the
+# tables.
+_NODES_SQL = "SELECT properties::text AS properties FROM {graph}.base"
+_EDGES_SQL = """
+SELECT DISTINCT
+    (ag_catalog.agtype_access_operator(
+        VARIADIC ARRAY[a.properties, '"entity_id"'::agtype]))::text AS source,
+    (ag_catalog.agtype_access_operator(
+        VARIADIC ARRAY[b.properties, '"entity_id"'::agtype]))::text AS target,
+    r.properties::text AS properties
+FROM {graph}."DIRECTED" r
+JOIN {graph}.base a ON r.start_id = a.id
+JOIN {graph}.base b ON r.end_id = b.id
+"""
+
+
+def _agtype_text(value: Any) -> Any:
+    """Edge endpoints come back as agtype text, i.e. with JSON quotes."""
+    if isinstance(value, str) and value.startswith('"'):
+        return json.loads(value)
+    return value
+
+
+class PgWorkspaceSnapshotter(WorkspaceSnapshotPort):
+    """Workspace snapshots of LightRAG's PostgreSQL storage.
+
+    Each ``lightrag_*`` table's rows for the workspace are dumped with binary
+    ``COPY`` and restored by copying into a temporary table, rewriting
+    ``workspace`` and inserting, so a clone costs about as much as reading
+    and writing its rows. The Apache AGE graph cannot be copied the same way
+    (its vertex and edge ids encode per-graph label ids), so nodes and edges
+    are exported through LightRAG's graph storage and upserted into the
+    target workspace's graph. An export reads the tables and the graph in
+    one read-only repeatable-read transaction, so it is a consistent
+    snapshot even while the workspace is being indexed.
+
+    The archive is a gzipped tar holding ``manifest.json``, one
+    ``tables/<table>.copy`` per table and the graph as JSON lines.
+    """
+
+    def __init__(
+        self,
+        pool: PostgresPool,
+        workspace_for: Callable[[str], str],
+        graph_for: Callable[[str], Awaitable[Any]],
+    ) -> None:
+        self._pool = pool
+        self._workspace_for = workspace_for
+        self._graph_for = graph_for
+
+    def _workspace(self, working_dir: str) -> str:
+        workspace = self._workspace_for(working_dir)
+        if not _IDENTIFIER.match(workspace):
+            raise ValueError(f"Unsupported workspace name: {workspace!r}")
+        return workspace
+
+    async def _tables(self, connection: Any) -> dict[str, list[str]]:
+        return {
+            table: list(columns)
+            for table, columns in await connection.fetch(_TABLES_SQL)
+            if _IDENTIFIER.match(table)
+        }
+
+    async def _read_graph(
+        self, connection: Any, graph_name: str
+    ) -> tuple[list[dict], list[dict]]:
+        if not _IDENTIFIER.match(graph_name.lower()):
+            raise ValueError(f"Unsupported graph name: {graph_name!r}")
+        nodes = []
+        for row in await connection.fetch(_NODES_SQL.format(graph=graph_name)):
+            node = json.loads(row["properties"])
+            node["id"] = node.get("entity_id")
+            nodes.append(node)
+        edges = []
+        for row in await connection.fetch(_EDGES_SQL.format(graph=graph_name)):
+            edge = json.loads(row["properties"]) if row["properties"] else {}
+            edge["source"] = _agtype_text(row["source"])
+            edge["target"] = _agtype_text(row["target"])
+            edges.append(edge)
+        return nodes, edges
+
+    async def export_workspace(
+        self,
+        working_dir: str,
+        archive_path: Path,
+        embedding_model: str,
+        embedding_dim: int,
+    ) -> WorkspaceSnapshot:
+        workspace = self._workspace(working_dir)
+        snapshot = WorkspaceSnapshot(
+            format_version=SNAPSHOT_FORMAT,
+            working_dir=working_dir,
+            workspace=workspace,
+            embedding_model=embedding_model,
+            embedding_dim=embedding_dim,
+            created_at=datetime.now(UTC),
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "tables").mkdir()
+            (root / "graph").mkdir()
+            graph = await self._graph_for(working_dir)
+            async with (
+                self._pool.acquire() as connection,
+                connection.transaction(isolation="repeatable_read", readonly=True),
+            ):
+                for table, columns in (await self._tables(connection)).items():
+                    status = await connection.copy_from_query(
+                        f"SELECT {', '.join(columns)} FROM {table} WHERE workspace = $1",
+                        workspace,
+                        output=str(root / "tables" / f"{table}.copy"),
+                        format="binary",
+                    )
+                    rows = int(status.split()[-1])
+                    if rows:
+                        snapshot.tables[table] = rows
+                        snapshot.columns[table] = columns
+                    else:
+                        (root / "tables" / f"{table}.copy").unlink()
+                nodes, edges = await self._read_graph(connection, graph.graph_name)
+            snapshot.nodes, snapshot.edges = len(nodes), len(edges)
+            await asyncio.to_thread(_write_jsonl, root / _NODES, nodes)
+            await asyncio.to_thread(_write_jsonl, root / _EDGES, edges)
+            (root / _MANIFEST).write_text(snapshot.model_dump_json(indent=2))
+            await asyncio.to_thread(_pack, root, archive_path)
+        logger.info(
+            f"Exported {working_dir}: {sum(snapshot.tables.values())} rows, "
+            f"{snapshot.nodes} nodes, {snapshot.edges} edges"
+        )
+        return snapshot
+
+    async def read_snapshot(self, archive_path: Path) -> WorkspaceSnapshot:
+        return await asyncio.to_thread(_read_manifest, archive_path)
+
+    async def import_workspace(
+        self, archive_path: Path, working_dir: str
+    ) -> WorkspaceSnapshot:
+        workspace = self._workspace(working_dir)
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            await asyncio.to_thread(_unpack, archive_path, root)
+            snapshot = WorkspaceSnapshot.model_validate_json(
+                (root / _MANIFEST).read_text()
+            )
+            if snapshot.format_version != SNAPSHOT_FORMAT:
+                raise ValueError(
+                    f"Unsupported snapshot format {snapshot.format_version}"
+                )
+            # Opening the graph initializes the target's LightRAG storages,
+            # which creates any table missing from this database.
+            graph = await self._graph_for(working_dir)
+            async with self._pool.acquire() as connection:
+                existing = await self._tables(connection)
+                for table, columns in snapshot.columns.items():
+                    if table not in existing:
+                        raise ValueError(f"Table {table} does not exist")
+                    await self._restore_table(
+                        connection,
+                        table,
+                        columns,
+                        root / "tables" / f"{table}.copy",
+                        workspace,
+                    )
+            nodes = await asyncio.to_thread(_read_jsonl, root / _NODES)
+            for start in range(0, len(nodes), _GRAPH_BATCH):
+                await graph.upsert_nodes_batch(
+                    [
+                        (
+                            node["entity_id"],
+                            {k: v for k, v in node.items() if k != "id"},
+                        )
+                        for node in nodes[start : start + _GRAPH_BATCH]
+                    ]
+                )
+            edges = await asyncio.to_thread(_read_jsonl, root / _EDGES)
+            for start in range(0, len(edges), _GRAPH_BATCH):
+                await graph.upsert_edges_batch(
+                    [
+                        (edge.pop("source"), edge.pop("target"), edge)
+                        for edge in edges[start : start + _GRAPH_BATCH]
+                    ]
+                )
+            await graph.index_done_callback()
+        logger.info(
+            f"Imported snapshot of {snapshot.working_dir} into {working_dir}: "
+            f"{sum(snapshot.tables.values())} rows, {snapshot.nodes} nodes, "
+            f"{snapshot.edges} edges"
+        )
+        return snapshot
+
+    @staticmethod
+    async def _restore_table(
+        connection: Any,
+        table: str,
+        columns: list[str],
+        source: Path,
+        workspace: str,
+    ) -> None:
+        names = ", ".join(columns)
+        async with connection.transaction():
+            await connection.execute(
+                f"CREATE TEMP TABLE snapshot_rows (LIKE {table}) ON COMMIT DROP"
+            )
+            await connection.copy_to_table(
+                "snapshot_rows", source=str(source), columns=columns, format="binary"
+            )
+            await connection.execute(
+                "UPDATE snapshot_rows SET workspace = $1", workspace
+            )
+            await connection.execute(
+                f"INSERT INTO {table} ({names}) SELECT {names} FROM snapshot_rows "
+                "ON CONFLICT DO NOTHING"
+            )
+
+    async def has_data(self, working_dir: str) -> bool:
+        workspace = self._workspace(working_dir)
+        async with self._pool.acquire() as connection:
+            for table in await self._tables(connection):
+                if await connection.fetchval(
+                    f"SELECT EXISTS (SELECT 1 FROM {table} WHERE workspace = $1)",
+                    workspace,
+                ):
+                    return True
+        return False
+
+
+def _write_jsonl(path: Path, items: list[dict]) -> None:
+    with path.open("w") as f:
+        for item in items:
+            f.write(json.dumps(item, default=str) + "\n")
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    with path.open() as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _pack(root: Path, archive_path: Path) -> None:
+    with tarfile.open(archive_path, "w:gz", compresslevel=6) as tar:
+        for path in sorted(root.rglob("*")):
+            if path.is_file():
+                tar.add(path, arcname=str(path.relative_to(root)))
+
+
+def _unpack(archive_path: Path, root: Path) -> None:
+    with tarfile.open(archive_path, "r:gz") as tar:
+        tar.extractall(root, filter="data")
+
+
+def _read_manifest(archive_path: Path) -> WorkspaceSnapshot:
+    with tarfile.open(archive_path, "r:gz") as tar:
+        try:
+            member = tar.extractfile(_MANIFEST)
+        except KeyError:
+            member = None
+        if member is None:
+            raise ValueError(f"{archive_path} is not a workspace snapshot")
+        return WorkspaceSnapshot.model_validate_json(member.read())
@@ -0,0 +1,250 @@
+import hashlib
+import logging
+import math
+import re
+from collections.abc import Callable
+from typing import Any
+
+from domain.entities.vector_index import (
+    VectorIndex,
+    VectorIndexMethod,
+    VectorIndexSpec,
+    VectorQuantization,
+)
+from domain.ports.vector_index_port import VectorIndexPort
+from infrastructure.database.postgres_pool import PostgresPool
+
+logger = logging.getLogger(__name__)
+
+_VECTOR_TABLES_SQL = """
+SELECT table_name, udt_name
+FROM information_schema.columns
+WHERE table_schema = current_schema()
+  AND column_name = 'content_vector'
+  AND table_name LIKE 'lightrag\\_vdb\\_%'
+ORDER BY table_name
+"""
+
+_LIST_SQL = """
+SELECT i.indexname AS name,
+       i.tablename AS "table",
+       i.indexdef AS definition,
+       pg_relation_size(x.indexrelid) AS size_bytes,
+       x.indisvalid AS valid
+FROM pg_indexes i
+JOIN pg_class c
+  ON c.relname = i.indexname AND c.relnamespace = i.schemaname::regnamespace
+JOIN pg_index x ON x.indexrelid = c.oid
+WHERE i.schemaname = current_schema() AND starts_with(i.indexname, $1)
+ORDER BY i.indexname
+"""
+
+_MANAGED_INDEX_SQL = """
+SELECT EXISTS (
+    SELECT 1 FROM pg_indexes
+    WHERE schemaname = current_schema()
+      AND tablename = $1
+      AND starts_with(indexname, $2)
+)
+"""
+
+# pgvector guidance for IVFFlat: rows / 1000 lists up to 1M rows, sqrt(rows) above.
+_IVFFLAT_SQRT_ABOVE = 1_000_000
+_IDENTIFIER = re.compile(r"^[a-z0-9_]+$")
+_COLUMN_TYPES = frozenset({"vector", "halfvec"})
+# Operator class used to index, and distance operator used to search, each
+# quantized representation.
+QUANTIZED_OPERATORS = {
+    VectorQuantization.HALFVEC: ("halfvec_cosine_ops", "<=>"),
+    VectorQuantization.BINARY: ("bit_hamming_ops", "<~>"),
+}
+
+
+def quantized_expression(value: str, quantization: VectorQuantization, dim: int) -> str:
+    """SQL for the quantized form of ``value``.
+
+    Index definitions and queries must both use this so PostgreSQL matches
+    the query's ORDER BY to the expression index.
+    """
+    if quantization is VectorQuantization.HALFVEC:
+        return f"({value})::halfvec({dim})"
+    return f"binary_quantize({value})::bit({dim})"
+
+
+def index_prefix(workspace: str) -> str:
+    """Name prefix of every index managed for ``workspace``."""
+    return f"vidx_{workspace}_"
+
+
+async def has_managed_index(connection: Any, table: str, workspace: str) -> bool:
+    """Whether ``table`` has a partial index managed for ``workspace``."""
+    return await connection.fetchval(
+        _MANAGED_INDEX_SQL, table.lower(), index_prefix(workspace)
+    )
+
+
+def ivfflat_lists(rows: int) -> int:
+    """Default number of IVFFlat lists for a workspace with ``rows`` vectors."""
+    if rows > _IVFFLAT_SQRT_ABOVE:
+        return int(math.sqrt(rows))
+    return max(1, rows // 1000)
+
+
+class PgVectorIndexManager(VectorIndexPort):
+    """Per-workspace pgvector indexes on LightRAG's ``lightrag_vdb_*`` tables.
+
+    LightRAG builds one HNSW index per vector table shared by every
+    workspace. Filtering that index on ``workspace`` happens after the ANN
+    scan, so a large table returns fewer than top_k rows, or slow exact scans,
+    for a given workspace. This manager adds partial indexes
+    (``WHERE workspace = '<ws>'``) that only contain one workspace's vectors.
+    They are named ``vidx_<workspace>_<method>[_<quantization>]_<table
+    hash>``, built and rebuilt ``CONCURRENTLY`` so indexing keeps running,
+    and reported with ``valid = false`` until a build completes.
+
+    A quantized index is an expression index over ``halfvec`` or
+    ``binary_quantize`` of the stored vectors. The table keeps its full-
+    precision column, which ``query_vectors`` uses to rescore candidates, so
+    existing workspaces migrate without rewriting rows.
+    """
+
+    def __init__(
+        self,
+        pool: PostgresPool,
+        workspace_for: Callable[[str], str],
+        hnsw_m: int = 16,
+        hnsw_ef_construction: int = 64,
+        maintenance_work_mem: str | None = None,
+    ) -> None:
+        self._pool = pool
+        self._workspace_for = workspace_for
+        self._hnsw_m = hnsw_m
+        self._hnsw_ef_construction = hnsw_ef_construction
+        self._maintenance_work_mem = maintenance_work_mem
+
+    def _workspace(self, working_dir: str) -> str:
+        workspace = self._workspace_for(working_dir)
+        if not _IDENTIFIER.match(workspace):
+            raise ValueError(f"Unsupported workspace name: {workspace!r}")
+        return workspace
+
+    @staticmethod
+    def index_name(
+        workspace: str,
+        method: VectorIndexMethod,
+        table: str,
+        quantization: VectorQuantization | None = None,
+    ) -> str:
+        digest = hashlib.sha256(table.encode()).hexdigest()[:8]
+        kind = method.value
+        if quantization is not None:
+            kind = f"{kind}_{quantization.value}"
+        return f"{index_prefix(workspace)}{kind}_{digest}"
+
+    async def list_indexes(self, working_dir: str) -> list[VectorIndex]:
+        prefix = index_prefix(self._workspace(working_dir))
+        async with self._pool.acquire() as connection:
+            rows = await connection.fetch(_LIST_SQL, prefix)
+        indexes = []
+        for row in rows:
+            # <method>[_<quantization>]_<table hash>
+            kind = row["name"][len(prefix) :].split("_")[:-1]
+            indexes.append(
+                VectorIndex(
+                    method=VectorIndexMethod(kind[0]),
+                    quantization=VectorQuantization(kind[1]) if len(kind) > 1 else None,
+                    **dict(row),
+                )
+            )
+        return indexes
+
+    async def create_indexes(
+        self, working_dir: str, spec: VectorIndexSpec
+    ) -> list[str]:
+        workspace = self._workspace(working_dir)
+        created: list[str] = []
+        async with self._pool.acquire() as connection:
+            if self._maintenance_work_mem:
+                await connection.execute(
+                    "SELECT set_config('maintenance_work_mem', $1, false)",
+                    self._maintenance_work_mem,
+                )
+            for table, column_type in await connection.fetch(_VECTOR_TABLES_SQL):
+                if not _IDENTIFIER.match(table) or column_type not in _COLUMN_TYPES:
+                    continue
+                rows = await connection.fetchval(
+                    f"SELECT count(*) FROM {table} WHERE workspace = $1", workspace
+                )
+                if not rows:
+                    continue
+                key = f"content_vector {column_type}_cosine_ops"
+                if spec.quantization is not None:
+                    dim = await connection.fetchval(
+                        f"SELECT vector_dims(content_vector) FROM {table} "
+                        "WHERE workspace = $1 LIMIT 1",
+                        workspace,
+                    )
+                    opclass, _ = QUANTIZED_OPERATORS[spec.quantization]
+                    expression = quantized_expression(
+                        "content_vector", spec.quantization, dim
+                    )
+                    key = f"({expression}) {opclass}"
+                name = self.index_name(workspace, spec.method, table, spec.quantization)
+                sql = self._create_sql(name, table, key, workspace, spec, rows)
+                logger.info(f"Building vector index {name} on {table} ({rows} rows)")
+                await connection.execute(sql)
+                created.append(name)
+        return created
+
+    def _create_sql(
+        self,
+        name: str,
+        table: str,
+        key: str,
+        workspace: str,
+        spec: VectorIndexSpec,
+        rows: int,
+    ) -> str:
+        if spec.method is VectorIndexMethod.HNSW:
+            options = (
+                f"m = {spec.m or self._hnsw_m}, "
+                f"ef_construction = {spec.ef_construction or self._hnsw_ef_construction}"
+            )
+        else:
+            options = f"lists = {spec.lists or ivfflat_lists(rows)}"
+        # Identifiers and the workspace literal are validated above; CREATE
+        # INDEX does not accept bind parameters in its predicate.
+        return (
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} "
+            f"USING {spec.method.value} ({key}) "
+            f"WITH ({options}) WHERE workspace = '{workspace}'"
+        )
+
+    async def rebuild_indexes(
+        self, working_dir: str, method: VectorIndexMethod | None = None
+    ) -> list[str]:
+        names = await self._names(working_dir, method)
+        async with self._pool.acquire() as connection:
+            for name in names:
+                logger.info(f"Rebuilding vector index {name}")
+                await connection.execute(f"REINDEX INDEX CONCURRENTLY {name}")
+        return names
+
+    async def drop_indexes(
+        self, working_dir: str, method: VectorIndexMethod | None = None
+    ) -> list[str]:
+        names = await self._names(working_dir, method)
+        async with self._pool.acquire() as connection:
+            for name in names:
+                logger.info(f"Dropping vector index {name}")
+                await connection.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        return names
+
+    async def _names(
+        self, working_dir: str, method: VectorIndexMethod | None
+    ) -> list[str]:
+        return [
+            index.name
+            for index in await self.list_indexes(working_dir)
+            if method is None or index.method is method
+        ]
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+import asyncpg
+
+from config import DatabaseConfig
+from domain.ports.database_pool_port import DatabasePoolPort
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _LoopPool:
+    pool: asyncpg.Pool | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class PostgresPool(DatabasePoolPort):
+    """Lazily created asyncpg pool for the service's own tables.
+
+    LightRAG manages its own connections to the same database; this pool is
+    used for queue, locking and maintenance queries issued by the service.
+    The pool is only opened on first use so importing the module never
+    touches the network. An asyncpg pool belongs to the event loop that
+    created it, so each loop gets its own (the API and MCP run separate loops
+    in stdio mode); ``max_size`` applies per loop.
+    """
+
+    def __init__(self, db_config: DatabaseConfig, max_size: int | None = None) -> None:
+        self._db_config = db_config
+        self._max_size = max_size or db_config.POSTGRES_POOL_MAX_SIZE
+        self._loops: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def get_pool(self) -> asyncpg.Pool:
+        """Return the running loop's pool, creating it on first call."""
+        state = self._loops.setdefault(asyncio.get_running_loop(), _LoopPool())
+        if state.pool is not None:
+            return state.pool
+        async with state.lock:
+            if state.pool is None:
+                state.pool = await asyncpg.create_pool(
+                    dsn=self._db_config.ASYNCPG_DSN,
+                    min_size=min(
+                        self._db_config.POSTGRES_POOL_MIN_SIZE, self._max_size
+                    ),
+                    max_size=self._max_size,
+                )
+                logger.info("PostgreSQL pool created")
+        return state.pool
+
+    @asynccontextmanager
+    async def acquire(
+        self, timeout: float | None = None
+    ) -> AsyncIterator[asyncpg.Connection]:
+        """Borrow a connection from the pool.
+
+        Raises ``asyncio.TimeoutError`` when none frees up within ``timeout``.
+        """
+        pool = await self.get_pool()
+        async with pool.acquire(timeout=timeout) as connection:
+            yield connection
+
+    async def close(self) -> None:
+        """Close the running loop's pool if it was opened."""
+        state = self._loops.pop(asyncio.get_running_loop(), None)
+        if state is not None and state.pool is not None:
+            await state.pool.close()
+
+    async def ping(self) -> None:
+        """Run ``SELECT 1`` on a pooled connection."""
+        async with self.acquire() as connection:
+            await connection.fetchval("SELECT 1")
+
+    def stats(self) -> dict:
+        """Report size and usage summed across loops without opening a pool."""
+        pools = [
+            state.pool for state in list(self._loops.values()) if state.pool is not None
+        ]
+        size = sum(pool.get_size() for pool in pools)
+        idle = sum(pool.get_idle_size() for pool in pools)
+        return {
+            "open": bool(pools),
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "max_size": self._max_size * max(len(pools), 1),
+        }
@@ -0,0 +1,88 @@
+import asyncio
+import hashlib
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from domain.ports.document_lock_port import DocumentLockPort
+from infrastructure.database.postgres_pool import PostgresPool
+
+logger = logging.getLogger(__name__)
+
+
+def advisory_lock_key(working_dir: str, object_key: str, content_hash: str) -> int:
+    """Map (workspace, object key, content hash) to a signed 64-bit lock id."""
+    digest = hashlib.sha256(
+        f"{working_dir}\x00{object_key}\x00{content_hash}".encode()
+    ).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+class InMemoryDocumentLock(DocumentLockPort):
+    """Process-local document lock.
+
+    A duplicate request for a document that is already being indexed in this
+    process waits for the in-flight run to finish and is then reported as a
+    duplicate instead of indexing the document a second time.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[int, asyncio.Event] = {}
+
+    @asynccontextmanager
+    async def hold(
+        self, working_dir: str, object_key: str, content_hash: str
+    ) -> AsyncIterator[bool]:
+        key = advisory_lock_key(working_dir, object_key, content_hash)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.info(
+                f"Attaching to in-flight indexing of '{object_key}' in '{working_dir}'"
+            )
+            await inflight.wait()
+            yield False
+            return
+
+        done = asyncio.Event()
+        self._inflight[key] = done
+        try:
+            async with self._acquire_shared(key) as acquired:
+                if not acquired:
+                    logger.info(
+                        f"'{object_key}' in '{working_dir}' is being indexed by another replica"
+                    )
+                yield acquired
+        finally:
+            self._inflight.pop(key, None)
+            done.set()
+
+    @asynccontextmanager
+    async def _acquire_shared(self, key: int) -> AsyncIterator[bool]:  # noqa: ARG002
+        """Hook for cross-process locking; a single process always owns the key."""
+        yield True
+
+
+class PostgresDocumentLock(InMemoryDocumentLock):
+    """Document lock shared across replicas through PostgreSQL advisory locks.
+
+    Duplicates inside one process attach to the in-flight run; duplicates on
+    other replicas fail ``pg_try_advisory_lock`` and are skipped. The lock is
+    session-scoped, so the connection is held for the whole indexing run and
+    the lock is released automatically if the replica dies. Because that run
+    includes the wait for a scheduler slot, ``pool`` should be a pool of its
+    own rather than the one the running jobs query through.
+    """
+
+    def __init__(self, pool: PostgresPool) -> None:
+        super().__init__()
+        self._pool = pool
+
+    @asynccontextmanager
+    async def _acquire_shared(self, key: int) -> AsyncIterator[bool]:
+        async with self._pool.acquire() as connection:
+            acquired = await connection.fetchval("SELECT pg_try_advisory_lock($1)", key)
+            try:
+                yield bool(acquired)
+            finally:
+                if acquired:
+                    await connection.execute("SELECT pg_advisory_unlock($1)", key)
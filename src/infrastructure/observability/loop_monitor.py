@@ -0,0 +1,111 @@
+"""Event loop lag monitoring.
+
+A task sleeps for ``interval`` in a loop and measures how late it wakes
+up: that delay is how long every other ready callback waited too. Lag is
+recorded in the ``event_loop.lag`` histogram and kept for ``/ready``.
+
+A callback that blocks the loop (docling parsing, a large JSON write, a
+glob over a big folder) also stops the measuring task, so a watchdog
+thread notices when it has not run for ``block_threshold`` and logs the
+loop thread's stack at that moment, which points at the blocking code.
+"""
+
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from opentelemetry import metrics
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+_lag_histogram = meter.create_histogram(
+    "event_loop.lag",
+    unit="ms",
+    description="Delay between when a loop callback was due and when it ran",
+)
+_blocked_counter = meter.create_counter(
+    "event_loop.blocked_callbacks",
+    description="Callbacks that blocked the event loop longer than the threshold",
+)
+
+# Window over which /ready reports the worst lag.
+_WINDOW_SECONDS = 10.0
+
+
+class EventLoopMonitor:
+    """Measures the running loop's lag and logs stacks of blocking callbacks."""
+
+    def __init__(self, interval: float = 0.1, block_threshold: float = 0.25) -> None:
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.blocked_callbacks = 0
+        self._lags: deque[float] = deque(
+            maxlen=max(1, round(_WINDOW_SECONDS / interval))
+        )
+        self._beat = time.monotonic()
+        self._loop_thread: int | None = None
+
+    @asynccontextmanager
+    async def running(self) -> AsyncIterator["EventLoopMonitor"]:
+        """Monitor the running loop for the duration of the context."""
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        stop = threading.Event()
+        watchdog = threading.Thread(
+            target=self._watch, args=(stop,), name="loop-watchdog", daemon=True
+        )
+        measuring = asyncio.create_task(self._measure())
+        watchdog.start()
+        logger.info(
+            f"Event loop monitor started (interval {self.interval * 1000:g} ms, "
+            f"block threshold {self.block_threshold * 1000:g} ms)"
+        )
+        try:
+            yield self
+        finally:
+            measuring.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await measuring
+            stop.set()
+            await asyncio.to_thread(watchdog.join)
+
+    def stats(self) -> dict:
+        return {
+            "lag_ms": round(self._lags[-1] * 1000, 2) if self._lags else 0.0,
+            "max_lag_ms": round(max(self._lags, default=0.0) * 1000, 2),
+            "blocked_callbacks": self.blocked_callbacks,
+        }
+
+    async def _measure(self) -> None:
+        while True:
+            self._beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.monotonic() - self._beat - self.interval)
+            self._lags.append(lag)
+            _lag_histogram.record(lag * 1000)
+
+    def _watch(self, stop: threading.Event) -> None:
+        reported_beat = None
+        while not stop.wait(self.block_threshold / 2):
+            beat = self._beat
+            stalled = time.monotonic() - beat - self.interval
+            if stalled < self.block_threshold or beat == reported_beat:
+                continue
+            reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            self.blocked_callbacks += 1
+            _blocked_counter.add(1)
+            logger.warning(
+                f"Event loop blocked for over {stalled * 1000:.0f} ms; "
+                "loop thread stack:\n" + "".join(traceback.format_stack(frame))
+            )
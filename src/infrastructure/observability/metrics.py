@@ -0,0 +1,58 @@
+"""OpenTelemetry metrics export for the API and the indexing worker.
+
+Instruments are created through the OpenTelemetry API and record nothing
+until ``configure_metrics`` installs an SDK meter provider. Like tracing,
+the SDK and the OTLP exporter are imported only when metrics are enabled.
+"""
+
+import logging
+from typing import Any
+
+from opentelemetry import metrics
+
+from config import MetricsConfig
+
+logger = logging.getLogger(__name__)
+
+
+def configure_metrics(
+    config: MetricsConfig, service_name: str, reader: Any = None
+) -> Any:
+    """Install an SDK meter provider for this process.
+
+    Metrics are exported every ``METRICS_EXPORT_INTERVAL_SECONDS``. An
+    explicit ``reader`` (e.g. an ``InMemoryMetricReader`` in tests) replaces
+    the exporting reader.
+
+    Returns:
+        The meter provider, or None when metrics are disabled.
+    """
+    if not config.METRICS_ENABLED:
+        return None
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import (
+        ConsoleMetricExporter,
+        PeriodicExportingMetricReader,
+    )
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+
+    if reader is None:
+        if config.METRICS_EXPORTER == "console":
+            exporter = ConsoleMetricExporter()
+        else:
+            from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+                OTLPMetricExporter,
+            )
+
+            exporter = OTLPMetricExporter()
+        reader = PeriodicExportingMetricReader(
+            exporter,
+            export_interval_millis=config.METRICS_EXPORT_INTERVAL_SECONDS * 1000,
+        )
+    provider = MeterProvider(
+        resource=Resource.create({SERVICE_NAME: service_name}),
+        metric_readers=[reader],
+    )
+    metrics.set_meter_provider(provider)
+    logger.info(f"Metrics enabled ({config.METRICS_EXPORTER} exporter)")
+    return provider
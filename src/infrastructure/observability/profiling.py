@@ -0,0 +1,96 @@
+"""On-demand sampling profiles of single requests and indexing jobs.
+
+pyinstrument's async mode follows the profiled task across awaits and into
+the tasks it creates, which inherit its context, so LightRAG's extraction
+tasks count towards the request that started them. Time the task spends
+awaiting (I/O, other requests, work in executor threads or subprocesses)
+shows as ``<await>``. Several requests can be profiled at once.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Literal
+
+from domain.ports.profiler_port import ProfilerPort
+from domain.ports.storage_port import StoragePort
+
+logger = logging.getLogger(__name__)
+
+ProfileFormat = Literal["speedscope", "pstats"]
+
+_EXTENSIONS: dict[str, str] = {
+    "speedscope": ".speedscope.json",
+    "pstats": ".pstats",
+}
+
+
+class PyinstrumentProfiler(ProfilerPort):
+    """Profiles with pyinstrument and uploads the result to object storage.
+
+    Speedscope profiles open in https://www.speedscope.app; pstats profiles
+    load with ``pstats.Stats`` or snakeviz.
+    """
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        bucket: str,
+        prefix: str,
+        output_dir: str,
+        profile_format: ProfileFormat = "speedscope",
+        interval: float = 0.01,
+    ) -> None:
+        self.storage = storage
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.output_dir = output_dir
+        self.profile_format = profile_format
+        self.interval = interval
+
+    def profile_key(self, name: str) -> str:
+        return f"{self.prefix}/{name.strip('/')}{_EXTENSIONS[self.profile_format]}"
+
+    @asynccontextmanager
+    async def profile(self, key: str) -> AsyncIterator[None]:
+        from pyinstrument import Profiler
+
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            yield
+        finally:
+            session = profiler.stop()
+            try:
+                await self._store(session, key)
+            except Exception as e:
+                logger.warning(f"Failed to store profile {key}: {e}")
+
+    async def _store(self, session: Any, key: str) -> None:
+        path = Path(self.output_dir) / (
+            f"profile-{uuid.uuid4().hex}{_EXTENSIONS[self.profile_format]}"
+        )
+        try:
+            # Rendering a long session takes a while; keep it off the loop.
+            await asyncio.to_thread(self._write, session, path)
+            await self.storage.upload_file(self.bucket, key, str(path))
+        finally:
+            path.unlink(missing_ok=True)
+        logger.info(f"Stored {session.duration:.1f}s profile at {key}")
+
+    def _write(self, session: Any, path: Path) -> None:
+        from pyinstrument.renderers import PstatsRenderer, SpeedscopeRenderer
+
+        renderer = (
+            SpeedscopeRenderer()
+            if self.profile_format == "speedscope"
+            else PstatsRenderer()
+        )
+        # Both renderers return str; pstats is marshal data decoded with
+        # surrogateescape, which this reverses.
+        path.write_bytes(
+            renderer.render(session).encode("utf-8", errors="surrogateescape")
+        )
@@ -0,0 +1,122 @@
+"""OpenTelemetry tracing for the API and the indexing worker.
+
+Spans are created through the OpenTelemetry API, which records nothing
+until ``configure_tracing`` installs an SDK tracer provider, so the
+instrumented code costs next to nothing with tracing disabled. The SDK and
+the OTLP exporter are imported only when tracing is enabled.
+
+Context reaches background work without extra plumbing: tasks created
+with ``asyncio.create_task`` copy the current context, and queued jobs
+carry their enqueuer's W3C trace context in the job payload.
+"""
+
+import logging
+from typing import Any
+
+from opentelemetry import context, propagate, trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from config import TracingConfig
+
+logger = logging.getLogger(__name__)
+
+_tracer = trace.get_tracer(__name__)
+
+
+def configure_tracing(config: TracingConfig, exporter: Any = None) -> Any:
+    """Install an SDK tracer provider for this process.
+
+    Spans are batched to the configured exporter. An explicit ``exporter``
+    (e.g. an ``InMemorySpanExporter`` in tests) replaces it and receives
+    each span synchronously when it ends.
+
+    Returns:
+        The tracer provider, or None when tracing is disabled.
+    """
+    if not config.TRACING_ENABLED:
+        return None
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+    )
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    provider = TracerProvider(
+        resource=Resource.create({SERVICE_NAME: config.OTEL_SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(config.TRACING_SAMPLE_RATIO)),
+    )
+    if exporter is not None:
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+    elif config.TRACING_EXPORTER == "console":
+        provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+    else:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+    logger.info(f"Tracing enabled ({config.TRACING_EXPORTER} exporter)")
+    return provider
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span for each HTTP request.
+
+    The span continues an incoming ``traceparent`` header and is current
+    while the route runs, so use case spans and background tasks started
+    by the route are its children. It ends once the response has been
+    sent and is renamed after the matched route template.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope.get("headers") or []
+        }
+        method = scope.get("method", "GET")
+        span = _tracer.start_span(
+            f"{method} {scope['path']}",
+            context=propagate.extract(headers, context=context.get_current()),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        )
+        token = context.attach(trace.set_span_in_context(span))
+
+        async def send_and_trace(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                span.set_attribute("http.response.status_code", message["status"])
+                if message["status"] >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                _end_request_span(span, scope)
+
+        try:
+            await self.app(scope, receive, send_and_trace)
+        except Exception as e:
+            span.record_exception(e)
+            span.set_status(Status(StatusCode.ERROR, str(e)))
+            raise
+        finally:
+            _end_request_span(span, scope)
+            context.detach(token)
+
+
+def _end_request_span(span: Any, scope: dict) -> None:
+    if not span.is_recording():
+        return
+    route = getattr(scope.get("route"), "path", None)
+    if route:
+        span.update_name(f"{scope.get('method', 'GET')} {route}")
+        span.set_attribute("http.route", route)
+    span.end()
@@ -0,0 +1,206 @@
+import json
+import logging
+import uuid
+from typing import Any
+
+import asyncpg
+
+from domain.entities.indexing_job import IndexingJob, IndexingJobStatus, IndexingJobType
+from domain.ports.job_queue_port import JobQueuePort
+from infrastructure.database.postgres_pool import PostgresPool
+
+logger = logging.getLogger(__name__)
+
+JOBS_TABLE = "raganything_indexing_jobs"
+
+_CREATE_TABLE_SQL = f"""
+CREATE TABLE IF NOT EXISTS {JOBS_TABLE} (
+    id UUID PRIMARY KEY,
+    job_type VARCHAR(16) NOT NULL,
+    working_dir TEXT NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+    status VARCHAR(16) NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    locked_by TEXT NULL,
+    lease_expires_at TIMESTAMPTZ NULL,
+    result JSONB NULL,
+    error TEXT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS {JOBS_TABLE}_runnable_idx
+    ON {JOBS_TABLE} (created_at) WHERE status IN ('queued', 'running');
+"""
+
+_CLAIM_SQL = f"""
+UPDATE {JOBS_TABLE} AS j
+SET status = 'running',
+    attempts = j.attempts + 1,
+    locked_by = $1,
+    lease_expires_at = now() + make_interval(secs => $2),
+    updated_at = now()
+WHERE j.id = (
+    SELECT id FROM {JOBS_TABLE}
+    WHERE (status = 'queued')
+       OR (status = 'running' AND lease_expires_at < now() AND attempts < $3)
+    ORDER BY created_at
+    FOR UPDATE SKIP LOCKED
+    LIMIT 1
+)
+RETURNING j.*
+"""
+
+# A worker that died on a job's last attempt leaves it running with an
+# expired lease; no claim may run it again, so it is failed here.
+_FAIL_EXHAUSTED_SQL = f"""
+UPDATE {JOBS_TABLE}
+SET status = 'failed',
+    error = 'Lease expired on the last attempt (worker lost)',
+    locked_by = NULL,
+    lease_expires_at = NULL,
+    updated_at = now()
+WHERE status = 'running' AND lease_expires_at < now() AND attempts >= $1
+"""
+
+
+class PostgresJobQueue(JobQueuePort):
+    """PostgreSQL implementation of JobQueuePort.
+
+    Workers claim jobs with ``FOR UPDATE SKIP LOCKED`` so any number of worker
+    processes can poll the same table without blocking each other. A claimed
+    job holds a lease that the worker extends with heartbeats; a job whose
+    lease expires (worker crashed) becomes claimable again until
+    ``max_attempts`` is reached, and is failed after that. Heartbeats and
+    outcomes only apply while ``locked_by`` is still the reporting worker, so
+    a worker whose job was reclaimed cannot extend or overwrite it.
+    """
+
+    def __init__(
+        self, pool: PostgresPool, lease_seconds: int = 300, max_attempts: int = 3
+    ) -> None:
+        self._pool = pool
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._schema_ready = False
+
+    async def _ensure_schema(self, connection: asyncpg.Connection) -> None:
+        if not self._schema_ready:
+            await connection.execute(_CREATE_TABLE_SQL)
+            self._schema_ready = True
+
+    async def enqueue(
+        self, job_type: IndexingJobType, working_dir: str, payload: dict[str, Any]
+    ) -> IndexingJob:
+        async with self._pool.acquire() as connection:
+            await self._ensure_schema(connection)
+            row = await connection.fetchrow(
+                f"""
+                INSERT INTO {JOBS_TABLE} (id, job_type, working_dir, payload, status)
+                VALUES ($1, $2, $3, $4::jsonb, 'queued')
+                RETURNING *
+                """,
+                uuid.uuid4(),
+                job_type.value,
+                working_dir,
+                json.dumps(payload),
+            )
+        job = _row_to_job(row)
+        logger.info(f"Queued {job.job_type.value} indexing job {job.id}")
+        return job
+
+    async def claim(self, worker_id: str) -> IndexingJob | None:
+        async with self._pool.acquire() as connection:
+            await self._ensure_schema(connection)
+            await connection.execute(_FAIL_EXHAUSTED_SQL, self._max_attempts)
+            row = await connection.fetchrow(
+                _CLAIM_SQL, worker_id, float(self._lease_seconds), self._max_attempts
+            )
+        return _row_to_job(row) if row else None
+
+    async def heartbeat(self, job_id: str, worker_id: str) -> None:
+        async with self._pool.acquire() as connection:
+            status = await connection.execute(
+                f"""
+                UPDATE {JOBS_TABLE}
+                SET lease_expires_at = now() + make_interval(secs => $3),
+                    updated_at = now()
+                WHERE id = $1 AND locked_by = $2 AND status = 'running'
+                """,
+                uuid.UUID(job_id),
+                worker_id,
+                float(self._lease_seconds),
+            )
+        _warn_if_lost(status, job_id, worker_id)
+
+    async def complete(
+        self, job_id: str, worker_id: str, result: dict[str, Any]
+    ) -> None:
+        async with self._pool.acquire() as connection:
+            status = await connection.execute(
+                f"""
+                UPDATE {JOBS_TABLE}
+                SET status = 'succeeded', result = $3::jsonb, error = NULL,
+                    lease_expires_at = NULL, updated_at = now()
+                WHERE id = $1 AND locked_by = $2 AND status = 'running'
+                """,
+                uuid.UUID(job_id),
+                worker_id,
+                json.dumps(result),
+            )
+        _warn_if_lost(status, job_id, worker_id)
+
+    async def fail(self, job_id: str, worker_id: str, error: str) -> None:
+        async with self._pool.acquire() as connection:
+            status = await connection.execute(
+                f"""
+                UPDATE {JOBS_TABLE}
+                SET status = CASE WHEN attempts < $4 THEN 'queued' ELSE 'failed' END,
+                    error = $3, lease_expires_at = NULL, updated_at = now()
+                WHERE id = $1 AND locked_by = $2 AND status = 'running'
+                """,
+                uuid.UUID(job_id),
+                worker_id,
+                error,
+                self._max_attempts,
+            )
+        _warn_if_lost(status, job_id, worker_id)
+
+    async def get(self, job_id: str) -> IndexingJob | None:
+        try:
+            key = uuid.UUID(job_id)
+        except ValueError:
+            return None
+        async with self._pool.acquire() as connection:
+            await self._ensure_schema(connection)
+            row = await connection.fetchrow(
+                f"SELECT * FROM {JOBS_TABLE} WHERE id = $1", key
+            )
+        return _row_to_job(row) if row else None
+
+
+def _warn_if_lost(status: str, job_id: str, worker_id: str) -> None:
+    if status == "UPDATE 0":
+        logger.warning(
+            f"Job {job_id} is no longer leased to {worker_id}; update ignored"
+        )
+
+
+def _row_to_job(row) -> IndexingJob:
+    return IndexingJob(
+        id=str(row["id"]),
+        job_type=IndexingJobType(row["job_type"]),
+        working_dir=row["working_dir"],
+        payload=_load_json(row["payload"]) or {},
+        status=IndexingJobStatus(row["status"]),
+        attempts=row["attempts"],
+        result=_load_json(row["result"]),
+        error=row["error"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+def _load_json(value):
+    if value is None or isinstance(value, dict):
+        return value
+    return json.loads(value)
@@ -0,0 +1,131 @@
+"""Chunk-level diffs when a changed file is indexed again.
+
+LightRAG's chunk ids are content hashes (``chunk-<md5>``) and each
+document's doc status lists the ids of its chunks, so a new version of a
+file can be compared with the previous one chunk by chunk. While
+``reusing_chunks`` is active, the workspace's chunker drops every chunk
+the previous version already has: only new or changed chunks are embedded
+and sent through entity extraction. ``adopt_chunks`` then hands the reused
+chunks, with the previous version's entity and relation lists, to the new
+document and leaves the previous versions listing only the chunks that
+disappeared, which is what deleting them removes.
+"""
+
+import inspect
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ChunkDiff:
+    """Chunk ids of a file's previous versions and those the new one reused."""
+
+    previous: set[str]
+    reused: set[str] = field(default_factory=set)
+
+
+# Original chunker and active diffs per LightRAG instance. Keyed by id():
+# LightRAG is a dataclass and therefore unhashable.
+_active: dict[int, tuple[Callable[..., Any], list[ChunkDiff]]] = {}
+
+
+def _diff_chunker(
+    chunker: Callable[..., Any], diffs: list[ChunkDiff]
+) -> Callable[..., Any]:
+    async def chunk(tokenizer: Any, content: str, *args: Any) -> list[dict]:
+        from lightrag.utils import compute_mdhash_id
+
+        chunks = chunker(tokenizer, content, *args)
+        if inspect.isawaitable(chunks):
+            chunks = await chunks
+        new = []
+        for item in chunks:
+            chunk_id = compute_mdhash_id(item["content"], prefix="chunk-")
+            diff = next((d for d in diffs if chunk_id in d.previous), None)
+            if diff is None:
+                new.append(item)
+            else:
+                diff.reused.add(chunk_id)
+        return new
+
+    return chunk
+
+
+@contextmanager
+def reusing_chunks(lightrag: Any, previous: Iterable[str]) -> Iterator[ChunkDiff]:
+    """Skip chunks in ``previous`` while documents are inserted into ``lightrag``."""
+    diff = ChunkDiff(previous=set(previous))
+    key = id(lightrag)
+    if key not in _active:
+        _active[key] = (lightrag.chunking_func, [])
+        lightrag.chunking_func = _diff_chunker(*_active[key])
+    chunker, diffs = _active[key]
+    diffs.append(diff)
+    try:
+        yield diff
+    finally:
+        diffs.remove(diff)
+        if not diffs:
+            lightrag.chunking_func = chunker
+            del _active[key]
+
+
+async def adopt_chunks(
+    lightrag: Any, doc_id: str, previous: dict[str, dict], diff: ChunkDiff
+) -> None:
+    """Move the chunks ``doc_id`` reused from ``previous`` versions to it.
+
+    Afterwards each previous version lists only its chunks that the new
+    version does not have, so ``adelete_by_doc_id`` removes exactly those
+    (and rebuilds the entities and relations they contributed to).
+    """
+    from lightrag.base import DocStatus
+
+    status = await lightrag.doc_status.get_by_id(doc_id)
+    if not status or status.get("status") != DocStatus.PROCESSED:
+        raise RuntimeError(f"New version {doc_id} has not been processed")
+    chunks = list(status.get("chunks_list") or [])
+    chunks += sorted(diff.reused - set(chunks))
+    kept = set(chunks)
+    updates = {doc_id: {**status, "chunks_list": chunks, "chunks_count": len(chunks)}}
+    removed = 0
+    for old_id, old_status in previous.items():
+        stale = [c for c in old_status.get("chunks_list") or [] if c not in kept]
+        updates[old_id] = {
+            **old_status,
+            "chunks_list": stale,
+            "chunks_count": len(stale),
+        }
+        removed += len(stale)
+    await _merge_tracking(lightrag.full_entities, [doc_id, *previous], "entity_names")
+    await _merge_tracking(
+        lightrag.full_relations, [doc_id, *previous], "relation_pairs"
+    )
+    await lightrag.doc_status.upsert(updates)
+    for storage in (
+        lightrag.doc_status,
+        lightrag.full_entities,
+        lightrag.full_relations,
+    ):
+        await storage.index_done_callback()
+    logger.info(
+        f"{doc_id}: {len(diff.reused)} chunks reused, "
+        f"{len(chunks) - len(diff.reused)} new, {removed} to delete"
+    )
+
+
+async def _merge_tracking(storage: Any, doc_ids: list[str], key: str) -> None:
+    """Union the documents' entity names (or relation pairs) into the first."""
+    merged: dict[Any, Any] = {}
+    for record in await storage.get_by_ids(doc_ids):
+        for item in (record or {}).get(key) or []:
+            merged.setdefault(tuple(item) if isinstance(item, list) else item, item)
+    if merged:
+        await storage.upsert(
+            {doc_ids[0]: {key: list(merged.values()), "count": len(merged)}}
+        )
@@ -0,0 +1,306 @@
+"""Chunks-only retrieval on top of LightRAG storages.
+
+``LightRAG.aquery_data`` builds the full graph context (node and edge
+lookups in the graph store, entity and relation descriptions, token
+truncation) even though this service only returns text chunks. This module
+resolves chunks straight from the vector stores and LightRAG's
+entity/relation chunk-tracking tables, so the graph store is never queried:
+
+- ``naive``: chunk vector search.
+- ``local``: entity vector search on low-level keywords, then the chunks
+  tracked for those entities.
+- ``global``: relation vector search on high-level keywords, then the chunks
+  tracked for those relations.
+- ``hybrid``: local and global; ``mix``: hybrid plus chunk vector search.
+- ``fusion``: chunk vector search plus full-text search over chunk content
+  (see ``lexical_index``), merged with reciprocal rank fusion so exact
+  identifiers missed by the embedding still rank near the top.
+
+Graph sources are merged round-robin with de-duplication, as LightRAG does.
+LightRAG is imported lazily to keep it off the API startup path.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from opentelemetry import trace
+
+from domain.entities.vector_index import VectorSearchSettings
+from infrastructure.rag.vector_search import query_vectors
+
+if TYPE_CHECKING:
+    from lightrag import LightRAG, QueryParam
+
+    from infrastructure.rag.lexical_index import LexicalIndex
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+_ENTITY_MODES = frozenset({"local", "hybrid", "mix"})
+_RELATION_MODES = frozenset({"global", "hybrid", "mix"})
+_VECTOR_MODES = frozenset({"naive", "mix"})
+KEYWORD_MODES = _ENTITY_MODES | _RELATION_MODES
+FUSION_MODE = "fusion"
+# Each fused source contributes this many times top_k candidates.
+_FUSION_DEPTH = 2
+
+
+class ChunkTrackingUnavailable(Exception):
+    """The workspace has no entity/relation chunk tracking to read from."""
+
+
+async def retrieve_chunks(
+    lightrag: "LightRAG",
+    query: str,
+    param: "QueryParam",
+    lexical_index: "LexicalIndex | None" = None,
+    rrf_k: int = 60,
+    query_embedding: Any = None,
+    vector_search: VectorSearchSettings | None = None,
+) -> dict[str, Any]:
+    """Return an ``aquery_data``-shaped result with chunks and references only.
+
+    ``lexical_index`` is required for the ``fusion`` mode; ``rrf_k`` is the
+    reciprocal rank fusion constant. A precomputed ``query_embedding`` is
+    reused for chunk vector search. ``vector_search`` applies to every
+    vector store queried.
+
+    Raises:
+        ChunkTrackingUnavailable: If graph hits were found but the workspace
+            predates LightRAG's chunk-tracking storages, so the caller
+            should fall back to the full graph query.
+    """
+    from lightrag.operate import get_keywords_from_query
+
+    mode = param.mode
+    query = query.strip()
+    top_k = param.chunk_top_k or param.top_k
+    hl_keywords: list[str] = []
+    ll_keywords: list[str] = []
+    if mode in KEYWORD_MODES:
+        hl_keywords, ll_keywords = await get_keywords_from_query(
+            query,
+            param,
+            _keyword_config(lightrag),
+            hashing_kv=lightrag.llm_response_cache,
+        )
+
+    if mode == FUSION_MODE:
+        if lexical_index is None:
+            raise ValueError("The fusion mode requires a lexical index")
+        depth = top_k * _FUSION_DEPTH
+        sources = await asyncio.gather(
+            _vector_chunks(lightrag, query, depth, query_embedding, vector_search),
+            _lexical_chunks(lexical_index, lightrag, query, depth),
+        )
+        chunks = reciprocal_rank_fusion(sources, rrf_k)[:top_k]
+        return _result(mode, chunks, sources, hl_keywords, ll_keywords)
+
+    sources = await asyncio.gather(
+        _vector_chunks(lightrag, query, top_k, query_embedding, vector_search)
+        if mode in _VECTOR_MODES
+        else _none(),
+        _entity_chunks(lightrag, ll_keywords, param.top_k, top_k, vector_search)
+        if mode in _ENTITY_MODES and ll_keywords
+        else _none(),
+        _relation_chunks(lightrag, hl_keywords, param.top_k, top_k, vector_search)
+        if mode in _RELATION_MODES and hl_keywords
+        else _none(),
+    )
+    chunks = _round_robin(sources)[:top_k]
+    return _result(mode, chunks, sources, hl_keywords, ll_keywords)
+
+
+def reciprocal_rank_fusion(sources: list[list[dict]], k: int = 60) -> list[dict]:
+    """Merge ranked chunk lists by summed ``1 / (k + rank)``, best first."""
+    scores: dict[str, float] = {}
+    chunks: dict[str, dict] = {}
+    for source in sources:
+        for rank, chunk in enumerate(source, start=1):
+            chunk_id = chunk["chunk_id"]
+            if not chunk_id:
+                continue
+            scores[chunk_id] = scores.get(chunk_id, 0.0) + 1.0 / (k + rank)
+            chunks.setdefault(chunk_id, chunk)
+    # sorted() is stable, so ties keep the first source's ranking
+    return [chunks[chunk_id] for chunk_id in sorted(scores, key=lambda c: -scores[c])]
+
+
+def _result(
+    mode: str,
+    chunks: list[dict],
+    sources: list[list[dict]],
+    hl_keywords: list[str],
+    ll_keywords: list[str],
+) -> dict[str, Any]:
+    metadata = {
+        "query_mode": mode,
+        "keywords": {"high_level": hl_keywords, "low_level": ll_keywords},
+        "processing_info": {
+            "merged_chunks_count": sum(len(source) for source in sources),
+            "final_chunks_count": len(chunks),
+        },
+    }
+    if not chunks:
+        return {
+            "status": "failure",
+            "message": "Query returned no results",
+            "data": {},
+            "metadata": metadata,
+        }
+
+    from lightrag.utils import generate_reference_list_from_chunks
+
+    references, chunks = generate_reference_list_from_chunks(chunks)
+    return {
+        "status": "success",
+        "message": "Query processed successfully",
+        "data": {
+            "entities": [],
+            "relationships": [],
+            "chunks": [
+                {
+                    "reference_id": chunk["reference_id"],
+                    "content": chunk["content"],
+                    "file_path": chunk["file_path"],
+                    "chunk_id": chunk["chunk_id"],
+                }
+                for chunk in chunks
+            ],
+            "references": references,
+        },
+        "metadata": metadata,
+    }
+
+
+def _keyword_config(lightrag: "LightRAG") -> dict[str, Any]:
+    # The subset of asdict(lightrag) that keyword extraction reads; asdict()
+    # deep-copies every field of the instance on each query.
+    return {
+        "addon_params": lightrag.addon_params,
+        "tokenizer": lightrag.tokenizer,
+        "llm_model_func": lightrag.llm_model_func,
+    }
+
+
+async def _none() -> list[dict]:
+    return []
+
+
+async def _lexical_chunks(
+    lexical_index: "LexicalIndex", lightrag: "LightRAG", query: str, top_k: int
+) -> list[dict]:
+    with tracer.start_as_current_span(
+        "lexical search", attributes={"rag.top_k": top_k}
+    ):
+        return await lexical_index.search(lightrag.text_chunks, query, top_k)
+
+
+async def _vector_chunks(
+    lightrag: "LightRAG",
+    query: str,
+    top_k: int,
+    query_embedding: Any = None,
+    vector_search: VectorSearchSettings | None = None,
+) -> list[dict]:
+    results = await query_vectors(
+        lightrag.chunks_vdb, query, top_k, query_embedding, vector_search
+    )
+    return [
+        {
+            "content": result["content"],
+            "file_path": result.get("file_path") or "unknown_source",
+            "chunk_id": result.get("id"),
+        }
+        for result in results
+        if "content" in result
+    ]
+
+
+async def _entity_chunks(
+    lightrag: "LightRAG",
+    ll_keywords: list[str],
+    top_k: int,
+    chunk_top_k: int,
+    vector_search: VectorSearchSettings | None = None,
+) -> list[dict]:
+    results = await query_vectors(
+        lightrag.entities_vdb, ", ".join(ll_keywords), top_k, settings=vector_search
+    )
+    keys = [result["entity_name"] for result in results]
+    return await _tracked_chunks(lightrag, "entity_chunks", keys, chunk_top_k)
+
+
+async def _relation_chunks(
+    lightrag: "LightRAG",
+    hl_keywords: list[str],
+    top_k: int,
+    chunk_top_k: int,
+    vector_search: VectorSearchSettings | None = None,
+) -> list[dict]:
+    from lightrag.utils import make_relation_chunk_key
+
+    results = await query_vectors(
+        lightrag.relationships_vdb,
+        ", ".join(hl_keywords),
+        top_k,
+        settings=vector_search,
+    )
+    keys = [
+        make_relation_chunk_key(result["src_id"], result["tgt_id"])
+        for result in results
+    ]
+    return await _tracked_chunks(lightrag, "relation_chunks", keys, chunk_top_k)
+
+
+async def _tracked_chunks(
+    lightrag: "LightRAG", storage_name: str, keys: list[str], top_k: int
+) -> list[dict]:
+    """Load the ``top_k`` chunks shared by most graph hits, best first."""
+    if not keys:
+        return []
+    storage = getattr(lightrag, storage_name, None)
+    with tracer.start_as_current_span(
+        "chunk tracking lookup", attributes={"db.collection.name": storage_name}
+    ):
+        records = await storage.get_by_ids(keys) if storage is not None else []
+    if not any(records):
+        raise ChunkTrackingUnavailable(storage_name)
+
+    counts: dict[str, int] = {}
+    for record in records:
+        for chunk_id in (record or {}).get("chunk_ids") or []:
+            counts[chunk_id] = counts.get(chunk_id, 0) + 1
+    # dicts keep first-seen order, so ties keep the vector-search ranking
+    chunk_ids = sorted(counts, key=lambda chunk_id: -counts[chunk_id])[:top_k]
+    if not chunk_ids:
+        return []
+
+    with tracer.start_as_current_span(
+        "chunk lookup", attributes={"db.collection.name": "text_chunks"}
+    ):
+        rows = await lightrag.text_chunks.get_by_ids(chunk_ids)
+    return [
+        {
+            "content": row["content"],
+            "file_path": row.get("file_path") or "unknown_source",
+            "chunk_id": chunk_id,
+        }
+        for chunk_id, row in zip(chunk_ids, rows, strict=True)
+        if row and "content" in row
+    ]
+
+
+def _round_robin(sources: list[list[dict]]) -> list[dict]:
+    merged: list[dict] = []
+    seen: set[str] = set()
+    for i in range(max((len(source) for source in sources), default=0)):
+        for source in sources:
+            if i < len(source):
+                chunk = source[i]
+                chunk_id = chunk["chunk_id"]
+                if chunk_id and chunk_id not in seen:
+                    seen.add(chunk_id)
+                    merged.append(chunk)
+    return merged
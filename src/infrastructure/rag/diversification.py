@@ -0,0 +1,138 @@
+"""Near-duplicate collapse and MMR reordering of retrieved chunks.
+
+Repeated boilerplate (headers, disclaimers, templated sections) produces
+chunks that are almost identical, so a top_k of 20 can spend several slots
+and the agent's context tokens on the same text. This stage runs after
+retrieval, on the chunk vectors already stored in ``chunks_vdb``:
+
+- near-duplicates (cosine similarity >= ``dedup_threshold`` with a chunk
+  ranked higher) are dropped;
+- the remaining chunks are reordered by maximal marginal relevance, trading
+  relevance to the query against similarity to the chunks already picked
+  (``diversity`` 0 keeps the relevance order, 1 maximises novelty).
+
+Everything is one matrix product over at most a few hundred vectors.
+NumPy is imported lazily to keep it off the API startup path.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _normalize(vectors: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def collapse_near_duplicates(similarity: "np.ndarray", threshold: float) -> list[int]:
+    """Return the indices to keep, in order, dropping later near-duplicates.
+
+    ``similarity`` is the pairwise cosine similarity matrix of chunks sorted
+    best first; a chunk is dropped when it is at least ``threshold`` similar
+    to a chunk already kept.
+    """
+    kept: list[int] = []
+    for i in range(len(similarity)):
+        if not kept or similarity[i, kept].max() < threshold:
+            kept.append(i)
+    return kept
+
+
+def maximal_marginal_relevance(
+    relevance: "np.ndarray", similarity: "np.ndarray", diversity: float, k: int
+) -> list[int]:
+    """Greedily pick ``k`` indices maximising MMR.
+
+    Each step picks ``argmax((1 - diversity) * relevance - diversity *
+    max_similarity_to_selected)``; the running maximum is updated with one
+    row of ``similarity`` per pick.
+    """
+    import numpy as np
+
+    n = len(relevance)
+    k = min(k, n)
+    selected: list[int] = []
+    redundancy = np.zeros(n, dtype=relevance.dtype)
+    available = np.ones(n, dtype=bool)
+    for _ in range(k):
+        scores = (1 - diversity) * relevance - diversity * redundancy
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        redundancy = np.maximum(redundancy, similarity[best])
+    return selected
+
+
+async def diversify_chunks(
+    result: dict[str, Any],
+    chunks_vdb: Any,
+    top_k: int,
+    query_embedding: "np.ndarray | None" = None,
+    diversity: float | None = None,
+    dedup_threshold: float | None = None,
+) -> dict[str, Any]:
+    """Collapse near-duplicate chunks and reorder by MMR, in place.
+
+    ``result`` is an ``aquery_data``-shaped result whose chunks are in
+    relevance order. MMR needs ``query_embedding``; without it only the
+    duplicate collapse runs. Chunks with no stored vector are kept after
+    the diversified ones, in their original order. Unused references are
+    dropped. The result is truncated to ``top_k`` chunks.
+    """
+    import numpy as np
+
+    data = result.get("data")
+    chunks = (data or {}).get("chunks") or []
+    if not chunks:
+        return result
+
+    stored = await chunks_vdb.get_vectors_by_ids([c["chunk_id"] for c in chunks])
+    with_vectors = [i for i, c in enumerate(chunks) if c["chunk_id"] in stored]
+    without_vectors = [i for i, c in enumerate(chunks) if c["chunk_id"] not in stored]
+    order = with_vectors
+    if with_vectors:
+        # Row-wise conversion is faster than one np.asarray over nested lists.
+        vectors = _normalize(
+            np.stack(
+                [
+                    np.asarray(stored[chunks[i]["chunk_id"]], dtype=np.float32)
+                    for i in with_vectors
+                ]
+            )
+        )
+        similarity = vectors @ vectors.T
+        positions = list(range(len(with_vectors)))
+        if dedup_threshold is not None:
+            positions = collapse_near_duplicates(similarity, dedup_threshold)
+        if diversity and query_embedding is not None:
+            query = _normalize(np.asarray(query_embedding, dtype=np.float32))
+            relevance = vectors[positions] @ query
+            picks = maximal_marginal_relevance(
+                relevance,
+                similarity[np.ix_(positions, positions)],
+                diversity,
+                len(positions),
+            )
+            positions = [positions[p] for p in picks]
+        order = [with_vectors[p] for p in positions]
+
+    kept = [chunks[i] for i in order + without_vectors][:top_k]
+    data["chunks"] = kept
+    if "references" in data:
+        used = {c.get("reference_id") for c in kept}
+        data["references"] = [
+            r for r in data["references"] if r.get("reference_id") in used
+        ]
+    metadata = result.setdefault("metadata", {})
+    metadata["diversification"] = {
+        "candidates": len(chunks),
+        "duplicates_removed": len(with_vectors) - len(order),
+        "diversity": diversity or 0.0,
+        "dedup_threshold": dedup_threshold,
+    }
+    return result
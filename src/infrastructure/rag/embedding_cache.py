@@ -0,0 +1,237 @@
+"""Content-addressed embedding cache shared by every workspace.
+
+Boilerplate, headers and templates recur across documents and workspaces,
+and LightRAG embeds each occurrence again. An embedding depends only on
+the model, its output dimension and the text, so vectors are cached under
+``(model, dim, sha256(text))`` and only misses are sent to the provider.
+
+- ``PostgresEmbeddingCache``: the ``raganything_embedding_cache`` table,
+  shared by every process using the database.
+- ``InMemoryEmbeddingCache``: a per-process LRU for local mode.
+
+Vectors are cached at the provider's full dimension; Matryoshka
+truncation happens afterwards, so workspaces at different reduced
+dimensions share entries.
+"""
+
+import functools
+import hashlib
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from opentelemetry import trace
+
+from infrastructure.database.postgres_pool import PostgresPool
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+CACHE_TABLE = "raganything_embedding_cache"
+
+_CREATE_TABLE_SQL = f"""
+CREATE TABLE IF NOT EXISTS {CACHE_TABLE} (
+    model TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    text_hash BYTEA NOT NULL,
+    embedding BYTEA NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (model, dim, text_hash)
+)
+"""
+
+
+def text_hash(text: str) -> bytes:
+    """SHA-256 digest of ``text``, the content part of a cache key."""
+    return hashlib.sha256(text.encode()).digest()
+
+
+@functools.cache
+def _tokenizer() -> Callable[[str], int]:
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+    except Exception:  # no tiktoken or its BPE file cannot be fetched
+        logger.warning("tiktoken unavailable; estimating saved tokens from length")
+        return lambda text: max(1, len(text) // 4)
+
+
+def count_tokens(text: str) -> int:
+    """Tokens ``text`` costs an OpenAI embedding model (cl100k_base)."""
+    return _tokenizer()(text)
+
+
+class EmbeddingCache(ABC):
+    """Embeddings keyed by model, dimension and text hash.
+
+    ``embed`` serves what it can from the cache, sends the distinct misses
+    to ``provider`` in one call and stores the results. A cache that cannot
+    be read or written is skipped rather than failing the embedding.
+    """
+
+    def __init__(self, count_tokens: Callable[[str], int] = count_tokens) -> None:
+        self._count_tokens = count_tokens
+        self.hits = 0
+        self.misses = 0
+        self.saved_tokens = 0
+
+    @abstractmethod
+    async def get_many(
+        self, model: str, dim: int, keys: list[bytes]
+    ) -> dict[bytes, Any]:
+        """Cached vectors among ``keys``, as float32 arrays."""
+
+    @abstractmethod
+    async def put_many(self, model: str, dim: int, vectors: dict[bytes, Any]) -> None:
+        """Store float32 vectors under their text hashes."""
+
+    async def embed(
+        self,
+        model: str,
+        dim: int,
+        texts: list[str],
+        provider: Callable[[list[str]], Awaitable[Any]],
+    ) -> Any:
+        """Embeddings of ``texts`` (one row each), calling ``provider`` for misses."""
+        import numpy as np
+
+        if not texts:
+            return np.empty((0, dim), dtype=np.float32)
+        keys = [text_hash(text) for text in texts]
+        try:
+            with tracer.start_as_current_span("embedding cache lookup"):
+                found = await self.get_many(model, dim, list(dict.fromkeys(keys)))
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            found = {}
+        missing = {
+            key: text for key, text in zip(keys, texts, strict=True) if key not in found
+        }
+        if missing:
+            vectors = np.asarray(
+                await provider(list(missing.values())), dtype=np.float32
+            )
+            computed = dict(zip(missing, vectors, strict=True))
+            try:
+                with tracer.start_as_current_span("embedding cache write"):
+                    await self.put_many(model, dim, computed)
+            except Exception as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+            found = {**found, **computed}
+
+        self.misses += len(missing)
+        self.hits += len(texts) - len(missing)
+        served = set()
+        for key, text in zip(keys, texts, strict=True):
+            # The first occurrence of a missing text is the one that was paid for.
+            if key in missing and key not in served:
+                served.add(key)
+            else:
+                self.saved_tokens += self._count_tokens(text)
+        return np.stack([found[key] for key in keys])
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "saved_tokens": self.saved_tokens,
+        }
+
+
+class PostgresEmbeddingCache(EmbeddingCache):
+    """Embedding cache in the service's PostgreSQL database.
+
+    Vectors are stored as raw float32 bytes, so the table needs no pgvector
+    column and works for any dimension. Entries are never expired: a text's
+    embedding does not change for a given model. When no pooled connection
+    frees up within ``acquire_timeout`` the lookup or write fails, and
+    ``embed`` calls the provider instead of waiting on the pool.
+    """
+
+    def __init__(
+        self,
+        pool: PostgresPool,
+        count_tokens: Callable[[str], int] = count_tokens,
+        acquire_timeout: float | None = None,
+    ) -> None:
+        super().__init__(count_tokens)
+        self._pool = pool
+        self._acquire_timeout = acquire_timeout
+        self._schema_ready = False
+
+    async def _ensure_schema(self, connection: Any) -> None:
+        if not self._schema_ready:
+            await connection.execute(_CREATE_TABLE_SQL)
+            self._schema_ready = True
+
+    async def get_many(
+        self, model: str, dim: int, keys: list[bytes]
+    ) -> dict[bytes, Any]:
+        import numpy as np
+
+        async with self._pool.acquire(timeout=self._acquire_timeout) as connection:
+            await self._ensure_schema(connection)
+            rows = await connection.fetch(
+                f"SELECT text_hash, embedding FROM {CACHE_TABLE} "
+                "WHERE model = $1 AND dim = $2 AND text_hash = ANY($3::bytea[])",
+                model,
+                dim,
+                keys,
+            )
+        return {
+            bytes(row["text_hash"]): np.frombuffer(row["embedding"], dtype=np.float32)
+            for row in rows
+        }
+
+    async def put_many(self, model: str, dim: int, vectors: dict[bytes, Any]) -> None:
+        import numpy as np
+
+        async with self._pool.acquire(timeout=self._acquire_timeout) as connection:
+            await self._ensure_schema(connection)
+            await connection.execute(
+                f"INSERT INTO {CACHE_TABLE} (model, dim, text_hash, embedding) "
+                "SELECT $1, $2, h, e FROM unnest($3::bytea[], $4::bytea[]) AS t(h, e) "
+                "ON CONFLICT DO NOTHING",
+                model,
+                dim,
+                list(vectors),
+                [np.asarray(v, dtype=np.float32).tobytes() for v in vectors.values()],
+            )
+
+
+class InMemoryEmbeddingCache(EmbeddingCache):
+    """Per-process LRU embedding cache holding up to ``max_entries`` vectors."""
+
+    def __init__(
+        self, max_entries: int, count_tokens: Callable[[str], int] = count_tokens
+    ) -> None:
+        super().__init__(count_tokens)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, int, bytes], Any] = OrderedDict()
+
+    async def get_many(
+        self, model: str, dim: int, keys: list[bytes]
+    ) -> dict[bytes, Any]:
+        found = {}
+        for key in keys:
+            vector = self._entries.get((model, dim, key))
+            if vector is not None:
+                self._entries.move_to_end((model, dim, key))
+                found[key] = vector
+        return found
+
+    async def put_many(self, model: str, dim: int, vectors: dict[bytes, Any]) -> None:
+        for key, vector in vectors.items():
+            self._entries[(model, dim, key)] = vector
+            self._entries.move_to_end((model, dim, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {**super().stats(), "size": len(self._entries)}
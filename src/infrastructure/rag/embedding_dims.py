@@ -0,0 +1,61 @@
+"""Embedding dimension each workspace is served at, shared by every process.
+
+After a migration cuts a workspace over to a smaller dimension, every API
+replica and worker has to read and write the new vector tables. The
+dimension is recorded per workspace and embedding model in the
+``raganything_embedding_dims`` table, and each process's engine reads it
+before using the workspace.
+"""
+
+from typing import Any
+
+from infrastructure.database.postgres_pool import PostgresPool
+
+DIMS_TABLE = "raganything_embedding_dims"
+
+_CREATE_TABLE_SQL = f"""
+CREATE TABLE IF NOT EXISTS {DIMS_TABLE} (
+    workspace TEXT NOT NULL,
+    model TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (workspace, model)
+)
+"""
+
+
+class PostgresEmbeddingDims:
+    """Per-workspace embedding dimensions in the service's PostgreSQL database."""
+
+    def __init__(self, pool: PostgresPool, model: str) -> None:
+        self._pool = pool
+        self._model = model
+        self._schema_ready = False
+
+    async def _ensure_schema(self, connection: Any) -> None:
+        if not self._schema_ready:
+            await connection.execute(_CREATE_TABLE_SQL)
+            self._schema_ready = True
+
+    async def get(self, workspace: str) -> int | None:
+        """The dimension ``workspace`` was cut over to, if it ever was."""
+        async with self._pool.acquire() as connection:
+            await self._ensure_schema(connection)
+            return await connection.fetchval(
+                f"SELECT dim FROM {DIMS_TABLE} WHERE workspace = $1 AND model = $2",
+                workspace,
+                self._model,
+            )
+
+    async def set(self, workspace: str, dim: int) -> None:
+        """Record that ``workspace`` is served at ``dim`` dimensions."""
+        async with self._pool.acquire() as connection:
+            await self._ensure_schema(connection)
+            await connection.execute(
+                f"INSERT INTO {DIMS_TABLE} (workspace, model, dim) "
+                "VALUES ($1, $2, $3) ON CONFLICT (workspace, model) "
+                "DO UPDATE SET dim = EXCLUDED.dim, updated_at = now()",
+                workspace,
+                self._model,
+                dim,
+            )
@@ -0,0 +1,65 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+Keywords = tuple[list[str], list[str]]
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query used as cache key."""
+    return " ".join(query.lower().split()).rstrip("?!. ")
+
+
+class KeywordCache:
+    """In-process LRU cache of LLM keyword extraction results with a TTL.
+
+    LightRAG's own LLM cache is stored per workspace, so the same question
+    asked against two workspaces pays for two extraction calls. Keyword
+    extraction depends only on the query text and the chat model, so this
+    cache is keyed on those and shared by every workspace in the process.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Keywords]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model: str, query: str) -> Keywords | None:
+        """Return cached (high_level, low_level) keywords, or None."""
+        key = (model, normalize_query(query))
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        hl_keywords, ll_keywords = entry[1]
+        return list(hl_keywords), list(ll_keywords)
+
+    def put(
+        self, model: str, query: str, hl_keywords: list[str], ll_keywords: list[str]
+    ) -> None:
+        """Store keywords; empty extractions are not cached."""
+        if self.max_entries <= 0 or not (hl_keywords or ll_keywords):
+            return
+        key = (model, normalize_query(query))
+        expires_at = self._clock() + self.ttl_seconds
+        self._entries[key] = (expires_at, (list(hl_keywords), list(ll_keywords)))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,274 @@
+"""Lexical (full-text) search over a workspace's text chunks.
+
+Vector search at ``COSINE_THRESHOLD`` misses exact terms such as part
+numbers, contract IDs or error codes, whose embeddings say little about the
+literal string. These indexes search LightRAG's ``text_chunks`` storage by
+term instead, for fusion with the vector hits (see ``chunk_retrieval``):
+
+- ``PostgresLexicalIndex``: a GIN expression index on
+  ``to_tsvector(<config>, content)`` over ``LIGHTRAG_DOC_CHUNKS``, queried
+  per workspace and ranked with ``ts_rank_cd``.
+- ``InMemoryLexicalIndex``: a BM25 inverted index built from the JSON KV
+  storage used by local mode, rebuilt when the workspace's chunks change.
+
+Both return chunks in the shape ``chunk_retrieval`` merges, best first.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import math
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any
+
+from infrastructure.database.postgres_pool import PostgresPool
+
+logger = logging.getLogger(__name__)
+
+# Words, plus identifiers joined by - . / (AB-1234, v2.1.0, HR/2024/17), which
+# are also indexed by their parts, as Postgres' default parser does.
+_TOKEN = re.compile(r"\w+(?:[-./]\w+)*")
+_PARTS = re.compile(r"\w+")
+_TS_CONFIG = re.compile(r"^[a-z_]+$")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase terms; compound identifiers also yield their parts."""
+    terms: list[str] = []
+    for match in _TOKEN.finditer(text.lower()):
+        token = match.group()
+        terms.append(token)
+        parts = _PARTS.findall(token)
+        if len(parts) > 1:
+            terms.extend(parts)
+    return terms
+
+
+class LexicalIndex(ABC):
+    """Full-text search over one LightRAG ``text_chunks`` storage."""
+
+    @abstractmethod
+    async def search(self, text_chunks: Any, query: str, top_k: int) -> list[dict]:
+        """Return up to ``top_k`` chunks matching ``query`` terms, best first.
+
+        Each chunk is a dict with ``content``, ``file_path`` and ``chunk_id``.
+        """
+
+
+class PostgresLexicalIndex(LexicalIndex):
+    """tsvector/GIN search on LightRAG's Postgres chunk table.
+
+    The GIN index is built by a background task (``start_build``, called at
+    startup and retried from searches until it succeeds) with ``CREATE INDEX
+    CONCURRENTLY``, so existing deployments pick it up without a migration
+    and no query waits for the build; until the index is valid, searches
+    scan the table. The build runs under an advisory lock so replicas do
+    not race, and an invalid index left by a failed build is dropped and
+    rebuilt. Each query term is parsed with ``plainto_tsquery`` and the
+    results are OR-ed with ``||``, so a single exact identifier is enough to
+    match; ``ts_rank_cd`` ranks chunks matching more terms higher.
+    """
+
+    def __init__(
+        self,
+        ts_config: str = "simple",
+        pool: PostgresPool | None = None,
+        retry_seconds: float = 60.0,
+    ) -> None:
+        if not _TS_CONFIG.match(ts_config):
+            raise ValueError(f"Invalid text search configuration: {ts_config!r}")
+        self._ts_config = ts_config
+        self._pool = pool
+        self._retry_seconds = retry_seconds
+        self.index_name = f"idx_lightrag_doc_chunks_fts_{ts_config}"
+        self._index_ready = False
+        self._build_task: asyncio.Task | None = None
+        self._next_attempt = 0.0
+
+    @property
+    def _tsvector(self) -> str:
+        # Must match the index expression exactly for the planner to use it.
+        return f"to_tsvector('{self._ts_config}'::regconfig, content)"
+
+    def start_build(self) -> None:
+        """Build the GIN index in the background unless it is ready or building.
+
+        Without a pool the index is left to be created by an operator.
+        """
+        if (
+            self._index_ready
+            or self._pool is None
+            or (self._build_task is not None and not self._build_task.done())
+            or time.monotonic() < self._next_attempt
+        ):
+            return
+        self._build_task = asyncio.create_task(self.build())
+
+    async def build(self) -> bool:
+        """Create the GIN index if needed; True once a valid index exists."""
+        assert self._pool is not None
+        lock_key = int.from_bytes(
+            hashlib.sha256(self.index_name.encode()).digest()[:8], "big", signed=True
+        )
+        try:
+            async with self._pool.acquire() as connection:
+                if not await connection.fetchval(
+                    "SELECT to_regclass('lightrag_doc_chunks') IS NOT NULL"
+                ):
+                    logger.info(
+                        "Chunk table does not exist yet; full-text index deferred"
+                    )
+                    return self._retry_later()
+                if not await connection.fetchval(
+                    "SELECT pg_try_advisory_lock($1)", lock_key
+                ):
+                    logger.info("Full-text index is being built by another replica")
+                    return self._retry_later()
+                try:
+                    valid = await self._is_valid(connection)
+                    if valid is False:
+                        logger.warning(f"Rebuilding invalid index {self.index_name}")
+                        await connection.execute(
+                            f"DROP INDEX CONCURRENTLY IF EXISTS {self.index_name}"
+                        )
+                    if valid is not True:
+                        logger.info(f"Building full-text index {self.index_name}")
+                        await connection.execute(
+                            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {self.index_name} "
+                            f"ON LIGHTRAG_DOC_CHUNKS USING GIN ({self._tsvector})"
+                        )
+                        valid = await self._is_valid(connection)
+                finally:
+                    await connection.execute("SELECT pg_advisory_unlock($1)", lock_key)
+        except Exception as e:
+            logger.warning(f"Could not build full-text index: {e}")
+            return self._retry_later()
+        if not valid:
+            return self._retry_later()
+        self._index_ready = True
+        logger.info(f"Full-text index {self.index_name} is ready")
+        return True
+
+    async def _is_valid(self, connection: Any) -> bool | None:
+        """``pg_index.indisvalid`` of the index, or None if it does not exist."""
+        return await connection.fetchval(
+            "SELECT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = $1",
+            self.index_name,
+        )
+
+    def _retry_later(self) -> bool:
+        self._next_attempt = time.monotonic() + self._retry_seconds
+        return False
+
+    async def aclose(self) -> None:
+        """Cancel a running build; the next start drops what it left behind."""
+        if self._build_task is not None:
+            self._build_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._build_task
+
+    async def search(self, text_chunks: Any, query: str, top_k: int) -> list[dict]:
+        db = text_chunks.db
+        self.start_build()
+        terms = list(dict.fromkeys(_TOKEN.findall(query.lower())))
+        if not terms:
+            return []
+        any_term = " || ".join(
+            f"plainto_tsquery($2::regconfig, ${n})" for n in range(4, 4 + len(terms))
+        )
+        sql = (
+            f"SELECT id, content, file_path, ts_rank_cd({self._tsvector}, q) AS rank "
+            f"FROM LIGHTRAG_DOC_CHUNKS, (SELECT {any_term} AS q) AS terms "
+            f"WHERE workspace = $1 AND {self._tsvector} @@ q "
+            "ORDER BY rank DESC LIMIT $3"
+        )
+        rows = await db.query(
+            sql,
+            [text_chunks.workspace, self._ts_config, top_k, *terms],
+            multirows=True,
+        )
+        return [
+            {
+                "content": row["content"],
+                "file_path": row.get("file_path") or "unknown_source",
+                "chunk_id": row["id"],
+            }
+            for row in rows or []
+        ]
+
+
+class _Bm25Index:
+    """Okapi BM25 over a fixed set of chunks."""
+
+    def __init__(self, chunks: dict[str, dict], k1: float = 1.2, b: float = 0.75):
+        self.keys = frozenset(chunks)
+        self._k1 = k1
+        self._b = b
+        self._chunks: dict[str, dict] = {}
+        self._postings: dict[str, list[tuple[str, int]]] = {}
+        self._lengths: dict[str, int] = {}
+        for chunk_id, chunk in chunks.items():
+            content = (chunk or {}).get("content")
+            if not content:
+                continue
+            terms = Counter(tokenize(content))
+            self._chunks[chunk_id] = chunk
+            self._lengths[chunk_id] = sum(terms.values())
+            for term, count in terms.items():
+                self._postings.setdefault(term, []).append((chunk_id, count))
+        self._avg_length = (
+            sum(self._lengths.values()) / len(self._lengths) if self._lengths else 0.0
+        )
+
+    def search(self, query: str, top_k: int) -> list[dict]:
+        total = len(self._lengths)
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for chunk_id, count in postings:
+                norm = (
+                    1 - self._b + self._b * self._lengths[chunk_id] / self._avg_length
+                )
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * (
+                    count * (self._k1 + 1) / (count + self._k1 * norm)
+                )
+        best = sorted(scores, key=lambda chunk_id: -scores[chunk_id])[:top_k]
+        return [
+            {
+                "content": self._chunks[chunk_id]["content"],
+                "file_path": self._chunks[chunk_id].get("file_path")
+                or "unknown_source",
+                "chunk_id": chunk_id,
+            }
+            for chunk_id in best
+        ]
+
+
+class InMemoryLexicalIndex(LexicalIndex):
+    """BM25 index per workspace over LightRAG's JSON KV chunk storage.
+
+    Chunk ids are content hashes, so the index is rebuilt only when the set
+    of chunk ids in the storage changes.
+    """
+
+    def __init__(self) -> None:
+        self._indexes: dict[str, _Bm25Index] = {}
+
+    async def search(self, text_chunks: Any, query: str, top_k: int) -> list[dict]:
+        # JsonKVStorage keeps its records in a shared in-process dict; reading
+        # it directly avoids copying every chunk through get_by_ids().
+        async with text_chunks._storage_lock:
+            data: dict[str, dict] = text_chunks._data or {}
+            index = self._indexes.get(text_chunks.workspace)
+            if index is None or index.keys != data.keys():
+                index = _Bm25Index(dict(data))
+                self._indexes[text_chunks.workspace] = index
+        return index.search(query, top_k)
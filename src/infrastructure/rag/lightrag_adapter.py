@@ -1,27 +1,69 @@
+import asyncio
 import hashlib
+import importlib
 import os
 import tempfile
 import time
-from typing import Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from fastapi.logger import logger
-from lightrag import QueryParam
-from lightrag.llm.openai import openai_complete_if_cache, openai_embed
-from lightrag.utils import EmbeddingFunc
-from raganything import RAGAnything, RAGAnythingConfig
+from opentelemetry import trace
 
 from application.requests.query_request import MultimodalContentItem
 from config import LLMConfig, RAGConfig
+from domain.entities.document_deletion import DeletionStatus, DocumentDeletionResult
 from domain.entities.indexing_result import (
     FileIndexingResult,
     FileProcessingDetail,
     FolderIndexingResult,
     FolderIndexingStats,
     IndexingStatus,
+    ModelCallKind,
 )
+from domain.entities.vector_index import VectorSearchSettings
 from domain.ports.rag_engine import RAGEnginePort
+from infrastructure.rag.chunk_diff import adopt_chunks, reusing_chunks
+from infrastructure.rag.chunk_retrieval import (
+    FUSION_MODE,
+    KEYWORD_MODES,
+    ChunkTrackingUnavailable,
+    retrieve_chunks,
+)
+from infrastructure.rag.diversification import diversify_chunks
+from infrastructure.rag.embedding_cache import EmbeddingCache, InMemoryEmbeddingCache
+from infrastructure.rag.embedding_dims import PostgresEmbeddingDims
+from infrastructure.rag.keyword_cache import KeywordCache
+from infrastructure.rag.lexical_index import (
+    InMemoryLexicalIndex,
+    LexicalIndex,
+    PostgresLexicalIndex,
+)
+from infrastructure.rag.matryoshka import truncate_embeddings
+from infrastructure.rag.provider_clients import ProviderHttpClients
+from infrastructure.rag.usage_tracking import recording_usage, tracking_call
+from infrastructure.scheduling.concurrency_limiter import ConcurrencyLimiter
+from infrastructure.scheduling.fair_scheduler import WeightedFairScheduler
+
+if TYPE_CHECKING:
+    from lightrag import QueryParam
+    from lightrag.llm.openai import openai_complete_if_cache, openai_embed
+    from lightrag.utils import EmbeddingFunc
+    from raganything import RAGAnything, RAGAnythingConfig
+
+QueryMode = Literal["local", "global", "hybrid", "naive", "mix", "bypass", "fusion"]
+
+tracer = trace.get_tracer(__name__)
+
+# Candidates retrieved per returned chunk when near-duplicates are collapsed
+# or chunks are reordered for diversity.
+_DIVERSIFY_DEPTH = 2
 
-QueryMode = Literal["local", "global", "hybrid", "naive", "mix", "bypass"]
+# Poll interval while a deletion waits for an insert into the same workspace.
+_DELETE_RETRY_SECONDS = 1.0
+
+
+class AmbiguousDocumentError(ValueError):
+    """The recorded file paths do not tell which documents belong to a file."""
 
 _POSTGRES_STORAGE = {
     "kv_storage": "PGKVStorage",
@@ -38,13 +80,89 @@ _LOCAL_STORAGE = {
 }
 
 
+# raganything, lightrag and docling take over a second to import. They are
+# resolved on first use (or by load_rag_stack() from a warm-up thread) so the
+# API can bind and answer /health before the RAG stack is loaded.
+_LAZY_IMPORTS = {
+    "QueryParam": ("lightrag", "QueryParam"),
+    "openai_complete_if_cache": ("lightrag.llm.openai", "openai_complete_if_cache"),
+    "openai_embed": ("lightrag.llm.openai", "openai_embed"),
+    "EmbeddingFunc": ("lightrag.utils", "EmbeddingFunc"),
+    "RAGAnything": ("raganything", "RAGAnything"),
+    "RAGAnythingConfig": ("raganything", "RAGAnythingConfig"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def load_rag_stack() -> None:
+    """Import the RAG stack into this module's namespace.
+
+    Safe to call repeatedly and from a background thread; names that are
+    already bound (including test patches) are left untouched.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
+
+
 class LightRAGAdapter(RAGEnginePort):
     """Adapter for RAGAnything/LightRAG implementing RAGEnginePort."""
 
-    def __init__(self, llm_config: LLMConfig, rag_config: RAGConfig) -> None:
+    def __init__(
+        self,
+        llm_config: LLMConfig,
+        rag_config: RAGConfig,
+        scheduler: WeightedFairScheduler | None = None,
+        llm_limiter: ConcurrencyLimiter | None = None,
+        keyword_cache: KeywordCache | None = None,
+        lexical_index: LexicalIndex | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+        http_clients: ProviderHttpClients | None = None,
+        embedding_dims: PostgresEmbeddingDims | None = None,
+    ) -> None:
         self._llm_config = llm_config
         self._rag_config = rag_config
         self.rag: dict[str, RAGAnything] = {}
+        self.scheduler = scheduler or WeightedFairScheduler(
+            max_concurrency=rag_config.INDEXING_MAX_CONCURRENCY,
+            workspace_concurrency=rag_config.INDEXING_WORKSPACE_CONCURRENCY,
+            weights=rag_config.INDEXING_WORKSPACE_WEIGHTS,
+        )
+        self.llm_limiter = llm_limiter or ConcurrencyLimiter(
+            llm_config.LLM_MAX_CONCURRENCY
+        )
+        self.keyword_cache = keyword_cache or KeywordCache(
+            ttl_seconds=rag_config.KEYWORD_CACHE_TTL_SECONDS,
+            max_entries=rag_config.KEYWORD_CACHE_MAX_ENTRIES,
+        )
+        # Dimensions switched at runtime by cutovers, here or (read from
+        # embedding_dims) in another process.
+        self._embedding_dims: dict[str, int] = {}
+        # When each workspace's recorded dimension was last read (monotonic).
+        self._dims_checked: dict[str, float] = {}
+        # Query vectors already computed for diversification, keyed by
+        # (working_dir, query), served to LightRAG's graph query while it runs.
+        self._query_embeddings: dict[tuple[str, str], Any] = {}
+        self.embedding_dims = embedding_dims
+        self.lexical_index = lexical_index or (
+            PostgresLexicalIndex(rag_config.LEXICAL_TS_CONFIG)
+            if rag_config.RAG_STORAGE_TYPE == "postgres"
+            else InMemoryLexicalIndex()
+        )
+        self.http_clients = http_clients or ProviderHttpClients(llm_config)
+        self.embedding_cache = embedding_cache
+        if embedding_cache is None and rag_config.EMBEDDING_CACHE_ENABLED:
+            self.embedding_cache = InMemoryEmbeddingCache(
+                rag_config.EMBEDDING_CACHE_MAX_ENTRIES
+            )
 
     @staticmethod
     def _make_workspace(working_dir: str) -> str:
@@ -58,9 +176,10 @@ class LightRAGAdapter(RAGEnginePort):
         digest = hashlib.sha256(working_dir.encode()).hexdigest()[:16]
         return f"ws_{digest}"
 
-    def init_project(self, working_dir: str) -> RAGAnything:
+    def init_project(self, working_dir: str) -> "RAGAnything":
         if working_dir in self.rag:
             return self.rag[working_dir]
+        load_rag_stack()
         workspace = self._make_workspace(working_dir)
 
         # Capture config values as locals to avoid passing bound methods.
@@ -69,34 +188,91 @@ class LightRAGAdapter(RAGEnginePort):
         # during init, which traverses the entire object graph including asyncpg
         # connections — and asyncpg objects are not picklable/copyable.
         llm_config = self._llm_config
+        llm_limiter = self.llm_limiter
+        embedding_cache = self.embedding_cache
+        http_clients = self.http_clients
+        embedding_dim = self._embedding_dim(working_dir)
 
         async def llm_call(prompt, system_prompt=None, history_messages=None, **kwargs):
             if history_messages is None:
                 history_messages = []
-            return await openai_complete_if_cache(
-                llm_config.CHAT_MODEL,
-                prompt,
-                system_prompt=system_prompt,
-                history_messages=history_messages,
-                api_key=llm_config.api_key,
-                base_url=llm_config.api_base_url,
-                **kwargs,
-            )
+            forward = kwargs.pop("token_tracker", None)
+            async with llm_limiter.slot():
+                with tracking_call(ModelCallKind.LLM, forward) as call:
+                    return await openai_complete_if_cache(
+                        llm_config.CHAT_MODEL,
+                        prompt,
+                        system_prompt=system_prompt,
+                        history_messages=history_messages,
+                        api_key=llm_config.api_key,
+                        base_url=llm_config.api_base_url,
+                        token_tracker=call,
+                        openai_client_configs=http_clients.client_configs(
+                            llm_config.api_base_url
+                        ),
+                        **kwargs,
+                    )
 
         async def vision_call(prompt, system_prompt=None, history_messages=None, image_data=None, **kwargs):
             if history_messages is None:
                 history_messages = []
             messages = _build_vision_messages(system_prompt, history_messages, prompt, image_data)
-            return await openai_complete_if_cache(
-                llm_config.VISION_MODEL,
-                "Image Description Task",
-                system_prompt=None,
-                history_messages=messages,
-                api_key=llm_config.api_key,
-                base_url=llm_config.api_base_url,
-                messages=messages,
-                **kwargs,
+            forward = kwargs.pop("token_tracker", None)
+            async with llm_limiter.slot():
+                with tracking_call(ModelCallKind.VISION, forward) as call:
+                    return await openai_complete_if_cache(
+                        llm_config.VISION_MODEL,
+                        "Image Description Task",
+                        system_prompt=None,
+                        history_messages=messages,
+                        api_key=llm_config.api_key,
+                        base_url=llm_config.api_base_url,
+                        messages=messages,
+                        token_tracker=call,
+                        openai_client_configs=http_clients.client_configs(
+                            llm_config.api_base_url
+                        ),
+                        **kwargs,
+                    )
+
+        async def provider_embed(texts, token_tracker):
+            async with llm_limiter.slot():
+                return await openai_embed(
+                    texts,
+                    model=llm_config.EMBEDDING_MODEL,
+                    api_key=llm_config.api_key,
+                    base_url=llm_config.api_base_url,
+                    token_tracker=token_tracker,
+                    client_configs=http_clients.client_configs(
+                        llm_config.api_base_url
+                    ),
+                )
+
+        async def embed_new(texts):
+            embeddings = await _tracked_embed(
+                texts, provider_embed, embedding_cache, llm_config
             )
+            if embedding_dim < llm_config.EMBEDDING_DIM:
+                return truncate_embeddings(embeddings, embedding_dim)
+            return embeddings
+
+        # Storages may pass hints such as context="query" that the cached
+        # provider call does not use.
+        async def embed(texts, **_kwargs):
+            known = [self._query_embeddings.get((working_dir, t)) for t in texts]
+            missing = [t for t, v in zip(texts, known, strict=True) if v is None]
+            if len(missing) == len(texts):
+                return await embed_new(texts)
+            import numpy as np
+
+            computed = iter(await embed_new(missing) if missing else [])
+            return np.stack(
+                [vector if vector is not None else next(computed) for vector in known]
+            )
+
+        # A reduced dimension gets its own LightRAG vector tables
+        # (<table>_<model>_<dim>d); full-size workspaces keep the unsuffixed ones.
+        reduced = embedding_dim < llm_config.EMBEDDING_DIM
 
         safe_working_dir = os.path.join(tempfile.gettempdir(), "raganything", working_dir.strip("/"))
         self.rag[working_dir] = RAGAnything(
@@ -112,27 +288,89 @@ class LightRAGAdapter(RAGEnginePort):
             llm_model_func=llm_call,
             vision_model_func=vision_call,
             embedding_func=EmbeddingFunc(
-                embedding_dim=llm_config.EMBEDDING_DIM,
+                embedding_dim=embedding_dim,
                 max_token_size=llm_config.MAX_TOKEN_SIZE,
-                func=lambda texts: openai_embed(
-                    texts,
-                    model=llm_config.EMBEDDING_MODEL,
-                    api_key=llm_config.api_key,
-                    base_url=llm_config.api_base_url,
-                ),
+                func=embed,
+                **({"model_name": llm_config.EMBEDDING_MODEL} if reduced else {}),
             ),
             lightrag_kwargs={
-                **(
-                    _POSTGRES_STORAGE
-                    if self._rag_config.RAG_STORAGE_TYPE == "postgres"
-                    else _LOCAL_STORAGE
-                ),
+                **self._storage_classes(),
                 "cosine_threshold": self._rag_config.COSINE_THRESHOLD,
                 "workspace": workspace,
             },
         )
+        _trace_method(self.rag[working_dir], "parse_document", "docling parse")
+        _trace_method(
+            self.rag[working_dir],
+            "_process_multimodal_content",
+            "multimodal processing",
+        )
         return self.rag[working_dir]
 
+    async def graph_storage(self, working_dir: str) -> Any:
+        """LightRAG's knowledge-graph storage for a workspace, initialized."""
+        rag = self.init_project(working_dir)
+        await rag._ensure_lightrag_initialized()
+        return rag.lightrag.chunk_entity_relation_graph
+
+    def _embedding_dim(self, working_dir: str) -> int:
+        return self._embedding_dims.get(
+            working_dir,
+            self._llm_config.EMBEDDING_WORKSPACE_DIMS.get(
+                working_dir, self._llm_config.EMBEDDING_DIM
+            ),
+        )
+
+    def _use_embedding_dim(self, working_dir: str, dim: int) -> None:
+        self._embedding_dims[working_dir] = dim
+        # Queries already holding the old engine finish on the old vectors.
+        self.rag.pop(working_dir, None)
+
+    async def embedding_dim(self, working_dir: str) -> int:
+        """The workspace's dimension, including cutovers by other processes.
+
+        The recorded dimension is re-read at most every
+        EMBEDDING_DIM_REFRESH_SECONDS. If the lookup fails, the cached (or
+        configured) dimension is kept rather than failing the caller.
+        """
+        now = time.monotonic()
+        checked = self._dims_checked.get(working_dir)
+        refresh = self._llm_config.EMBEDDING_DIM_REFRESH_SECONDS
+        if self.embedding_dims is None or (
+            checked is not None and now - checked < refresh
+        ):
+            return self._embedding_dim(working_dir)
+        self._dims_checked[working_dir] = now
+        try:
+            dim = await self.embedding_dims.get(self._make_workspace(working_dir))
+        except Exception as e:
+            logger.warning(f"Could not read the dimension of {working_dir}: {e}")
+            return self._embedding_dim(working_dir)
+        if dim is not None and dim != self._embedding_dim(working_dir):
+            logger.info(f"Workspace {working_dir} was cut over to {dim} dimensions")
+            self._use_embedding_dim(working_dir, dim)
+        return self._embedding_dim(working_dir)
+
+    async def set_embedding_dim(self, working_dir: str, dim: int) -> None:
+        if self.embedding_dims is not None:
+            await self.embedding_dims.set(self._make_workspace(working_dir), dim)
+            self._dims_checked[working_dir] = time.monotonic()
+        self._use_embedding_dim(working_dir, dim)
+
+    def _storage_classes(self) -> dict[str, str]:
+        """LightRAG storage implementation names for the configured backend."""
+        if self._rag_config.RAG_STORAGE_TYPE == "postgres":
+            return _POSTGRES_STORAGE
+        if self._rag_config.LOCAL_VECTOR_STORAGE == "mmap":
+            from infrastructure.rag.mmap_vector_storage import (
+                STORAGE_NAME,
+                register_mmap_vector_storage,
+            )
+
+            register_mmap_vector_storage()
+            return {**_LOCAL_STORAGE, "vector_storage": STORAGE_NAME}
+        return _LOCAL_STORAGE
+
     # ------------------------------------------------------------------
     # LLM callables (passed directly to RAGAnything)
     # ------------------------------------------------------------------
@@ -140,6 +378,7 @@ class LightRAGAdapter(RAGEnginePort):
     async def _llm_call(
         self, prompt, system_prompt=None, history_messages=None, **kwargs
     ):
+        load_rag_stack()
         if history_messages is None:
             history_messages = []
         return await openai_complete_if_cache(
@@ -149,9 +388,33 @@ class LightRAGAdapter(RAGEnginePort):
             history_messages=history_messages,
             api_key=self._llm_config.api_key,
             base_url=self._llm_config.api_base_url,
+            openai_client_configs=self.http_clients.client_configs(
+                self._llm_config.api_base_url
+            ),
             **kwargs,
         )
 
+    async def embed_texts(self, texts: list[str]):
+        """Full-dimension embeddings of ``texts``, sharing the LLM limiter."""
+        load_rag_stack()
+
+        async def provider_embed(batch: list[str], token_tracker: Any):
+            async with self.llm_limiter.slot():
+                return await openai_embed(
+                    batch,
+                    model=self._llm_config.EMBEDDING_MODEL,
+                    api_key=self._llm_config.api_key,
+                    base_url=self._llm_config.api_base_url,
+                    token_tracker=token_tracker,
+                    client_configs=self.http_clients.client_configs(
+                        self._llm_config.api_base_url
+                    ),
+                )
+
+        return await _tracked_embed(
+            texts, provider_embed, self.embedding_cache, self._llm_config
+        )
+
     async def _vision_call(
         self,
         prompt,
@@ -160,6 +423,7 @@ class LightRAGAdapter(RAGEnginePort):
         image_data=None,
         **kwargs,
     ):
+        load_rag_stack()
         if history_messages is None:
             history_messages = []
         messages = _build_vision_messages(
@@ -173,48 +437,223 @@ class LightRAGAdapter(RAGEnginePort):
             api_key=self._llm_config.api_key,
             base_url=self._llm_config.api_base_url,
             messages=messages,
+            openai_client_configs=self.http_clients.client_configs(
+                self._llm_config.api_base_url
+            ),
             **kwargs,
         )
 
+    # ------------------------------------------------------------------
+    # Port implementation — load
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict:
+        indexing = self.scheduler.stats()
+        return {
+            "engines": len(self.rag),
+            "indexing": {
+                "running": indexing["running"],
+                "waiting": indexing["waiting"],
+                "max_concurrency": indexing["max_concurrency"],
+            },
+            "llm": self.llm_limiter.stats(),
+            **(
+                {"embedding_cache": self.embedding_cache.stats()}
+                if self.embedding_cache is not None
+                else {}
+            ),
+        }
+
     # ------------------------------------------------------------------
     # Port implementation — indexing
     # ------------------------------------------------------------------
 
-    def _ensure_initialized(self, working_dir: str) -> RAGAnything:
+    def _ensure_initialized(self, working_dir: str) -> "RAGAnything":
         rag = self.rag.get(working_dir)
         if rag is None:
             raise RuntimeError(f"RAG engine not initialized for '{working_dir}'. Call init_project() first.")
+        load_rag_stack()
+        return rag
+
+    async def _engine(self, working_dir: str) -> "RAGAnything":
+        """The workspace's engine, rebuilt if another process cut it over."""
+        self._ensure_initialized(working_dir)
+        await self.embedding_dim(working_dir)
+        rag = self.init_project(working_dir)
+        await rag._ensure_lightrag_initialized()
         return rag
 
     async def index_document(
         self, file_path: str, file_name: str, output_dir: str, working_dir: str = ""
     ) -> FileIndexingResult:
         start_time = time.time()
-        rag = self._ensure_initialized(working_dir)
-        await rag._ensure_lightrag_initialized()
-        try:
-            await rag.process_document_complete(
-                file_path=file_path, output_dir=output_dir, parse_method="txt"
+        rag = await self._engine(working_dir)
+        with recording_usage(working_dir, file_name) as recorder:
+            try:
+                async with self.scheduler.slot(working_dir):
+                    await _process_document(rag, file_path, output_dir)
+                processing_time_ms = (time.time() - start_time) * 1000
+                return FileIndexingResult(
+                    status=IndexingStatus.SUCCESS,
+                    message=f"File '{file_name}' indexed successfully",
+                    file_path=file_path,
+                    file_name=file_name,
+                    processing_time_ms=round(processing_time_ms, 2),
+                    usage=recorder.usage,
+                )
+            except Exception as e:
+                processing_time_ms = (time.time() - start_time) * 1000
+                logger.error(
+                    f"Failed to index document {file_path}: {e}", exc_info=True
+                )
+                return FileIndexingResult(
+                    status=IndexingStatus.FAILED,
+                    message=f"Failed to index file '{file_name}'",
+                    file_path=file_path,
+                    file_name=file_name,
+                    processing_time_ms=round(processing_time_ms, 2),
+                    usage=recorder.usage,
+                    error=str(e),
+                )
+
+    async def replace_document(
+        self, file_path: str, file_name: str, output_dir: str, working_dir: str = ""
+    ) -> FileIndexingResult:
+        # Also covers the entity and relation rebuilds of the deletions.
+        with recording_usage(working_dir, file_name) as recorder:
+            result = await self._replace_document(
+                file_path, file_name, output_dir, working_dir
             )
-            processing_time_ms = (time.time() - start_time) * 1000
+        return result.model_copy(update={"usage": recorder.usage})
+
+    async def _replace_document(
+        self, file_path: str, file_name: str, output_dir: str, working_dir: str
+    ) -> FileIndexingResult:
+        rag = await self._engine(working_dir)
+        lightrag = rag.lightrag
+        try:
+            previous_ids = await _indexed_doc_ids(lightrag, file_name)
+        except AmbiguousDocumentError as e:
             return FileIndexingResult(
-                status=IndexingStatus.SUCCESS,
-                message=f"File '{file_name}' indexed successfully",
+                status=IndexingStatus.FAILED,
+                message=f"Cannot tell which indexed documents are '{file_name}'",
                 file_path=file_path,
                 file_name=file_name,
-                processing_time_ms=round(processing_time_ms, 2),
+                error=str(e),
             )
+        previous = {
+            doc_id: status
+            for doc_id, status in zip(
+                previous_ids,
+                await lightrag.doc_status.get_by_ids(previous_ids),
+                strict=True,
+            )
+            if status
+        }
+        if not previous:
+            return await self.index_document(
+                file_path, file_name, output_dir, working_dir
+            )
+
+        chunk_ids = (c for s in previous.values() for c in s.get("chunks_list") or [])
+        with reusing_chunks(lightrag, chunk_ids) as diff:
+            result = await self.index_document(
+                file_path, file_name, output_dir, working_dir
+            )
+        if result.status != IndexingStatus.SUCCESS:
+            return result
+        current = [
+            doc_id
+            for doc_id in await _indexed_doc_ids(lightrag, file_name, strict=False)
+            if doc_id not in previous
+        ]
+        if not current:
+            # Same content: the previous version is the current one.
+            return result
+
+        try:
+            async with self.scheduler.slot(working_dir):
+                await adopt_chunks(lightrag, current[0], previous, diff)
+                for doc_id in previous:
+                    outcome = await self._delete_doc(
+                        lightrag, doc_id, delete_llm_cache=False
+                    )
+                    if outcome.status not in ("success", "not_found"):
+                        raise RuntimeError(outcome.message)
         except Exception as e:
-            processing_time_ms = (time.time() - start_time) * 1000
-            logger.error(f"Failed to index document {file_path}: {e}", exc_info=True)
-            return FileIndexingResult(
-                status=IndexingStatus.FAILED,
-                message=f"Failed to index file '{file_name}'",
-                file_path=file_path,
+            logger.error(
+                f"Failed to remove previous versions of {file_name}: {e}",
+                exc_info=True,
+            )
+            return result.model_copy(
+                update={
+                    "status": IndexingStatus.FAILED,
+                    "message": f"Indexed '{file_name}' but failed to remove its "
+                    "previous version",
+                    "error": str(e),
+                }
+            )
+        return result
+
+    async def delete_document(
+        self, file_name: str, working_dir: str = "", delete_llm_cache: bool = True
+    ) -> DocumentDeletionResult:
+        start_time = time.time()
+        rag = await self._engine(working_dir)
+        deleted: list[str] = []
+
+        def result(status: DeletionStatus, message: str, error: str | None = None):
+            return DocumentDeletionResult(
+                status=status,
+                message=message,
                 file_name=file_name,
-                processing_time_ms=round(processing_time_ms, 2),
+                doc_ids=deleted,
+                processing_time_ms=round((time.time() - start_time) * 1000, 2),
+                error=error,
+            )
+
+        try:
+            async with self.scheduler.slot(working_dir):
+                doc_ids = await _indexed_doc_ids(rag.lightrag, file_name)
+                for doc_id in doc_ids:
+                    outcome = await self._delete_doc(
+                        rag.lightrag, doc_id, delete_llm_cache
+                    )
+                    if outcome.status == "not_allowed":
+                        return result(
+                            DeletionStatus.BUSY,
+                            f"Workspace is busy indexing; '{file_name}' was not "
+                            "fully deleted",
+                            error=outcome.message,
+                        )
+                    if outcome.status == "fail":
+                        raise RuntimeError(outcome.message)
+                    deleted.append(doc_id)
+        except AmbiguousDocumentError as e:
+            return result(
+                DeletionStatus.AMBIGUOUS,
+                f"Cannot tell which indexed documents are '{file_name}'",
                 error=str(e),
             )
+        except Exception as e:
+            logger.error(f"Failed to delete document {file_name}: {e}", exc_info=True)
+            return result(
+                DeletionStatus.FAILED, f"Failed to delete file '{file_name}'", str(e)
+            )
+        if not doc_ids:
+            return result(DeletionStatus.NOT_FOUND, f"File '{file_name}' is not indexed")
+        return result(DeletionStatus.SUCCESS, f"File '{file_name}' deleted")
+
+    async def _delete_doc(self, lightrag: Any, doc_id: str, delete_llm_cache: bool):
+        """``adelete_by_doc_id``, retried while an insert holds the pipeline."""
+        deadline = time.monotonic() + self._rag_config.DOCUMENT_DELETE_WAIT_SECONDS
+        while True:
+            outcome = await lightrag.adelete_by_doc_id(
+                doc_id, delete_llm_cache=delete_llm_cache
+            )
+            if outcome.status != "not_allowed" or time.monotonic() >= deadline:
+                return outcome
+            await asyncio.sleep(_DELETE_RETRY_SECONDS)
 
     async def index_folder(
         self,
@@ -224,15 +663,16 @@ class LightRAGAdapter(RAGEnginePort):
         file_extensions: list[str] | None = None,
         working_dir: str = "",
     ) -> FolderIndexingResult:
-        """Index a folder by processing each document sequentially.
+        """Index a folder by submitting each document to the fair scheduler.
 
         RAGAnything's process_folder_complete uses deepcopy internally which
         fails with asyncpg/asyncio objects. We iterate files manually and
-        call process_document_complete for each one instead.
+        call process_document_complete for each one instead. Every file waits
+        for its own scheduler slot, so other workspaces' files interleave with
+        a large folder instead of queueing behind it.
         """
         start_time = time.time()
-        rag = self._ensure_initialized(working_dir)
-        await rag._ensure_lightrag_initialized()
+        rag = await self._engine(working_dir)
 
         glob_pattern = "**/*" if recursive else "*"
         from pathlib import Path
@@ -246,35 +686,38 @@ class LightRAGAdapter(RAGEnginePort):
 
         succeeded = 0
         failed = 0
-        file_results: list[FileProcessingDetail] = []
 
-        for file_path_obj in all_files:
-            try:
-                await rag.process_document_complete(
-                    file_path=str(file_path_obj),
-                    output_dir=output_dir,
-                    parse_method="txt",
-                )
-                succeeded += 1
-                file_results.append(
-                    FileProcessingDetail(
+        async def _index_one(file_path_obj: Path) -> FileProcessingDetail:
+            nonlocal succeeded, failed
+            with recording_usage(working_dir, file_path_obj.name) as recorder:
+                try:
+                    async with self.scheduler.slot(working_dir):
+                        await _process_document(rag, str(file_path_obj), output_dir)
+                    succeeded += 1
+                    logger.info(f"Indexed {file_path_obj.name} ({succeeded}/{len(all_files)})")
+                    return FileProcessingDetail(
                         file_path=str(file_path_obj),
                         file_name=file_path_obj.name,
                         status=IndexingStatus.SUCCESS,
+                        usage=recorder.usage,
                     )
-                )
-                logger.info(f"Indexed {file_path_obj.name} ({succeeded}/{len(all_files)})")
-            except Exception as e:
-                failed += 1
-                logger.error(f"Failed to index {file_path_obj.name}: {e}")
-                file_results.append(
-                    FileProcessingDetail(
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"Failed to index {file_path_obj.name}: {e}")
+                    return FileProcessingDetail(
                         file_path=str(file_path_obj),
                         file_name=file_path_obj.name,
                         status=IndexingStatus.FAILED,
+                        usage=recorder.usage,
                         error=str(e),
                     )
-                )
+
+        # gather wraps each file in its own task, which copies the folder's
+        # recorder into the file's context.
+        with recording_usage(working_dir) as folder_recorder:
+            file_results: list[FileProcessingDetail] = list(
+                await asyncio.gather(*[_index_one(f) for f in all_files])
+            )
 
         processing_time_ms = (time.time() - start_time) * 1000
         total = len(all_files)
@@ -301,6 +744,7 @@ class LightRAGAdapter(RAGEnginePort):
             ),
             file_results=file_results,
             processing_time_ms=round(processing_time_ms, 2),
+            usage=folder_recorder.usage,
         )
 
     # ------------------------------------------------------------------
@@ -308,23 +752,130 @@ class LightRAGAdapter(RAGEnginePort):
     # ------------------------------------------------------------------
 
     async def query(
-        self, query: str, mode: str = "naive", top_k: int = 10, working_dir: str = ""
+        self,
+        query: str,
+        mode: str = "naive",
+        top_k: int = 10,
+        working_dir: str = "",
+        hl_keywords: list[str] | None = None,
+        ll_keywords: list[str] | None = None,
+        diversity: float | None = None,
+        dedup_threshold: float | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
     ) -> dict:
-        rag = self._ensure_initialized(working_dir)
-        await rag._ensure_lightrag_initialized()
+        rag = await self._engine(working_dir)
         if rag.lightrag is None:
             return {
                 "status": "failure",
                 "message": "RAG engine not initialized",
                 "data": {},
             }
-        param = QueryParam(mode=cast(QueryMode, mode), top_k=top_k, chunk_top_k=top_k)
-        result = await rag.lightrag.aquery_data(query=query, param=param)
+        # LightRAG skips its keyword LLM call when either list is non-empty.
+        extract_keywords = mode in KEYWORD_MODES and not (hl_keywords or ll_keywords)
+        if extract_keywords:
+            cached = self.keyword_cache.get(self._llm_config.CHAT_MODEL, query)
+            if cached is not None:
+                hl_keywords, ll_keywords = cached
+                extract_keywords = False
+        diversify = bool(diversity) or dedup_threshold is not None
+        query_embedding = None
+        if diversity:
+            # Embedded once here and reused by vector search (ours, or
+            # LightRAG's graph query through embed()) and MMR.
+            embeddings = await rag.lightrag.chunks_vdb.embedding_func([query])
+            query_embedding = embeddings[0]
+        param = QueryParam(
+            mode=cast(QueryMode, mode),
+            top_k=top_k,
+            chunk_top_k=top_k * _DIVERSIFY_DEPTH if diversify else top_k,
+            hl_keywords=hl_keywords or [],
+            ll_keywords=ll_keywords or [],
+        )
+        vector_search = self._vector_search_settings(working_dir, ef_search, probes)
+        if query_embedding is not None:
+            self._query_embeddings[(working_dir, query)] = query_embedding
+        try:
+            result = await self._retrieve(
+                rag.lightrag, query, param, query_embedding, vector_search
+            )
+        finally:
+            if query_embedding is not None:
+                self._query_embeddings.pop((working_dir, query), None)
+        if diversify:
+            await diversify_chunks(
+                result,
+                rag.lightrag.chunks_vdb,
+                top_k,
+                query_embedding=query_embedding,
+                diversity=diversity,
+                dedup_threshold=dedup_threshold,
+            )
+        if extract_keywords:
+            keywords = (result.get("metadata") or {}).get("keywords") or {}
+            self.keyword_cache.put(
+                self._llm_config.CHAT_MODEL,
+                query,
+                keywords.get("high_level") or [],
+                keywords.get("low_level") or [],
+            )
         if isinstance(result.get("data"), dict):
             result["data"]["entities"] = []
             result["data"]["relationships"] = []
         return result
 
+    def _vector_search_settings(
+        self, working_dir: str, ef_search: int | None, probes: int | None
+    ) -> VectorSearchSettings:
+        """Per-query values, else the workspace's configured ones, else the global ones."""
+        workspace = self._rag_config.VECTOR_SEARCH_WORKSPACE_SETTINGS.get(
+            working_dir, {}
+        )
+        # "none" turns a globally enabled quantization off for one workspace.
+        quantization = workspace.get(
+            "quantization", self._rag_config.VECTOR_QUANTIZATION
+        )
+        return VectorSearchSettings(
+            ef_search=ef_search
+            or workspace.get("ef_search")
+            or self._rag_config.VECTOR_HNSW_EF_SEARCH,
+            probes=probes
+            or workspace.get("probes")
+            or self._rag_config.VECTOR_IVFFLAT_PROBES,
+            quantization=quantization if quantization != "none" else None,
+            rescore_factor=workspace.get("rescore_factor")
+            or self._rag_config.VECTOR_RESCORE_FACTOR,
+        )
+
+    async def _retrieve(
+        self,
+        lightrag,
+        query: str,
+        param: "QueryParam",
+        query_embedding=None,
+        vector_search: VectorSearchSettings | None = None,
+    ) -> dict:
+        """Retrieve chunks, skipping LightRAG's graph context unless disabled."""
+        if param.mode == FUSION_MODE or (
+            self._rag_config.QUERY_CHUNKS_ONLY and param.mode != "bypass"
+        ):
+            try:
+                return await retrieve_chunks(
+                    lightrag,
+                    query,
+                    param,
+                    lexical_index=self.lexical_index,
+                    rrf_k=self._rag_config.FUSION_RRF_K,
+                    query_embedding=query_embedding,
+                    vector_search=vector_search,
+                )
+            except ChunkTrackingUnavailable as e:
+                logger.warning(
+                    f"No {e} for this workspace; falling back to the full graph query"
+                )
+        with tracer.start_as_current_span("lightrag graph query"):
+            return await lightrag.aquery_data(query=query, param=param)
+
     async def query_multimodal(
         self,
         query: str,
@@ -333,8 +884,7 @@ class LightRAGAdapter(RAGEnginePort):
         top_k: int = 10,
         working_dir: str = "",
     ) -> str:
-        rag = self._ensure_initialized(working_dir)
-        await rag._ensure_lightrag_initialized()
+        rag = await self._engine(working_dir)
         raw_content = [
             item.model_dump(exclude_none=True) for item in multimodal_content
         ]
@@ -419,6 +969,114 @@ def _build_vision_messages(
     return messages
 
 
+async def _process_document(rag: Any, file_path: str, output_dir: str) -> None:
+    """``process_document_complete`` in a span; the time before it is the slot wait."""
+    with tracer.start_as_current_span(
+        "raganything process document",
+        attributes={"rag.file_path": file_path},
+    ):
+        await rag.process_document_complete(
+            file_path=file_path, output_dir=output_dir, parse_method="txt"
+        )
+
+
+def _trace_method(rag: Any, name: str, span_name: str) -> None:
+    """Wrap one of a RAGAnything instance's async methods in a span."""
+    method = getattr(rag, name)
+
+    async def traced(*args: Any, **kwargs: Any) -> Any:
+        with tracer.start_as_current_span(span_name):
+            return await method(*args, **kwargs)
+
+    setattr(rag, name, traced)
+
+
+async def _tracked_embed(
+    texts: list[str],
+    provider: Any,
+    embedding_cache: EmbeddingCache | None,
+    llm_config: LLMConfig,
+) -> Any:
+    """Embed ``texts`` through the cache as one tracked embedding call.
+
+    ``provider(batch, token_tracker)`` is only sent the cache misses; the
+    other texts are counted as cache hits.
+    """
+    with tracking_call(ModelCallKind.EMBEDDING) as call:
+        sent = 0
+
+        async def send(batch: list[str]) -> Any:
+            nonlocal sent
+            sent += len(batch)
+            return await provider(batch, call)
+
+        try:
+            if embedding_cache is None:
+                return await send(texts)
+            return await embedding_cache.embed(
+                llm_config.EMBEDDING_MODEL, llm_config.EMBEDDING_DIM, texts, send
+            )
+        finally:
+            call.cache_hits = len(texts) - sent
+
+
+async def _indexed_doc_ids(
+    lightrag: Any, file_name: str, strict: bool = True
+) -> list[str]:
+    """LightRAG document ids indexed from ``file_name``, one per version.
+
+    RAGAnything records the file's base name (or its full path with
+    USE_FULL_PATH) as the document's ``file_path``. A full path matches when
+    it ends with the whole object name. A base name is shared by every object
+    with that name under any prefix, so it only identifies the file when a
+    single document carries it.
+
+    Raises:
+        AmbiguousDocumentError: If ``strict`` and the matches span several
+            recorded paths, or several documents recorded by base name only.
+    """
+    from lightrag.base import DocStatus
+
+    base_name = os.path.basename(file_name)
+
+    def matches(path: str | None) -> bool:
+        if not path:
+            return False
+        if "/" not in path:
+            return path == base_name
+        return path == file_name or path.endswith(f"/{file_name}")
+
+    doc_status = lightrag.doc_status
+    if type(doc_status).__name__ == "PGDocStatusStorage":
+        rows = await doc_status.db.query(
+            "SELECT id, file_path FROM LIGHTRAG_DOC_STATUS "
+            "WHERE workspace = $1 AND (file_path = $2 OR right(file_path, $3) = $4)",
+            [doc_status.workspace, base_name, len(file_name) + 1, f"/{file_name}"],
+            multirows=True,
+        )
+        found = {
+            row["id"]: row["file_path"]
+            for row in rows or []
+            if matches(row["file_path"])
+        }
+    else:
+        docs = await doc_status.get_docs_by_statuses(list(DocStatus))
+        found = {
+            doc_id: doc.file_path
+            for doc_id, doc in docs.items()
+            if matches(doc.file_path)
+        }
+    if strict and len(found) > 1:
+        paths = sorted(set(found.values()))
+        if len(paths) > 1 or "/" not in paths[0]:
+            raise AmbiguousDocumentError(
+                f"{len(found)} indexed documents match '{file_name}' "
+                f"({', '.join(paths)}); set USE_FULL_PATH so documents record "
+                "their full path"
+            )
+    return list(found)
+
+
 def _parse_file_details(result_dict: dict) -> list[FileProcessingDetail] | None:
     if "file_details" not in result_dict:
         return None
@@ -0,0 +1,32 @@
+"""Matryoshka-style embedding dimension reduction.
+
+Models trained with Matryoshka representation learning (OpenAI's
+``text-embedding-3-*`` among them) front-load information, so the first
+``dim`` components of an embedding, re-normalised, are a usable
+lower-dimensional embedding. Storage and brute-force/ANN search cost scale
+with ``dim``.
+
+NumPy is imported lazily to keep it off the API startup path.
+"""
+
+from typing import Any
+
+
+def truncate_embeddings(vectors: Any, dim: int) -> Any:
+    """Keep the first ``dim`` components of each row and L2-normalise them."""
+    import numpy as np
+
+    truncated = np.asarray(vectors, dtype=np.float32)[..., :dim]
+    norms = np.linalg.norm(truncated, axis=-1, keepdims=True)
+    return truncated / np.where(norms == 0, 1.0, norms)
+
+
+def collection_suffix(model_name: str, dim: int) -> str:
+    """LightRAG's vector table suffix for ``model_name`` at ``dim`` dimensions.
+
+    Mirrors ``BaseVectorStorage._generate_collection_suffix``: LightRAG stores
+    each (model, dimension) pair in its own ``<table>_<suffix>`` table.
+    """
+    import re
+
+    return f"{re.sub(r'[^a-zA-Z0-9_]', '_', model_name.lower())}_{dim}d"
@@ -0,0 +1,395 @@
+"""Memory-mapped NumPy vector storage for ``RAG_STORAGE_TYPE=local``.
+
+``NanoVectorDBStorage`` keeps every vector, base64-encoded, in one JSON file
+that is parsed on startup and rewritten on every save. This storage instead
+keeps, per namespace and workspace:
+
+- ``vdb_<namespace>.<gen>.f32``: an append-only matrix of L2-normalised
+  float32 rows, read through ``np.memmap``;
+- ``vdb_<namespace>.<gen>.ids.jsonl``: an append-only sidecar with one line
+  per written row (id, row number, meta fields) or deleted id;
+- ``vdb_<namespace>.mmap.json``: the current generation and dimension,
+  replaced atomically.
+
+Opening a workspace maps the matrix without reading it and replays the
+sidecar, so startup cost does not grow with the vector count. The pages
+live in the OS page cache and are shared by every worker process mapping
+the same file. Queries are a blocked brute-force matrix-vector product.
+Upserts append a new row and supersede the old one; once more than half of
+the rows are superseded, ``index_done_callback`` compacts them into a new
+generation.
+
+Writes follow LightRAG's single-writer rule: rows are appended under the
+namespace lock and other processes reload the new tail after
+``index_done_callback`` sets their update flags.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, final
+
+import numpy as np
+import orjson
+from lightrag.base import BaseVectorStorage
+from lightrag.kg.shared_storage import (
+    get_namespace_lock,
+    get_update_flag,
+    set_all_update_flags,
+)
+from lightrag.utils import compute_mdhash_id, logger
+
+STORAGE_NAME = "MmapVectorStorage"
+
+# Rows scored per matrix-vector product, bounding the temporary score array.
+_QUERY_BLOCK_ROWS = 65_536
+# Compact when superseded or deleted rows exceed this fraction of the file.
+_COMPACT_GARBAGE_RATIO = 0.5
+
+
+def register_mmap_vector_storage() -> None:
+    """Make ``MmapVectorStorage`` selectable as a LightRAG ``vector_storage``."""
+    from lightrag.kg import (
+        STORAGE_ENV_REQUIREMENTS,
+        STORAGE_IMPLEMENTATIONS,
+        STORAGES,
+    )
+
+    implementations = STORAGE_IMPLEMENTATIONS["VECTOR_STORAGE"]["implementations"]
+    if STORAGE_NAME not in implementations:
+        implementations.append(STORAGE_NAME)
+    STORAGES[STORAGE_NAME] = __name__
+    STORAGE_ENV_REQUIREMENTS[STORAGE_NAME] = []
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+@final
+@dataclass
+class MmapVectorStorage(BaseVectorStorage):
+    def __post_init__(self):
+        self._validate_embedding_func()
+        kwargs = self.global_config.get("vector_db_storage_cls_kwargs", {})
+        cosine_threshold = kwargs.get("cosine_better_than_threshold")
+        if cosine_threshold is None:
+            raise ValueError(
+                "cosine_better_than_threshold must be specified in vector_db_storage_cls_kwargs"
+            )
+        self.cosine_better_than_threshold = cosine_threshold
+
+        working_dir = self.global_config["working_dir"]
+        if self.workspace:
+            workspace_dir = os.path.join(working_dir, self.workspace)
+        else:
+            self.workspace = ""
+            workspace_dir = working_dir
+        os.makedirs(workspace_dir, exist_ok=True)
+        self._base = os.path.join(workspace_dir, f"vdb_{self.namespace}")
+        self._dim = self.embedding_func.embedding_dim
+        self._max_batch_size = self.global_config["embedding_batch_num"]
+        self._storage_lock = None
+        self.storage_updated = None
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    @property
+    def _manifest_path(self) -> str:
+        return f"{self._base}.mmap.json"
+
+    def _matrix_path(self, generation: int) -> str:
+        return f"{self._base}.{generation}.f32"
+
+    def _ids_path(self, generation: int) -> str:
+        return f"{self._base}.{generation}.ids.jsonl"
+
+    def _read_generation(self) -> int:
+        if not os.path.exists(self._manifest_path):
+            return 0
+        with open(self._manifest_path, "rb") as f:
+            manifest = orjson.loads(f.read())
+        if manifest["dim"] != self._dim:
+            raise ValueError(
+                f"{self._manifest_path} holds {manifest['dim']}-d vectors, "
+                f"but the embedding function returns {self._dim}-d vectors"
+            )
+        return manifest["generation"]
+
+    def _write_manifest(self, generation: int) -> None:
+        tmp = f"{self._manifest_path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps({"generation": generation, "dim": self._dim}))
+        os.replace(tmp, self._manifest_path)
+
+    def _load(self) -> None:
+        """Map the current generation and replay its whole sidecar."""
+        self._generation = self._read_generation()
+        self._rows: dict[str, int] = {}
+        self._ids: dict[int, str] = {}
+        self._records: dict[str, dict[str, Any]] = {}
+        self._ids_offset = 0
+        self._live = np.zeros(0, dtype=bool)
+        self._remap()
+        self._replay()
+
+    def _remap(self) -> None:
+        path = self._matrix_path(self._generation)
+        rows = os.path.getsize(path) // (4 * self._dim) if os.path.exists(path) else 0
+        if rows:
+            self._matrix = np.memmap(
+                path, dtype=np.float32, mode="r", shape=(rows, self._dim)
+            )
+        else:
+            self._matrix = np.empty((0, self._dim), dtype=np.float32)
+        if len(self._live) < rows:
+            self._live = np.concatenate(
+                [self._live, np.zeros(rows - len(self._live), dtype=bool)]
+            )
+
+    def _replay(self) -> None:
+        """Apply sidecar lines written since the last replay."""
+        path = self._ids_path(self._generation)
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            f.seek(self._ids_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partially written by a concurrent append
+                self._ids_offset += len(line)
+                entry = orjson.loads(line)
+                if entry.get("deleted"):
+                    self._forget(entry["id"])
+                elif entry["row"] < len(self._matrix):
+                    self._forget(entry["id"])
+                    self._rows[entry["id"]] = entry["row"]
+                    self._ids[entry["row"]] = entry["id"]
+                    self._records[entry["id"]] = entry
+                    self._live[entry["row"]] = True
+
+    def _forget(self, id_: str) -> None:
+        row = self._rows.pop(id_, None)
+        if row is not None:
+            self._live[row] = False
+            self._ids.pop(row, None)
+            self._records.pop(id_, None)
+
+    def _append(self, vectors: np.ndarray, entries: list[dict[str, Any]]) -> None:
+        """Append rows, then the sidecar lines that reference them."""
+        if len(vectors):
+            with open(self._matrix_path(self._generation), "ab") as f:
+                # Drop a partial row left by an interrupted append.
+                f.truncate(len(self._matrix) * 4 * self._dim)
+                f.write(vectors.tobytes())
+            self._remap()
+        if not os.path.exists(self._manifest_path):
+            self._write_manifest(self._generation)
+        with open(self._ids_path(self._generation), "ab") as f:
+            f.write(b"".join(orjson.dumps(e) + b"\n" for e in entries))
+        self._replay()
+
+    def _compact(self) -> None:
+        """Rewrite live rows into a new generation and switch to it."""
+        ids = list(self._rows)
+        rows = np.fromiter((self._rows[i] for i in ids), dtype=np.int64, count=len(ids))
+        old = self._generation
+        new = old + 1
+        with open(self._matrix_path(new), "wb") as f:
+            f.write(np.ascontiguousarray(self._matrix[rows]).tobytes())
+        with open(self._ids_path(new), "wb") as f:
+            f.write(
+                b"".join(
+                    orjson.dumps({**self._records[i], "row": n}) + b"\n"
+                    for n, i in enumerate(ids)
+                )
+            )
+        self._write_manifest(new)
+        self._load()
+        for path in (self._matrix_path(old), self._ids_path(old)):
+            if os.path.exists(path):
+                os.remove(path)
+        logger.info(
+            f"[{self.workspace}] Compacted {self.namespace} vectors to {len(ids)} rows"
+        )
+
+    # ------------------------------------------------------------------
+    # BaseVectorStorage
+    # ------------------------------------------------------------------
+
+    async def initialize(self):
+        self.storage_updated = await get_update_flag(
+            self.namespace, workspace=self.workspace
+        )
+        self._storage_lock = get_namespace_lock(
+            self.namespace, workspace=self.workspace
+        )
+
+    async def _refresh(self) -> None:
+        """Pick up rows written by another process (caller holds the lock)."""
+        if not self.storage_updated.value:
+            return
+        if self._read_generation() != self._generation:
+            self._load()
+        else:
+            self._remap()
+            self._replay()
+        self.storage_updated.value = False
+
+    async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
+        if not data:
+            return
+        contents = [v["content"] for v in data.values()]
+        batches = [
+            contents[i : i + self._max_batch_size]
+            for i in range(0, len(contents), self._max_batch_size)
+        ]
+        embeddings = np.concatenate(
+            await asyncio.gather(
+                *(self.embedding_func(batch, context="document") for batch in batches)
+            )
+        )
+        if len(embeddings) != len(data):
+            logger.error(
+                f"[{self.workspace}] embedding is not 1-1 with data, {len(embeddings)} != {len(data)}"
+            )
+            return
+
+        created_at = int(time.time())
+        async with self._storage_lock:
+            await self._refresh()
+            start = len(self._matrix)
+            entries = [
+                {
+                    "id": k,
+                    "row": start + n,
+                    "created_at": created_at,
+                    **{f: v[f] for f in self.meta_fields if f in v},
+                }
+                for n, (k, v) in enumerate(data.items())
+            ]
+            self._append(_normalize(embeddings), entries)
+
+    async def query(
+        self, query: str, top_k: int, query_embedding: list[float] = None
+    ) -> list[dict[str, Any]]:
+        if query_embedding is None:
+            query_embedding = (
+                await self.embedding_func([query], context="query", _priority=5)
+            )[0]
+        q = _normalize(query_embedding)
+
+        async with self._storage_lock:
+            await self._refresh()
+            matrix, live = self._matrix, self._live
+        if not self._rows or top_k <= 0:
+            return []
+
+        best_scores = np.empty(0, dtype=np.float32)
+        best_rows = np.empty(0, dtype=np.int64)
+        for start in range(0, len(matrix), _QUERY_BLOCK_ROWS):
+            scores = matrix[start : start + _QUERY_BLOCK_ROWS] @ q
+            keep = live[start : start + len(scores)] & (
+                scores >= self.cosine_better_than_threshold
+            )
+            candidates = np.flatnonzero(keep)
+            if len(candidates) > top_k:
+                top = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+                candidates = candidates[top]
+            best_scores = np.concatenate([best_scores, scores[candidates]])
+            best_rows = np.concatenate([best_rows, candidates + start])
+        order = np.argsort(-best_scores, kind="stable")[:top_k]
+
+        results = []
+        for i in order:
+            record = self._records[self._ids[int(best_rows[i])]]
+            results.append(
+                {
+                    **{k: v for k, v in record.items() if k != "row"},
+                    "distance": float(best_scores[i]),
+                }
+            )
+        return results
+
+    async def delete(self, ids: list[str]):
+        async with self._storage_lock:
+            await self._refresh()
+            known = [i for i in ids if i in self._rows]
+            if known:
+                self._append(
+                    np.empty((0, self._dim), dtype=np.float32),
+                    [{"id": i, "deleted": True} for i in known],
+                )
+        logger.debug(
+            f"[{self.workspace}] Deleted {len(known)} vectors from {self.namespace}"
+        )
+
+    async def delete_entity(self, entity_name: str) -> None:
+        await self.delete([compute_mdhash_id(entity_name, prefix="ent-")])
+
+    async def delete_entity_relation(self, entity_name: str) -> None:
+        async with self._storage_lock:
+            await self._refresh()
+            ids = [
+                id_
+                for id_, record in self._records.items()
+                if entity_name in (record.get("src_id"), record.get("tgt_id"))
+            ]
+        if ids:
+            await self.delete(ids)
+
+    async def index_done_callback(self) -> bool:
+        async with self._storage_lock:
+            # Rows are appended as they are upserted; only pick up what other
+            # processes appended before deciding whether to compact.
+            await self._refresh()
+            garbage = len(self._matrix) - len(self._rows)
+            if garbage > _COMPACT_GARBAGE_RATIO * len(self._matrix):
+                self._compact()
+            await set_all_update_flags(self.namespace, workspace=self.workspace)
+            self.storage_updated.value = False
+        return True
+
+    async def get_by_id(self, id: str) -> dict[str, Any] | None:
+        return (await self.get_by_ids([id]))[0]
+
+    async def get_by_ids(self, ids: list[str]) -> list[dict[str, Any] | None]:
+        async with self._storage_lock:
+            await self._refresh()
+            records = [self._records.get(i) for i in ids]
+        return [
+            {k: v for k, v in r.items() if k != "row"} if r is not None else None
+            for r in records
+        ]
+
+    async def get_vectors_by_ids(self, ids: list[str]) -> dict[str, list[float]]:
+        async with self._storage_lock:
+            await self._refresh()
+            found = [(i, self._rows[i]) for i in ids if i in self._rows]
+            matrix = self._matrix
+        return {i: matrix[row].tolist() for i, row in found}
+
+    async def drop(self) -> dict[str, str]:
+        try:
+            async with self._storage_lock:
+                generation = self._read_generation()
+                for path in (
+                    self._matrix_path(generation),
+                    self._ids_path(generation),
+                    self._manifest_path,
+                ):
+                    if os.path.exists(path):
+                        os.remove(path)
+                self._load()
+                await set_all_update_flags(self.namespace, workspace=self.workspace)
+                self.storage_updated.value = False
+            return {"status": "success", "message": "data dropped"}
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error dropping {self.namespace}: {e}")
+            return {"status": "error", "message": str(e)}
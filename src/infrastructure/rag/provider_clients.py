@@ -0,0 +1,87 @@
+"""Long-lived HTTP clients for the OpenAI-compatible model provider.
+
+LightRAG's ``openai_complete_if_cache`` and ``openai_embed`` build an
+``AsyncOpenAI`` client per call and close it afterwards, so without help
+every call opens a new connection and TLS session. Passing a shared
+``httpx.AsyncClient`` as the OpenAI client's ``http_client`` keeps the
+connections alive across calls and across every workspace engine.
+
+Closing an ``AsyncOpenAI`` closes its ``http_client``, so the shared client
+ignores ``aclose``; ``ProviderHttpClients.aclose`` closes it at shutdown.
+Connections belong to the event loop that opened them, so clients are kept
+per loop (the API and MCP run separate loops in stdio mode).
+"""
+
+import asyncio
+import functools
+import logging
+import weakref
+
+import httpx
+
+from config import LLMConfig
+
+logger = logging.getLogger(__name__)
+
+
+class SharedAsyncClient(httpx.AsyncClient):
+    """An ``httpx.AsyncClient`` that OpenAI clients borrow and cannot close."""
+
+    async def aclose(self) -> None:
+        """No-op: the per-call OpenAI clients that borrow this client close it."""
+
+    async def close_pool(self) -> None:
+        """Close the client's connections (at process shutdown)."""
+        await super().aclose()
+
+
+@functools.cache
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("h2 is not installed; provider calls use HTTP/1.1")
+        return False
+    return True
+
+
+class ProviderHttpClients:
+    """One shared HTTP client per provider base URL and event loop."""
+
+    def __init__(self, llm_config: LLMConfig) -> None:
+        self._http2 = llm_config.LLM_HTTP2
+        self._limits = httpx.Limits(
+            max_connections=llm_config.LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=llm_config.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=llm_config.LLM_HTTP_KEEPALIVE_SECONDS,
+        )
+        # OpenAI uses the http_client's timeout when it is not httpx's default.
+        self._timeout = httpx.Timeout(
+            llm_config.LLM_HTTP_READ_TIMEOUT_SECONDS,
+            connect=llm_config.LLM_HTTP_CONNECT_TIMEOUT_SECONDS,
+        )
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, SharedAsyncClient]
+        ] = weakref.WeakKeyDictionary()
+
+    def get(self, base_url: str) -> SharedAsyncClient:
+        """The running loop's client for ``base_url``, created on first use."""
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(base_url)
+        if client is None or client.is_closed:
+            client = clients[base_url] = SharedAsyncClient(
+                http2=self._http2 and _http2_available(),
+                limits=self._limits,
+                timeout=self._timeout,
+            )
+        return client
+
+    def client_configs(self, base_url: str) -> dict:
+        """``client_configs`` for LightRAG's OpenAI functions using the shared client."""
+        return {"http_client": self.get(base_url)}
+
+    async def aclose(self) -> None:
+        """Close the running loop's clients."""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.close_pool()
@@ -0,0 +1,147 @@
+"""Token and latency accounting for a workspace's model calls.
+
+Every LLM, vision and embedding call made through the callables built in
+``init_project`` runs inside ``tracking_call``, which hands the call a
+``CallTracker`` to pass to LightRAG as ``token_tracker``, times it and
+opens a client span for it. On
+exit the call is added to every ``UsageRecorder`` active in the calling
+context: indexing opens one per file (and one per folder), and the worker
+tags them with the job being run. The recorders live in a context
+variable, which tasks copy when they are created, so the calls LightRAG
+makes from its extraction tasks are attributed to the file being indexed.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from opentelemetry import trace
+
+from domain.entities.indexing_result import IndexingUsage, ModelCallKind
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+_recorders: ContextVar[tuple["UsageRecorder", ...]] = ContextVar(
+    "usage_recorders", default=()
+)
+_job_id: ContextVar[str | None] = ContextVar("usage_job_id", default=None)
+
+
+class UsageRecorder:
+    """Model usage totals for one indexing operation."""
+
+    def __init__(
+        self,
+        working_dir: str,
+        file_name: str | None = None,
+        job_id: str | None = None,
+    ) -> None:
+        self.usage = IndexingUsage(
+            working_dir=working_dir, job_id=job_id, file_name=file_name
+        )
+
+    def record(
+        self,
+        kind: ModelCallKind,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cache_hits: int,
+        duration_ms: float,
+    ) -> None:
+        totals = getattr(self.usage, kind.value)
+        totals.calls += 1
+        totals.prompt_tokens += prompt_tokens
+        totals.completion_tokens += completion_tokens
+        totals.cache_hits += cache_hits
+        totals.duration_ms = round(totals.duration_ms + duration_ms, 2)
+
+
+class CallTracker:
+    """LightRAG ``token_tracker`` for a single call.
+
+    Token counts reported by the provider are kept and forwarded to the
+    tracker the caller passed in, if any.
+    """
+
+    def __init__(self, forward: Any = None) -> None:
+        self._forward = forward
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cache_hits = 0
+
+    def add_usage(self, token_counts: dict) -> None:
+        self.prompt_tokens += token_counts.get("prompt_tokens") or 0
+        self.completion_tokens += token_counts.get("completion_tokens") or 0
+        if self._forward is not None:
+            self._forward.add_usage(token_counts)
+
+
+@contextmanager
+def job_context(job_id: str) -> Iterator[None]:
+    """Tag the usage recorded while running ``job_id`` with it."""
+    token = _job_id.set(job_id)
+    try:
+        yield
+    finally:
+        _job_id.reset(token)
+
+
+@contextmanager
+def recording_usage(
+    working_dir: str, file_name: str | None = None
+) -> Iterator[UsageRecorder]:
+    """Record the model calls made in this context (and its tasks)."""
+    recorder = UsageRecorder(working_dir, file_name, _job_id.get())
+    token = _recorders.set((*_recorders.get(), recorder))
+    try:
+        yield recorder
+    finally:
+        _recorders.reset(token)
+
+
+@contextmanager
+def tracking_call(kind: ModelCallKind, forward: Any = None) -> Iterator[CallTracker]:
+    """Time and trace one model call and add it to the active recorders.
+
+    Failed calls are recorded too.
+    """
+    tracker = CallTracker(forward)
+    start = time.perf_counter()
+    with tracer.start_as_current_span(
+        f"{kind.value} call", kind=trace.SpanKind.CLIENT
+    ) as span:
+        try:
+            yield tracker
+        finally:
+            span.set_attributes(
+                {
+                    "gen_ai.usage.input_tokens": tracker.prompt_tokens,
+                    "gen_ai.usage.output_tokens": tracker.completion_tokens,
+                    "rag.cache_hits": tracker.cache_hits,
+                }
+            )
+            _record(kind, tracker, (time.perf_counter() - start) * 1000)
+
+
+def _record(kind: ModelCallKind, tracker: CallTracker, duration_ms: float) -> None:
+    recorders = _recorders.get()
+    for recorder in recorders:
+        recorder.record(
+            kind,
+            tracker.prompt_tokens,
+            tracker.completion_tokens,
+            tracker.cache_hits,
+            duration_ms,
+        )
+    if recorders:
+        usage = recorders[-1].usage
+        logger.debug(
+            f"{kind.value} call for job={usage.job_id} file={usage.file_name} "
+            f"workspace={usage.working_dir}: {tracker.prompt_tokens} prompt + "
+            f"{tracker.completion_tokens} completion tokens, "
+            f"{tracker.cache_hits} cache hits, {duration_ms:.1f} ms"
+        )
@@ -0,0 +1,156 @@
+"""Vector store queries with per-query pgvector search settings.
+
+``PGVectorStorage.query`` runs on LightRAG's pool with the server's
+``hnsw.ef_search`` / ``ivfflat.probes``. When a query asks for other values,
+the same LightRAG SQL template (which takes the query vector as ``$4`` since
+lightrag-hku 1.4.16) runs in a transaction that first sets them with
+``SET LOCAL``, so the pooled connection is left unchanged. The
+transaction also forces a custom plan: asyncpg reuses prepared statements,
+and PostgreSQL's generic plan for ``workspace = $1`` cannot use a
+per-workspace partial index (see ``PgVectorIndexManager``). Queries on a
+table with such an index for the workspace therefore take this path even
+with default settings. Whether one exists is re-checked at most every
+``_MANAGED_INDEX_REFRESH_SECONDS``.
+
+With ``quantization`` set, candidates come from the workspace's quantized
+index (``top_k * rescore_factor`` of them, ordered by the compact distance)
+and LightRAG's query then ranks and thresholds only those candidates on the
+full-precision column.
+
+Other vector storages ignore the settings.
+"""
+
+import logging
+import time
+from typing import Any
+
+from opentelemetry import trace
+
+from domain.entities.vector_index import VectorSearchSettings
+from infrastructure.database.pgvector_index_manager import (
+    QUANTIZED_OPERATORS,
+    has_managed_index,
+    quantized_expression,
+)
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+# pgvector rejects larger hnsw.ef_search values.
+_MAX_EF_SEARCH = 1000
+_MANAGED_INDEX_REFRESH_SECONDS = 60.0
+# (table, workspace) -> (when it was last checked (monotonic), has an index)
+_managed_indexes: dict[tuple[str, str], tuple[float, bool]] = {}
+
+
+def _is_pgvector(vdb: Any) -> bool:
+    return type(vdb).__name__ == "PGVectorStorage"
+
+
+async def _has_managed_index(vdb: Any) -> bool:
+    key = (vdb.table_name, vdb.workspace)
+    checked_at, managed = _managed_indexes.get(key, (float("-inf"), False))
+    if time.monotonic() - checked_at < _MANAGED_INDEX_REFRESH_SECONDS:
+        return managed
+    try:
+        async with vdb.db.pool.acquire() as connection:
+            managed = bool(
+                await has_managed_index(connection, vdb.table_name, vdb.workspace)
+            )
+    except Exception as e:
+        logger.warning(f"Could not check vector indexes of {vdb.table_name}: {e}")
+    _managed_indexes[key] = (time.monotonic(), managed)
+    return managed
+
+
+async def query_vectors(
+    vdb: Any,
+    query: str,
+    top_k: int,
+    query_embedding: Any = None,
+    settings: VectorSearchSettings | None = None,
+) -> list[dict[str, Any]]:
+    """Query a LightRAG vector storage, applying ``settings`` on pgvector."""
+    with tracer.start_as_current_span(
+        "vector search",
+        attributes={
+            "db.collection.name": getattr(vdb, "namespace", ""),
+            "rag.top_k": top_k,
+        },
+    ):
+        return await _query_vectors(vdb, query, top_k, query_embedding, settings)
+
+
+async def _query_vectors(
+    vdb: Any,
+    query: str,
+    top_k: int,
+    query_embedding: Any,
+    settings: VectorSearchSettings | None,
+) -> list[dict[str, Any]]:
+    if settings is None:
+        settings = VectorSearchSettings()
+    if not _is_pgvector(vdb) or (
+        settings.is_default() and not await _has_managed_index(vdb)
+    ):
+        if query_embedding is None:
+            return await vdb.query(query, top_k=top_k)
+        return await vdb.query(query, top_k=top_k, query_embedding=query_embedding)
+
+    from lightrag.kg.postgres_impl import SQL_TEMPLATES
+
+    if query_embedding is None:
+        query_embedding = (await vdb.embedding_func([query]))[0]
+    vector_cast = (
+        "halfvec"
+        if getattr(vdb.db, "vector_index_type", None) == "HNSW_HALFVEC"
+        else "vector"
+    )
+    ef_search = settings.ef_search
+    candidate_limit: list[int] = []
+    if settings.quantization is None:
+        sql = SQL_TEMPLATES[vdb.namespace].format(
+            table_name=vdb.table_name, vector_cast=vector_cast
+        )
+    else:
+        candidates = top_k * settings.rescore_factor
+        # An HNSW scan returns at most ef_search rows.
+        ef_search = min(max(ef_search or 0, candidates), _MAX_EF_SEARCH)
+        sql = _rescoring_sql(vdb, vector_cast, settings, dim=len(query_embedding))
+        candidate_limit.append(candidates)
+    statements = ["SET LOCAL plan_cache_mode = force_custom_plan"]
+    if ef_search is not None:
+        statements.append(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+    if settings.probes is not None:
+        statements.append(f"SET LOCAL ivfflat.probes = {int(settings.probes)}")
+
+    async with vdb.db.pool.acquire() as connection, connection.transaction():
+        await connection.execute("; ".join(statements))
+        rows = await connection.fetch(
+            sql,
+            vdb.workspace,
+            1 - vdb.cosine_better_than_threshold,
+            top_k,
+            query_embedding,
+            *candidate_limit,
+        )
+    return [dict(row) for row in rows]
+
+
+def _rescoring_sql(
+    vdb: Any, vector_cast: str, settings: VectorSearchSettings, dim: int
+) -> str:
+    """LightRAG's query for ``vdb`` run over quantized-index candidates ($5)."""
+    from lightrag.kg.postgres_impl import SQL_TEMPLATES
+
+    _, operator = QUANTIZED_OPERATORS[settings.quantization]
+    column = quantized_expression("content_vector", settings.quantization, dim)
+    query = quantized_expression(f"$4::{vector_cast}", settings.quantization, dim)
+    rescore = SQL_TEMPLATES[vdb.namespace].format(
+        table_name="candidates", vector_cast=vector_cast
+    )
+    return (
+        f"WITH candidates AS MATERIALIZED ("
+        f"SELECT * FROM {vdb.table_name} WHERE workspace = $1 "
+        f"ORDER BY {column} {operator} {query} LIMIT $5) {rescore}"
+    )
@@ -0,0 +1,71 @@
+import asyncio
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+
+@dataclass
+class _LoopSlots:
+    semaphore: asyncio.Semaphore
+    running: int = 0
+    waiting: int = 0
+
+
+class ConcurrencyLimiter:
+    """Async concurrency limiter that exposes its queue depth.
+
+    A semaphore does not report how many callers are blocked on it; this
+    wrapper counts them so saturation can be surfaced by the readiness probe.
+    A semaphore belongs to one event loop, so each loop gets its own slots
+    (the API and MCP run separate loops in stdio mode); the counts are summed
+    across loops.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopSlots
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def running(self) -> int:
+        return sum(slots.running for slots in list(self._loops.values()))
+
+    @property
+    def waiting(self) -> int:
+        return sum(slots.waiting for slots in list(self._loops.values()))
+
+    def _slots(self) -> _LoopSlots:
+        loop = asyncio.get_running_loop()
+        slots = self._loops.get(loop)
+        if slots is None:
+            slots = self._loops[loop] = _LoopSlots(
+                asyncio.Semaphore(self.max_concurrency)
+            )
+        return slots
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of the block."""
+        slots = self._slots()
+        slots.waiting += 1
+        try:
+            await slots.semaphore.acquire()
+        finally:
+            slots.waiting -= 1
+        slots.running += 1
+        try:
+            yield
+        finally:
+            slots.running -= 1
+            slots.semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "waiting": self.waiting,
+            "max_concurrency": self.max_concurrency,
+        }
@@ -0,0 +1,162 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import weakref
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(order=True)
+class _PendingWork:
+    finish_tag: float
+    sequence: int
+    workspace: str = field(compare=False)
+    start_tag: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+@dataclass
+class _LoopQueue:
+    """Virtual clock, running counts and pending work of one event loop."""
+
+    virtual_clock: float = 0.0
+    last_finish: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    running: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    pending: list[_PendingWork] = field(default_factory=list)
+
+
+class WeightedFairScheduler:
+    """Weighted fair queuing of file-level indexing work across workspaces.
+
+    Every unit of work is stamped with a virtual finish tag
+    ``max(virtual_clock, last_finish[workspace]) + cost / weight``. Whenever a
+    slot frees up, the pending unit with the smallest finish tag whose workspace
+    is still below its concurrency cap is started. A single-file request from
+    one workspace is therefore dispatched ahead of the remaining files of a
+    large folder being indexed in another.
+
+    Futures belong to the event loop that created them, so each loop has its
+    own queue and caps (the API and MCP run separate loops in stdio mode);
+    ``running``, ``waiting`` and ``stats`` cover every loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        workspace_concurrency: int,
+        weights: dict[str, float] | None = None,
+        default_weight: float = 1.0,
+    ) -> None:
+        self._max_concurrency = max(1, max_concurrency)
+        self._workspace_concurrency = max(1, workspace_concurrency)
+        self._weights = weights or {}
+        self._default_weight = default_weight
+        self._queues: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopQueue
+        ] = weakref.WeakKeyDictionary()
+        self._sequence = itertools.count()
+
+    @property
+    def running(self) -> int:
+        """Number of work units currently holding a slot."""
+        return sum(self._counts()[0].values())
+
+    @property
+    def waiting(self) -> int:
+        """Number of work units queued for a slot."""
+        return sum(self._counts()[1].values())
+
+    def stats(self) -> dict:
+        """Snapshot of running and queued work per workspace."""
+        running, queued = self._counts()
+        return {
+            "running": sum(running.values()),
+            "waiting": sum(queued.values()),
+            "max_concurrency": self._max_concurrency,
+            "workspaces": {
+                ws: {"running": running.get(ws, 0), "waiting": queued.get(ws, 0)}
+                for ws in set(running) | set(queued)
+                if running.get(ws, 0) or queued.get(ws, 0)
+            },
+        }
+
+    def _counts(self) -> tuple[dict[str, int], dict[str, int]]:
+        """Running and queued work units per workspace, summed over loops."""
+        running: dict[str, int] = defaultdict(int)
+        queued: dict[str, int] = defaultdict(int)
+        for queue in list(self._queues.values()):
+            for ws, count in list(queue.running.items()):
+                running[ws] += count
+            for work in list(queue.pending):
+                if not work.future.done():
+                    queued[work.workspace] += 1
+        return running, queued
+
+    def _queue(self) -> _LoopQueue:
+        loop = asyncio.get_running_loop()
+        queue = self._queues.get(loop)
+        if queue is None:
+            queue = self._queues[loop] = _LoopQueue()
+        return queue
+
+    @asynccontextmanager
+    async def slot(self, workspace: str, cost: float = 1.0) -> AsyncIterator[None]:
+        """Hold one concurrency slot for ``workspace`` while the block runs."""
+        await self._acquire(workspace, cost)
+        try:
+            yield
+        finally:
+            self._release(workspace)
+
+    async def _acquire(self, workspace: str, cost: float) -> None:
+        queue = self._queue()
+        weight = self._weights.get(workspace, self._default_weight)
+        start_tag = max(queue.virtual_clock, queue.last_finish[workspace])
+        finish_tag = start_tag + cost / max(weight, 1e-9)
+        queue.last_finish[workspace] = finish_tag
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            queue.pending,
+            _PendingWork(
+                finish_tag, next(self._sequence), workspace, start_tag, future
+            ),
+        )
+        self._dispatch(queue)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release(workspace)
+            raise
+
+    def _release(self, workspace: str) -> None:
+        queue = self._queue()
+        queue.running[workspace] -= 1
+        if queue.running[workspace] <= 0:
+            queue.running.pop(workspace)
+        self._dispatch(queue)
+
+    def _dispatch(self, queue: _LoopQueue) -> None:
+        skipped: list[_PendingWork] = []
+        while queue.pending and sum(queue.running.values()) < self._max_concurrency:
+            work = heapq.heappop(queue.pending)
+            if work.future.done():
+                continue
+            if queue.running.get(work.workspace, 0) >= self._workspace_concurrency:
+                skipped.append(work)
+                continue
+            queue.running[work.workspace] += 1
+            queue.virtual_clock = max(queue.virtual_clock, work.start_tag)
+            work.future.set_result(None)
+        for work in skipped:
+            heapq.heappush(queue.pending, work)
+        if not queue.pending and not queue.running:
+            # Idle: reset the virtual clock so tags do not grow without bound.
+            queue.virtual_clock = 0.0
+            queue.last_finish.clear()
@@ -3,10 +3,13 @@ import logging
 
 from minio import Minio
 from minio.error import S3Error
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
 
 from domain.ports.storage_port import StoragePort
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 
 
 class MinioAdapter(StoragePort):
@@ -45,24 +48,31 @@ class MinioAdapter(StoragePort):
         Raises:
             FileNotFoundError: If the object or bucket does not exist.
         """
-        try:
-            loop = asyncio.get_running_loop()
-            response = await loop.run_in_executor(
-                None, lambda: self.client.get_object(bucket, object_path)
-            )
+        with tracer.start_as_current_span(
+            "minio.get_object",
+            kind=SpanKind.CLIENT,
+            attributes={"s3.bucket": bucket, "s3.key": object_path},
+        ):
             try:
-                return response.read()
-            finally:
-                response.close()
-                response.release_conn()
-        except S3Error as e:
-            if e.code in ("NoSuchKey", "NoSuchBucket"):
-                logger.warning(f"Object not found: bucket={bucket}, path={object_path}")
-                raise FileNotFoundError(
-                    f"Object not found: bucket={bucket}, path={object_path}"
-                ) from None
-            logger.error(f"MinIO error retrieving object: {e}", exc_info=True)
-            raise
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(
+                    None, lambda: self.client.get_object(bucket, object_path)
+                )
+                try:
+                    return response.read()
+                finally:
+                    response.close()
+                    response.release_conn()
+            except S3Error as e:
+                if e.code in ("NoSuchKey", "NoSuchBucket"):
+                    logger.warning(
+                        f"Object not found: bucket={bucket}, path={object_path}"
+                    )
+                    raise FileNotFoundError(
+                        f"Object not found: bucket={bucket}, path={object_path}"
+                    ) from None
+                logger.error(f"MinIO error retrieving object: {e}", exc_info=True)
+                raise
 
     async def list_objects(
         self, bucket: str, prefix: str, recursive: bool = True
@@ -78,11 +88,91 @@ class MinioAdapter(StoragePort):
         Returns:
             A list of object keys (excluding directories).
         """
-        loop = asyncio.get_running_loop()
-        objects = await loop.run_in_executor(
-            None,
-            lambda: list(
-                self.client.list_objects(bucket, prefix=prefix, recursive=recursive)
-            ),
-        )
-        return [obj.object_name for obj in objects if not obj.is_dir]
+        with tracer.start_as_current_span(
+            "minio.list_objects",
+            kind=SpanKind.CLIENT,
+            attributes={"s3.bucket": bucket, "s3.prefix": prefix},
+        ):
+            loop = asyncio.get_running_loop()
+            objects = await loop.run_in_executor(
+                None,
+                lambda: list(
+                    self.client.list_objects(bucket, prefix=prefix, recursive=recursive)
+                ),
+            )
+            return [obj.object_name for obj in objects if not obj.is_dir]
+
+    async def upload_file(self, bucket: str, object_path: str, file_path: str) -> None:
+        """
+        Upload a local file to MinIO (multipart for large files).
+
+        Args:
+            bucket: The bucket to write to.
+            object_path: The path/key of the object within the bucket.
+            file_path: The local file to upload.
+        """
+        with tracer.start_as_current_span(
+            "minio.upload_file",
+            kind=SpanKind.CLIENT,
+            attributes={"s3.bucket": bucket, "s3.key": object_path},
+        ):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, lambda: self.client.fput_object(bucket, object_path, file_path)
+            )
+
+    async def download_file(
+        self, bucket: str, object_path: str, file_path: str
+    ) -> None:
+        """
+        Download a MinIO object to a local file.
+
+        Args:
+            bucket: The bucket name where the object is stored.
+            object_path: The path/key of the object within the bucket.
+            file_path: The local file to write.
+
+        Raises:
+            FileNotFoundError: If the object or bucket does not exist.
+        """
+        with tracer.start_as_current_span(
+            "minio.download_file",
+            kind=SpanKind.CLIENT,
+            attributes={"s3.bucket": bucket, "s3.key": object_path},
+        ):
+            try:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    None,
+                    lambda: self.client.fget_object(bucket, object_path, file_path),
+                )
+            except S3Error as e:
+                if e.code in ("NoSuchKey", "NoSuchBucket"):
+                    raise FileNotFoundError(
+                        f"Object not found: bucket={bucket}, path={object_path}"
+                    ) from None
+                logger.error(f"MinIO error downloading object: {e}", exc_info=True)
+                raise
+
+    async def ping(self, bucket: str) -> None:
+        """
+        Check that MinIO answers and the bucket exists.
+
+        Args:
+            bucket: The bucket the service reads from.
+
+        Raises:
+            FileNotFoundError: If the bucket does not exist.
+        """
+        with tracer.start_as_current_span(
+            "minio.ping", kind=SpanKind.CLIENT, attributes={"s3.bucket": bucket}
+        ):
+            loop = asyncio.get_running_loop()
+            exists = await loop.run_in_executor(
+                None, lambda: self.client.bucket_exists(bucket)
+            )
+            if not exists:
+                raise FileNotFoundError(f"Bucket not found: {bucket}")
+
+    async def aclose(self) -> None:
+        """No-op: minio-py's urllib3 pool is not tied to an event loop."""
@@ -2,33 +2,68 @@
 Simplified following hexagonal architecture pattern from pickpro_indexing_api.
 """
 
+import contextlib
 import logging
 import threading
+import time
+from collections.abc import AsyncIterator
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from application.api.admin_routes import admin_router
 from application.api.health_routes import health_router
 from application.api.indexing_routes import indexing_router
 from application.api.mcp_tools import mcp
 from application.api.query_routes import query_router
-from dependencies import app_config
+from dependencies import (
+    app_config,
+    lexical_index,
+    loop_monitor,
+    metrics_config,
+    minio_adapter,
+    rag_adapter,
+    tracing_config,
+)
+from infrastructure.observability.metrics import configure_metrics
+from infrastructure.observability.tracing import TracingMiddleware, configure_tracing
+from infrastructure.rag.lightrag_adapter import load_rag_stack
 
 logger = logging.getLogger(__name__)
 
 
 MCP_PATH = "/mcp"
 
-if app_config.MCP_TRANSPORT == "streamable":
-    mcp_app = mcp.http_app(path="/")
-    app = FastAPI(
-        title="RAG Anything API",
-        lifespan=mcp_app.lifespan,
-    )
+configure_tracing(tracing_config)
+configure_metrics(metrics_config, service_name=tracing_config.OTEL_SERVICE_NAME)
+
+mcp_app = mcp.http_app(path="/") if app_config.MCP_TRANSPORT == "streamable" else None
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the MCP app's lifespan when it is mounted, and the loop monitor.
+
+    Starts the full-text index build in the background, and closes the
+    shared provider HTTP clients and storage connections on shutdown.
+    """
+    async with contextlib.AsyncExitStack() as stack:
+        stack.push_async_callback(rag_adapter.http_clients.aclose)
+        stack.push_async_callback(minio_adapter.aclose)
+        if lexical_index is not None:
+            lexical_index.start_build()
+            stack.push_async_callback(lexical_index.aclose)
+        if mcp_app is not None:
+            await stack.enter_async_context(mcp_app.lifespan(app))
+        if metrics_config.LOOP_MONITOR_ENABLED:
+            await stack.enter_async_context(loop_monitor.running())
+        yield
+
+
+app = FastAPI(title="RAG Anything API", lifespan=lifespan)
+if mcp_app is not None:
     app.mount(MCP_PATH, mcp_app)
-else:
-    app = FastAPI(title="RAG Anything API")
 
 app.add_middleware(
     CORSMiddleware,
@@ -37,6 +72,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(TracingMiddleware)
 
 # ============= REST API ROUTES =============
 
@@ -45,10 +81,22 @@ REST_PATH = "/api/v1"
 app.include_router(indexing_router, prefix=REST_PATH)
 app.include_router(health_router, prefix=REST_PATH)
 app.include_router(query_router, prefix=REST_PATH)
+app.include_router(admin_router, prefix=REST_PATH)
 
 # ============= MAIN =============
 
 
+def warm_up_rag_stack():
+    """Load raganything/lightrag/docling without delaying server startup."""
+    start = time.perf_counter()
+    try:
+        load_rag_stack()
+    except Exception:
+        logger.exception("RAG stack warm-up failed; it will load on first use")
+        return
+    logger.info(f"RAG stack loaded in {time.perf_counter() - start:.2f}s")
+
+
 def run_fastapi():
     uvicorn.run(
         app,
@@ -61,6 +109,8 @@ def run_fastapi():
 
 
 if __name__ == "__main__":
+    if app_config.RAG_WARMUP:
+        threading.Thread(target=warm_up_rag_stack, name="rag-warmup", daemon=True).start()
     if app_config.MCP_TRANSPORT == "stdio":
         api_thread = threading.Thread(target=run_fastapi, daemon=True)
         api_thread.start()
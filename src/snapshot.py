@@ -0,0 +1,69 @@
+"""Workspace snapshot command line.
+
+Exports a workspace's indexed data to MinIO, or restores a snapshot under
+another working_dir, without going through the API (RAG_STORAGE_TYPE must be
+postgres). Usage::
+
+    python src/snapshot.py export <working_dir>
+    python src/snapshot.py list <working_dir>
+    python src/snapshot.py import <snapshot_key> <working_dir>
+"""
+
+import argparse
+import asyncio
+import logging
+
+from application.requests.snapshot_request import (
+    ExportSnapshotRequest,
+    ImportSnapshotRequest,
+)
+from dependencies import (
+    get_export_snapshot_use_case,
+    get_import_snapshot_use_case,
+    postgres_pool,
+)
+
+
+async def main(args: argparse.Namespace) -> None:
+    export_use_case = get_export_snapshot_use_case()
+    import_use_case = get_import_snapshot_use_case()
+    if export_use_case is None or import_use_case is None:
+        raise SystemExit("Workspace snapshots require RAG_STORAGE_TYPE=postgres")
+    try:
+        if args.command == "export":
+            key = export_use_case.snapshot_key(args.working_dir)
+            snapshot = await export_use_case.execute(
+                ExportSnapshotRequest(working_dir=args.working_dir), key
+            )
+            print(key)
+            print(snapshot.model_dump_json(indent=2))
+        elif args.command == "list":
+            for key in await export_use_case.list_snapshots(args.working_dir):
+                print(key)
+        else:
+            snapshot = await import_use_case.execute(
+                ImportSnapshotRequest(
+                    snapshot_key=args.snapshot_key, working_dir=args.working_dir
+                )
+            )
+            print(snapshot.model_dump_json(indent=2))
+    finally:
+        await postgres_pool.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="Export a workspace to MinIO")
+    export.add_argument("working_dir")
+    listing = commands.add_parser("list", help="List a workspace's snapshots")
+    listing.add_argument("working_dir")
+    restore = commands.add_parser("import", help="Restore a snapshot")
+    restore.add_argument("snapshot_key")
+    restore.add_argument("working_dir")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,206 @@
+"""Indexing worker entry point.
+
+Pulls indexing jobs from the PostgreSQL job queue and runs them, so ingestion
+can be scaled independently of the API/query processes. Run with
+``python src/worker.py``; the API enqueues jobs when INDEXING_BACKEND=queue.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import socket
+from collections.abc import Callable
+
+from opentelemetry import propagate, trace
+from opentelemetry.trace import SpanKind
+
+from application.use_cases.run_indexing_job_use_case import RunIndexingJobUseCase
+from dependencies import (
+    get_run_indexing_job_use_case,
+    job_queue,
+    lock_pool,
+    loop_monitor,
+    metrics_config,
+    minio_adapter,
+    postgres_pool,
+    profiler,
+    queue_config,
+    rag_adapter,
+    tracing_config,
+)
+from domain.entities.indexing_job import IndexingJob
+from domain.entities.indexing_result import IndexingStatus
+from domain.ports.job_queue_port import JobQueuePort
+from domain.ports.profiler_port import ProfilerPort
+from infrastructure.observability.metrics import configure_metrics
+from infrastructure.observability.tracing import configure_tracing
+from infrastructure.queue.postgres_job_queue import PostgresJobQueue
+from infrastructure.rag.usage_tracking import job_context
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+
+async def _heartbeat(
+    queue: JobQueuePort, job_id: str, worker_id: str, interval: float
+) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await queue.heartbeat(job_id, worker_id)
+        except Exception:
+            logger.warning("Heartbeat failed for job %s", job_id, exc_info=True)
+
+
+async def run_job(
+    queue: JobQueuePort,
+    use_case: RunIndexingJobUseCase,
+    job: IndexingJob,
+    worker_id: str,
+    heartbeat_interval: float,
+    profiler: ProfilerPort | None = None,
+) -> None:
+    """Run one claimed job and record its outcome in the queue.
+
+    The job's span continues the trace of the request that enqueued it.
+    Jobs queued with the profile flag run under ``profiler``, and the
+    result records where the profile was stored. A result with status
+    ``failed`` fails the job, so it is retried like a raised error.
+    """
+    heartbeat = asyncio.create_task(
+        _heartbeat(queue, job.id, worker_id, heartbeat_interval)
+    )
+    with tracer.start_as_current_span(
+        f"indexing job {job.job_type.value}",
+        context=propagate.extract(job.payload.get("trace_context") or {}),
+        kind=SpanKind.CONSUMER,
+        attributes={
+            "job.id": job.id,
+            "job.attempts": job.attempts,
+            "rag.working_dir": job.working_dir,
+        },
+        record_exception=False,
+    ) as span:
+        profile_key = None
+        profiling: contextlib.AbstractAsyncContextManager = contextlib.nullcontext()
+        if profiler is not None and job.payload.get("profile"):
+            profile_key = profiler.profile_key(f"jobs/{job.id}")
+            profiling = profiler.profile(profile_key)
+        try:
+            with job_context(job.id):
+                async with profiling:
+                    result = await use_case.execute(job)
+            span.set_attribute("job.result_status", result.status.value)
+            if result.status == IndexingStatus.FAILED:
+                logger.error("Job %s failed: %s", job.id, result.message)
+                span.set_status(trace.Status(trace.StatusCode.ERROR, result.message))
+                await queue.fail(job.id, worker_id, result.message)
+            else:
+                outcome = result.model_dump(mode="json")
+                if profile_key:
+                    outcome["profile_key"] = profile_key
+                await queue.complete(job.id, worker_id, outcome)
+                logger.info(
+                    "Job %s finished with status %s", job.id, result.status.value
+                )
+        except Exception as e:
+            logger.exception("Job %s failed", job.id)
+            span.record_exception(e)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
+            await queue.fail(job.id, worker_id, str(e))
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+
+async def run_worker(
+    queue: JobQueuePort,
+    use_case_factory: Callable[[], RunIndexingJobUseCase],
+    worker_id: str,
+    concurrency: int,
+    poll_interval: float,
+    heartbeat_interval: float,
+    stop_event: asyncio.Event,
+    profiler: ProfilerPort | None = None,
+) -> None:
+    """Claim and run jobs until ``stop_event`` is set, then drain running jobs."""
+    slots = asyncio.Semaphore(max(1, concurrency))
+    running: set[asyncio.Task] = set()
+
+    while not stop_event.is_set():
+        await slots.acquire()
+        try:
+            job = await queue.claim(worker_id)
+        except Exception:
+            logger.exception("Failed to claim a job")
+            job = None
+        if job is None:
+            slots.release()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop_event.wait(), timeout=poll_interval)
+            continue
+
+        logger.info(
+            "Worker %s claimed %s job %s", worker_id, job.job_type.value, job.id
+        )
+        task = asyncio.create_task(
+            run_job(
+                queue, use_case_factory(), job, worker_id, heartbeat_interval, profiler
+            )
+        )
+        running.add(task)
+        task.add_done_callback(running.discard)
+        task.add_done_callback(lambda _: slots.release())
+
+    if running:
+        logger.info("Waiting for %d running job(s) before exit", len(running))
+        await asyncio.gather(*running, return_exceptions=True)
+
+
+async def main() -> None:
+    configure_tracing(tracing_config)
+    configure_metrics(metrics_config, service_name=tracing_config.OTEL_SERVICE_NAME)
+    queue = job_queue or PostgresJobQueue(
+        postgres_pool,
+        lease_seconds=queue_config.JOB_LEASE_SECONDS,
+        max_attempts=queue_config.JOB_MAX_ATTEMPTS,
+    )
+    worker_id = f"{socket.gethostname()}-{os.getpid()}"
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop_event.set)
+
+    logger.info(
+        "Indexing worker %s started (concurrency=%d)",
+        worker_id,
+        queue_config.WORKER_CONCURRENCY,
+    )
+    try:
+        async with contextlib.AsyncExitStack() as stack:
+            if metrics_config.LOOP_MONITOR_ENABLED:
+                await stack.enter_async_context(loop_monitor.running())
+            await run_worker(
+                queue,
+                get_run_indexing_job_use_case,
+                worker_id=worker_id,
+                concurrency=queue_config.WORKER_CONCURRENCY,
+                poll_interval=queue_config.WORKER_POLL_INTERVAL_SECONDS,
+                heartbeat_interval=max(1.0, queue_config.JOB_LEASE_SECONDS / 3),
+                stop_event=stop_event,
+                profiler=profiler,
+            )
+    finally:
+        await rag_adapter.http_clients.aclose()
+        await minio_adapter.aclose()
+        await postgres_pool.close()
+        await lock_pool.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -3,12 +3,15 @@ from pathlib import Path
 
 import pytest
 
+from config import MetricsConfig, TracingConfig
 from domain.entities.indexing_result import (
     FileIndexingResult,
     FolderIndexingResult,
     FolderIndexingStats,
     IndexingStatus,
 )
+from infrastructure.observability.metrics import configure_metrics
+from infrastructure.observability.tracing import configure_tracing
 
 # Load external fixtures from tests/fixtures/external.py without __init__.py
 _fixtures_path = Path(__file__).parent / "fixtures" / "external.py"
@@ -19,6 +22,8 @@ _spec.loader.exec_module(_external)
 # Re-export fixtures so pytest discovers them
 mock_rag_engine = _external.mock_rag_engine
 mock_storage = _external.mock_storage
+mock_job_queue = _external.mock_job_queue
+mock_profiler = _external.mock_profiler
 
 
 @pytest.fixture
@@ -49,3 +54,34 @@ def sample_folder_indexing_result() -> FolderIndexingResult:
         ),
         processing_time_ms=1200.0,
     )
+
+
+@pytest.fixture(scope="session")
+def _in_memory_spans():
+    """Install a tracer provider once per run; OpenTelemetry allows only one."""
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    configure_tracing(TracingConfig(TRACING_ENABLED=True), exporter=exporter)
+    return exporter
+
+
+@pytest.fixture
+def span_exporter(_in_memory_spans):
+    """Provide the in-memory span exporter, emptied for this test."""
+    _in_memory_spans.clear()
+    return _in_memory_spans
+
+
+@pytest.fixture(scope="session")
+def metric_reader():
+    """Install a meter provider once per run, read on demand by the tests."""
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+    reader = InMemoryMetricReader()
+    configure_metrics(
+        MetricsConfig(METRICS_ENABLED=True), service_name="test", reader=reader
+    )
+    return reader
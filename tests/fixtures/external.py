@@ -1,13 +1,22 @@
-from unittest.mock import AsyncMock
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from domain.entities.document_deletion import DeletionStatus, DocumentDeletionResult
+from domain.entities.indexing_job import (
+    IndexingJob,
+    IndexingJobStatus,
+    IndexingJobType,
+)
 from domain.entities.indexing_result import (
     FileIndexingResult,
     FolderIndexingResult,
     FolderIndexingStats,
     IndexingStatus,
 )
+from domain.ports.job_queue_port import JobQueuePort
+from domain.ports.profiler_port import ProfilerPort
 from domain.ports.rag_engine import RAGEnginePort
 from domain.ports.storage_port import StoragePort
 
@@ -25,6 +34,16 @@ def mock_rag_engine() -> AsyncMock:
         processing_time_ms=100.0,
     )
 
+    mock.replace_document.return_value = mock.index_document.return_value
+
+    mock.delete_document.return_value = DocumentDeletionResult(
+        status=DeletionStatus.SUCCESS,
+        message="File 'report.pdf' deleted",
+        file_name="report.pdf",
+        doc_ids=["doc-1"],
+        processing_time_ms=50.0,
+    )
+
     mock.index_folder.return_value = FolderIndexingResult(
         status=IndexingStatus.SUCCESS,
         message="Folder indexed successfully",
@@ -41,6 +60,14 @@ def mock_rag_engine() -> AsyncMock:
 
     mock.query_multimodal.return_value = "Multimodal analysis result"
 
+    mock.embedding_dim.return_value = 1536
+
+    mock.stats.return_value = {
+        "engines": 1,
+        "indexing": {"running": 0, "waiting": 0, "max_concurrency": 4},
+        "llm": {"running": 0, "waiting": 0, "max_concurrency": 16},
+    }
+
     return mock
 
 
@@ -50,4 +77,34 @@ def mock_storage() -> AsyncMock:
     mock = AsyncMock(spec=StoragePort)
     mock.get_object.return_value = b"fake file content"
     mock.list_objects.return_value = ["project/doc1.pdf", "project/doc2.pdf"]
+    mock.ping.return_value = None
+    return mock
+
+
+@pytest.fixture
+def mock_job_queue() -> AsyncMock:
+    """Provide an AsyncMock of JobQueuePort for external adapter mocking."""
+    mock = AsyncMock(spec=JobQueuePort)
+    mock.enqueue.return_value = IndexingJob(
+        id="0b6f3f0e-1111-4c8e-9d1a-2d4c4f6b7a10",
+        job_type=IndexingJobType.FILE,
+        working_dir="project",
+        payload={"file_name": "project/doc1.pdf", "working_dir": "project"},
+        status=IndexingJobStatus.QUEUED,
+    )
+    mock.claim.return_value = None
+    return mock
+
+
+@pytest.fixture
+def mock_profiler() -> MagicMock:
+    """Provide a MagicMock of ProfilerPort whose profile() is a no-op context."""
+
+    @asynccontextmanager
+    async def _profile(_key: str):
+        yield
+
+    mock = MagicMock(spec=ProfilerPort)
+    mock.profile_key.side_effect = lambda name: f"profiles/{name}.speedscope.json"
+    mock.profile.side_effect = _profile
     return mock
@@ -0,0 +1,159 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.use_cases.check_readiness_use_case import CheckReadinessUseCase
+from domain.ports.database_pool_port import DatabasePoolPort
+
+
+@pytest.fixture
+def mock_database() -> MagicMock:
+    mock = MagicMock(spec=DatabasePoolPort)
+    mock.ping = AsyncMock(return_value=None)
+    mock.stats.return_value = {
+        "open": True,
+        "size": 4,
+        "idle": 3,
+        "in_use": 1,
+        "max_size": 10,
+    }
+    return mock
+
+
+class TestCheckReadinessUseCase:
+    async def test_ready_when_dependencies_answer_and_load_is_low(
+        self,
+        mock_rag_engine: AsyncMock,
+        mock_storage: AsyncMock,
+        mock_database: MagicMock,
+    ) -> None:
+        use_case = CheckReadinessUseCase(
+            mock_rag_engine, mock_storage, "my-bucket", database=mock_database
+        )
+
+        report = await use_case.execute()
+
+        assert report.ready is True
+        assert report.reasons == []
+        assert report.dependencies["storage"].ok is True
+        assert report.dependencies["postgres"].latency_ms is not None
+        assert report.saturation["db_pool"]["usage"] == 0.1
+        assert report.saturation["engines"] == 1
+        mock_storage.ping.assert_awaited_once_with("my-bucket")
+
+    async def test_database_is_skipped_when_not_configured(
+        self, mock_rag_engine: AsyncMock, mock_storage: AsyncMock
+    ) -> None:
+        use_case = CheckReadinessUseCase(mock_rag_engine, mock_storage, "my-bucket")
+
+        report = await use_case.execute()
+
+        assert set(report.dependencies) == {"storage"}
+        assert "db_pool" not in report.saturation
+
+    async def test_not_ready_when_dependency_fails(
+        self, mock_rag_engine: AsyncMock, mock_storage: AsyncMock
+    ) -> None:
+        mock_storage.ping.side_effect = FileNotFoundError("Bucket not found: b")
+        use_case = CheckReadinessUseCase(mock_rag_engine, mock_storage, "b")
+
+        report = await use_case.execute()
+
+        assert report.ready is False
+        assert report.dependencies["storage"].ok is False
+        assert report.reasons == ["storage: Bucket not found: b"]
+
+    async def test_not_ready_when_dependency_exceeds_latency_budget(
+        self,
+        mock_rag_engine: AsyncMock,
+        mock_storage: AsyncMock,
+        mock_database: MagicMock,
+    ) -> None:
+        async def _slow_ping() -> None:
+            await asyncio.sleep(1)
+
+        mock_database.ping.side_effect = _slow_ping
+        use_case = CheckReadinessUseCase(
+            mock_rag_engine,
+            mock_storage,
+            "my-bucket",
+            database=mock_database,
+            latency_budget_ms=10,
+        )
+
+        report = await use_case.execute()
+
+        assert report.ready is False
+        assert report.dependencies["postgres"].error == "no response within 10 ms"
+
+    async def test_not_ready_above_saturation_thresholds(
+        self,
+        mock_rag_engine: AsyncMock,
+        mock_storage: AsyncMock,
+        mock_database: MagicMock,
+    ) -> None:
+        mock_rag_engine.stats.return_value = {
+            "engines": 12,
+            "indexing": {"running": 4, "waiting": 6, "max_concurrency": 4},
+            "llm": {"running": 16, "waiting": 80, "max_concurrency": 16},
+        }
+        mock_database.stats.return_value["in_use"] = 10
+        use_case = CheckReadinessUseCase(
+            mock_rag_engine,
+            mock_storage,
+            "my-bucket",
+            database=mock_database,
+            max_indexing_tasks=8,
+            max_engines=10,
+            max_db_pool_usage=0.9,
+            max_llm_queue_depth=50,
+        )
+
+        report = await use_case.execute()
+
+        assert report.ready is False
+        assert report.reasons == [
+            "indexing tasks 10 above threshold 8",
+            "engine cache 12 above threshold 10",
+            "LLM queue depth 80 above threshold 50",
+            "DB pool usage 1 above threshold 0.9",
+        ]
+
+    async def test_unset_thresholds_are_not_checked(
+        self, mock_rag_engine: AsyncMock, mock_storage: AsyncMock
+    ) -> None:
+        mock_rag_engine.stats.return_value = {
+            "engines": 500,
+            "indexing": {"running": 4, "waiting": 600, "max_concurrency": 4},
+            "llm": {"running": 16, "waiting": 900, "max_concurrency": 16},
+        }
+        use_case = CheckReadinessUseCase(
+            mock_rag_engine,
+            mock_storage,
+            "my-bucket",
+            max_indexing_tasks=None,
+            max_engines=None,
+            max_llm_queue_depth=None,
+        )
+
+        report = await use_case.execute()
+
+        assert report.ready is True
+
+    async def test_not_ready_when_event_loop_lags(
+        self, mock_rag_engine: AsyncMock, mock_storage: AsyncMock
+    ) -> None:
+        loop = {"lag_ms": 2.1, "max_lag_ms": 1800.0, "blocked_callbacks": 1}
+        use_case = CheckReadinessUseCase(
+            mock_rag_engine,
+            mock_storage,
+            "my-bucket",
+            loop_stats=lambda: loop,
+            max_loop_lag_ms=500,
+        )
+
+        report = await use_case.execute()
+
+        assert report.saturation["event_loop"] == loop
+        assert report.reasons == ["event loop lag (ms) 1800 above threshold 500"]
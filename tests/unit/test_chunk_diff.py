@@ -0,0 +1,97 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from lightrag.utils import compute_mdhash_id
+
+from infrastructure.rag.chunk_diff import ChunkDiff, adopt_chunks, reusing_chunks
+
+
+def _chunk_id(text: str) -> str:
+    return compute_mdhash_id(text, prefix="chunk-")
+
+
+def _chunker(_tokenizer, content: str, *_args) -> list[dict]:
+    return [{"content": text, "chunk_order_index": i} for i, text in enumerate(content)]
+
+
+class TestReusingChunks:
+    async def test_drops_previous_chunks_and_records_them(self) -> None:
+        lightrag = MagicMock(chunking_func=_chunker)
+
+        with reusing_chunks(lightrag, [_chunk_id("A"), _chunk_id("X")]) as diff:
+            chunks = await lightrag.chunking_func(None, "ABA", "\n", False, 100, 1200)
+
+        assert [c["content"] for c in chunks] == ["B"]
+        assert chunks[0]["chunk_order_index"] == 1
+        assert diff.reused == {_chunk_id("A")}
+        assert lightrag.chunking_func is _chunker
+
+    async def test_concurrent_diffs_share_one_chunker(self) -> None:
+        lightrag = MagicMock(chunking_func=_chunker)
+
+        with reusing_chunks(lightrag, [_chunk_id("A")]) as first:
+            with reusing_chunks(lightrag, [_chunk_id("B")]) as second:
+                chunks = await lightrag.chunking_func(None, "ABC")
+            assert lightrag.chunking_func is not _chunker
+
+        assert [c["content"] for c in chunks] == ["C"]
+        assert (first.reused, second.reused) == ({_chunk_id("A")}, {_chunk_id("B")})
+        assert lightrag.chunking_func is _chunker
+
+
+class TestAdoptChunks:
+    @staticmethod
+    def _lightrag(new_status: dict) -> MagicMock:
+        lightrag = MagicMock()
+        lightrag.doc_status.get_by_id = AsyncMock(return_value=new_status)
+        for storage in (
+            lightrag.doc_status,
+            lightrag.full_entities,
+            lightrag.full_relations,
+        ):
+            storage.upsert = AsyncMock()
+            storage.index_done_callback = AsyncMock()
+        lightrag.full_entities.get_by_ids = AsyncMock(
+            return_value=[
+                {"entity_names": ["Pump", "Valve"]},
+                {"entity_names": ["Valve", "Seal"]},
+            ]
+        )
+        lightrag.full_relations.get_by_ids = AsyncMock(
+            return_value=[None, {"relation_pairs": [["Pump", "Seal"]]}]
+        )
+        return lightrag
+
+    async def test_moves_reused_chunks_and_graph_tracking_to_new_version(
+        self,
+    ) -> None:
+        lightrag = self._lightrag({"status": "processed", "chunks_list": ["chunk-c"]})
+        previous = {
+            "doc-old": {"status": "processed", "chunks_list": ["chunk-a", "chunk-b"]}
+        }
+
+        await adopt_chunks(
+            lightrag,
+            "doc-new",
+            previous,
+            ChunkDiff({"chunk-a", "chunk-b"}, {"chunk-a"}),
+        )
+
+        updates = lightrag.doc_status.upsert.await_args.args[0]
+        assert updates["doc-new"]["chunks_list"] == ["chunk-c", "chunk-a"]
+        assert updates["doc-new"]["chunks_count"] == 2
+        assert updates["doc-old"]["chunks_list"] == ["chunk-b"]
+        lightrag.full_entities.upsert.assert_awaited_once_with(
+            {"doc-new": {"entity_names": ["Pump", "Valve", "Seal"], "count": 3}}
+        )
+        lightrag.full_relations.upsert.assert_awaited_once_with(
+            {"doc-new": {"relation_pairs": [["Pump", "Seal"]], "count": 1}}
+        )
+
+    async def test_refuses_unprocessed_new_version(self) -> None:
+        lightrag = self._lightrag({"status": "processing", "chunks_list": []})
+
+        with pytest.raises(RuntimeError, match="not been processed"):
+            await adopt_chunks(lightrag, "doc-new", {}, ChunkDiff(set()))
+
+        lightrag.doc_status.upsert.assert_not_awaited()
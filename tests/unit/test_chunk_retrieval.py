@@ -0,0 +1,206 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from lightrag import QueryParam
+from lightrag.utils import make_relation_chunk_key
+
+from infrastructure.rag.chunk_retrieval import (
+    ChunkTrackingUnavailable,
+    reciprocal_rank_fusion,
+    retrieve_chunks,
+)
+from infrastructure.rag.lexical_index import LexicalIndex
+
+
+def _row(chunk_id: str, file_path: str = "doc.pdf") -> dict:
+    return {"content": f"content of {chunk_id}", "file_path": file_path}
+
+
+@pytest.fixture
+def lightrag() -> MagicMock:
+    """LightRAG instance whose storages are mocked; the graph store must stay unused."""
+    mock = MagicMock()
+    mock.chunks_vdb.query = AsyncMock(
+        return_value=[
+            {"id": "v1", "content": "vector 1", "file_path": "a.pdf"},
+            {"id": "v2", "content": "vector 2", "file_path": "b.pdf"},
+        ]
+    )
+    mock.entities_vdb.query = AsyncMock(
+        return_value=[{"entity_name": "ACME"}, {"entity_name": "Alice"}]
+    )
+    mock.entity_chunks.get_by_ids = AsyncMock(
+        return_value=[{"chunk_ids": ["e1", "e2"]}, {"chunk_ids": ["e2", "v1"]}]
+    )
+    mock.relationships_vdb.query = AsyncMock(
+        return_value=[{"src_id": "ACME", "tgt_id": "Alice"}]
+    )
+    mock.relation_chunks.get_by_ids = AsyncMock(return_value=[{"chunk_ids": ["r1"]}])
+
+    async def _get_by_ids(ids):
+        return [_row(chunk_id) for chunk_id in ids]
+
+    mock.text_chunks.get_by_ids = AsyncMock(side_effect=_get_by_ids)
+    return mock
+
+
+class TestRetrieveChunks:
+    """Tests for retrieve_chunks — LightRAG storages are mocked."""
+
+    async def test_naive_uses_chunk_vector_search_only(
+        self, lightrag: MagicMock
+    ) -> None:
+        param = QueryParam(mode="naive", top_k=5, chunk_top_k=5)
+
+        result = await retrieve_chunks(lightrag, " what? ", param)
+
+        assert result["status"] == "success"
+        assert [c["chunk_id"] for c in result["data"]["chunks"]] == ["v1", "v2"]
+        assert result["data"]["chunks"][0]["reference_id"] == "1"
+        assert result["data"]["references"][0]["file_path"] == "a.pdf"
+        lightrag.chunks_vdb.query.assert_awaited_once_with("what?", top_k=5)
+        lightrag.entities_vdb.query.assert_not_awaited()
+        lightrag.chunk_entity_relation_graph.get_nodes_batch.assert_not_called()
+
+    async def test_local_resolves_entity_chunks_by_frequency(
+        self, lightrag: MagicMock
+    ) -> None:
+        param = QueryParam(mode="local", top_k=5, ll_keywords=["ACME", "Alice"])
+
+        result = await retrieve_chunks(lightrag, "q", param)
+
+        assert [c["chunk_id"] for c in result["data"]["chunks"]] == ["e2", "e1", "v1"]
+        lightrag.entities_vdb.query.assert_awaited_once_with("ACME, Alice", top_k=5)
+        lightrag.entity_chunks.get_by_ids.assert_awaited_once_with(["ACME", "Alice"])
+        lightrag.chunks_vdb.query.assert_not_awaited()
+        assert result["metadata"]["keywords"]["low_level"] == ["ACME", "Alice"]
+
+    async def test_local_looks_up_only_top_ranked_tracked_chunks(
+        self, lightrag: MagicMock
+    ) -> None:
+        param = QueryParam(
+            mode="local", top_k=5, chunk_top_k=2, ll_keywords=["ACME", "Alice"]
+        )
+
+        result = await retrieve_chunks(lightrag, "q", param)
+
+        assert [c["chunk_id"] for c in result["data"]["chunks"]] == ["e2", "e1"]
+        lightrag.text_chunks.get_by_ids.assert_awaited_once_with(["e2", "e1"])
+
+    async def test_global_resolves_relation_chunks(self, lightrag: MagicMock) -> None:
+        param = QueryParam(mode="global", top_k=5, hl_keywords=["partnerships"])
+
+        result = await retrieve_chunks(lightrag, "q", param)
+
+        assert [c["chunk_id"] for c in result["data"]["chunks"]] == ["r1"]
+        lightrag.relation_chunks.get_by_ids.assert_awaited_once_with(
+            [make_relation_chunk_key("ACME", "Alice")]
+        )
+
+    async def test_mix_merges_sources_round_robin_without_duplicates(
+        self, lightrag: MagicMock
+    ) -> None:
+        param = QueryParam(
+            mode="mix",
+            top_k=5,
+            chunk_top_k=4,
+            hl_keywords=["partnerships"],
+            ll_keywords=["ACME"],
+        )
+
+        result = await retrieve_chunks(lightrag, "q", param)
+
+        assert [c["chunk_id"] for c in result["data"]["chunks"]] == [
+            "v1",
+            "e2",
+            "r1",
+            "v2",
+        ]
+        assert result["metadata"]["processing_info"]["final_chunks_count"] == 4
+
+    async def test_extracts_keywords_when_not_supplied(
+        self, lightrag: MagicMock
+    ) -> None:
+        param = QueryParam(mode="hybrid", top_k=5)
+
+        with patch(
+            "lightrag.operate.get_keywords_from_query",
+            AsyncMock(return_value=(["partnerships"], ["ACME"])),
+        ) as mock_extract:
+            result = await retrieve_chunks(lightrag, "q", param)
+
+        mock_extract.assert_awaited_once()
+        assert result["metadata"]["keywords"] == {
+            "high_level": ["partnerships"],
+            "low_level": ["ACME"],
+        }
+
+    async def test_returns_failure_when_nothing_found(
+        self, lightrag: MagicMock
+    ) -> None:
+        lightrag.chunks_vdb.query.return_value = []
+        param = QueryParam(mode="naive", top_k=5)
+
+        result = await retrieve_chunks(lightrag, "q", param)
+
+        assert result["status"] == "failure"
+        assert result["data"] == {}
+
+    async def test_raises_when_chunk_tracking_is_empty(
+        self, lightrag: MagicMock
+    ) -> None:
+        lightrag.entity_chunks.get_by_ids.return_value = [None, None]
+        param = QueryParam(mode="local", top_k=5, ll_keywords=["ACME"])
+
+        with pytest.raises(ChunkTrackingUnavailable):
+            await retrieve_chunks(lightrag, "q", param)
+
+    async def test_fusion_ranks_exact_match_from_lexical_search(
+        self, lightrag: MagicMock
+    ) -> None:
+        """A chunk found only by full-text search still makes a small top_k."""
+        lightrag.chunks_vdb.query.return_value = [
+            {"id": "v1", "content": "vector 1", "file_path": "a.pdf"},
+            {"id": "v2", "content": "vector 2", "file_path": "b.pdf"},
+            {"id": "v3", "content": "vector 3", "file_path": "c.pdf"},
+        ]
+        lexical_index = AsyncMock(spec=LexicalIndex)
+        lexical_index.search.return_value = [
+            {"content": "part AB-1234", "file_path": "p.pdf", "chunk_id": "x1"},
+            {"content": "vector 3", "file_path": "c.pdf", "chunk_id": "v3"},
+        ]
+        param = QueryParam(mode="fusion", top_k=3, chunk_top_k=3)
+
+        result = await retrieve_chunks(
+            lightrag, "AB-1234", param, lexical_index=lexical_index
+        )
+
+        assert [c["chunk_id"] for c in result["data"]["chunks"]] == ["v3", "v1", "x1"]
+        lightrag.chunks_vdb.query.assert_awaited_once_with("AB-1234", top_k=6)
+        lexical_index.search.assert_awaited_once_with(
+            lightrag.text_chunks, "AB-1234", 6
+        )
+        lightrag.entities_vdb.query.assert_not_awaited()
+
+    async def test_fusion_requires_lexical_index(self, lightrag: MagicMock) -> None:
+        param = QueryParam(mode="fusion", top_k=2)
+
+        with pytest.raises(ValueError):
+            await retrieve_chunks(lightrag, "AB-1234", param)
+
+
+class TestReciprocalRankFusion:
+    def test_sums_reciprocal_ranks_across_sources(self) -> None:
+        def chunk(chunk_id: str) -> dict:
+            return {"chunk_id": chunk_id}
+
+        fused = reciprocal_rank_fusion(
+            [[chunk("a"), chunk("b"), chunk("c")], [chunk("c"), chunk("d")]], k=60
+        )
+
+        assert [c["chunk_id"] for c in fused] == ["c", "a", "b", "d"]
+
+    def test_ties_keep_first_source_order(self) -> None:
+        fused = reciprocal_rank_fusion([[{"chunk_id": "a"}], [{"chunk_id": "b"}]], k=60)
+
+        assert [c["chunk_id"] for c in fused] == ["a", "b"]
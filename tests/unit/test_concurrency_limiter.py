@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from infrastructure.scheduling.concurrency_limiter import ConcurrencyLimiter
+
+
+class TestConcurrencyLimiter:
+    async def test_caps_concurrency_and_counts_waiters(self) -> None:
+        limiter = ConcurrencyLimiter(max_concurrency=2)
+        release = asyncio.Event()
+
+        async def _call() -> None:
+            async with limiter.slot():
+                await release.wait()
+
+        tasks = [asyncio.create_task(_call()) for _ in range(5)]
+        await asyncio.sleep(0)
+
+        assert limiter.stats() == {"running": 2, "waiting": 3, "max_concurrency": 2}
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert limiter.running == 0
+        assert limiter.waiting == 0
+
+    async def test_cancelled_waiter_is_not_counted(self) -> None:
+        limiter = ConcurrencyLimiter(max_concurrency=1)
+        release = asyncio.Event()
+
+        async def _call() -> None:
+            async with limiter.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(_call())
+        waiter = asyncio.create_task(_call())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.waiting == 0
+        release.set()
+        await holder
+        assert limiter.running == 0
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            ConcurrencyLimiter(max_concurrency=0)
+
+    def test_each_event_loop_gets_its_own_slots(self) -> None:
+        limiter = ConcurrencyLimiter(max_concurrency=1)
+
+        async def _call() -> None:
+            async with limiter.slot():
+                await asyncio.sleep(0)
+
+        async def _contend() -> None:
+            await asyncio.gather(_call(), _call())
+
+        # A semaphore a waiter bound to the first loop fails on the second.
+        asyncio.run(_contend())
+        asyncio.run(_contend())
+
+        assert limiter.stats()["running"] == 0
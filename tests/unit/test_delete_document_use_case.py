@@ -0,0 +1,37 @@
+from unittest.mock import AsyncMock
+
+from application.use_cases.delete_document_use_case import DeleteDocumentUseCase
+from domain.entities.document_deletion import DeletionStatus
+
+
+class TestDeleteDocumentUseCase:
+    """Tests for DeleteDocumentUseCase — the rag_engine is mocked."""
+
+    async def test_execute_initializes_project_and_deletes(
+        self, mock_rag_engine: AsyncMock
+    ) -> None:
+        """Should open the workspace and delete the file with its LLM cache."""
+        use_case = DeleteDocumentUseCase(rag_engine=mock_rag_engine)
+
+        result = await use_case.execute(
+            file_name="report.pdf", working_dir="/tmp/rag/p1"
+        )
+
+        mock_rag_engine.init_project.assert_called_once_with("/tmp/rag/p1")
+        mock_rag_engine.delete_document.assert_awaited_once_with(
+            file_name="report.pdf", working_dir="/tmp/rag/p1", delete_llm_cache=True
+        )
+        assert result.status == DeletionStatus.SUCCESS
+
+    async def test_execute_can_keep_llm_cache(self, mock_rag_engine: AsyncMock) -> None:
+        """delete_llm_cache=False should be passed through to the engine."""
+        use_case = DeleteDocumentUseCase(rag_engine=mock_rag_engine)
+
+        await use_case.execute(
+            file_name="report.pdf", working_dir="/tmp/rag/p1", delete_llm_cache=False
+        )
+
+        assert (
+            mock_rag_engine.delete_document.await_args.kwargs["delete_llm_cache"]
+            is False
+        )
@@ -0,0 +1,105 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from infrastructure.rag.diversification import (
+    collapse_near_duplicates,
+    diversify_chunks,
+    maximal_marginal_relevance,
+)
+
+
+def _chunk(chunk_id: str, reference_id: str = "1") -> dict:
+    return {
+        "reference_id": reference_id,
+        "content": f"content of {chunk_id}",
+        "file_path": f"{reference_id}.pdf",
+        "chunk_id": chunk_id,
+    }
+
+
+def _result(chunks: list[dict]) -> dict:
+    references = sorted({c["reference_id"] for c in chunks})
+    return {
+        "status": "success",
+        "data": {
+            "chunks": chunks,
+            "references": [
+                {"reference_id": r, "file_path": f"{r}.pdf"} for r in references
+            ],
+        },
+        "metadata": {"query_mode": "naive"},
+    }
+
+
+def _chunks_vdb(vectors: dict[str, list[float]]) -> MagicMock:
+    vdb = MagicMock()
+    vdb.get_vectors_by_ids = AsyncMock(
+        side_effect=lambda ids: {i: vectors[i] for i in ids if i in vectors}
+    )
+    return vdb
+
+
+class TestCollapseNearDuplicates:
+    def test_keeps_first_of_each_near_duplicate_group(self) -> None:
+        similarity = np.array(
+            [[1.0, 0.99, 0.1], [0.99, 1.0, 0.2], [0.1, 0.2, 1.0]], dtype=np.float32
+        )
+
+        assert collapse_near_duplicates(similarity, threshold=0.95) == [0, 2]
+
+
+class TestMaximalMarginalRelevance:
+    def test_zero_diversity_keeps_relevance_order(self) -> None:
+        relevance = np.array([0.9, 0.8, 0.7])
+        similarity = np.eye(3)
+
+        assert maximal_marginal_relevance(relevance, similarity, 0.0, 3) == [0, 1, 2]
+
+    def test_diversity_promotes_dissimilar_chunk(self) -> None:
+        relevance = np.array([0.9, 0.88, 0.7])
+        similarity = np.array([[1.0, 0.9, 0.0], [0.9, 1.0, 0.0], [0.0, 0.0, 1.0]])
+
+        assert maximal_marginal_relevance(relevance, similarity, 0.5, 2) == [0, 2]
+
+
+class TestDiversifyChunks:
+    async def test_collapses_duplicates_and_prunes_references(self) -> None:
+        result = _result([_chunk("a", "1"), _chunk("b", "2"), _chunk("c", "1")])
+        vdb = _chunks_vdb({"a": [1.0, 0.0], "b": [1.0, 0.01], "c": [0.0, 1.0]})
+
+        await diversify_chunks(result, vdb, top_k=10, dedup_threshold=0.95)
+
+        assert [c["chunk_id"] for c in result["data"]["chunks"]] == ["a", "c"]
+        assert result["data"]["references"] == [
+            {"reference_id": "1", "file_path": "1.pdf"}
+        ]
+        assert result["metadata"]["diversification"]["duplicates_removed"] == 1
+        vdb.get_vectors_by_ids.assert_awaited_once_with(["a", "b", "c"])
+
+    async def test_mmr_reorders_with_query_embedding(self) -> None:
+        result = _result([_chunk("a"), _chunk("b"), _chunk("c")])
+        vdb = _chunks_vdb({"a": [1.0, 0.0], "b": [0.99, 0.1], "c": [0.6, 0.8]})
+
+        await diversify_chunks(
+            result, vdb, top_k=2, query_embedding=np.array([1.0, 0.0]), diversity=0.7
+        )
+
+        assert [c["chunk_id"] for c in result["data"]["chunks"]] == ["a", "c"]
+
+    async def test_chunks_without_vectors_are_kept_last(self) -> None:
+        result = _result([_chunk("x"), _chunk("a"), _chunk("b")])
+        vdb = _chunks_vdb({"a": [1.0, 0.0], "b": [1.0, 0.0]})
+
+        await diversify_chunks(result, vdb, top_k=10, dedup_threshold=0.9)
+
+        assert [c["chunk_id"] for c in result["data"]["chunks"]] == ["a", "x"]
+
+    async def test_leaves_empty_result_untouched(self) -> None:
+        result = {"status": "failure", "data": {}}
+        vdb = _chunks_vdb({})
+
+        await diversify_chunks(result, vdb, top_k=5, dedup_threshold=0.9)
+
+        assert result == {"status": "failure", "data": {}}
+        vdb.get_vectors_by_ids.assert_not_awaited()
@@ -0,0 +1,119 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from infrastructure.locking.document_lock import (
+    InMemoryDocumentLock,
+    PostgresDocumentLock,
+    advisory_lock_key,
+)
+
+
+@pytest.fixture
+def connection() -> AsyncMock:
+    conn = AsyncMock()
+    conn.fetchval.return_value = True
+    return conn
+
+
+@pytest.fixture
+def pool(connection: AsyncMock) -> MagicMock:
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def _acquire():
+        yield connection
+
+    pool.acquire = _acquire
+    return pool
+
+
+class TestAdvisoryLockKey:
+    def test_key_is_signed_64_bit_and_stable(self) -> None:
+        key = advisory_lock_key("project", "docs/a.pdf", "abc")
+
+        assert -(2**63) <= key < 2**63
+        assert key == advisory_lock_key("project", "docs/a.pdf", "abc")
+
+    def test_key_changes_with_any_component(self) -> None:
+        base = advisory_lock_key("project", "docs/a.pdf", "abc")
+
+        assert base != advisory_lock_key("other", "docs/a.pdf", "abc")
+        assert base != advisory_lock_key("project", "docs/b.pdf", "abc")
+        assert base != advisory_lock_key("project", "docs/a.pdf", "def")
+
+
+class TestInMemoryDocumentLock:
+    async def test_first_caller_acquires(self) -> None:
+        lock = InMemoryDocumentLock()
+
+        async with lock.hold("project", "a.pdf", "h1") as acquired:
+            assert acquired is True
+
+    async def test_duplicate_attaches_and_is_not_acquired(self) -> None:
+        """A concurrent duplicate should wait for the in-flight run, then yield False."""
+        lock = InMemoryDocumentLock()
+        release = asyncio.Event()
+        events: list[str] = []
+
+        async def _owner() -> None:
+            async with lock.hold("project", "a.pdf", "h1") as acquired:
+                events.append(f"owner:{acquired}")
+                await release.wait()
+                events.append("owner:done")
+
+        async def _duplicate() -> None:
+            async with lock.hold("project", "a.pdf", "h1") as acquired:
+                events.append(f"duplicate:{acquired}")
+
+        owner = asyncio.create_task(_owner())
+        await asyncio.sleep(0)
+        duplicate = asyncio.create_task(_duplicate())
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(owner, duplicate)
+
+        assert events == ["owner:True", "owner:done", "duplicate:False"]
+
+    async def test_different_content_hash_is_not_a_duplicate(self) -> None:
+        lock = InMemoryDocumentLock()
+
+        async with (
+            lock.hold("project", "a.pdf", "h1") as first,
+            lock.hold("project", "a.pdf", "h2") as second,
+        ):
+            assert first is True
+            assert second is True
+
+
+class TestPostgresDocumentLock:
+    """Tests for PostgresDocumentLock — the asyncpg connection is mocked."""
+
+    async def test_acquires_and_releases_advisory_lock(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        lock = PostgresDocumentLock(pool)
+        key = advisory_lock_key("project", "a.pdf", "h1")
+
+        async with lock.hold("project", "a.pdf", "h1") as acquired:
+            assert acquired is True
+
+        connection.fetchval.assert_awaited_once_with(
+            "SELECT pg_try_advisory_lock($1)", key
+        )
+        connection.execute.assert_awaited_once_with(
+            "SELECT pg_advisory_unlock($1)", key
+        )
+
+    async def test_skips_when_other_replica_holds_lock(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        connection.fetchval.return_value = False
+        lock = PostgresDocumentLock(pool)
+
+        async with lock.hold("project", "a.pdf", "h1") as acquired:
+            assert acquired is False
+
+        connection.execute.assert_not_awaited()
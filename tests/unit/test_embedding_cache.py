@@ -0,0 +1,142 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from infrastructure.rag.embedding_cache import (
+    InMemoryEmbeddingCache,
+    PostgresEmbeddingCache,
+    text_hash,
+)
+
+
+def _provider() -> AsyncMock:
+    """Embeds each text as [len(text), 1.0]."""
+    return AsyncMock(side_effect=lambda texts: [[float(len(t)), 1.0] for t in texts])
+
+
+class TestInMemoryEmbeddingCache:
+    async def test_only_misses_reach_the_provider(self) -> None:
+        cache = InMemoryEmbeddingCache(max_entries=10, count_tokens=len)
+        provider = _provider()
+
+        await cache.embed("model", 2, ["header", "body"], provider)
+        embeddings = await cache.embed("model", 2, ["header", "new text"], provider)
+
+        assert provider.await_args_list[1].args == (["new text"],)
+        assert embeddings.tolist() == [[6.0, 1.0], [8.0, 1.0]]
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 3,
+            "hit_rate": 0.25,
+            "saved_tokens": len("header"),
+            "size": 3,
+        }
+
+    async def test_duplicates_in_a_batch_are_embedded_once(self) -> None:
+        cache = InMemoryEmbeddingCache(max_entries=10, count_tokens=len)
+        provider = _provider()
+
+        embeddings = await cache.embed("model", 2, ["same", "same", "other"], provider)
+
+        provider.assert_awaited_once_with(["same", "other"])
+        assert embeddings.shape == (3, 2)
+        assert (cache.hits, cache.misses, cache.saved_tokens) == (1, 2, 4)
+
+    async def test_entries_are_scoped_by_model_and_dimension(self) -> None:
+        cache = InMemoryEmbeddingCache(max_entries=10, count_tokens=len)
+        provider = _provider()
+
+        await cache.embed("model-a", 2, ["text"], provider)
+        await cache.embed("model-b", 2, ["text"], provider)
+        await cache.embed("model-a", 3, ["text"], provider)
+
+        assert provider.await_count == 3
+        assert cache.hits == 0
+
+    async def test_evicts_least_recently_used(self) -> None:
+        cache = InMemoryEmbeddingCache(max_entries=2, count_tokens=len)
+        provider = _provider()
+
+        await cache.embed("model", 2, ["a", "b"], provider)
+        await cache.embed("model", 2, ["a"], provider)
+        await cache.embed("model", 2, ["c"], provider)
+
+        found = await cache.get_many("model", 2, [text_hash(t) for t in "abc"])
+        assert set(found) == {text_hash("a"), text_hash("c")}
+
+    async def test_lookup_failure_falls_back_to_provider(self) -> None:
+        cache = InMemoryEmbeddingCache(max_entries=10, count_tokens=len)
+        cache.get_many = AsyncMock(side_effect=RuntimeError("down"))
+        provider = _provider()
+
+        embeddings = await cache.embed("model", 2, ["text"], provider)
+
+        assert embeddings.tolist() == [[4.0, 1.0]]
+
+
+class TestPostgresEmbeddingCache:
+    @pytest.fixture
+    def connection(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def cache(self, connection: AsyncMock) -> PostgresEmbeddingCache:
+        pool = MagicMock()
+
+        @asynccontextmanager
+        async def _acquire(timeout=None):
+            assert timeout == 0.5
+            yield connection
+
+        pool.acquire = _acquire
+        return PostgresEmbeddingCache(pool, count_tokens=len, acquire_timeout=0.5)
+
+    async def test_reads_hits_and_writes_misses_as_float32(
+        self, cache: PostgresEmbeddingCache, connection: AsyncMock
+    ) -> None:
+        cached = np.asarray([0.5, 0.25], dtype=np.float32)
+        connection.fetch.return_value = [
+            {"text_hash": text_hash("known"), "embedding": cached.tobytes()}
+        ]
+        provider = _provider()
+
+        embeddings = await cache.embed("model", 2, ["known", "unknown"], provider)
+
+        assert embeddings.tolist() == [[0.5, 0.25], [7.0, 1.0]]
+        provider.assert_awaited_once_with(["unknown"])
+        sql, model, dim, keys, vectors = connection.execute.await_args.args
+        assert "ON CONFLICT DO NOTHING" in sql
+        assert (model, dim, keys) == ("model", 2, [text_hash("unknown")])
+        assert np.frombuffer(vectors[0], dtype=np.float32).tolist() == [7.0, 1.0]
+
+    async def test_creates_table_once(
+        self, cache: PostgresEmbeddingCache, connection: AsyncMock
+    ) -> None:
+        connection.fetch.return_value = []
+
+        await cache.embed("model", 2, ["a"], _provider())
+        await cache.embed("model", 2, ["b"], _provider())
+
+        creates = [
+            c for c in connection.execute.await_args_list if "CREATE TABLE" in c.args[0]
+        ]
+        assert len(creates) == 1
+
+    async def test_pool_timeout_falls_back_to_provider(self) -> None:
+        pool = MagicMock()
+
+        @asynccontextmanager
+        async def _exhausted(timeout=None):  # noqa: ARG001
+            raise TimeoutError
+            yield
+
+        pool.acquire = _exhausted
+        cache = PostgresEmbeddingCache(pool, count_tokens=len, acquire_timeout=0.1)
+        provider = _provider()
+
+        embeddings = await cache.embed("model", 2, ["text"], provider)
+
+        assert embeddings.tolist() == [[4.0, 1.0]]
+        provider.assert_awaited_once_with(["text"])
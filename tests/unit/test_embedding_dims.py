@@ -0,0 +1,51 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from infrastructure.rag.embedding_dims import DIMS_TABLE, PostgresEmbeddingDims
+
+
+@pytest.fixture
+def connection() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def pool(connection: AsyncMock) -> MagicMock:
+    """PostgresPool stand-in whose acquire() yields the mocked asyncpg connection."""
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def _acquire():
+        yield connection
+
+    pool.acquire = _acquire
+    return pool
+
+
+class TestPostgresEmbeddingDims:
+    async def test_set_upserts_per_workspace_and_model(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        dims = PostgresEmbeddingDims(pool, "text-embedding-3-large")
+
+        await dims.set("ws_a", 512)
+        await dims.set("ws_a", 256)
+
+        create, *upserts = [c.args for c in connection.execute.await_args_list]
+        assert f"CREATE TABLE IF NOT EXISTS {DIMS_TABLE}" in create[0]
+        assert "ON CONFLICT (workspace, model)" in upserts[0][0]
+        assert [u[1:] for u in upserts] == [
+            ("ws_a", "text-embedding-3-large", 512),
+            ("ws_a", "text-embedding-3-large", 256),
+        ]
+
+    async def test_get_returns_none_for_workspaces_never_cut_over(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        connection.fetchval.return_value = None
+        dims = PostgresEmbeddingDims(pool, "m")
+
+        assert await dims.get("ws_a") is None
+        assert connection.fetchval.await_args.args[1:] == ("ws_a", "m")
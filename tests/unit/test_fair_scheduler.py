@@ -0,0 +1,157 @@
+import asyncio
+import threading
+
+import pytest
+
+from infrastructure.scheduling.fair_scheduler import WeightedFairScheduler
+
+
+async def _run_jobs(
+    scheduler: WeightedFairScheduler, jobs: list[tuple[str, str]]
+) -> list[str]:
+    """Submit (workspace, label) jobs in order and return the start order."""
+    started: list[str] = []
+
+    async def _job(workspace: str, label: str) -> None:
+        async with scheduler.slot(workspace):
+            started.append(label)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*[_job(workspace, label) for workspace, label in jobs])
+    return started
+
+
+class TestWeightedFairScheduler:
+    """Tests for WeightedFairScheduler — pure asyncio, no external boundary."""
+
+    async def test_small_job_overtakes_large_folder(self) -> None:
+        """A single file from another workspace should start before the rest of a large folder."""
+        scheduler = WeightedFairScheduler(max_concurrency=1, workspace_concurrency=1)
+        jobs = [("big", f"big-{i}") for i in range(10)] + [("small", "small-0")]
+
+        started = await _run_jobs(scheduler, jobs)
+
+        assert started.index("small-0") <= 2
+
+    async def test_respects_workspace_concurrency_cap(self) -> None:
+        """No workspace should exceed its per-workspace concurrency cap."""
+        scheduler = WeightedFairScheduler(max_concurrency=4, workspace_concurrency=2)
+        peak = 0
+        current = 0
+
+        async def _job() -> None:
+            nonlocal peak, current
+            async with scheduler.slot("ws"):
+                current += 1
+                peak = max(peak, current)
+                await asyncio.sleep(0.01)
+                current -= 1
+
+        await asyncio.gather(*[_job() for _ in range(6)])
+
+        assert peak == 2
+
+    async def test_respects_global_concurrency_cap(self) -> None:
+        """Running work across all workspaces should not exceed max_concurrency."""
+        scheduler = WeightedFairScheduler(max_concurrency=3, workspace_concurrency=5)
+        peak = 0
+
+        async def _job(workspace: str) -> None:
+            nonlocal peak
+            async with scheduler.slot(workspace):
+                peak = max(peak, scheduler.running)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[_job(f"ws-{i % 4}") for i in range(12)])
+
+        assert peak == 3
+        assert scheduler.running == 0
+        assert scheduler.waiting == 0
+
+    async def test_weights_favor_heavier_workspace(self) -> None:
+        """A workspace with a higher weight should get proportionally more early slots."""
+        scheduler = WeightedFairScheduler(
+            max_concurrency=1, workspace_concurrency=1, weights={"gold": 3.0}
+        )
+        jobs = [("bronze", f"bronze-{i}") for i in range(6)] + [
+            ("gold", f"gold-{i}") for i in range(6)
+        ]
+
+        started = await _run_jobs(scheduler, jobs)
+
+        first_eight = started[:8]
+        assert sum(label.startswith("gold") for label in first_eight) >= 5
+
+    async def test_cancelled_waiter_releases_nothing(self) -> None:
+        """Cancelling a queued job should leave slot accounting consistent."""
+        scheduler = WeightedFairScheduler(max_concurrency=1, workspace_concurrency=1)
+        release = asyncio.Event()
+
+        async def _holder() -> None:
+            async with scheduler.slot("a"):
+                await release.wait()
+
+        async def _waiter() -> None:
+            async with scheduler.slot("b"):
+                pass
+
+        holder = asyncio.create_task(_holder())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(_waiter())
+        await asyncio.sleep(0)
+        assert scheduler.waiting == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        release.set()
+        await holder
+
+        assert scheduler.running == 0
+        assert scheduler.waiting == 0
+
+    async def test_stats_reports_per_workspace_counts(self) -> None:
+        """stats() should expose running and waiting counts per workspace."""
+        scheduler = WeightedFairScheduler(max_concurrency=1, workspace_concurrency=1)
+        release = asyncio.Event()
+
+        async def _job(workspace: str) -> None:
+            async with scheduler.slot(workspace):
+                await release.wait()
+
+        tasks = [asyncio.create_task(_job("a")), asyncio.create_task(_job("b"))]
+        await asyncio.sleep(0)
+
+        stats = scheduler.stats()
+        assert stats["running"] == 1
+        assert stats["waiting"] == 1
+        assert stats["workspaces"]["a"] == {"running": 1, "waiting": 0}
+        assert stats["workspaces"]["b"] == {"running": 0, "waiting": 1}
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    def test_each_event_loop_has_its_own_queue(self) -> None:
+        """A loop on another thread (MCP in stdio mode) neither blocks nor is woken."""
+        scheduler = WeightedFairScheduler(max_concurrency=1, workspace_concurrency=1)
+        held = threading.Event()
+        release = threading.Event()
+
+        async def _hold() -> None:
+            async with scheduler.slot("ws"):
+                held.set()
+                await asyncio.to_thread(release.wait)
+
+        async def _other() -> int:
+            async with scheduler.slot("ws"):
+                return scheduler.running
+
+        thread = threading.Thread(target=asyncio.run, args=(_hold(),))
+        thread.start()
+        try:
+            assert held.wait(5)
+            assert asyncio.run(asyncio.wait_for(_other(), 5)) == 2
+        finally:
+            release.set()
+            thread.join()
+        assert scheduler.running == 0
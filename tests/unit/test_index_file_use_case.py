@@ -1,11 +1,26 @@
+import hashlib
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from application.use_cases.index_file_use_case import IndexFileUseCase
 from domain.entities.indexing_result import FileIndexingResult, IndexingStatus
+from domain.ports.document_lock_port import DocumentLockPort
+
+
+def _document_lock(acquired: bool) -> MagicMock:
+    """DocumentLockPort stand-in that records hold() calls and yields ``acquired``."""
+    lock = MagicMock(spec=DocumentLockPort)
+
+    @asynccontextmanager
+    async def _hold(*_args):
+        yield acquired
+
+    lock.hold.side_effect = _hold
+    return lock
 
 
 class TestIndexFileUseCase:
@@ -101,6 +116,33 @@ class TestIndexFileUseCase:
             working_dir="/tmp/rag/p1",
         )
 
+    async def test_execute_with_replace_calls_replace_document(
+        self,
+        mock_rag_engine: AsyncMock,
+        mock_storage: AsyncMock,
+        tmp_path: Path,
+    ) -> None:
+        """replace=True should re-index through rag_engine.replace_document."""
+        output_dir = str(tmp_path)
+        use_case = IndexFileUseCase(
+            rag_engine=mock_rag_engine,
+            storage=mock_storage,
+            bucket="my-bucket",
+            output_dir=output_dir,
+        )
+
+        await use_case.execute(
+            file_name="report.pdf", working_dir="/tmp/rag/p1", replace=True
+        )
+
+        mock_rag_engine.replace_document.assert_called_once_with(
+            file_path=os.path.join(output_dir, "report.pdf"),
+            file_name="report.pdf",
+            output_dir=output_dir,
+            working_dir="/tmp/rag/p1",
+        )
+        mock_rag_engine.index_document.assert_not_called()
+
     async def test_execute_returns_result(
         self,
         mock_rag_engine: AsyncMock,
@@ -156,3 +198,50 @@ class TestIndexFileUseCase:
 
         assert result.status == IndexingStatus.FAILED
         assert result.error == "Corrupt PDF"
+
+    async def test_execute_holds_document_lock_with_content_hash(
+        self,
+        mock_rag_engine: AsyncMock,
+        mock_storage: AsyncMock,
+        tmp_path: Path,
+    ) -> None:
+        """Should lock on (working_dir, file_name, sha256 of content) before indexing."""
+        mock_storage.get_object.return_value = b"pdf bytes"
+        lock = _document_lock(acquired=True)
+        use_case = IndexFileUseCase(
+            rag_engine=mock_rag_engine,
+            storage=mock_storage,
+            bucket="my-bucket",
+            output_dir=str(tmp_path),
+            document_lock=lock,
+        )
+
+        await use_case.execute(file_name="report.pdf", working_dir="/tmp/rag/p1")
+
+        lock.hold.assert_called_once_with(
+            "/tmp/rag/p1", "report.pdf", hashlib.sha256(b"pdf bytes").hexdigest()
+        )
+        mock_rag_engine.index_document.assert_called_once()
+
+    async def test_execute_skips_duplicate_in_flight_document(
+        self,
+        mock_rag_engine: AsyncMock,
+        mock_storage: AsyncMock,
+        tmp_path: Path,
+    ) -> None:
+        """Should return SKIPPED without writing or indexing when the lock is held elsewhere."""
+        use_case = IndexFileUseCase(
+            rag_engine=mock_rag_engine,
+            storage=mock_storage,
+            bucket="my-bucket",
+            output_dir=str(tmp_path),
+            document_lock=_document_lock(acquired=False),
+        )
+
+        result = await use_case.execute(
+            file_name="report.pdf", working_dir="/tmp/rag/p1"
+        )
+
+        assert result.status == IndexingStatus.SKIPPED
+        assert not (tmp_path / "report.pdf").exists()
+        mock_rag_engine.index_document.assert_not_called()
@@ -0,0 +1,243 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from application.requests.indexing_request import IndexFileRequest, IndexFolderRequest
+from application.use_cases.enqueue_indexing_job_use_case import (
+    EnqueueIndexingJobUseCase,
+)
+from application.use_cases.index_file_use_case import IndexFileUseCase
+from application.use_cases.index_folder_use_case import IndexFolderUseCase
+from application.use_cases.run_indexing_job_use_case import RunIndexingJobUseCase
+from domain.entities.indexing_job import (
+    IndexingJob,
+    IndexingJobStatus,
+    IndexingJobType,
+)
+from domain.entities.indexing_result import FileIndexingResult, IndexingStatus
+from infrastructure.rag.usage_tracking import recording_usage
+from worker import run_worker
+
+
+def _job(job_type: IndexingJobType, payload: dict) -> IndexingJob:
+    return IndexingJob(
+        id="job-1",
+        job_type=job_type,
+        working_dir="project",
+        payload=payload,
+        status=IndexingJobStatus.RUNNING,
+    )
+
+
+class TestEnqueueIndexingJobUseCase:
+    """Tests for EnqueueIndexingJobUseCase — job_queue is external, mocked."""
+
+    async def test_enqueues_file_request(self, mock_job_queue: AsyncMock) -> None:
+        use_case = EnqueueIndexingJobUseCase(mock_job_queue)
+
+        await use_case.execute(
+            IndexFileRequest(file_name="project/a.pdf", working_dir="project")
+        )
+
+        mock_job_queue.enqueue.assert_awaited_once_with(
+            job_type=IndexingJobType.FILE,
+            working_dir="project",
+            payload={
+                "file_name": "project/a.pdf",
+                "working_dir": "project",
+                "replace": False,
+            },
+        )
+
+    async def test_enqueues_folder_request(self, mock_job_queue: AsyncMock) -> None:
+        use_case = EnqueueIndexingJobUseCase(mock_job_queue)
+
+        await use_case.execute(IndexFolderRequest(working_dir="project"))
+
+        kwargs = mock_job_queue.enqueue.call_args.kwargs
+        assert kwargs["job_type"] == IndexingJobType.FOLDER
+        assert kwargs["payload"]["recursive"] is True
+
+
+class TestRunIndexingJobUseCase:
+    async def test_runs_file_job(self) -> None:
+        file_use_case = AsyncMock(spec=IndexFileUseCase)
+        folder_use_case = AsyncMock(spec=IndexFolderUseCase)
+        use_case = RunIndexingJobUseCase(file_use_case, folder_use_case)
+
+        await use_case.execute(
+            _job(IndexingJobType.FILE, {"file_name": "project/a.pdf"})
+        )
+
+        file_use_case.execute.assert_awaited_once_with(
+            file_name="project/a.pdf", working_dir="project", replace=False
+        )
+        folder_use_case.execute.assert_not_awaited()
+
+    async def test_runs_file_replace_job(self) -> None:
+        file_use_case = AsyncMock(spec=IndexFileUseCase)
+        use_case = RunIndexingJobUseCase(file_use_case, AsyncMock())
+
+        await use_case.execute(
+            _job(IndexingJobType.FILE, {"file_name": "project/a.pdf", "replace": True})
+        )
+
+        file_use_case.execute.assert_awaited_once_with(
+            file_name="project/a.pdf", working_dir="project", replace=True
+        )
+
+    async def test_runs_folder_job(self) -> None:
+        file_use_case = AsyncMock(spec=IndexFileUseCase)
+        folder_use_case = AsyncMock(spec=IndexFolderUseCase)
+        use_case = RunIndexingJobUseCase(file_use_case, folder_use_case)
+
+        await use_case.execute(
+            _job(
+                IndexingJobType.FOLDER,
+                {"working_dir": "project", "recursive": False},
+            )
+        )
+
+        request = folder_use_case.execute.call_args.kwargs["request"]
+        assert request == IndexFolderRequest(working_dir="project", recursive=False)
+
+
+class TestWorkerLoop:
+    async def test_worker_completes_claimed_job(
+        self, mock_job_queue: AsyncMock
+    ) -> None:
+        """The worker should run a claimed job and record its result."""
+        stop = asyncio.Event()
+        job = _job(IndexingJobType.FILE, {"file_name": "project/a.pdf"})
+        mock_job_queue.claim.side_effect = [job, None]
+        run_use_case = AsyncMock(spec=RunIndexingJobUseCase)
+        run_use_case.execute.return_value = FileIndexingResult(
+            status=IndexingStatus.SUCCESS,
+            message="ok",
+            file_path="/tmp/a.pdf",
+            file_name="project/a.pdf",
+        )
+
+        async def _stop_when_done(*_args) -> None:
+            stop.set()
+
+        mock_job_queue.complete.side_effect = _stop_when_done
+
+        await run_worker(
+            mock_job_queue,
+            lambda: run_use_case,
+            worker_id="w1",
+            concurrency=1,
+            poll_interval=0.01,
+            heartbeat_interval=60,
+            stop_event=stop,
+        )
+
+        mock_job_queue.complete.assert_awaited_once()
+        job_id, worker_id, result = mock_job_queue.complete.call_args[0]
+        assert (job_id, worker_id) == ("job-1", "w1")
+        assert result["status"] == "success"
+
+    async def test_worker_tags_usage_with_job_id(
+        self, mock_job_queue: AsyncMock
+    ) -> None:
+        stop = asyncio.Event()
+        mock_job_queue.claim.side_effect = [
+            _job(IndexingJobType.FILE, {"file_name": "project/a.pdf"}),
+            None,
+        ]
+        run_use_case = AsyncMock(spec=RunIndexingJobUseCase)
+
+        async def _execute(_job: IndexingJob) -> FileIndexingResult:
+            with recording_usage("project", "a.pdf") as recorder:
+                return FileIndexingResult(
+                    status=IndexingStatus.SUCCESS,
+                    message="ok",
+                    file_path="/tmp/a.pdf",
+                    file_name="a.pdf",
+                    usage=recorder.usage,
+                )
+
+        run_use_case.execute.side_effect = _execute
+
+        async def _stop_when_done(*_args) -> None:
+            stop.set()
+
+        mock_job_queue.complete.side_effect = _stop_when_done
+
+        await run_worker(
+            mock_job_queue,
+            lambda: run_use_case,
+            worker_id="w1",
+            concurrency=1,
+            poll_interval=0.01,
+            heartbeat_interval=60,
+            stop_event=stop,
+        )
+
+        _job_id, _worker_id, result = mock_job_queue.complete.call_args[0]
+        assert result["usage"]["job_id"] == "job-1"
+
+    async def test_worker_profiles_flagged_job(
+        self,
+        mock_job_queue: AsyncMock,
+        mock_profiler: MagicMock,
+        sample_file_indexing_result: FileIndexingResult,
+    ) -> None:
+        stop = asyncio.Event()
+        mock_job_queue.claim.side_effect = [
+            _job(IndexingJobType.FILE, {"file_name": "a.pdf", "profile": True}),
+            None,
+        ]
+        run_use_case = AsyncMock(spec=RunIndexingJobUseCase)
+        run_use_case.execute.return_value = sample_file_indexing_result
+
+        async def _stop_when_done(*_args) -> None:
+            stop.set()
+
+        mock_job_queue.complete.side_effect = _stop_when_done
+
+        await run_worker(
+            mock_job_queue,
+            lambda: run_use_case,
+            worker_id="w1",
+            concurrency=1,
+            poll_interval=0.01,
+            heartbeat_interval=60,
+            stop_event=stop,
+            profiler=mock_profiler,
+        )
+
+        mock_profiler.profile.assert_called_once_with(
+            "profiles/jobs/job-1.speedscope.json"
+        )
+        _job_id, _worker_id, result = mock_job_queue.complete.call_args[0]
+        assert result["profile_key"] == "profiles/jobs/job-1.speedscope.json"
+
+    async def test_worker_fails_job_on_exception(
+        self, mock_job_queue: AsyncMock
+    ) -> None:
+        stop = asyncio.Event()
+        mock_job_queue.claim.side_effect = [
+            _job(IndexingJobType.FILE, {"file_name": "project/a.pdf"}),
+            None,
+        ]
+        run_use_case = AsyncMock(spec=RunIndexingJobUseCase)
+        run_use_case.execute.side_effect = RuntimeError("download failed")
+
+        async def _stop_when_done(*_args) -> None:
+            stop.set()
+
+        mock_job_queue.fail.side_effect = _stop_when_done
+
+        await run_worker(
+            mock_job_queue,
+            lambda: run_use_case,
+            worker_id="w1",
+            concurrency=1,
+            poll_interval=0.01,
+            heartbeat_interval=60,
+            stop_event=stop,
+        )
+
+        mock_job_queue.fail.assert_awaited_once_with("job-1", "w1", "download failed")
+        mock_job_queue.complete.assert_not_awaited()
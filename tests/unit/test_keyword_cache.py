@@ -0,0 +1,71 @@
+from infrastructure.rag.keyword_cache import KeywordCache, normalize_query
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestKeywordCache:
+    def test_normalize_query_ignores_case_spacing_and_trailing_punctuation(
+        self,
+    ) -> None:
+        assert normalize_query("  What  is RAG? ") == normalize_query("what is rag")
+
+    def test_hit_after_put(self) -> None:
+        cache = KeywordCache(ttl_seconds=60, max_entries=10)
+
+        cache.put("model-a", "What is RAG?", ["retrieval"], ["RAG"])
+
+        assert cache.get("model-a", "what is rag") == (["retrieval"], ["RAG"])
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 0}
+
+    def test_key_includes_chat_model(self) -> None:
+        cache = KeywordCache(ttl_seconds=60, max_entries=10)
+
+        cache.put("model-a", "What is RAG?", ["retrieval"], ["RAG"])
+
+        assert cache.get("model-b", "What is RAG?") is None
+
+    def test_entries_expire_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache = KeywordCache(ttl_seconds=60, max_entries=10, clock=clock)
+        cache.put("m", "q", ["hl"], ["ll"])
+
+        clock.now = 61
+
+        assert cache.get("m", "q") is None
+        assert cache.stats()["size"] == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = KeywordCache(ttl_seconds=60, max_entries=2)
+        cache.put("m", "first", ["a"], [])
+        cache.put("m", "second", ["b"], [])
+        cache.get("m", "first")
+
+        cache.put("m", "third", ["c"], [])
+
+        assert cache.get("m", "second") is None
+        assert cache.get("m", "first") == (["a"], [])
+
+    def test_empty_extractions_and_disabled_cache_store_nothing(self) -> None:
+        cache = KeywordCache(ttl_seconds=60, max_entries=10)
+        disabled = KeywordCache(ttl_seconds=60, max_entries=0)
+
+        cache.put("m", "q", [], [])
+        disabled.put("m", "q", ["hl"], ["ll"])
+
+        assert cache.get("m", "q") is None
+        assert disabled.get("m", "q") is None
+
+    def test_returned_lists_are_copies(self) -> None:
+        cache = KeywordCache(ttl_seconds=60, max_entries=10)
+        cache.put("m", "q", ["hl"], ["ll"])
+
+        hl_keywords, _ = cache.get("m", "q")
+        hl_keywords.append("mutated")
+
+        assert cache.get("m", "q") == (["hl"], ["ll"])
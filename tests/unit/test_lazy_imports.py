@@ -0,0 +1,41 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from infrastructure.rag import lightrag_adapter
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+
+class TestLazyRagImports:
+    def test_importing_main_does_not_load_rag_stack(self) -> None:
+        """The API entry point must not import raganything/lightrag/docling eagerly."""
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, main; "
+                "print(sorted(m for m in ('raganything', 'lightrag', 'docling') "
+                "if m in sys.modules))",
+            ],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert proc.stdout.strip() == "[]"
+
+    def test_load_rag_stack_binds_lazy_names(self) -> None:
+        from raganything import RAGAnything
+
+        lightrag_adapter.load_rag_stack()
+
+        assert lightrag_adapter.RAGAnything is RAGAnything
+        assert "QueryParam" in vars(lightrag_adapter)
+
+    def test_unknown_attribute_raises(self) -> None:
+        with pytest.raises(AttributeError):
+            _ = lightrag_adapter.NotARealName
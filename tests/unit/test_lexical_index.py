@@ -0,0 +1,189 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from infrastructure.rag.lexical_index import (
+    InMemoryLexicalIndex,
+    PostgresLexicalIndex,
+    tokenize,
+)
+
+
+def _json_kv_storage(data: dict[str, dict]) -> SimpleNamespace:
+    """Stand-in for LightRAG's JsonKVStorage internals read by the index."""
+    return SimpleNamespace(
+        workspace="ws_test", _data=data, _storage_lock=asyncio.Lock()
+    )
+
+
+def _pool(connection: AsyncMock) -> MagicMock:
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def _acquire():
+        yield connection
+
+    pool.acquire = _acquire
+    return pool
+
+
+def _pg_kv_storage(rows: list[dict]) -> MagicMock:
+    storage = MagicMock()
+    storage.workspace = "ws_test"
+    storage.db.execute = AsyncMock()
+    storage.db.query = AsyncMock(return_value=rows)
+    return storage
+
+
+class TestTokenize:
+    def test_keeps_compound_identifiers_and_their_parts(self) -> None:
+        assert tokenize("Part AB-1234, v2.1") == [
+            "part",
+            "ab-1234",
+            "ab",
+            "1234",
+            "v2.1",
+            "v2",
+            "1",
+        ]
+
+
+class TestInMemoryLexicalIndex:
+    async def test_ranks_exact_identifier_match_first(self) -> None:
+        storage = _json_kv_storage(
+            {
+                "c1": {"content": "Warranty terms for pumps.", "file_path": "a.pdf"},
+                "c2": {"content": "Replace pump AB-1234 yearly.", "file_path": "b.pdf"},
+                "c3": {"content": "Pump AB-9999 is discontinued."},
+            }
+        )
+
+        hits = await InMemoryLexicalIndex().search(storage, "AB-1234", top_k=2)
+
+        assert hits[0] == {
+            "content": "Replace pump AB-1234 yearly.",
+            "file_path": "b.pdf",
+            "chunk_id": "c2",
+        }
+        assert len(hits) == 2
+        assert hits[1]["file_path"] == "unknown_source"
+
+    async def test_returns_nothing_without_matching_terms(self) -> None:
+        storage = _json_kv_storage({"c1": {"content": "Warranty terms."}})
+
+        assert await InMemoryLexicalIndex().search(storage, "ZX-42", top_k=5) == []
+
+    async def test_rebuilds_when_chunks_change(self) -> None:
+        storage = _json_kv_storage({"c1": {"content": "Invoice INV-1."}})
+        index = InMemoryLexicalIndex()
+        assert [h["chunk_id"] for h in await index.search(storage, "INV-2", 5)] == [
+            "c1"
+        ]
+
+        storage._data["c2"] = {"content": "Invoice INV-2."}
+
+        hits = await index.search(storage, "INV-2", top_k=5)
+        assert hits[0]["chunk_id"] == "c2"
+
+
+class TestPostgresLexicalIndex:
+    async def test_queries_workspace_with_tsvector_match(self) -> None:
+        storage = _pg_kv_storage(
+            [{"id": "c2", "content": "Replace AB-1234.", "file_path": None}]
+        )
+
+        hits = await PostgresLexicalIndex("simple").search(storage, "AB-1234", 8)
+
+        assert hits == [
+            {
+                "content": "Replace AB-1234.",
+                "file_path": "unknown_source",
+                "chunk_id": "c2",
+            }
+        ]
+        sql, params = storage.db.query.await_args.args
+        assert "to_tsvector('simple'::regconfig, content) @@ q" in sql
+        assert "ts_rank_cd" in sql
+        assert params == ["ws_test", "simple", 8, "ab-1234"]
+        assert storage.db.query.await_args.kwargs == {"multirows": True}
+
+    async def test_ors_one_tsquery_per_distinct_term(self) -> None:
+        storage = _pg_kv_storage([])
+
+        await PostgresLexicalIndex("simple").search(
+            storage, "Replace AB-1234, then replace HR/2024/17", 5
+        )
+
+        sql, params = storage.db.query.await_args.args
+        assert (
+            "(SELECT plainto_tsquery($2::regconfig, $4) || "
+            "plainto_tsquery($2::regconfig, $5) || "
+            "plainto_tsquery($2::regconfig, $6) || "
+            "plainto_tsquery($2::regconfig, $7) AS q) AS terms"
+        ) in sql
+        assert params[3:] == ["replace", "ab-1234", "then", "hr/2024/17"]
+
+    async def test_query_without_terms_skips_the_database(self) -> None:
+        storage = _pg_kv_storage([])
+
+        assert await PostgresLexicalIndex("simple").search(storage, " ?! ", 5) == []
+        storage.db.query.assert_not_awaited()
+
+    async def test_search_does_not_wait_for_index_build(self) -> None:
+        storage = _pg_kv_storage([])
+        pool = _pool(AsyncMock())
+        index = PostgresLexicalIndex("english", pool=pool)
+        index.build = AsyncMock(return_value=True)
+
+        await index.search(storage, "a", 5)
+        await index.search(storage, "b", 5)
+        await asyncio.sleep(0)
+
+        index.build.assert_awaited_once()
+        storage.db.execute.assert_not_awaited()
+
+    async def test_builds_gin_index_and_marks_ready_when_valid(self) -> None:
+        connection = AsyncMock()
+        # table exists, lock acquired, no index yet, valid after the build
+        connection.fetchval.side_effect = [True, True, None, True]
+        index = PostgresLexicalIndex("english", pool=_pool(connection))
+
+        assert await index.build() is True
+
+        statements = [c.args[0] for c in connection.execute.await_args_list]
+        assert "CREATE INDEX CONCURRENTLY IF NOT EXISTS" in statements[0]
+        assert "USING GIN (to_tsvector('english'::regconfig, content))" in statements[0]
+        assert "pg_advisory_unlock" in statements[-1]
+        index.start_build()
+        assert index._build_task is None
+
+    async def test_rebuilds_invalid_index_and_retries_failed_build(self) -> None:
+        connection = AsyncMock()
+        # an invalid index is left over and the rebuild is invalid again
+        connection.fetchval.side_effect = [True, True, False, False]
+        index = PostgresLexicalIndex(pool=_pool(connection), retry_seconds=0)
+
+        assert await index.build() is False
+
+        statements = [c.args[0] for c in connection.execute.await_args_list]
+        assert statements[0].startswith("DROP INDEX CONCURRENTLY IF EXISTS")
+        assert "CREATE INDEX CONCURRENTLY" in statements[1]
+        index.start_build()
+        assert index._build_task is not None
+        await index.aclose()
+
+    async def test_search_works_when_index_build_fails(self) -> None:
+        storage = _pg_kv_storage([])
+        connection = AsyncMock()
+        connection.fetchval.side_effect = RuntimeError("connection refused")
+        index = PostgresLexicalIndex(pool=_pool(connection))
+
+        assert await index.search(storage, "a", 5) == []
+        assert await index._build_task is False
+
+    def test_rejects_unsafe_text_search_config(self) -> None:
+        with pytest.raises(ValueError):
+            PostgresLexicalIndex("simple'); DROP TABLE x; --")
@@ -1,11 +1,21 @@
 import os
 import tempfile
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
+import numpy as np
 import pytest
+from lightrag.utils import compute_mdhash_id
 
 from config import LLMConfig, RAGConfig
+from domain.entities.document_deletion import DeletionStatus
 from domain.entities.indexing_result import IndexingStatus
+from domain.entities.vector_index import VectorQuantization
+from infrastructure.rag.lexical_index import (
+    InMemoryLexicalIndex,
+    LexicalIndex,
+    PostgresLexicalIndex,
+)
 from infrastructure.rag.lightrag_adapter import LightRAGAdapter
 
 
@@ -31,6 +41,40 @@ def rag_config_local() -> RAGConfig:
     return RAGConfig(RAG_STORAGE_TYPE="local")
 
 
+@pytest.fixture
+def rag_config_graph_query() -> RAGConfig:
+    """Config that routes queries through LightRAG's aquery_data."""
+    return RAGConfig(RAG_STORAGE_TYPE="postgres", QUERY_CHUNKS_ONLY=False)
+
+
+class PGDocStatusStorage:
+    """Stands in for LightRAG's PostgreSQL doc status storage (matched by name)."""
+
+    def __init__(self, rows: list[dict]) -> None:
+        self.workspace = "ws"
+        self.db = MagicMock()
+        self.db.query = AsyncMock(return_value=rows)
+
+
+def _rag_with_docs(docs: dict[str, str], *statuses: str) -> MagicMock:
+    """A RAGAnything mock whose doc status holds ``{doc_id: file_path}``."""
+    mock_rag = MagicMock()
+    mock_rag._ensure_lightrag_initialized = AsyncMock()
+    mock_rag.process_document_complete = AsyncMock()
+    mock_rag.lightrag.doc_status.get_docs_by_statuses = AsyncMock(
+        return_value={
+            doc_id: SimpleNamespace(file_path=path) for doc_id, path in docs.items()
+        }
+    )
+    mock_rag.lightrag.adelete_by_doc_id = AsyncMock(
+        side_effect=[
+            SimpleNamespace(status=status, message=f"{status} message")
+            for status in statuses
+        ]
+    )
+    return mock_rag
+
+
 class TestLightRAGAdapter:
     """Tests for LightRAGAdapter — the external boundary (RAGAnything) is mocked."""
 
@@ -100,6 +144,152 @@ class TestLightRAGAdapter:
         assert lightrag_kwargs["graph_storage"] == "PGGraphStorage"
         assert lightrag_kwargs["doc_status_storage"] == "PGDocStatusStorage"
 
+    @patch("infrastructure.rag.lightrag_adapter.openai_embed", new_callable=AsyncMock)
+    @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
+    @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
+    async def test_reduced_dimension_workspace_truncates_embeddings(
+        self,
+        _mock_rag_cls: MagicMock,
+        mock_embedding_func: MagicMock,
+        mock_openai_embed: AsyncMock,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        """A workspace in EMBEDDING_WORKSPACE_DIMS gets truncated vectors in its own tables."""
+        llm_config.EMBEDDING_WORKSPACE_DIMS = {"/tmp/small": 2}
+        mock_openai_embed.return_value = [[3.0, 4.0, 12.0]]
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        adapter.init_project("/tmp/small")
+
+        kwargs = mock_embedding_func.call_args.kwargs
+        assert kwargs["embedding_dim"] == 2
+        assert kwargs["model_name"] == "test-embed"
+        embeddings = await kwargs["func"](["text"], context="document")
+        assert embeddings[0].tolist() == pytest.approx([0.6, 0.8])
+
+    @patch(
+        "infrastructure.rag.lightrag_adapter.openai_embed", new_callable=AsyncMock
+    )
+    @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
+    @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
+    async def test_embedding_cache_is_shared_across_workspaces(
+        self,
+        _mock_rag_cls: MagicMock,
+        mock_embedding_func: MagicMock,
+        mock_openai_embed: AsyncMock,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        """Text embedded in one workspace is not sent to the provider again."""
+        llm_config.EMBEDDING_WORKSPACE_DIMS = {"/tmp/small": 2}
+        mock_openai_embed.side_effect = lambda texts, **_kw: [
+            [3.0, 4.0, 12.0] for _ in texts
+        ]
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        adapter.init_project("/tmp/full")
+        embed_full = mock_embedding_func.call_args.kwargs["func"]
+        adapter.init_project("/tmp/small")
+        embed_small = mock_embedding_func.call_args.kwargs["func"]
+
+        await embed_full(["boilerplate", "clause 1"])
+        embeddings = await embed_small(["boilerplate"])
+
+        mock_openai_embed.assert_awaited_once()
+        assert embeddings[0].tolist() == pytest.approx([0.6, 0.8])
+        assert adapter.stats()["embedding_cache"]["hits"] == 1
+
+    @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
+    @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
+    def test_full_dimension_workspace_keeps_unsuffixed_tables(
+        self,
+        _mock_rag_cls: MagicMock,
+        mock_embedding_func: MagicMock,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        adapter.init_project("/tmp/full")
+
+        kwargs = mock_embedding_func.call_args.kwargs
+        assert kwargs["embedding_dim"] == 128
+        assert "model_name" not in kwargs
+
+    @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
+    @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
+    async def test_set_embedding_dim_rebuilds_engine_at_new_dimension(
+        self,
+        mock_rag_cls: MagicMock,
+        mock_embedding_func: MagicMock,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        embedding_dims = AsyncMock()
+        embedding_dims.get.return_value = None
+        adapter = LightRAGAdapter(
+            llm_config, rag_config_postgres, embedding_dims=embedding_dims
+        )
+        adapter.init_project("/tmp/p")
+
+        await adapter.set_embedding_dim("/tmp/p", 64)
+
+        embedding_dims.set.assert_awaited_once_with(
+            LightRAGAdapter._make_workspace("/tmp/p"), 64
+        )
+        assert "/tmp/p" not in adapter.rag
+        assert await adapter.embedding_dim("/tmp/p") == 64
+        adapter.init_project("/tmp/p")
+        assert mock_rag_cls.call_count == 2
+        assert mock_embedding_func.call_args.kwargs["embedding_dim"] == 64
+
+    @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
+    @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
+    async def test_engine_follows_cutover_recorded_by_another_process(
+        self,
+        mock_rag_cls: MagicMock,
+        mock_embedding_func: MagicMock,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        """A cached engine is rebuilt once the recorded dimension changes."""
+        mock_rag_cls.return_value = _rag_with_docs({})
+        embedding_dims = AsyncMock()
+        embedding_dims.get.return_value = None
+        llm_config = llm_config.model_copy(
+            update={"EMBEDDING_DIM_REFRESH_SECONDS": 0.0}
+        )
+        adapter = LightRAGAdapter(
+            llm_config, rag_config_postgres, embedding_dims=embedding_dims
+        )
+        adapter.init_project("/tmp/p")
+
+        await adapter.delete_document("report.pdf", "/tmp/p")
+        assert mock_rag_cls.call_count == 1
+
+        embedding_dims.get.return_value = 64
+        await adapter.delete_document("report.pdf", "/tmp/p")
+
+        assert mock_rag_cls.call_count == 2
+        assert mock_embedding_func.call_args.kwargs["embedding_dim"] == 64
+        embedding_dims.set.assert_not_awaited()
+
+    async def test_embedding_dim_is_cached_and_survives_lookup_failures(
+        self, llm_config: LLMConfig, rag_config_postgres: RAGConfig
+    ) -> None:
+        """Lookups are cached, and a failed one keeps the known dimension."""
+        embedding_dims = AsyncMock()
+        embedding_dims.get.return_value = 64
+        adapter = LightRAGAdapter(
+            llm_config, rag_config_postgres, embedding_dims=embedding_dims
+        )
+
+        assert await adapter.embedding_dim("/tmp/p") == 64
+        assert await adapter.embedding_dim("/tmp/p") == 64
+        embedding_dims.get.assert_awaited_once()
+
+        adapter._dims_checked.clear()
+        embedding_dims.get.side_effect = OSError("pool closed")
+        assert await adapter.embedding_dim("/tmp/p") == 64
+
     @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
     @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
     def test_init_project_passes_local_storage_when_configured(
@@ -120,6 +310,31 @@ class TestLightRAGAdapter:
         assert lightrag_kwargs["graph_storage"] == "NetworkXStorage"
         assert lightrag_kwargs["doc_status_storage"] == "JsonDocStatusStorage"
 
+    @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
+    @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
+    def test_init_project_registers_mmap_vector_storage(
+        self,
+        mock_rag_cls: MagicMock,
+        _mock_embedding_func: MagicMock,
+        llm_config: LLMConfig,
+    ) -> None:
+        """Should register and select MmapVectorStorage when LOCAL_VECTOR_STORAGE=mmap."""
+        from lightrag.kg import STORAGE_IMPLEMENTATIONS, STORAGES
+
+        adapter = LightRAGAdapter(
+            llm_config, RAGConfig(RAG_STORAGE_TYPE="local", LOCAL_VECTOR_STORAGE="mmap")
+        )
+        adapter.init_project("/tmp/mmap_project")
+
+        lightrag_kwargs = mock_rag_cls.call_args[1]["lightrag_kwargs"]
+        assert lightrag_kwargs["vector_storage"] == "MmapVectorStorage"
+        assert lightrag_kwargs["kv_storage"] == "JsonKVStorage"
+        assert STORAGES["MmapVectorStorage"] == "infrastructure.rag.mmap_vector_storage"
+        assert (
+            "MmapVectorStorage"
+            in STORAGE_IMPLEMENTATIONS["VECTOR_STORAGE"]["implementations"]
+        )
+
     @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
     @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
     def test_init_project_passes_cosine_threshold(
@@ -139,6 +354,67 @@ class TestLightRAGAdapter:
             lightrag_kwargs["cosine_threshold"] == rag_config_postgres.COSINE_THRESHOLD
         )
 
+    @patch("infrastructure.rag.lightrag_adapter.openai_embed", new_callable=AsyncMock)
+    @patch(
+        "infrastructure.rag.lightrag_adapter.openai_complete_if_cache",
+        new_callable=AsyncMock,
+    )
+    @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
+    @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
+    async def test_index_document_reports_model_usage(
+        self,
+        mock_rag_cls: MagicMock,
+        mock_embedding_func: MagicMock,
+        mock_complete: AsyncMock,
+        mock_openai_embed: AsyncMock,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        """Calls made through the workspace's callables are tagged with the file."""
+
+        async def complete(*_args, token_tracker, **_kw):
+            token_tracker.add_usage(
+                {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120}
+            )
+            return "entities"
+
+        async def embed(texts, token_tracker, **_kw):
+            token_tracker.add_usage({"prompt_tokens": 7, "total_tokens": 7})
+            return [[0.1] * 128 for _ in texts]
+
+        mock_complete.side_effect = complete
+        mock_openai_embed.side_effect = embed
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        rag = adapter.init_project("test_dir")
+        llm_call = mock_rag_cls.call_args.kwargs["llm_model_func"]
+        embed_func = mock_embedding_func.call_args.kwargs["func"]
+        tracker = MagicMock()
+
+        async def process(**_kw):
+            await embed_func(["chunk", "header"])
+            await embed_func(["header"])
+            await llm_call("extract", token_tracker=tracker)
+
+        rag.process_document_complete = AsyncMock(side_effect=process)
+        rag._ensure_lightrag_initialized = AsyncMock()
+
+        result = await adapter.index_document(
+            file_path="/tmp/doc.pdf",
+            file_name="doc.pdf",
+            output_dir="/tmp/output",
+            working_dir="test_dir",
+        )
+
+        usage = result.usage
+        assert (usage.working_dir, usage.file_name) == ("test_dir", "doc.pdf")
+        assert usage.llm.calls == 1
+        assert (usage.llm.prompt_tokens, usage.llm.completion_tokens) == (100, 20)
+        assert usage.embedding.calls == 2
+        assert usage.embedding.prompt_tokens == 7
+        assert usage.embedding.cache_hits == 1
+        assert usage.vision.calls == 0
+        tracker.add_usage.assert_called_once()
+
     async def test_index_document_success(
         self,
         llm_config: LLMConfig,
@@ -229,6 +505,83 @@ class TestLightRAGAdapter:
         assert result.recursive is True
         assert result.processing_time_ms is not None
 
+    @patch(
+        "infrastructure.rag.lightrag_adapter.openai_complete_if_cache",
+        new_callable=AsyncMock,
+    )
+    @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
+    @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
+    async def test_index_folder_reports_usage_per_file_and_total(
+        self,
+        mock_rag_cls: MagicMock,
+        _mock_embedding_func: MagicMock,
+        mock_complete: AsyncMock,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+        tmp_path,
+    ) -> None:
+        async def complete(_model, prompt, *_args, token_tracker, **_kw):
+            token_tracker.add_usage({"prompt_tokens": len(prompt)})
+            return "ok"
+
+        mock_complete.side_effect = complete
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        rag = adapter.init_project("test_dir")
+        llm_call = mock_rag_cls.call_args.kwargs["llm_model_func"]
+
+        async def process(file_path, **_kw):
+            await llm_call(os.path.basename(file_path))
+
+        rag.process_document_complete = AsyncMock(side_effect=process)
+        rag._ensure_lightrag_initialized = AsyncMock()
+        (tmp_path / "a.pdf").write_text("pdf1")
+        (tmp_path / "bb.pdf").write_text("pdf2")
+
+        result = await adapter.index_folder(
+            folder_path=str(tmp_path), output_dir="/tmp/output", working_dir="test_dir"
+        )
+
+        per_file = {d.file_name: d.usage.llm.prompt_tokens for d in result.file_results}
+        assert per_file == {"a.pdf": 5, "bb.pdf": 6}
+        assert result.usage.file_name is None
+        assert result.usage.llm.calls == 2
+        assert result.usage.llm.prompt_tokens == 11
+
+    @patch(
+        "infrastructure.rag.lightrag_adapter.openai_embed", new_callable=AsyncMock
+    )
+    @patch(
+        "infrastructure.rag.lightrag_adapter.openai_complete_if_cache",
+        new_callable=AsyncMock,
+    )
+    @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
+    @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
+    async def test_model_calls_share_one_http_client_across_workspaces(
+        self,
+        mock_rag_cls: MagicMock,
+        mock_embedding_func: MagicMock,
+        mock_complete: AsyncMock,
+        mock_openai_embed: AsyncMock,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        mock_openai_embed.side_effect = lambda texts, **_kw: [
+            [1.0] * 128 for _ in texts
+        ]
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        adapter.init_project("project-a")
+        await mock_rag_cls.call_args.kwargs["llm_model_func"]("prompt")
+        adapter.init_project("project-b")
+        await mock_rag_cls.call_args.kwargs["llm_model_func"]("prompt")
+        await mock_embedding_func.call_args.kwargs["func"](["text"])
+
+        shared = adapter.http_clients.get(llm_config.api_base_url)
+        for call_args in mock_complete.call_args_list:
+            assert call_args.kwargs["openai_client_configs"]["http_client"] is shared
+        embed_configs = mock_openai_embed.call_args.kwargs["client_configs"]
+        assert embed_configs["http_client"] is shared
+        await adapter.http_clients.aclose()
+
     async def test_index_folder_raises_when_not_initialized(
         self,
         llm_config: LLMConfig,
@@ -263,10 +616,10 @@ class TestLightRAGAdapter:
     async def test_query_success(
         self,
         llm_config: LLMConfig,
-        rag_config_postgres: RAGConfig,
+        rag_config_graph_query: RAGConfig,
     ) -> None:
-        """Should return query result from lightrag.aquery_data."""
-        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        """Should return query result from lightrag.aquery_data when chunks-only is off."""
+        adapter = LightRAGAdapter(llm_config, rag_config_graph_query)
         mock_rag = MagicMock()
         mock_rag._ensure_lightrag_initialized = AsyncMock()
         mock_lightrag = MagicMock()
@@ -284,6 +637,64 @@ class TestLightRAGAdapter:
         assert result["data"]["answer"] == "42"
         mock_lightrag.aquery_data.assert_awaited_once()
 
+    async def test_query_reuses_cached_keywords_across_workspaces(
+        self,
+        llm_config: LLMConfig,
+        rag_config_graph_query: RAGConfig,
+    ) -> None:
+        """Keywords extracted in one workspace should skip extraction in another."""
+        adapter = LightRAGAdapter(llm_config, rag_config_graph_query)
+        params = []
+
+        async def _aquery_data(param, **_kwargs):
+            params.append(param)
+            return {
+                "status": "success",
+                "data": {},
+                "metadata": {
+                    "keywords": {"high_level": ["pricing"], "low_level": ["ACME"]}
+                },
+            }
+
+        for working_dir in ("ws_a", "ws_b"):
+            mock_rag = MagicMock()
+            mock_rag._ensure_lightrag_initialized = AsyncMock()
+            mock_rag.lightrag.aquery_data = AsyncMock(side_effect=_aquery_data)
+            adapter.rag[working_dir] = mock_rag
+
+        await adapter.query("How is ACME priced?", mode="hybrid", working_dir="ws_a")
+        await adapter.query("how is acme priced", mode="hybrid", working_dir="ws_b")
+
+        assert params[0].hl_keywords == []
+        assert params[1].hl_keywords == ["pricing"]
+        assert params[1].ll_keywords == ["ACME"]
+        assert adapter.keyword_cache.stats()["hits"] == 1
+
+    async def test_query_passes_supplied_keywords_without_caching(
+        self,
+        llm_config: LLMConfig,
+        rag_config_graph_query: RAGConfig,
+    ) -> None:
+        adapter = LightRAGAdapter(llm_config, rag_config_graph_query)
+        mock_rag = MagicMock()
+        mock_rag._ensure_lightrag_initialized = AsyncMock()
+        mock_rag.lightrag.aquery_data = AsyncMock(
+            return_value={"status": "success", "data": {}}
+        )
+        adapter.rag["test_dir"] = mock_rag
+
+        await adapter.query(
+            "anything",
+            mode="local",
+            working_dir="test_dir",
+            ll_keywords=["ACME"],
+        )
+
+        param = mock_rag.lightrag.aquery_data.call_args.kwargs["param"]
+        assert param.ll_keywords == ["ACME"]
+        assert param.hl_keywords == []
+        assert adapter.keyword_cache.stats() == {"size": 0, "hits": 0, "misses": 0}
+
     async def test_query_returns_failure_when_lightrag_none(
         self,
         llm_config: LLMConfig,
@@ -352,7 +763,7 @@ class TestLightRAGAdapter:
 
         call_count = 0
 
-        async def side_effect(**kwargs):
+        async def side_effect(**_kwargs):
             nonlocal call_count
             call_count += 1
             if call_count <= 2:
@@ -375,3 +786,511 @@ class TestLightRAGAdapter:
         assert result.status == IndexingStatus.PARTIAL
         assert result.stats.files_processed == 2
         assert result.stats.files_failed == 1
+
+    @patch("infrastructure.rag.lightrag_adapter.openai_embed")
+    @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
+    @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
+    async def test_stats_reports_engines_and_llm_limiter(
+        self,
+        _mock_rag_cls: MagicMock,
+        mock_embedding_func: MagicMock,
+        mock_openai_embed: AsyncMock,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        """Embedding calls should go through the LLM limiter reported by stats()."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        adapter.init_project("/tmp/test_project")
+        seen: list[dict] = []
+
+        async def _embed(*_args, **_kwargs):
+            seen.append(adapter.stats()["llm"])
+            return [[0.1] * 128]
+
+        mock_openai_embed.side_effect = _embed
+        await mock_embedding_func.call_args[1]["func"](["text"])
+
+        stats = adapter.stats()
+        assert stats["engines"] == 1
+        assert stats["indexing"]["running"] == 0
+        assert seen[0]["running"] == 1
+        assert stats["llm"]["running"] == 0
+
+    async def test_query_uses_chunks_only_path_by_default(
+        self,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        """Should answer from the chunk vector store without calling aquery_data."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = MagicMock()
+        mock_rag._ensure_lightrag_initialized = AsyncMock()
+        mock_rag.lightrag.chunks_vdb.query = AsyncMock(
+            return_value=[{"id": "chunk-1", "content": "text", "file_path": "a.pdf"}]
+        )
+        mock_rag.lightrag.aquery_data = AsyncMock()
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.query("anything", mode="naive", working_dir="test_dir")
+
+        assert result["data"]["chunks"][0]["chunk_id"] == "chunk-1"
+        mock_rag.lightrag.aquery_data.assert_not_awaited()
+
+    async def test_query_falls_back_when_chunk_tracking_missing(
+        self,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        """Workspaces without entity chunk tracking should use aquery_data."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = MagicMock()
+        mock_rag._ensure_lightrag_initialized = AsyncMock()
+        lightrag = mock_rag.lightrag
+        lightrag.entities_vdb.query = AsyncMock(return_value=[{"entity_name": "ACME"}])
+        lightrag.entity_chunks.get_by_ids = AsyncMock(return_value=[None])
+        lightrag.aquery_data = AsyncMock(
+            return_value={"status": "success", "data": {"chunks": []}}
+        )
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.query(
+            "anything", mode="local", working_dir="test_dir", ll_keywords=["ACME"]
+        )
+
+        assert result["status"] == "success"
+        lightrag.aquery_data.assert_awaited_once()
+
+    def test_lexical_index_follows_storage_type(
+        self,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+        rag_config_local: RAGConfig,
+    ) -> None:
+        postgres = LightRAGAdapter(llm_config, rag_config_postgres)
+        local = LightRAGAdapter(llm_config, rag_config_local)
+
+        assert isinstance(postgres.lexical_index, PostgresLexicalIndex)
+        assert isinstance(local.lexical_index, InMemoryLexicalIndex)
+
+    async def test_fusion_query_uses_lexical_index_even_with_graph_query(
+        self,
+        llm_config: LLMConfig,
+        rag_config_graph_query: RAGConfig,
+    ) -> None:
+        """'fusion' is not a LightRAG mode, so it never reaches aquery_data."""
+        lexical_index = AsyncMock(spec=LexicalIndex)
+        lexical_index.search.return_value = [
+            {"content": "AB-1234", "file_path": "p.pdf", "chunk_id": "x1"}
+        ]
+        adapter = LightRAGAdapter(
+            llm_config, rag_config_graph_query, lexical_index=lexical_index
+        )
+        mock_rag = MagicMock()
+        mock_rag._ensure_lightrag_initialized = AsyncMock()
+        mock_rag.lightrag.chunks_vdb.query = AsyncMock(return_value=[])
+        mock_rag.lightrag.aquery_data = AsyncMock()
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.query(
+            "AB-1234", mode="fusion", top_k=3, working_dir="test_dir"
+        )
+
+        assert result["data"]["chunks"][0]["chunk_id"] == "x1"
+        assert result["metadata"]["query_mode"] == "fusion"
+        lexical_index.search.assert_awaited_once_with(
+            mock_rag.lightrag.text_chunks, "AB-1234", 6
+        )
+        mock_rag.lightrag.aquery_data.assert_not_awaited()
+
+    async def test_query_diversity_embeds_query_once_and_overfetches(
+        self,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        """The query embedding feeds both vector search and MMR."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = MagicMock()
+        mock_rag._ensure_lightrag_initialized = AsyncMock()
+        vdb = mock_rag.lightrag.chunks_vdb
+        vdb.embedding_func = AsyncMock(return_value=[[1.0, 0.0]])
+        vdb.query = AsyncMock(
+            return_value=[
+                {"id": "a", "content": "boilerplate", "file_path": "a.pdf"},
+                {"id": "b", "content": "boilerplate", "file_path": "a.pdf"},
+                {"id": "c", "content": "other", "file_path": "c.pdf"},
+            ]
+        )
+        vdb.get_vectors_by_ids = AsyncMock(
+            return_value={"a": [1.0, 0.0], "b": [1.0, 0.0], "c": [0.5, 0.5]}
+        )
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.query(
+            "q",
+            mode="naive",
+            top_k=2,
+            working_dir="test_dir",
+            diversity=0.5,
+            dedup_threshold=0.98,
+        )
+
+        assert [c["chunk_id"] for c in result["data"]["chunks"]] == ["a", "c"]
+        vdb.embedding_func.assert_awaited_once_with(["q"])
+        vdb.query.assert_awaited_once_with("q", top_k=4, query_embedding=[1.0, 0.0])
+
+    @patch("infrastructure.rag.lightrag_adapter.openai_embed", new_callable=AsyncMock)
+    @patch("infrastructure.rag.lightrag_adapter.EmbeddingFunc")
+    @patch("infrastructure.rag.lightrag_adapter.RAGAnything")
+    async def test_graph_query_reuses_the_diversification_embedding(
+        self,
+        mock_rag_cls: MagicMock,
+        mock_embedding_func: MagicMock,
+        mock_openai_embed: AsyncMock,
+        llm_config: LLMConfig,
+        rag_config_graph_query: RAGConfig,
+    ) -> None:
+        """LightRAG's own embedding of the query is served the MMR vector."""
+        mock_openai_embed.return_value = np.array([[0.0, 1.0]])
+        adapter = LightRAGAdapter(llm_config, rag_config_graph_query)
+        adapter.init_project("test_dir")
+        embed = mock_embedding_func.call_args.kwargs["func"]
+        mock_rag = mock_rag_cls.return_value
+        mock_rag._ensure_lightrag_initialized = AsyncMock()
+        vdb = mock_rag.lightrag.chunks_vdb
+        vdb.embedding_func = AsyncMock(return_value=np.array([[1.0, 0.0]]))
+        served = []
+
+        async def _aquery_data(query, **_kwargs):
+            served.append(await embed([query, "keyword"], context="query"))
+            return {"data": {"chunks": []}}
+
+        mock_rag.lightrag.aquery_data = _aquery_data
+
+        await adapter.query(
+            "q", mode="hybrid", top_k=2, working_dir="test_dir", diversity=0.5
+        )
+
+        assert mock_openai_embed.await_args.args[0] == ["keyword"]
+        assert served[0].tolist() == [[1.0, 0.0], [0.0, 1.0]]
+        assert adapter._query_embeddings == {}
+
+    async def test_query_without_diversification_skips_vector_lookup(
+        self,
+        llm_config: LLMConfig,
+        rag_config_postgres: RAGConfig,
+    ) -> None:
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = MagicMock()
+        mock_rag._ensure_lightrag_initialized = AsyncMock()
+        vdb = mock_rag.lightrag.chunks_vdb
+        vdb.query = AsyncMock(
+            return_value=[{"id": "a", "content": "text", "file_path": "a.pdf"}]
+        )
+        vdb.get_vectors_by_ids = AsyncMock()
+        adapter.rag["test_dir"] = mock_rag
+
+        await adapter.query("q", mode="naive", top_k=2, working_dir="test_dir")
+
+        vdb.query.assert_awaited_once_with("q", top_k=2)
+        vdb.get_vectors_by_ids.assert_not_awaited()
+
+    def test_vector_search_settings_prefers_query_then_workspace_then_global(
+        self, llm_config: LLMConfig
+    ) -> None:
+        """Per-query knobs should override workspace config, which overrides global."""
+        adapter = LightRAGAdapter(
+            llm_config,
+            RAGConfig(
+                RAG_STORAGE_TYPE="postgres",
+                VECTOR_HNSW_EF_SEARCH=40,
+                VECTOR_IVFFLAT_PROBES=4,
+                VECTOR_SEARCH_WORKSPACE_SETTINGS={"big": {"ef_search": 200}},
+            ),
+        )
+
+        small = adapter._vector_search_settings("small", None, None)
+        assert (small.ef_search, small.probes) == (40, 4)
+        assert adapter._vector_search_settings("big", None, None).ef_search == 200
+        big = adapter._vector_search_settings("big", 80, 8)
+        assert (big.ef_search, big.probes) == (80, 8)
+
+    def test_vector_search_settings_quantization_per_workspace(
+        self, llm_config: LLMConfig
+    ) -> None:
+        """Workspaces should opt out of global quantization with "none"."""
+        adapter = LightRAGAdapter(
+            llm_config,
+            RAGConfig(
+                RAG_STORAGE_TYPE="postgres",
+                VECTOR_QUANTIZATION="binary",
+                VECTOR_SEARCH_WORKSPACE_SETTINGS={
+                    "legacy": {"quantization": "none"},
+                    "half": {"quantization": "halfvec", "rescore_factor": 2},
+                },
+            ),
+        )
+
+        default = adapter._vector_search_settings("new", None, None)
+        half = adapter._vector_search_settings("half", None, None)
+
+        assert default.quantization is VectorQuantization.BINARY
+        assert default.rescore_factor == 4
+        assert (half.quantization, half.rescore_factor) == (
+            VectorQuantization.HALFVEC,
+            2,
+        )
+        assert adapter._vector_search_settings("legacy", None, None).is_default()
+
+    async def test_delete_document_removes_every_version_of_the_file(
+        self, llm_config: LLMConfig, rag_config_postgres: RAGConfig
+    ) -> None:
+        """Every doc indexed from the file goes, other files stay."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = _rag_with_docs(
+            {
+                "doc-old": "/data/docs/report.pdf",
+                "doc-new": "/data/docs/report.pdf",
+                "doc-x": "/data/docs/other.pdf",
+            },
+            "success",
+            "success",
+        )
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.delete_document("docs/report.pdf", "test_dir")
+
+        assert result.status == DeletionStatus.SUCCESS
+        assert result.doc_ids == ["doc-old", "doc-new"]
+        assert mock_rag.lightrag.adelete_by_doc_id.await_args_list == [
+            call("doc-old", delete_llm_cache=True),
+            call("doc-new", delete_llm_cache=True),
+        ]
+
+    async def test_delete_document_matches_nested_object_names(
+        self, llm_config: LLMConfig, rag_config_postgres: RAGConfig
+    ) -> None:
+        """Objects under a prefix are stored by base name or full path."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = _rag_with_docs(
+            {"doc-a": "a.pdf", "doc-b": "/data/project/docs/b.pdf"},
+            "success",
+            "success",
+        )
+        adapter.rag["test_dir"] = mock_rag
+
+        first = await adapter.delete_document("project/docs/a.pdf", "test_dir")
+        second = await adapter.delete_document("project/docs/b.pdf", "test_dir")
+
+        assert (first.doc_ids, second.doc_ids) == (["doc-a"], ["doc-b"])
+
+    async def test_delete_document_rejects_ambiguous_base_names(
+        self, llm_config: LLMConfig, rag_config_postgres: RAGConfig
+    ) -> None:
+        """Base names shared by several documents, or different full paths, are not guessed."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = _rag_with_docs(
+            {
+                "doc-a": "report.pdf",
+                "doc-b": "report.pdf",
+                "doc-c": "/data/alpha/docs/notes.pdf",
+                "doc-d": "/data/beta/docs/notes.pdf",
+            },
+            "success",
+        )
+        adapter.rag["test_dir"] = mock_rag
+
+        by_base_name = await adapter.delete_document("alpha/report.pdf", "test_dir")
+        by_suffix = await adapter.delete_document("docs/notes.pdf", "test_dir")
+        exact = await adapter.delete_document("alpha/docs/notes.pdf", "test_dir")
+
+        assert by_base_name.status == DeletionStatus.AMBIGUOUS
+        assert "report.pdf" in by_base_name.error
+        assert by_suffix.status == DeletionStatus.AMBIGUOUS
+        assert exact.doc_ids == ["doc-c"]
+        assert mock_rag.lightrag.adelete_by_doc_id.await_args_list == [
+            call("doc-c", delete_llm_cache=True)
+        ]
+
+    async def test_delete_document_looks_up_postgres_doc_status_by_path(
+        self, llm_config: LLMConfig, rag_config_postgres: RAGConfig
+    ) -> None:
+        """On PostgreSQL the file's doc ids come from one indexed query."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = _rag_with_docs({}, "success")
+        doc_status = PGDocStatusStorage([{"id": "doc-1", "file_path": "report.pdf"}])
+        mock_rag.lightrag.doc_status = doc_status
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.delete_document("report.pdf", "test_dir")
+
+        assert result.doc_ids == ["doc-1"]
+        sql, params = doc_status.db.query.await_args.args
+        assert "LIGHTRAG_DOC_STATUS" in sql
+        assert params[:2] == ["ws", "report.pdf"]
+
+    async def test_delete_document_not_indexed(
+        self, llm_config: LLMConfig, rag_config_postgres: RAGConfig
+    ) -> None:
+        """An unknown file is reported as NOT_FOUND without deleting anything."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = _rag_with_docs({"doc-x": "other.pdf"})
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.delete_document("report.pdf", "test_dir")
+
+        assert result.status == DeletionStatus.NOT_FOUND
+        mock_rag.lightrag.adelete_by_doc_id.assert_not_awaited()
+
+    async def test_delete_document_busy_after_waiting(
+        self, llm_config: LLMConfig
+    ) -> None:
+        """A pipeline busy past DOCUMENT_DELETE_WAIT_SECONDS is reported as BUSY."""
+        adapter = LightRAGAdapter(
+            llm_config,
+            RAGConfig(RAG_STORAGE_TYPE="postgres", DOCUMENT_DELETE_WAIT_SECONDS=0),
+        )
+        mock_rag = _rag_with_docs({"doc-1": "report.pdf"}, "not_allowed")
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.delete_document("report.pdf", "test_dir")
+
+        assert result.status == DeletionStatus.BUSY
+        assert result.doc_ids == []
+
+    async def test_delete_document_failure(
+        self, llm_config: LLMConfig, rag_config_postgres: RAGConfig
+    ) -> None:
+        """A failed LightRAG deletion is reported as FAILED with its message."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = _rag_with_docs({"doc-1": "report.pdf"}, "fail")
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.delete_document("report.pdf", "test_dir")
+
+        assert result.status == DeletionStatus.FAILED
+        assert result.error == "fail message"
+
+    async def test_replace_document_without_previous_version_just_indexes(
+        self, llm_config: LLMConfig, rag_config_postgres: RAGConfig
+    ) -> None:
+        """A file indexed for the first time is neither diffed nor deleted."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = _rag_with_docs({})
+        mock_rag.lightrag.doc_status.get_by_ids = AsyncMock(return_value=[])
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.replace_document(
+            file_path="/tmp/report.pdf",
+            file_name="report.pdf",
+            output_dir="/tmp/output",
+            working_dir="test_dir",
+        )
+
+        assert result.status == IndexingStatus.SUCCESS
+        mock_rag.process_document_complete.assert_awaited_once()
+        mock_rag.lightrag.adelete_by_doc_id.assert_not_awaited()
+
+    async def test_replace_document_rejects_ambiguous_previous_versions(
+        self, llm_config: LLMConfig, rag_config_postgres: RAGConfig
+    ) -> None:
+        """Nothing is indexed or deleted when the base name matches several documents."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = _rag_with_docs({"doc-a": "report.pdf", "doc-b": "report.pdf"})
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.replace_document(
+            file_path="/tmp/report.pdf",
+            file_name="alpha/report.pdf",
+            output_dir="/tmp/output",
+            working_dir="test_dir",
+        )
+
+        assert result.status == IndexingStatus.FAILED
+        assert "USE_FULL_PATH" in result.error
+        mock_rag.process_document_complete.assert_not_awaited()
+        mock_rag.lightrag.adelete_by_doc_id.assert_not_awaited()
+
+    async def test_replace_document_only_processes_changed_chunks(
+        self, llm_config: LLMConfig, rag_config_postgres: RAGConfig
+    ) -> None:
+        """Unchanged chunks are reused; only the vanished ones are deleted."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        kept, dropped, added = (
+            compute_mdhash_id(text, prefix="chunk-") for text in ("A", "B", "C")
+        )
+        mock_rag = _rag_with_docs({"doc-old": "report.pdf"}, "success")
+        lightrag = mock_rag.lightrag
+        lightrag.chunking_func = lambda _tokenizer, content: [
+            {"content": text} for text in content
+        ]
+        old_status = {"status": "processed", "chunks_list": [kept, dropped]}
+        lightrag.doc_status.get_by_ids = AsyncMock(return_value=[old_status])
+        lightrag.doc_status.get_by_id = AsyncMock(
+            return_value={"status": "processed", "chunks_list": [added]}
+        )
+        lightrag.doc_status.upsert = AsyncMock()
+        lightrag.doc_status.index_done_callback = AsyncMock()
+        for storage in (lightrag.full_entities, lightrag.full_relations):
+            storage.get_by_ids = AsyncMock(return_value=[None, None])
+            storage.index_done_callback = AsyncMock()
+        chunked: list[dict] = []
+
+        async def index(**_kwargs) -> None:
+            chunked.extend(await lightrag.chunking_func(None, "AC"))
+            lightrag.doc_status.get_docs_by_statuses.return_value = {
+                "doc-old": SimpleNamespace(file_path="report.pdf"),
+                "doc-new": SimpleNamespace(file_path="report.pdf"),
+            }
+
+        mock_rag.process_document_complete.side_effect = index
+        chunker = lightrag.chunking_func
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.replace_document(
+            file_path="/tmp/report.pdf",
+            file_name="report.pdf",
+            output_dir="/tmp/output",
+            working_dir="test_dir",
+        )
+
+        assert result.status == IndexingStatus.SUCCESS
+        assert chunked == [{"content": "C"}]
+        assert lightrag.chunking_func is chunker
+        updates = lightrag.doc_status.upsert.await_args.args[0]
+        assert updates["doc-new"]["chunks_list"] == [added, kept]
+        assert updates["doc-old"]["chunks_list"] == [dropped]
+        lightrag.adelete_by_doc_id.assert_awaited_once_with(
+            "doc-old", delete_llm_cache=False
+        )
+
+    async def test_replace_document_keeps_previous_version_on_failure(
+        self, llm_config: LLMConfig, rag_config_postgres: RAGConfig
+    ) -> None:
+        """If the new version did not finish processing, nothing is deleted."""
+        adapter = LightRAGAdapter(llm_config, rag_config_postgres)
+        mock_rag = _rag_with_docs({"doc-old": "report.pdf"}, "success")
+        lightrag = mock_rag.lightrag
+        lightrag.doc_status.get_by_ids = AsyncMock(
+            return_value=[{"status": "processed", "chunks_list": ["chunk-a"]}]
+        )
+        lightrag.doc_status.get_by_id = AsyncMock(return_value={"status": "failed"})
+
+        async def index(**_kwargs) -> None:
+            lightrag.doc_status.get_docs_by_statuses.return_value = {
+                "doc-old": SimpleNamespace(file_path="report.pdf"),
+                "doc-new": SimpleNamespace(file_path="report.pdf"),
+            }
+
+        mock_rag.process_document_complete.side_effect = index
+        adapter.rag["test_dir"] = mock_rag
+
+        result = await adapter.replace_document(
+            file_path="/tmp/report.pdf",
+            file_name="report.pdf",
+            output_dir="/tmp/output",
+            working_dir="test_dir",
+        )
+
+        assert result.status == IndexingStatus.FAILED
+        assert "not been processed" in result.error
+        lightrag.adelete_by_doc_id.assert_not_awaited()
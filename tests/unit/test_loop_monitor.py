@@ -0,0 +1,55 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from infrastructure.observability.loop_monitor import EventLoopMonitor
+
+
+def _blocking_parse(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def _metric_points(reader, name: str) -> list:
+    data = reader.get_metrics_data()
+    return [
+        point
+        for resource in data.resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+        if metric.name == name
+        for point in metric.data.data_points
+    ]
+
+
+class TestEventLoopMonitor:
+    async def test_measures_lag_without_blocking(self) -> None:
+        monitor = EventLoopMonitor(interval=0.01, block_threshold=0.2)
+
+        async with monitor.running():
+            await asyncio.sleep(0.05)
+
+        stats = monitor.stats()
+        assert stats["max_lag_ms"] < 200
+        assert stats["blocked_callbacks"] == 0
+
+    async def test_blocking_callback_is_logged_with_its_stack(
+        self, caplog: pytest.LogCaptureFixture, metric_reader
+    ) -> None:
+        monitor = EventLoopMonitor(interval=0.01, block_threshold=0.05)
+
+        with caplog.at_level(logging.WARNING):
+            async with monitor.running():
+                await asyncio.sleep(0.02)
+                _blocking_parse(0.2)
+                await asyncio.sleep(0.05)
+
+        assert monitor.blocked_callbacks == 1
+        assert monitor.stats()["max_lag_ms"] >= 150
+        (record,) = [r for r in caplog.records if "Event loop blocked" in r.message]
+        assert "_blocking_parse" in record.message
+        (lag,) = _metric_points(metric_reader, "event_loop.lag")
+        assert lag.max >= 150
+        (blocked,) = _metric_points(metric_reader, "event_loop.blocked_callbacks")
+        assert blocked.value >= 1
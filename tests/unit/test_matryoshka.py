@@ -0,0 +1,25 @@
+import numpy as np
+
+from infrastructure.rag.matryoshka import collection_suffix, truncate_embeddings
+
+
+class TestTruncateEmbeddings:
+    def test_keeps_leading_components_normalized(self) -> None:
+        vectors = np.array([[3.0, 4.0, 12.0], [0.0, 2.0, 1.0]])
+
+        truncated = truncate_embeddings(vectors, 2)
+
+        assert truncated.shape == (2, 2)
+        np.testing.assert_allclose(truncated, [[0.6, 0.8], [0.0, 1.0]])
+
+    def test_zero_prefix_stays_zero(self) -> None:
+        truncated = truncate_embeddings([[0.0, 0.0, 1.0]], 2)
+
+        np.testing.assert_array_equal(truncated, [[0.0, 0.0]])
+
+
+class TestCollectionSuffix:
+    def test_matches_lightrag_table_suffix(self) -> None:
+        assert collection_suffix("text-embedding-3-large", 512) == (
+            "text_embedding_3_large_512d"
+        )
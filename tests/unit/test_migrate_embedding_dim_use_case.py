@@ -0,0 +1,82 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from application.requests.embedding_migration_request import (
+    MigrateEmbeddingDimRequest,
+)
+from application.use_cases.migrate_embedding_dim_use_case import (
+    MigrateEmbeddingDimUseCase,
+)
+from domain.entities.embedding_migration import (
+    EmbeddingMigrationMode,
+    EmbeddingMigrationStatus,
+)
+
+
+@pytest.fixture
+def migrator() -> AsyncMock:
+    mock = AsyncMock()
+    mock.copy_workspace.return_value = {"lightrag_vdb_chunks_m_256d": 10}
+    return mock
+
+
+class TestMigrateEmbeddingDimUseCase:
+    async def test_copies_then_cuts_over(
+        self, mock_rag_engine: AsyncMock, migrator: AsyncMock
+    ) -> None:
+        use_case = MigrateEmbeddingDimUseCase(mock_rag_engine, migrator)
+        migration = await use_case.start(
+            MigrateEmbeddingDimRequest(
+                working_dir="p", target_dim=256, mode=EmbeddingMigrationMode.REEMBED
+            )
+        )
+
+        assert migration.status is EmbeddingMigrationStatus.RUNNING
+        mock_rag_engine.set_embedding_dim.assert_not_awaited()
+
+        await use_case.run(migration)
+
+        assert migration.status is EmbeddingMigrationStatus.COMPLETED
+        assert migration.rows_copied == {"lightrag_vdb_chunks_m_256d": 10}
+        assert migration.finished_at is not None
+        mock_rag_engine.set_embedding_dim.assert_awaited_once_with("p", 256)
+        assert use_case.get("p") is migration
+
+    async def test_failed_copy_keeps_serving_old_dimension(
+        self, mock_rag_engine: AsyncMock, migrator: AsyncMock
+    ) -> None:
+        migrator.copy_workspace.side_effect = RuntimeError("connection lost")
+        use_case = MigrateEmbeddingDimUseCase(mock_rag_engine, migrator)
+        migration = await use_case.start(
+            MigrateEmbeddingDimRequest(working_dir="p", target_dim=256)
+        )
+
+        await use_case.run(migration)
+
+        assert migration.status is EmbeddingMigrationStatus.FAILED
+        assert migration.error == "connection lost"
+        mock_rag_engine.set_embedding_dim.assert_not_awaited()
+
+    async def test_rejects_concurrent_migration_of_same_workspace(
+        self, mock_rag_engine: AsyncMock, migrator: AsyncMock
+    ) -> None:
+        use_case = MigrateEmbeddingDimUseCase(mock_rag_engine, migrator)
+        await use_case.start(
+            MigrateEmbeddingDimRequest(working_dir="p", target_dim=256)
+        )
+
+        with pytest.raises(RuntimeError, match="already running"):
+            await use_case.start(
+                MigrateEmbeddingDimRequest(working_dir="p", target_dim=512)
+            )
+
+    async def test_rejects_target_not_smaller(
+        self, mock_rag_engine: AsyncMock, migrator: AsyncMock
+    ) -> None:
+        use_case = MigrateEmbeddingDimUseCase(mock_rag_engine, migrator)
+
+        with pytest.raises(ValueError, match="smaller"):
+            await use_case.start(
+                MigrateEmbeddingDimRequest(working_dir="p", target_dim=1536)
+            )
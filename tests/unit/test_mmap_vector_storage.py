@@ -0,0 +1,155 @@
+import os
+
+import numpy as np
+import pytest
+from lightrag.kg.shared_storage import finalize_share_data, initialize_share_data
+
+from infrastructure.rag.mmap_vector_storage import MmapVectorStorage
+
+_VECTORS = {
+    "a": [1.0, 0.0, 0.0],
+    "b": [0.0, 1.0, 0.0],
+    "c": [0.9, 0.1, 0.0],
+    "q": [1.0, 0.05, 0.0],
+}
+
+
+class _Embed:
+    """Embedding function stub: each content string names a fixed vector."""
+
+    embedding_dim = 3
+
+    async def __call__(self, texts, **_kwargs):
+        return np.array([_VECTORS[t] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def _shared_data():
+    initialize_share_data()
+    yield
+    finalize_share_data()
+
+
+async def _storage(working_dir: str, namespace: str = "chunks") -> MmapVectorStorage:
+    storage = MmapVectorStorage(
+        namespace=namespace,
+        workspace="ws",
+        global_config={
+            "working_dir": working_dir,
+            "embedding_batch_num": 2,
+            "vector_db_storage_cls_kwargs": {"cosine_better_than_threshold": 0.2},
+        },
+        embedding_func=_Embed(),
+        meta_fields={"content", "file_path", "src_id", "tgt_id"},
+    )
+    await storage.initialize()
+    return storage
+
+
+def _without_timestamps(records: list[dict | None]) -> list[dict | None]:
+    return [
+        {k: v for k, v in r.items() if k != "created_at"} if r else r for r in records
+    ]
+
+
+def _rows(working_dir: str, generation: int = 0) -> int:
+    path = os.path.join(working_dir, "ws", f"vdb_chunks.{generation}.f32")
+    return os.path.getsize(path) // (4 * 3)
+
+
+class TestMmapVectorStorage:
+    async def test_query_returns_nearest_above_threshold(self, tmp_path) -> None:
+        storage = await _storage(str(tmp_path))
+        await storage.upsert(
+            {
+                "a": {"content": "a", "file_path": "a.pdf"},
+                "b": {"content": "b", "file_path": "b.pdf"},
+                "c": {"content": "c", "file_path": "c.pdf"},
+            }
+        )
+
+        results = await storage.query("q", top_k=5)
+
+        assert [r["id"] for r in results] == ["a", "c"]
+        assert results[0]["file_path"] == "a.pdf"
+        assert results[0]["distance"] == pytest.approx(0.9988, abs=1e-3)
+        assert "row" not in results[0]
+
+    async def test_reopen_maps_persisted_rows(self, tmp_path) -> None:
+        storage = await _storage(str(tmp_path))
+        await storage.upsert({"a": {"content": "a"}, "b": {"content": "b"}})
+        await storage.index_done_callback()
+
+        reopened = await _storage(str(tmp_path))
+
+        assert isinstance(reopened._matrix, np.memmap)
+        assert (await reopened.get_by_id("b"))["content"] == "b"
+        vectors = await reopened.get_vectors_by_ids(["a", "missing"])
+        assert vectors == {"a": [1.0, 0.0, 0.0]}
+
+    async def test_upsert_supersedes_and_delete_tombstones(self, tmp_path) -> None:
+        storage = await _storage(str(tmp_path))
+        await storage.upsert({"a": {"content": "a"}, "c": {"content": "c"}})
+        await storage.upsert({"a": {"content": "b"}})
+        await storage.delete(["c"])
+
+        reopened = await _storage(str(tmp_path))
+
+        assert _rows(str(tmp_path)) == 3
+        assert [r["id"] for r in await reopened.query("q", top_k=5)] == []
+        assert _without_timestamps(await reopened.get_by_ids(["a", "c"])) == [
+            {"id": "a", "content": "b"},
+            None,
+        ]
+
+    async def test_index_done_compacts_mostly_dead_rows(self, tmp_path) -> None:
+        storage = await _storage(str(tmp_path))
+        await storage.upsert({"a": {"content": "a"}, "b": {"content": "b"}})
+        await storage.upsert({"a": {"content": "c"}, "b": {"content": "b"}})
+        await storage.delete(["b"])
+
+        assert await storage.index_done_callback() is True
+
+        assert _rows(str(tmp_path), generation=1) == 1
+        assert not os.path.exists(os.path.join(tmp_path, "ws", "vdb_chunks.0.f32"))
+        assert [r["id"] for r in await storage.query("q", top_k=5)] == ["a"]
+
+    async def test_other_instance_sees_rows_after_update_flag(self, tmp_path) -> None:
+        writer = await _storage(str(tmp_path))
+        reader = await _storage(str(tmp_path))
+
+        await writer.upsert({"a": {"content": "a"}})
+        await writer.index_done_callback()
+
+        assert [r["id"] for r in await reader.query("q", top_k=5)] == ["a"]
+
+    async def test_delete_entity_relation_matches_either_end(self, tmp_path) -> None:
+        storage = await _storage(str(tmp_path), namespace="relationships")
+        await storage.upsert(
+            {
+                "r1": {"content": "a", "src_id": "Acme", "tgt_id": "Bob"},
+                "r2": {"content": "b", "src_id": "Bob", "tgt_id": "Carol"},
+            }
+        )
+
+        await storage.delete_entity_relation("Acme")
+
+        assert _without_timestamps(await storage.get_by_ids(["r1", "r2"])) == [
+            None,
+            {
+                "id": "r2",
+                "content": "b",
+                "src_id": "Bob",
+                "tgt_id": "Carol",
+            },
+        ]
+
+    async def test_rejects_dimension_change(self, tmp_path) -> None:
+        storage = await _storage(str(tmp_path))
+        await storage.upsert({"a": {"content": "a"}})
+        _Embed.embedding_dim = 4
+        try:
+            with pytest.raises(ValueError, match="3-d vectors"):
+                await _storage(str(tmp_path))
+        finally:
+            _Embed.embedding_dim = 3
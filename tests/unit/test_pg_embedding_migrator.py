@@ -0,0 +1,165 @@
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from domain.entities.embedding_migration import EmbeddingMigrationMode
+from infrastructure.database.pg_embedding_migrator import PgEmbeddingMigrator
+
+_STARTED = datetime(2026, 1, 1, tzinfo=UTC)
+_COLUMNS = [
+    ("id", "varchar"),
+    ("workspace", "varchar"),
+    ("content", "text"),
+    ("content_vector", "vector"),
+    ("update_time", "timestamp"),
+]
+
+
+@pytest.fixture
+def connection() -> AsyncMock:
+    conn = AsyncMock()
+    # Only the chunks table exists.
+    conn.fetch.side_effect = lambda _sql, *args: (
+        _COLUMNS if args == ("lightrag_vdb_chunks",) else []
+    )
+    conn.fetchval.side_effect = lambda sql, *_args: (
+        None if "to_regclass" in sql else _STARTED
+    )
+    conn.transaction = MagicMock()
+    return conn
+
+
+@pytest.fixture
+def pool(connection: AsyncMock) -> MagicMock:
+    """PostgresPool stand-in whose acquire() yields the mocked asyncpg connection."""
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def _acquire():
+        yield connection
+
+    pool.acquire = _acquire
+    return pool
+
+
+def _migrator(pool: MagicMock, **kwargs) -> PgEmbeddingMigrator:
+    return PgEmbeddingMigrator(
+        pool,
+        workspace_for=lambda d: f"ws_{d}",
+        model_name="text-embedding-3-small",
+        model_dim=1536,
+        batch_size=2,
+        **kwargs,
+    )
+
+
+def _executed(connection: AsyncMock) -> list[str]:
+    return [c.args[0] for c in connection.execute.await_args_list]
+
+
+class TestTableName:
+    def test_full_dimension_uses_base_table(self, pool: MagicMock) -> None:
+        migrator = _migrator(pool)
+
+        assert migrator.table_name("lightrag_vdb_chunks", 1536) == "lightrag_vdb_chunks"
+        assert migrator.table_name("lightrag_vdb_chunks", 256) == (
+            "lightrag_vdb_chunks_text_embedding_3_small_256d"
+        )
+
+
+class TestTruncateCopy:
+    async def test_creates_target_and_copies_in_batches(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        # Two full batches, then empty; the catch-up pass finds nothing.
+        connection.fetchrow.side_effect = [("b", 2), ("c", 1), (None, 0), (None, 0)]
+        progress: list[tuple[str, int]] = []
+
+        copied = await _migrator(pool).copy_workspace(
+            "p",
+            1536,
+            256,
+            EmbeddingMigrationMode.TRUNCATE,
+            on_progress=lambda table, rows: progress.append((table, rows)),
+        )
+
+        target = "lightrag_vdb_chunks_text_embedding_3_small_256d"
+        assert copied == {target: 3}
+        assert progress == [(target, 2), (target, 3)]
+        executed = _executed(connection)
+        assert executed[0] == (
+            f"CREATE TABLE IF NOT EXISTS {target} "
+            "(LIKE lightrag_vdb_chunks INCLUDING DEFAULTS)"
+        )
+        assert "content_vector TYPE vector(256)" in executed[1]
+        assert executed[-1].startswith(f"DELETE FROM {target} t")
+        first_batch = connection.fetchrow.await_args_list[0]
+        assert (
+            "l2_normalize(subvector(content_vector, 1, 256))::vector(256)"
+            in (first_batch.args[0])
+        )
+        assert first_batch.args[1:] == ("ws_p", "", 2)
+        # Keyset pagination continues from the last id PostgreSQL returned.
+        assert connection.fetchrow.await_args_list[1].args[2] == "b"
+        catch_up = connection.fetchrow.await_args_list[3]
+        assert "update_time >= $4" in catch_up.args[0]
+        assert catch_up.args[4] == _STARTED
+
+    async def test_existing_target_is_reused(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        connection.fetchval.side_effect = lambda sql, *_args: (
+            "lightrag_vdb_chunks_x" if "to_regclass" in sql else _STARTED
+        )
+        connection.fetchrow.side_effect = [(None, 0), (None, 0)]
+
+        await _migrator(pool).copy_workspace(
+            "p", 1536, 256, EmbeddingMigrationMode.TRUNCATE
+        )
+
+        assert not any("CREATE TABLE" in sql for sql in _executed(connection))
+
+    async def test_rejects_larger_target(self, pool: MagicMock) -> None:
+        with pytest.raises(ValueError, match="only reducing"):
+            await _migrator(pool).copy_workspace(
+                "p", 256, 1536, EmbeddingMigrationMode.TRUNCATE
+            )
+
+
+class TestReembedCopy:
+    async def test_embeds_content_and_inserts_truncated_vectors(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        rows = [
+            {
+                "id": "a",
+                "workspace": "ws_p",
+                "content": "alpha",
+                "content_vector": "[...]",
+                "update_time": _STARTED,
+            }
+        ]
+        fetches = iter([_COLUMNS, rows, [], []])
+        connection.fetch.side_effect = lambda _sql, *args: (
+            next(fetches) if args[0] in ("lightrag_vdb_chunks", "ws_p") else []
+        )
+        embed = AsyncMock(return_value=np.array([[3.0, 4.0, 5.0]]))
+
+        copied = await _migrator(pool, embed=embed).copy_workspace(
+            "p", 1536, 2, EmbeddingMigrationMode.REEMBED
+        )
+
+        assert copied == {"lightrag_vdb_chunks_text_embedding_3_small_2d": 1}
+        embed.assert_awaited_once_with(["alpha"])
+        sql, records = connection.executemany.await_args.args
+        assert "$4::vector(2)" in sql
+        assert records[0][3] == "[0.6000000238418579,0.800000011920929]"
+
+    async def test_requires_embedding_function(self, pool: MagicMock) -> None:
+        with pytest.raises(ValueError, match="embedding function"):
+            await _migrator(pool).copy_workspace(
+                "p", 1536, 256, EmbeddingMigrationMode.REEMBED
+            )
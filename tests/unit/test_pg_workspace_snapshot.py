@@ -0,0 +1,170 @@
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from infrastructure.database.pg_workspace_snapshot import PgWorkspaceSnapshotter
+
+_TABLES = [
+    ("lightrag_doc_status", ["workspace", "id", "status"]),
+    ("lightrag_vdb_chunks", ["id", "workspace", "content", "content_vector"]),
+]
+
+
+_NODES = [
+    {"properties": '{"entity_id": "Alice", "entity_type": "person"}'},
+    {"properties": '{"entity_id": "Acme", "entity_type": "organization"}'},
+]
+_EDGES = [{"source": '"Alice"', "target": '"Acme"', "properties": '{"weight": 1.0}'}]
+
+
+@pytest.fixture
+def connection() -> AsyncMock:
+    conn = AsyncMock()
+    conn.tables = _TABLES
+    conn.transaction = MagicMock()
+
+    async def fetch(query):
+        if "information_schema" in query:
+            return conn.tables
+        return _EDGES if '"DIRECTED"' in query else _NODES
+
+    conn.fetch.side_effect = fetch
+
+    async def copy_from_query(query, *args, output, format):
+        rows = 0 if "lightrag_doc_status" in query else 2
+        Path(output).write_bytes(f"{format}:{args[0]}:{rows}".encode())
+        return f"COPY {rows}"
+
+    conn.copy_from_query.side_effect = copy_from_query
+    return conn
+
+
+@pytest.fixture
+def pool(connection: AsyncMock) -> MagicMock:
+    """PostgresPool stand-in whose acquire() yields the mocked asyncpg connection."""
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def _acquire():
+        yield connection
+
+    pool.acquire = _acquire
+    return pool
+
+
+@pytest.fixture
+def graph() -> AsyncMock:
+    graph = AsyncMock()
+    graph.graph_name = "ws_src_chunk_entity_relation"
+    return graph
+
+
+def _snapshotter(pool: MagicMock, graph: AsyncMock) -> PgWorkspaceSnapshotter:
+    return PgWorkspaceSnapshotter(
+        pool,
+        workspace_for=lambda d: f"ws_{d}",
+        graph_for=AsyncMock(return_value=graph),
+    )
+
+
+class TestPgWorkspaceSnapshotter:
+    async def test_export_then_import_restores_under_new_workspace(
+        self,
+        pool: MagicMock,
+        connection: AsyncMock,
+        graph: AsyncMock,
+        tmp_path: Path,
+    ) -> None:
+        snapshotter = _snapshotter(pool, graph)
+        archive = tmp_path / "snapshot.tar.gz"
+
+        exported = await snapshotter.export_workspace(
+            "src", archive, embedding_model="m", embedding_dim=1536
+        )
+
+        # Empty tables are left out of the archive.
+        assert exported.tables == {"lightrag_vdb_chunks": 2}
+        assert exported.nodes == 2 and exported.edges == 1
+        query, workspace = connection.copy_from_query.await_args_list[1].args
+        assert query == (
+            "SELECT id, workspace, content, content_vector "
+            "FROM lightrag_vdb_chunks WHERE workspace = $1"
+        )
+        assert workspace == "ws_src"
+        # Tables and graph are read in one snapshot.
+        connection.transaction.assert_called_once_with(
+            isolation="repeatable_read", readonly=True
+        )
+        graph_queries = [c.args[0] for c in connection.fetch.await_args_list[1:]]
+        assert all("ws_src_chunk_entity_relation" in q for q in graph_queries)
+        graph.get_all_nodes.assert_not_awaited()
+        assert (await snapshotter.read_snapshot(archive)) == exported
+
+        copied: list[bytes] = []
+        connection.copy_to_table.side_effect = lambda _table, source, **_kw: (
+            copied.append(Path(source).read_bytes())
+        )
+        imported = await snapshotter.import_workspace(archive, "dst")
+
+        assert imported == exported
+        assert copied == [b"binary:ws_src:2"]
+        assert connection.copy_to_table.await_args.kwargs["columns"] == [
+            "id",
+            "workspace",
+            "content",
+            "content_vector",
+        ]
+        executed = [c.args for c in connection.execute.await_args_list]
+        assert ("UPDATE snapshot_rows SET workspace = $1", "ws_dst") in executed
+        assert executed[-1][0].startswith("INSERT INTO lightrag_vdb_chunks")
+        graph.upsert_nodes_batch.assert_awaited_once_with(
+            [
+                ("Alice", {"entity_id": "Alice", "entity_type": "person"}),
+                ("Acme", {"entity_id": "Acme", "entity_type": "organization"}),
+            ]
+        )
+        graph.upsert_edges_batch.assert_awaited_once_with(
+            [("Alice", "Acme", {"weight": 1.0})]
+        )
+
+    async def test_import_rejects_missing_table(
+        self,
+        pool: MagicMock,
+        connection: AsyncMock,
+        graph: AsyncMock,
+        tmp_path: Path,
+    ) -> None:
+        snapshotter = _snapshotter(pool, graph)
+        archive = tmp_path / "snapshot.tar.gz"
+        await snapshotter.export_workspace(
+            "src", archive, embedding_model="m", embedding_dim=1536
+        )
+        connection.tables = _TABLES[:1]
+
+        with pytest.raises(ValueError, match="lightrag_vdb_chunks"):
+            await snapshotter.import_workspace(archive, "dst")
+
+    async def test_read_snapshot_rejects_other_archives(
+        self, pool: MagicMock, graph: AsyncMock, tmp_path: Path
+    ) -> None:
+        import tarfile
+
+        archive = tmp_path / "other.tar.gz"
+        with tarfile.open(archive, "w:gz"):
+            pass
+
+        with pytest.raises(ValueError, match="not a workspace snapshot"):
+            await _snapshotter(pool, graph).read_snapshot(archive)
+
+    async def test_has_data_checks_every_table(
+        self, pool: MagicMock, connection: AsyncMock, graph: AsyncMock
+    ) -> None:
+        connection.fetchval.side_effect = [False, True]
+
+        assert await _snapshotter(pool, graph).has_data("dst")
+        assert connection.fetchval.await_args.args == (
+            "SELECT EXISTS (SELECT 1 FROM lightrag_vdb_chunks WHERE workspace = $1)",
+            "ws_dst",
+        )
@@ -0,0 +1,189 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from domain.entities.vector_index import (
+    VectorIndexMethod,
+    VectorIndexSpec,
+    VectorQuantization,
+)
+from infrastructure.database.pgvector_index_manager import (
+    PgVectorIndexManager,
+    ivfflat_lists,
+)
+
+
+@pytest.fixture
+def connection() -> AsyncMock:
+    conn = AsyncMock()
+    conn.fetch.return_value = [
+        ("lightrag_vdb_chunks_model_128d", "vector"),
+        ("lightrag_vdb_entity_model_128d", "halfvec"),
+    ]
+    conn.fetchval.return_value = 5000
+    return conn
+
+
+@pytest.fixture
+def pool(connection: AsyncMock) -> MagicMock:
+    """PostgresPool stand-in whose acquire() yields the mocked asyncpg connection."""
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def _acquire():
+        yield connection
+
+    pool.acquire = _acquire
+    return pool
+
+
+def _manager(pool: MagicMock, **kwargs) -> PgVectorIndexManager:
+    return PgVectorIndexManager(pool, workspace_for=lambda d: f"ws_{d}", **kwargs)
+
+
+def _index_row(name: str, valid: bool = True) -> dict:
+    return {
+        "name": name,
+        "table": "lightrag_vdb_chunks_model_128d",
+        "definition": f"CREATE INDEX {name} ...",
+        "size_bytes": 8192,
+        "valid": valid,
+    }
+
+
+class TestIvfflatLists:
+    def test_uses_rows_over_thousand_then_sqrt(self) -> None:
+        assert ivfflat_lists(500) == 1
+        assert ivfflat_lists(50_000) == 50
+        assert ivfflat_lists(4_000_000) == 2000
+
+
+class TestPgVectorIndexManager:
+    """Tests for PgVectorIndexManager — the asyncpg connection is mocked."""
+
+    async def test_create_builds_partial_hnsw_index_per_table(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        """Should build one concurrent partial index per vector table."""
+        manager = _manager(pool, hnsw_m=24)
+
+        created = await manager.create_indexes(
+            "proj", VectorIndexSpec(method=VectorIndexMethod.HNSW, ef_construction=100)
+        )
+
+        assert len(created) == 2
+        statements = [c.args[0] for c in connection.execute.await_args_list]
+        assert statements[0] == (
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {created[0]} "
+            "ON lightrag_vdb_chunks_model_128d USING hnsw "
+            "(content_vector vector_cosine_ops) "
+            "WITH (m = 24, ef_construction = 100) WHERE workspace = 'ws_proj'"
+        )
+        assert "halfvec_cosine_ops" in statements[1]
+        assert created[0].startswith("vidx_ws_proj_hnsw_")
+
+    async def test_create_ivfflat_sizes_lists_from_row_count(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        manager = _manager(pool)
+
+        await manager.create_indexes(
+            "proj", VectorIndexSpec(method=VectorIndexMethod.IVFFLAT)
+        )
+
+        assert "WITH (lists = 5)" in connection.execute.await_args_list[0].args[0]
+
+    async def test_create_binary_index_over_quantized_expression(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        """Should index binary_quantize(content_vector) with Hamming distance."""
+        connection.fetch.return_value = [("lightrag_vdb_chunks_model_128d", "vector")]
+        connection.fetchval.side_effect = [5000, 128]
+        manager = _manager(pool)
+
+        created = await manager.create_indexes(
+            "proj", VectorIndexSpec(quantization=VectorQuantization.BINARY)
+        )
+
+        assert created[0].startswith("vidx_ws_proj_hnsw_binary_")
+        sql = connection.execute.await_args_list[0].args[0]
+        assert (
+            "USING hnsw ((binary_quantize(content_vector)::bit(128)) bit_hamming_ops)"
+            in sql
+        )
+
+    async def test_create_skips_tables_without_workspace_rows(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        connection.fetchval.return_value = 0
+        manager = _manager(pool)
+
+        created = await manager.create_indexes("proj", VectorIndexSpec())
+
+        assert created == []
+        connection.execute.assert_not_awaited()
+
+    async def test_create_sets_maintenance_work_mem(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        manager = _manager(pool, maintenance_work_mem="1GB")
+
+        await manager.create_indexes("proj", VectorIndexSpec())
+
+        connection.execute.assert_any_await(
+            "SELECT set_config('maintenance_work_mem', $1, false)", "1GB"
+        )
+
+    async def test_rejects_unsafe_workspace_names(self, pool: MagicMock) -> None:
+        manager = PgVectorIndexManager(pool, workspace_for=lambda _: "a'; DROP")
+
+        with pytest.raises(ValueError):
+            await manager.list_indexes("proj")
+
+    async def test_list_parses_method_from_name(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        connection.fetch.return_value = [
+            _index_row("vidx_ws_proj_hnsw_0123abcd"),
+            _index_row("vidx_ws_proj_ivfflat_0123abcd", valid=False),
+            _index_row("vidx_ws_proj_hnsw_halfvec_0123abcd"),
+        ]
+        manager = _manager(pool)
+
+        indexes = await manager.list_indexes("proj")
+
+        assert [i.method for i in indexes] == [
+            VectorIndexMethod.HNSW,
+            VectorIndexMethod.IVFFLAT,
+            VectorIndexMethod.HNSW,
+        ]
+        assert [i.quantization for i in indexes] == [
+            None,
+            None,
+            VectorQuantization.HALFVEC,
+        ]
+        assert indexes[1].valid is False
+        connection.fetch.assert_awaited_once()
+        assert connection.fetch.await_args.args[1] == "vidx_ws_proj_"
+
+    async def test_rebuild_and_drop_filter_by_method(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        connection.fetch.return_value = [
+            _index_row("vidx_ws_proj_hnsw_0123abcd"),
+            _index_row("vidx_ws_proj_ivfflat_0123abcd"),
+        ]
+        manager = _manager(pool)
+
+        rebuilt = await manager.rebuild_indexes("proj", VectorIndexMethod.HNSW)
+        dropped = await manager.drop_indexes("proj")
+
+        assert rebuilt == ["vidx_ws_proj_hnsw_0123abcd"]
+        assert len(dropped) == 2
+        statements = [c.args[0] for c in connection.execute.await_args_list]
+        assert statements == [
+            "REINDEX INDEX CONCURRENTLY vidx_ws_proj_hnsw_0123abcd",
+            "DROP INDEX CONCURRENTLY IF EXISTS vidx_ws_proj_hnsw_0123abcd",
+            "DROP INDEX CONCURRENTLY IF EXISTS vidx_ws_proj_ivfflat_0123abcd",
+        ]
@@ -0,0 +1,181 @@
+import json
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from domain.entities.indexing_job import IndexingJobStatus, IndexingJobType
+from infrastructure.queue.postgres_job_queue import PostgresJobQueue
+
+
+def _row(**overrides) -> dict:
+    row = {
+        "id": uuid.UUID("0b6f3f0e-1111-4c8e-9d1a-2d4c4f6b7a10"),
+        "job_type": "file",
+        "working_dir": "project",
+        "payload": json.dumps({"file_name": "project/a.pdf", "working_dir": "project"}),
+        "status": "queued",
+        "attempts": 0,
+        "result": None,
+        "error": None,
+        "created_at": datetime.now(UTC),
+        "updated_at": datetime.now(UTC),
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def connection() -> AsyncMock:
+    conn = AsyncMock()
+    conn.fetchrow.return_value = _row()
+    return conn
+
+
+@pytest.fixture
+def pool(connection: AsyncMock) -> MagicMock:
+    """PostgresPool stand-in whose acquire() yields the mocked asyncpg connection."""
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def _acquire():
+        yield connection
+
+    pool.acquire = _acquire
+    return pool
+
+
+class TestPostgresJobQueue:
+    """Tests for PostgresJobQueue — the asyncpg connection is mocked."""
+
+    async def test_enqueue_inserts_queued_job(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        """Should insert a queued row and return it as an IndexingJob."""
+        queue = PostgresJobQueue(pool)
+
+        job = await queue.enqueue(
+            IndexingJobType.FILE,
+            "project",
+            {"file_name": "project/a.pdf", "working_dir": "project"},
+        )
+
+        assert job.status == IndexingJobStatus.QUEUED
+        assert job.payload["file_name"] == "project/a.pdf"
+        sql, *args = connection.fetchrow.call_args[0]
+        assert "INSERT INTO raganything_indexing_jobs" in sql
+        assert args[1] == "file"
+        assert json.loads(args[3])["file_name"] == "project/a.pdf"
+
+    async def test_enqueue_creates_schema_once(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        queue = PostgresJobQueue(pool)
+
+        await queue.enqueue(IndexingJobType.FILE, "project", {})
+        await queue.enqueue(IndexingJobType.FILE, "project", {})
+
+        ddl_calls = [
+            c
+            for c in connection.execute.call_args_list
+            if "CREATE TABLE IF NOT EXISTS" in c[0][0]
+        ]
+        assert len(ddl_calls) == 1
+
+    async def test_claim_uses_skip_locked(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        """Should claim with FOR UPDATE SKIP LOCKED and pass lease and max attempts."""
+        connection.fetchrow.return_value = _row(status="running", attempts=1)
+        queue = PostgresJobQueue(pool, lease_seconds=60, max_attempts=5)
+
+        job = await queue.claim("worker-1")
+
+        assert job is not None
+        assert job.status == IndexingJobStatus.RUNNING
+        sql, worker_id, lease, max_attempts = connection.fetchrow.call_args[0]
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert worker_id == "worker-1"
+        assert lease == pytest.approx(60.0)
+        assert max_attempts == 5
+
+    async def test_claim_fails_exhausted_expired_jobs_first(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        queue = PostgresJobQueue(pool, max_attempts=3)
+
+        await queue.claim("worker-1")
+
+        sql, max_attempts = connection.execute.call_args_list[-1][0]
+        assert "SET status = 'failed'" in sql
+        assert "lease_expires_at < now() AND attempts >= $1" in sql
+        assert max_attempts == 3
+
+    async def test_stale_worker_cannot_extend_a_reclaimed_job(
+        self, pool: MagicMock, connection: AsyncMock, caplog
+    ) -> None:
+        connection.execute.return_value = "UPDATE 0"
+        queue = PostgresJobQueue(pool)
+
+        await queue.heartbeat(str(uuid.uuid4()), "worker-1")
+
+        sql, _key, worker_id, _lease = connection.execute.call_args[0]
+        assert "locked_by = $2" in sql
+        assert worker_id == "worker-1"
+        assert "no longer leased to worker-1" in caplog.text
+
+    async def test_claim_returns_none_when_empty(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        connection.fetchrow.return_value = None
+        queue = PostgresJobQueue(pool)
+
+        assert await queue.claim("worker-1") is None
+
+    async def test_complete_stores_result(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        queue = PostgresJobQueue(pool)
+        job_id = str(uuid.uuid4())
+
+        await queue.complete(job_id, "worker-1", {"status": "success"})
+
+        sql, key, worker_id, result = connection.execute.call_args[0]
+        assert "status = 'succeeded'" in sql
+        assert "locked_by = $2" in sql
+        assert (str(key), worker_id) == (job_id, "worker-1")
+        assert json.loads(result) == {"status": "success"}
+
+    async def test_fail_requeues_until_max_attempts(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        queue = PostgresJobQueue(pool, max_attempts=4)
+
+        await queue.fail(str(uuid.uuid4()), "worker-1", "boom")
+
+        sql, _key, worker_id, error, max_attempts = connection.execute.call_args[0]
+        assert "WHEN attempts < $4 THEN 'queued' ELSE 'failed'" in sql
+        assert "locked_by = $2" in sql
+        assert worker_id == "worker-1"
+        assert error == "boom"
+        assert max_attempts == 4
+
+    async def test_get_returns_none_for_invalid_id(self, pool: MagicMock) -> None:
+        queue = PostgresJobQueue(pool)
+
+        assert await queue.get("not-a-uuid") is None
+
+    async def test_get_decodes_result(
+        self, pool: MagicMock, connection: AsyncMock
+    ) -> None:
+        connection.fetchrow.return_value = _row(
+            status="succeeded", result=json.dumps({"status": "success"})
+        )
+        queue = PostgresJobQueue(pool)
+
+        job = await queue.get(str(uuid.uuid4()))
+
+        assert job is not None
+        assert job.result == {"status": "success"}
@@ -0,0 +1,61 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from config import DatabaseConfig
+from infrastructure.database.postgres_pool import PostgresPool
+
+
+def _asyncpg_pool() -> MagicMock:
+    pool = MagicMock()
+    pool.get_size.return_value = 2
+    pool.get_idle_size.return_value = 1
+    pool.close = AsyncMock()
+    return pool
+
+
+class TestPostgresPool:
+    def test_each_event_loop_gets_its_own_pool(self) -> None:
+        pool = PostgresPool(DatabaseConfig(), max_size=4)
+
+        with patch(
+            "infrastructure.database.postgres_pool.asyncpg.create_pool",
+            AsyncMock(side_effect=lambda **_kwargs: _asyncpg_pool()),
+        ) as create_pool:
+
+            async def _twice() -> MagicMock:
+                first = await pool.get_pool()
+                assert await pool.get_pool() is first
+                return first
+
+            first = asyncio.run(_twice())
+            second = asyncio.run(_twice())
+
+        assert first is not second
+        assert create_pool.await_count == 2
+
+    async def test_stats_and_close_cover_the_running_loop(self) -> None:
+        pool = PostgresPool(DatabaseConfig(), max_size=4)
+        assert pool.stats() == {
+            "open": False,
+            "size": 0,
+            "idle": 0,
+            "in_use": 0,
+            "max_size": 4,
+        }
+
+        with patch(
+            "infrastructure.database.postgres_pool.asyncpg.create_pool",
+            AsyncMock(return_value=_asyncpg_pool()),
+        ):
+            opened = await pool.get_pool()
+
+        assert pool.stats() == {
+            "open": True,
+            "size": 2,
+            "idle": 1,
+            "in_use": 1,
+            "max_size": 4,
+        }
+        await pool.close()
+        opened.close.assert_awaited_once()
+        assert pool.stats()["open"] is False
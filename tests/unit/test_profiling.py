@@ -0,0 +1,82 @@
+import asyncio
+import json
+import marshal
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from infrastructure.observability.profiling import PyinstrumentProfiler
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestPyinstrumentProfiler:
+    @pytest.fixture
+    def uploads(self, mock_storage: AsyncMock) -> dict[str, bytes]:
+        """Profiles uploaded to mock_storage, by key (the local file is removed)."""
+        uploaded: dict[str, bytes] = {}
+
+        async def _upload(_bucket: str, key: str, file_path: str) -> None:
+            uploaded[key] = Path(file_path).read_bytes()
+
+        mock_storage.upload_file.side_effect = _upload
+        return uploaded
+
+    def test_profile_key_has_format_extension(self, mock_storage: AsyncMock) -> None:
+        profiler = PyinstrumentProfiler(
+            mock_storage, "b", "profiles/", "/tmp", "pstats"
+        )
+
+        assert profiler.profile_key("jobs/job-1") == "profiles/jobs/job-1.pstats"
+
+    async def test_stores_speedscope_profile_including_child_tasks(
+        self, mock_storage: AsyncMock, uploads: dict[str, bytes], tmp_path: Path
+    ) -> None:
+        profiler = PyinstrumentProfiler(
+            mock_storage, "bucket", "profiles", str(tmp_path), interval=0.001
+        )
+
+        async def extract() -> None:
+            await asyncio.sleep(0)
+            _busy(0.02)
+
+        key = profiler.profile_key("queries/q1")
+        async with profiler.profile(key):
+            await asyncio.create_task(extract())
+
+        profile = json.loads(uploads[key])
+        assert "speedscope" in profile["$schema"]
+        assert "extract" in {frame["name"] for frame in profile["shared"]["frames"]}
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_stores_pstats_profile_when_profiled_code_fails(
+        self, mock_storage: AsyncMock, uploads: dict[str, bytes], tmp_path: Path
+    ) -> None:
+        profiler = PyinstrumentProfiler(
+            mock_storage, "bucket", "profiles", str(tmp_path), "pstats", 0.001
+        )
+
+        with pytest.raises(RuntimeError):
+            async with profiler.profile("profiles/jobs/job-1.pstats"):
+                _busy(0.01)
+                raise RuntimeError("parse failed")
+
+        stats = marshal.loads(uploads["profiles/jobs/job-1.pstats"])
+        assert any(function == "_busy" for _file, _line, function in stats)
+
+    async def test_storage_failure_does_not_fail_the_request(
+        self, mock_storage: AsyncMock, tmp_path: Path
+    ) -> None:
+        mock_storage.upload_file.side_effect = ConnectionError("minio down")
+        profiler = PyinstrumentProfiler(mock_storage, "bucket", "p", str(tmp_path))
+
+        async with profiler.profile("p/queries/q1.speedscope.json"):
+            pass
+
+        assert list(tmp_path.iterdir()) == []
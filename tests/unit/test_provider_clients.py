@@ -0,0 +1,58 @@
+import asyncio
+
+import openai
+
+from config import LLMConfig
+from infrastructure.rag.provider_clients import ProviderHttpClients
+
+BASE_URL = "https://openrouter.ai/api/v1"
+
+
+class TestProviderHttpClients:
+    async def test_one_client_per_base_url(self) -> None:
+        clients = ProviderHttpClients(LLMConfig())
+
+        client = clients.get(BASE_URL)
+
+        assert clients.get(BASE_URL) is client
+        assert clients.get("http://localhost:11434/v1") is not client
+        await clients.aclose()
+
+    async def test_timeouts_come_from_config(self) -> None:
+        clients = ProviderHttpClients(LLMConfig(LLM_HTTP_READ_TIMEOUT_SECONDS=90))
+
+        client = clients.get(BASE_URL)
+
+        assert client.timeout.read == 90
+        assert client.timeout.connect == 10
+        await clients.aclose()
+
+    async def test_closing_a_borrowing_openai_client_keeps_connections(
+        self,
+    ) -> None:
+        clients = ProviderHttpClients(LLMConfig())
+        shared = clients.get(BASE_URL)
+
+        # What LightRAG does on every call.
+        per_call = openai.AsyncOpenAI(
+            api_key="k", base_url=BASE_URL, **clients.client_configs(BASE_URL)
+        )
+        await per_call.close()
+
+        assert not shared.is_closed
+        assert per_call.timeout == shared.timeout
+        assert clients.get(BASE_URL) is shared
+
+        await clients.aclose()
+        assert shared.is_closed
+
+    def test_each_event_loop_gets_its_own_client(self) -> None:
+        clients = ProviderHttpClients(LLMConfig())
+
+        async def get():
+            return clients.get(BASE_URL)
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+
+        assert first is not second
@@ -0,0 +1,59 @@
+import pytest
+
+from domain.services.query_mode_router import choose_query_mode
+
+
+class TestChooseQueryMode:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "What is the company's revenue in 2023?",
+            "What does the contract say about termination notice periods?",
+        ],
+    )
+    def test_plain_questions_use_naive(self, query: str) -> None:
+        assert choose_query_mode(query).mode == "naive"
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            'Find the "force majeure" clause',
+            "Where is config_loader defined?",
+            "What is the status of INV-2034?",
+            "Open quarterly_report.pdf",
+        ],
+    )
+    def test_exact_lookups_use_fusion(self, query: str) -> None:
+        assert choose_query_mode(query).mode == "fusion"
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "What is the relationship between Alice and the ACME project?",
+            "Compare the 2022 and 2023 pricing models",
+            "Which policies affect remote work approvals?",
+        ],
+    )
+    def test_relational_questions_use_local(self, query: str) -> None:
+        assert choose_query_mode(query).mode == "local"
+
+    @pytest.mark.parametrize(
+        "query",
+        ["Summarize the main findings", "Give me an overview of the documents"],
+    )
+    def test_thematic_questions_use_global(self, query: str) -> None:
+        assert choose_query_mode(query).mode == "global"
+
+    def test_relational_and_thematic_question_uses_hybrid(self) -> None:
+        decision = choose_query_mode(
+            "Summarize how supplier delays impact delivery across all reports"
+        )
+
+        assert decision.mode == "hybrid"
+        assert decision.reason == "relational and thematic"
+
+    def test_exact_lookup_wins_over_graph_wording(self) -> None:
+        decision = choose_query_mode('Compare "Plan A" with the baseline')
+
+        assert decision.mode == "fusion"
+        assert decision.reason == "exact lookup"
@@ -40,6 +40,12 @@ class TestQueryUseCase:
             mode="hybrid",
             top_k=20,
             working_dir="/tmp/rag/test",
+            hl_keywords=None,
+            ll_keywords=None,
+            diversity=None,
+            dedup_threshold=None,
+            ef_search=None,
+            probes=None,
         )
 
     async def test_execute_returns_result_from_rag_engine(
@@ -76,6 +82,12 @@ class TestQueryUseCase:
             mode="naive",
             top_k=10,
             working_dir="/tmp/rag/test",
+            hl_keywords=None,
+            ll_keywords=None,
+            diversity=None,
+            dedup_threshold=None,
+            ef_search=None,
+            probes=None,
         )
 
     async def test_execute_with_mix_mode(
@@ -98,4 +110,35 @@ class TestQueryUseCase:
             mode="mix",
             top_k=5,
             working_dir="/tmp/rag/test",
+            hl_keywords=None,
+            ll_keywords=None,
+            diversity=None,
+            dedup_threshold=None,
+            ef_search=None,
+            probes=None,
         )
+
+    async def test_execute_auto_mode_routes_and_records_mode(
+        self,
+        mock_rag_engine: AsyncMock,
+    ) -> None:
+        """mode='auto' should query with the routed mode and record it in metadata."""
+        mock_rag_engine.query.return_value = {
+            "status": "success",
+            "data": {},
+            "metadata": {"query_mode": "global"},
+        }
+        use_case = QueryUseCase(rag_engine=mock_rag_engine)
+
+        result = await use_case.execute(
+            working_dir="/tmp/rag/test",
+            query="Summarize the key findings across all reports",
+            mode="auto",
+        )
+
+        assert mock_rag_engine.query.call_args.kwargs["mode"] == "global"
+        assert result["metadata"] == {
+            "query_mode": "global",
+            "requested_mode": "auto",
+            "mode_reason": "thematic",
+        }
@@ -1,19 +1,46 @@
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 from httpx import ASGITransport
 
+import dependencies
 from application.requests.query_request import MultimodalContentItem
+from application.use_cases.check_readiness_use_case import CheckReadinessUseCase
+from application.use_cases.delete_document_use_case import DeleteDocumentUseCase
+from application.use_cases.enqueue_indexing_job_use_case import (
+    EnqueueIndexingJobUseCase,
+)
 from application.use_cases.index_file_use_case import IndexFileUseCase
 from application.use_cases.index_folder_use_case import IndexFolderUseCase
+from application.use_cases.migrate_embedding_dim_use_case import (
+    MigrateEmbeddingDimUseCase,
+)
 from application.use_cases.multimodal_query_use_case import MultimodalQueryUseCase
 from application.use_cases.query_use_case import QueryUseCase
 from dependencies import (
+    get_check_readiness_use_case,
+    get_delete_document_use_case,
+    get_enqueue_indexing_job_use_case,
+    get_export_snapshot_use_case,
+    get_import_snapshot_use_case,
     get_index_file_use_case,
     get_index_folder_use_case,
+    get_job_queue,
+    get_migrate_embedding_dim_use_case,
     get_multimodal_query_use_case,
+    get_profiler,
     get_query_use_case,
+    get_vector_index_manager,
+)
+from domain.entities.document_deletion import DeletionStatus, DocumentDeletionResult
+from domain.entities.embedding_migration import EmbeddingMigrationMode
+from domain.entities.readiness import DependencyCheck, ReadinessReport
+from domain.entities.vector_index import (
+    VectorIndex,
+    VectorIndexMethod,
+    VectorIndexSpec,
 )
 from main import app
 
@@ -101,6 +128,98 @@ class TestIndexFileRoute:
         assert response.status_code == 422
 
 
+    async def test_index_file_passes_replace_flag(
+        self,
+        mock_index_file_use_case: AsyncMock,
+    ) -> None:
+        """replace=true in the body should reach the use case."""
+        app.dependency_overrides[get_index_file_use_case] = (
+            lambda: mock_index_file_use_case
+        )
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/file/index",
+                json={
+                    "file_name": "doc.pdf",
+                    "working_dir": "/tmp/rag/test",
+                    "replace": True,
+                },
+            )
+            await asyncio.sleep(0)
+
+        assert response.status_code == 202
+        mock_index_file_use_case.execute.assert_awaited_once_with(
+            file_name="doc.pdf", working_dir="/tmp/rag/test", replace=True
+        )
+
+
+class TestDeleteFileRoute:
+    @staticmethod
+    def _use_case(status: DeletionStatus) -> AsyncMock:
+        mock = AsyncMock(spec=DeleteDocumentUseCase)
+        mock.execute.return_value = DocumentDeletionResult(
+            status=status,
+            message="done",
+            file_name="doc.pdf",
+            doc_ids=["doc-1"] if status == DeletionStatus.SUCCESS else [],
+            error="pipeline busy" if status == DeletionStatus.BUSY else None,
+        )
+        return mock
+
+    async def _delete(self, **params) -> httpx.Response:
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await client.delete(
+                "/api/v1/file",
+                params={"working_dir": "/tmp/rag/test", "file_name": "doc.pdf"}
+                | params,
+            )
+
+    async def test_delete_file_returns_result(self) -> None:
+        use_case = self._use_case(DeletionStatus.SUCCESS)
+        app.dependency_overrides[get_delete_document_use_case] = lambda: use_case
+
+        response = await self._delete(delete_llm_cache="false")
+
+        assert response.status_code == 200
+        assert response.json()["doc_ids"] == ["doc-1"]
+        use_case.execute.assert_awaited_once_with(
+            file_name="doc.pdf", working_dir="/tmp/rag/test", delete_llm_cache=False
+        )
+
+    @pytest.mark.parametrize(
+        ("deletion_status", "http_status"),
+        [
+            (DeletionStatus.NOT_FOUND, 404),
+            (DeletionStatus.BUSY, 409),
+            (DeletionStatus.FAILED, 500),
+        ],
+    )
+    async def test_delete_file_maps_errors(
+        self, deletion_status: DeletionStatus, http_status: int
+    ) -> None:
+        use_case = self._use_case(deletion_status)
+        app.dependency_overrides[get_delete_document_use_case] = lambda: use_case
+
+        response = await self._delete()
+
+        assert response.status_code == http_status
+
+    async def test_delete_file_requires_file_name(self) -> None:
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.delete(
+                "/api/v1/file", params={"working_dir": "/tmp/rag/test"}
+            )
+
+        assert response.status_code == 422
+
+
 class TestIndexFolderRoute:
     @pytest.fixture
     def mock_index_folder_use_case(self) -> AsyncMock:
@@ -166,6 +285,87 @@ class TestIndexFolderRoute:
         assert response.status_code == 422
 
 
+class TestQueuedIndexingRoutes:
+    async def test_index_file_enqueues_job_when_queue_enabled(
+        self,
+        mock_job_queue: AsyncMock,
+    ) -> None:
+        """With a job queue configured, the route should only enqueue and return the job id."""
+        app.dependency_overrides[get_enqueue_indexing_job_use_case] = lambda: (
+            EnqueueIndexingJobUseCase(mock_job_queue)
+        )
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/file/index",
+                json={"file_name": "project/doc1.pdf", "working_dir": "project"},
+            )
+
+        assert response.status_code == 202
+        body = response.json()
+        assert body["status"] == "accepted"
+        assert body["job_id"] == mock_job_queue.enqueue.return_value.id
+        mock_job_queue.enqueue.assert_awaited_once()
+
+    async def test_index_folder_enqueues_job_when_queue_enabled(
+        self,
+        mock_job_queue: AsyncMock,
+    ) -> None:
+        app.dependency_overrides[get_enqueue_indexing_job_use_case] = lambda: (
+            EnqueueIndexingJobUseCase(mock_job_queue)
+        )
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/folder/index",
+                json={"working_dir": "project", "recursive": False},
+            )
+
+        assert response.status_code == 202
+        assert "job_id" in response.json()
+
+    async def test_get_job_returns_job(self, mock_job_queue: AsyncMock) -> None:
+        mock_job_queue.get.return_value = mock_job_queue.enqueue.return_value
+        app.dependency_overrides[get_job_queue] = lambda: mock_job_queue
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                f"/api/v1/jobs/{mock_job_queue.enqueue.return_value.id}"
+            )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "queued"
+
+    async def test_get_job_returns_404_for_unknown_job(
+        self, mock_job_queue: AsyncMock
+    ) -> None:
+        mock_job_queue.get.return_value = None
+        app.dependency_overrides[get_job_queue] = lambda: mock_job_queue
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/v1/jobs/missing")
+
+        assert response.status_code == 404
+
+    async def test_get_job_returns_404_without_queue(self) -> None:
+        app.dependency_overrides[get_job_queue] = lambda: None
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/v1/jobs/anything")
+
+        assert response.status_code == 404
+
+
 class TestQueryRoute:
     @pytest.fixture
     def mock_query_use_case(self) -> AsyncMock:
@@ -229,6 +429,12 @@ class TestQueryRoute:
             query="What are the findings?",
             mode="hybrid",
             top_k=20,
+            hl_keywords=None,
+            ll_keywords=None,
+            diversity=None,
+            dedup_threshold=None,
+            ef_search=None,
+            probes=None,
         )
 
     async def test_query_returns_response_body(
@@ -279,6 +485,12 @@ class TestQueryRoute:
             query="test query",
             mode="naive",
             top_k=10,
+            hl_keywords=None,
+            ll_keywords=None,
+            diversity=None,
+            dedup_threshold=None,
+            ef_search=None,
+            probes=None,
         )
 
     async def test_query_rejects_missing_query_field(self) -> None:
@@ -318,6 +530,133 @@ class TestQueryRoute:
 
         assert response.status_code == 422
 
+    async def test_query_passes_diversification_params(
+        self,
+        mock_query_use_case: AsyncMock,
+    ) -> None:
+        app.dependency_overrides[get_query_use_case] = (
+            lambda: mock_query_use_case
+        )
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/query",
+                json={
+                    "working_dir": "/tmp/rag/test",
+                    "query": "q",
+                    "diversity": 0.3,
+                    "dedup_threshold": 0.95,
+                },
+            )
+
+        assert response.status_code == 200
+        kwargs = mock_query_use_case.execute.call_args.kwargs
+        assert kwargs["diversity"] == 0.3
+        assert kwargs["dedup_threshold"] == 0.95
+
+    async def test_query_rejects_out_of_range_diversity(self) -> None:
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/query",
+                json={"working_dir": "/tmp/rag/test", "query": "q", "diversity": 1.5},
+            )
+
+        assert response.status_code == 422
+
+    async def test_query_accepts_auto_mode_and_reports_chosen_mode(
+        self,
+        mock_query_use_case: AsyncMock,
+    ) -> None:
+        mock_query_use_case.execute.return_value["metadata"] = {
+            "query_mode": "global",
+            "requested_mode": "auto",
+            "mode_reason": "thematic",
+        }
+        app.dependency_overrides[get_query_use_case] = (
+            lambda: mock_query_use_case
+        )
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/query",
+                json={
+                    "working_dir": "/tmp/rag/test",
+                    "query": "Summarize the main findings",
+                    "mode": "auto",
+                },
+            )
+
+        assert response.status_code == 200
+        assert response.headers["X-Query-Mode"] == "global"
+        assert mock_query_use_case.execute.call_args.kwargs["mode"] == "auto"
+
+    async def test_query_returns_only_validated_chunk_fields(
+        self,
+        mock_query_use_case: AsyncMock,
+    ) -> None:
+        mock_query_use_case.execute.return_value["data"] = {
+            "entities": [{"entity_name": "ignored"}],
+            "chunks": [
+                {
+                    "reference_id": "1",
+                    "content": "Revenue grew 12%.",
+                    "file_path": "report.pdf",
+                    "chunk_id": "chunk-1",
+                    "score": 0.91,
+                }
+            ],
+        }
+        app.dependency_overrides[get_query_use_case] = (
+            lambda: mock_query_use_case
+        )
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/query",
+                json={"working_dir": "/tmp/rag/test", "query": "revenue"},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [
+            {
+                "reference_id": "1",
+                "content": "Revenue grew 12%.",
+                "file_path": "report.pdf",
+                "chunk_id": "chunk-1",
+            }
+        ]
+
+    async def test_query_returns_500_on_malformed_chunk(
+        self,
+        mock_query_use_case: AsyncMock,
+    ) -> None:
+        mock_query_use_case.execute.return_value["data"] = {
+            "chunks": [{"reference_id": "1", "content": "missing fields"}]
+        }
+        app.dependency_overrides[get_query_use_case] = (
+            lambda: mock_query_use_case
+        )
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.post(
+                "/api/v1/query",
+                json={"working_dir": "/tmp/rag/test", "query": "revenue"},
+            )
+
+        assert response.status_code == 500
+
 
 class TestMultimodalQueryRoute:
     @pytest.fixture
@@ -459,3 +798,393 @@ class TestMultimodalQueryRoute:
             )
 
         assert response.status_code == 422
+
+
+class TestReadyRoute:
+    async def test_ready_returns_200_when_ready(self) -> None:
+        mock = AsyncMock(spec=CheckReadinessUseCase)
+        mock.execute.return_value = ReadinessReport(
+            ready=True,
+            dependencies={"storage": DependencyCheck(ok=True, latency_ms=1.2)},
+        )
+        app.dependency_overrides[get_check_readiness_use_case] = lambda: mock
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/v1/ready")
+
+        assert response.status_code == 200
+        assert response.json()["dependencies"]["storage"]["latency_ms"] == 1.2
+
+    async def test_ready_returns_503_when_not_ready(self) -> None:
+        mock = AsyncMock(spec=CheckReadinessUseCase)
+        mock.execute.return_value = ReadinessReport(
+            ready=False, reasons=["LLM queue depth 80 above threshold 50"]
+        )
+        app.dependency_overrides[get_check_readiness_use_case] = lambda: mock
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/v1/ready")
+
+        assert response.status_code == 503
+        assert response.json()["reasons"] == ["LLM queue depth 80 above threshold 50"]
+
+
+class TestAdminRoutes:
+    @pytest.fixture
+    def mock_index_manager(self) -> AsyncMock:
+        manager = AsyncMock()
+        manager.list_indexes.return_value = [
+            VectorIndex(
+                name="vidx_ws_hnsw_0123abcd",
+                table="lightrag_vdb_chunks_model_128d",
+                method=VectorIndexMethod.HNSW,
+                definition="CREATE INDEX ...",
+                size_bytes=8192,
+                valid=True,
+            )
+        ]
+        manager.drop_indexes.return_value = ["vidx_ws_hnsw_0123abcd"]
+        return manager
+
+    @pytest.fixture
+    def admin_key(self, monkeypatch: pytest.MonkeyPatch) -> str:
+        monkeypatch.setattr(dependencies.app_config, "ADMIN_API_KEY", "secret")
+        return "secret"
+
+    async def test_admin_disabled_without_key_configured(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(dependencies.app_config, "ADMIN_API_KEY", None)
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/api/v1/admin/vector-indexes", params={"working_dir": "p"}
+            )
+
+        assert response.status_code == 403
+
+    @pytest.mark.usefixtures("admin_key")
+    async def test_admin_rejects_wrong_key(self) -> None:
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/api/v1/admin/vector-indexes",
+                params={"working_dir": "p"},
+                headers={"X-Admin-Key": "wrong"},
+            )
+
+        assert response.status_code == 401
+
+    async def test_list_returns_404_without_postgres(self, admin_key: str) -> None:
+        app.dependency_overrides[get_vector_index_manager] = lambda: None
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/api/v1/admin/vector-indexes",
+                params={"working_dir": "p"},
+                headers={"X-Admin-Key": admin_key},
+            )
+
+        assert response.status_code == 404
+
+    async def test_list_returns_indexes(
+        self, admin_key: str, mock_index_manager: AsyncMock
+    ) -> None:
+        app.dependency_overrides[get_vector_index_manager] = lambda: mock_index_manager
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/api/v1/admin/vector-indexes",
+                params={"working_dir": "p"},
+                headers={"X-Admin-Key": admin_key},
+            )
+
+        assert response.status_code == 200
+        assert response.json()[0]["method"] == "hnsw"
+        mock_index_manager.list_indexes.assert_awaited_once_with("p")
+
+    async def test_create_returns_202_and_builds_in_background(
+        self, admin_key: str, mock_index_manager: AsyncMock
+    ) -> None:
+        app.dependency_overrides[get_vector_index_manager] = lambda: mock_index_manager
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/admin/vector-indexes",
+                json={"working_dir": "p", "method": "ivfflat", "lists": 50},
+                headers={"X-Admin-Key": admin_key},
+            )
+            await asyncio.sleep(0)
+
+        assert response.status_code == 202
+        mock_index_manager.create_indexes.assert_awaited_once_with(
+            "p",
+            VectorIndexSpec(method=VectorIndexMethod.IVFFLAT, lists=50),
+        )
+
+    async def test_drop_returns_dropped_names(
+        self, admin_key: str, mock_index_manager: AsyncMock
+    ) -> None:
+        app.dependency_overrides[get_vector_index_manager] = lambda: mock_index_manager
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.delete(
+                "/api/v1/admin/vector-indexes",
+                params={"working_dir": "p", "method": "hnsw"},
+                headers={"X-Admin-Key": admin_key},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["dropped"] == ["vidx_ws_hnsw_0123abcd"]
+        mock_index_manager.drop_indexes.assert_awaited_once_with(
+            "p", VectorIndexMethod.HNSW
+        )
+
+    async def test_embedding_migration_runs_and_cuts_over(
+        self, admin_key: str, mock_rag_engine: AsyncMock
+    ) -> None:
+        migrator = AsyncMock()
+        migrator.copy_workspace.return_value = {"lightrag_vdb_chunks_m_512d": 3}
+        use_case = MigrateEmbeddingDimUseCase(mock_rag_engine, migrator)
+        app.dependency_overrides[get_migrate_embedding_dim_use_case] = lambda: use_case
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/admin/embedding-migrations",
+                json={"working_dir": "p", "target_dim": 512},
+                headers={"X-Admin-Key": admin_key},
+            )
+            await asyncio.sleep(0)
+            status_response = await client.get(
+                "/api/v1/admin/embedding-migrations",
+                params={"working_dir": "p"},
+                headers={"X-Admin-Key": admin_key},
+            )
+
+        assert response.status_code == 202
+        body = status_response.json()
+        assert body["status"] == "completed"
+        assert body["source_dim"] == 1536
+        assert body["rows_copied"] == {"lightrag_vdb_chunks_m_512d": 3}
+        migrator.copy_workspace.assert_awaited_once()
+        assert migrator.copy_workspace.await_args.args == (
+            "p",
+            1536,
+            512,
+            EmbeddingMigrationMode.TRUNCATE,
+        )
+        mock_rag_engine.set_embedding_dim.assert_awaited_once_with("p", 512)
+
+    async def test_embedding_migration_rejects_larger_dimension(
+        self, admin_key: str, mock_rag_engine: AsyncMock
+    ) -> None:
+        use_case = MigrateEmbeddingDimUseCase(mock_rag_engine, AsyncMock())
+        app.dependency_overrides[get_migrate_embedding_dim_use_case] = lambda: use_case
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/admin/embedding-migrations",
+                json={"working_dir": "p", "target_dim": 3072},
+                headers={"X-Admin-Key": admin_key},
+            )
+
+        assert response.status_code == 400
+
+    async def test_embedding_migration_status_404_when_unknown(
+        self, admin_key: str
+    ) -> None:
+        app.dependency_overrides[get_migrate_embedding_dim_use_case] = lambda: None
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/api/v1/admin/embedding-migrations",
+                params={"working_dir": "p"},
+                headers={"X-Admin-Key": admin_key},
+            )
+
+        assert response.status_code == 404
+
+    async def test_snapshot_export_returns_key_and_runs_in_background(
+        self, admin_key: str
+    ) -> None:
+        use_case = AsyncMock()
+        use_case.snapshot_key = lambda working_dir: f"snapshots/{working_dir}/1.tar.gz"
+        app.dependency_overrides[get_export_snapshot_use_case] = lambda: use_case
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/admin/snapshots/export",
+                json={"working_dir": "p"},
+                headers={"X-Admin-Key": admin_key},
+            )
+            await asyncio.sleep(0)
+
+        assert response.status_code == 202
+        assert response.json()["snapshot_key"] == "snapshots/p/1.tar.gz"
+        request, key = use_case.execute.await_args.args
+        assert (request.working_dir, key) == ("p", "snapshots/p/1.tar.gz")
+
+    async def test_snapshot_import_conflicts_with_non_empty_workspace(
+        self, admin_key: str
+    ) -> None:
+        use_case = AsyncMock()
+        use_case.ensure_empty.side_effect = RuntimeError("already has data")
+        app.dependency_overrides[get_import_snapshot_use_case] = lambda: use_case
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/admin/snapshots/import",
+                json={"snapshot_key": "snapshots/p/1.tar.gz", "working_dir": "q"},
+                headers={"X-Admin-Key": admin_key},
+            )
+
+        assert response.status_code == 409
+        use_case.execute.assert_not_called()
+
+    async def test_snapshots_404_without_postgres(self, admin_key: str) -> None:
+        app.dependency_overrides[get_export_snapshot_use_case] = lambda: None
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/api/v1/admin/snapshots",
+                params={"working_dir": "p"},
+                headers={"X-Admin-Key": admin_key},
+            )
+
+        assert response.status_code == 404
+
+
+class TestProfiledRequests:
+    @pytest.fixture
+    def admin_key(self, monkeypatch: pytest.MonkeyPatch) -> str:
+        monkeypatch.setattr(dependencies.app_config, "ADMIN_API_KEY", "secret")
+        return "secret"
+
+    @pytest.fixture(autouse=True)
+    def _profiler(self, mock_profiler: MagicMock) -> None:
+        app.dependency_overrides[get_profiler] = lambda: mock_profiler
+
+    @pytest.fixture
+    def mock_query_use_case(self) -> AsyncMock:
+        mock = AsyncMock(spec=QueryUseCase)
+        mock.execute.return_value = {"status": "success", "data": {"chunks": []}}
+        app.dependency_overrides[get_query_use_case] = lambda: mock
+        return mock
+
+    @pytest.mark.usefixtures("admin_key", "mock_query_use_case")
+    async def test_profiling_requires_admin_key(self, mock_profiler: MagicMock) -> None:
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/query",
+                json={"working_dir": "project", "query": "q"},
+                headers={"X-Profile": "true"},
+            )
+
+        assert response.status_code == 401
+        mock_profiler.profile.assert_not_called()
+
+    @pytest.mark.usefixtures("mock_query_use_case")
+    async def test_query_is_profiled_for_admin(
+        self, admin_key: str, mock_profiler: MagicMock
+    ) -> None:
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/query",
+                json={"working_dir": "project", "query": "q"},
+                headers={"X-Profile": "true", "X-Admin-Key": admin_key},
+            )
+
+        assert response.status_code == 200
+        key = response.headers["X-Profile-Key"]
+        assert key.startswith("profiles/queries/")
+        mock_profiler.profile.assert_called_once_with(key)
+
+    async def test_query_without_header_is_not_profiled(
+        self, mock_query_use_case: AsyncMock, mock_profiler: MagicMock
+    ) -> None:
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/query", json={"working_dir": "project", "query": "q"}
+            )
+
+        assert "X-Profile-Key" not in response.headers
+        mock_profiler.profile.assert_not_called()
+        mock_query_use_case.execute.assert_awaited_once()
+
+    async def test_queued_job_carries_profile_flag(
+        self, admin_key: str, mock_job_queue: AsyncMock
+    ) -> None:
+        app.dependency_overrides[get_enqueue_indexing_job_use_case] = lambda: (
+            EnqueueIndexingJobUseCase(mock_job_queue)
+        )
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/file/index",
+                json={"file_name": "project/doc1.pdf", "working_dir": "project"},
+                headers={"X-Profile": "true", "X-Admin-Key": admin_key},
+            )
+
+        assert response.status_code == 202
+        job_id = mock_job_queue.enqueue.return_value.id
+        assert response.json()["profile_key"] == (
+            f"profiles/jobs/{job_id}.speedscope.json"
+        )
+        assert mock_job_queue.enqueue.call_args.kwargs["payload"]["profile"] is True
+
+    async def test_background_indexing_runs_under_profiler(
+        self, admin_key: str, mock_profiler: MagicMock
+    ) -> None:
+        use_case = AsyncMock(spec=IndexFileUseCase)
+        app.dependency_overrides[get_index_file_use_case] = lambda: use_case
+        app.dependency_overrides[get_enqueue_indexing_job_use_case] = lambda: None
+
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/file/index",
+                json={"file_name": "project/doc1.pdf", "working_dir": "project"},
+                headers={"X-Profile": "true", "X-Admin-Key": admin_key},
+            )
+        await asyncio.sleep(0)
+
+        key = response.json()["profile_key"]
+        assert key.startswith("profiles/indexing/")
+        mock_profiler.profile.assert_called_once_with(key)
+        use_case.execute.assert_awaited_once()
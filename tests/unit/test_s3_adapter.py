@@ -0,0 +1,164 @@
+import datetime
+from collections.abc import AsyncIterator, Mapping
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from minio.credentials import Credentials
+from minio.signer import sign_v4_s3
+
+from infrastructure.storage.s3_adapter import AsyncS3Adapter, sign_v4
+
+NS = "http://s3.amazonaws.com/doc/2006-03-01/"
+
+
+class FakeS3:
+    """In-memory S3 on a local aiohttp server, paging listings by 2."""
+
+    def __init__(self, objects: dict[str, bytes]) -> None:
+        self.objects = objects
+        self.requests: list[web.Request] = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append(request)
+        assert request.headers["Authorization"].startswith("AWS4-HMAC-SHA256 ")
+        bucket, _, key = request.path[1:].partition("/")
+        if bucket != "bucket":
+            return _error(404, "NoSuchBucket")
+        if request.method == "HEAD":
+            return web.Response()
+        if request.method == "PUT":
+            self.objects[key] = await request.read()
+            return web.Response()
+        if key:
+            if key not in self.objects:
+                return _error(404, "NoSuchKey")
+            return web.Response(body=self.objects[key])
+        return self._list(request.query)
+
+    def _list(self, query: Mapping[str, str]) -> web.Response:
+        prefix = query.get("prefix", "")
+        keys = sorted(k for k in self.objects if k.startswith(prefix))
+        if "delimiter" in query:
+            keys = [k for k in keys if "/" not in k[len(prefix) :]]
+        start = int(query.get("continuation-token", "0"))
+        page = keys[start : start + 2]
+        truncated = start + 2 < len(keys)
+        contents = "".join(f"<Contents><Key>{k}</Key></Contents>" for k in page)
+        token = (
+            f"<NextContinuationToken>{start + 2}</NextContinuationToken>"
+            if truncated
+            else ""
+        )
+        return web.Response(
+            text=(
+                f'<ListBucketResult xmlns="{NS}">{contents}'
+                f"<IsTruncated>{str(truncated).lower()}</IsTruncated>{token}"
+                "</ListBucketResult>"
+            )
+        )
+
+
+def _error(status: int, code: str) -> web.Response:
+    return web.Response(status=status, text=f"<Error><Code>{code}</Code></Error>")
+
+
+class TestSignV4:
+    def test_matches_minio_signer(self) -> None:
+        now = datetime.datetime(2026, 5, 1, 12, 0, tzinfo=datetime.UTC)
+        payload = "UNSIGNED-PAYLOAD"
+
+        target, headers = sign_v4(
+            "PUT",
+            "localhost:9000",
+            "/bucket/docs/a report (1).pdf",
+            {"partNumber": "1", "uploadId": "x/y"},
+            payload,
+            "access",
+            "secret",
+            "us-east-1",
+            now,
+        )
+        expected = sign_v4_s3(
+            method="PUT",
+            url=urlsplit(f"http://localhost:9000{target}"),
+            region="us-east-1",
+            headers={
+                "Host": "localhost:9000",
+                "x-amz-content-sha256": payload,
+                "x-amz-date": headers["x-amz-date"],
+            },
+            credentials=Credentials("access", "secret"),
+            content_sha256=payload,
+            date=now,
+        )
+
+        assert (
+            target
+            == "/bucket/docs/a%20report%20%281%29.pdf?partNumber=1&uploadId=x%2Fy"
+        )
+        assert headers["authorization"] == expected["Authorization"]
+
+
+class TestAsyncS3Adapter:
+    @pytest.fixture
+    def s3(self) -> FakeS3:
+        return FakeS3(
+            {
+                "docs/a.pdf": b"a",
+                "docs/b.pdf": b"b",
+                "docs/sub/": b"",
+                "docs/sub/c.pdf": b"c",
+                "other/d.pdf": b"d",
+            }
+        )
+
+    @pytest.fixture
+    async def adapter(self, s3: FakeS3) -> AsyncIterator[AsyncS3Adapter]:
+        app = web.Application(client_max_size=8 * 1024 * 1024)
+        app.router.add_route("*", "/{path:.*}", s3.handle)
+        async with TestServer(app) as server:
+            adapter = AsyncS3Adapter(f"127.0.0.1:{server.port}", "access", "secret")
+            yield adapter
+
+    async def test_get_object(self, adapter: AsyncS3Adapter) -> None:
+        assert await adapter.get_object("bucket", "docs/a.pdf") == b"a"
+
+        with pytest.raises(FileNotFoundError):
+            await adapter.get_object("bucket", "docs/missing.pdf")
+
+    async def test_list_objects_follows_pages_and_skips_directories(
+        self, adapter: AsyncS3Adapter, s3: FakeS3
+    ) -> None:
+        keys = await adapter.list_objects("bucket", "docs/")
+
+        assert keys == ["docs/a.pdf", "docs/b.pdf", "docs/sub/c.pdf"]
+        assert len(s3.requests) == 2
+        assert await adapter.list_objects("bucket", "docs/", recursive=False) == [
+            "docs/a.pdf",
+            "docs/b.pdf",
+        ]
+
+    async def test_upload_and_download_stream_files(
+        self, adapter: AsyncS3Adapter, tmp_path: Path
+    ) -> None:
+        source = tmp_path / "snapshot.tar.gz"
+        source.write_bytes(b"x" * 3_000_000)
+
+        await adapter.upload_file("bucket", "snapshots/w.tar.gz", str(source))
+        target = tmp_path / "restored.tar.gz"
+        await adapter.download_file("bucket", "snapshots/w.tar.gz", str(target))
+
+        assert target.read_bytes() == source.read_bytes()
+        with pytest.raises(FileNotFoundError):
+            await adapter.download_file("bucket", "missing", str(tmp_path / "m"))
+
+    async def test_ping_raises_when_bucket_is_missing(
+        self, adapter: AsyncS3Adapter
+    ) -> None:
+        await adapter.ping("bucket")
+
+        with pytest.raises(FileNotFoundError, match="Bucket not found"):
+            await adapter.ping("missing")
@@ -0,0 +1,154 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import httpx
+from fastapi import FastAPI
+from opentelemetry import trace
+
+from application.requests.indexing_request import IndexFileRequest
+from application.use_cases.enqueue_indexing_job_use_case import (
+    EnqueueIndexingJobUseCase,
+)
+from application.use_cases.index_file_use_case import IndexFileUseCase
+from application.use_cases.run_indexing_job_use_case import RunIndexingJobUseCase
+from config import TracingConfig
+from domain.entities.indexing_job import (
+    IndexingJob,
+    IndexingJobStatus,
+    IndexingJobType,
+)
+from domain.entities.indexing_result import FileIndexingResult, ModelCallKind
+from infrastructure.observability.tracing import TracingMiddleware, configure_tracing
+from infrastructure.rag.usage_tracking import tracking_call
+from worker import run_job
+
+TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+TRACEPARENT = f"00-{TRACE_ID}-b7ad6b7169203331-01"
+
+tracer = trace.get_tracer(__name__)
+
+
+def _spans(exporter) -> dict:
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+def _ancestors(exporter, span) -> set[int]:
+    by_id = {s.context.span_id: s for s in exporter.get_finished_spans()}
+    found = set()
+    while span.parent is not None:
+        found.add(span.parent.span_id)
+        span = by_id.get(span.parent.span_id)
+        if span is None:
+            break
+    return found
+
+
+class TestTracing:
+    def test_disabled_tracing_installs_nothing(self) -> None:
+        assert configure_tracing(TracingConfig(TRACING_ENABLED=False)) is None
+
+    async def test_request_span_is_parent_of_route_and_background_work(
+        self, span_exporter
+    ) -> None:
+        app = FastAPI()
+        app.add_middleware(TracingMiddleware)
+        background: list[asyncio.Task] = []
+
+        async def work() -> None:
+            with tracer.start_as_current_span("background work"):
+                await asyncio.sleep(0)
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: str) -> dict:
+            with tracer.start_as_current_span("route work"):
+                background.append(asyncio.create_task(work()))
+            return {"id": item_id}
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/items/42", headers={"traceparent": TRACEPARENT}
+            )
+        await asyncio.gather(*background)
+
+        assert response.status_code == 200
+        spans = _spans(span_exporter)
+        (server,) = (
+            span
+            for span in span_exporter.get_finished_spans()
+            if span.instrumentation_scope.name == "infrastructure.observability.tracing"
+        )
+        assert server.name == "GET /items/{item_id}"
+        assert format(server.context.trace_id, "032x") == TRACE_ID
+        assert server.attributes["http.route"] == "/items/{item_id}"
+        assert server.attributes["http.response.status_code"] == 200
+        for name in ("route work", "background work"):
+            assert spans[name].context.trace_id == server.context.trace_id
+            assert server.context.span_id in _ancestors(span_exporter, spans[name])
+
+    async def test_index_file_use_case_spans_its_steps(
+        self,
+        span_exporter,
+        mock_rag_engine: AsyncMock,
+        mock_storage: AsyncMock,
+        tmp_path: Path,
+    ) -> None:
+        use_case = IndexFileUseCase(
+            rag_engine=mock_rag_engine,
+            storage=mock_storage,
+            bucket="my-bucket",
+            output_dir=str(tmp_path),
+        )
+
+        await use_case.execute(file_name="docs/report.pdf", working_dir="project")
+
+        spans = _spans(span_exporter)
+        root = spans["IndexFileUseCase.execute"]
+        assert root.attributes["rag.working_dir"] == "project"
+        assert root.attributes["rag.file_name"] == "docs/report.pdf"
+        for step in ("download", "write", "index"):
+            assert spans[f"IndexFileUseCase.{step}"].parent.span_id == (
+                root.context.span_id
+            )
+
+    async def test_queued_job_continues_enqueuing_trace(
+        self,
+        span_exporter,
+        mock_job_queue: AsyncMock,
+        sample_file_indexing_result: FileIndexingResult,
+    ) -> None:
+        with tracer.start_as_current_span("POST /file/index") as request_span:
+            await EnqueueIndexingJobUseCase(mock_job_queue).execute(
+                IndexFileRequest(file_name="project/a.pdf", working_dir="project")
+            )
+        payload = mock_job_queue.enqueue.call_args.kwargs["payload"]
+        assert "traceparent" in payload["trace_context"]
+
+        job = IndexingJob(
+            id="job-1",
+            job_type=IndexingJobType.FILE,
+            working_dir="project",
+            payload=payload,
+            status=IndexingJobStatus.RUNNING,
+        )
+        run_use_case = AsyncMock(spec=RunIndexingJobUseCase)
+        run_use_case.execute.return_value = sample_file_indexing_result
+        await run_job(
+            mock_job_queue, run_use_case, job, worker_id="w1", heartbeat_interval=60
+        )
+
+        job_span = _spans(span_exporter)["indexing job file"]
+        assert job_span.parent.span_id == request_span.get_span_context().span_id
+        assert job_span.attributes["job.id"] == "job-1"
+
+    def test_model_call_span_carries_token_counts(self, span_exporter) -> None:
+        with tracking_call(ModelCallKind.EMBEDDING) as call:
+            call.add_usage({"prompt_tokens": 12})
+            call.cache_hits = 3
+
+        span = _spans(span_exporter)["embedding call"]
+        assert span.attributes["gen_ai.usage.input_tokens"] == 12
+        assert span.attributes["rag.cache_hits"] == 3
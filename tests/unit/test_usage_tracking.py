@@ -0,0 +1,66 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from domain.entities.indexing_result import ModelCallKind
+from infrastructure.rag.usage_tracking import (
+    job_context,
+    recording_usage,
+    tracking_call,
+)
+
+
+class TestUsageTracking:
+    def test_call_is_added_to_every_active_recorder(self) -> None:
+        with (
+            recording_usage("project") as folder,
+            recording_usage("project", "a.pdf") as file,
+            tracking_call(ModelCallKind.LLM) as call,
+        ):
+            call.add_usage({"prompt_tokens": 10, "completion_tokens": 3})
+
+        for recorder in (folder, file):
+            assert recorder.usage.llm.calls == 1
+            assert recorder.usage.llm.prompt_tokens == 10
+            assert recorder.usage.llm.completion_tokens == 3
+        assert file.usage.file_name == "a.pdf"
+
+    def test_call_outside_a_recorder_is_not_recorded(self) -> None:
+        with tracking_call(ModelCallKind.EMBEDDING) as call:
+            call.add_usage({"prompt_tokens": 5})
+
+        with recording_usage("project") as recorder:
+            pass
+        assert recorder.usage.embedding.calls == 0
+
+    def test_failed_call_is_still_counted(self) -> None:
+        with (
+            recording_usage("project") as recorder,
+            pytest.raises(RuntimeError),
+            tracking_call(ModelCallKind.VISION),
+        ):
+            raise RuntimeError("rate limited")
+
+        assert recorder.usage.vision.calls == 1
+        assert recorder.usage.vision.duration_ms >= 0
+
+    def test_usage_is_forwarded_to_caller_tracker(self) -> None:
+        forward = MagicMock()
+
+        with tracking_call(ModelCallKind.LLM, forward) as call:
+            call.add_usage({"prompt_tokens": 1})
+
+        forward.add_usage.assert_called_once_with({"prompt_tokens": 1})
+
+    async def test_tasks_inherit_recorder_and_job(self) -> None:
+        async def extract() -> None:
+            with tracking_call(ModelCallKind.LLM) as call:
+                call.add_usage({"prompt_tokens": 4})
+
+        with job_context("job-1"), recording_usage("project", "a.pdf") as recorder:
+            await asyncio.gather(extract(), asyncio.create_task(extract()))
+
+        assert recorder.usage.job_id == "job-1"
+        assert recorder.usage.llm.calls == 2
+        assert recorder.usage.llm.prompt_tokens == 8
@@ -0,0 +1,151 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from domain.entities.vector_index import VectorQuantization, VectorSearchSettings
+from infrastructure.rag import vector_search
+from infrastructure.rag.vector_search import query_vectors
+
+
+@pytest.fixture(autouse=True)
+def _forget_managed_indexes():
+    vector_search._managed_indexes.clear()
+
+
+class PGVectorStorage:
+    """Named like LightRAG's storage so query_vectors takes the pgvector path."""
+
+    def __init__(self, connection: AsyncMock) -> None:
+        self.namespace = "chunks"
+        self.table_name = "LIGHTRAG_VDB_CHUNKS"
+        self.workspace = "ws"
+        self.cosine_better_than_threshold = 0.2
+        self.embedding_func = AsyncMock(return_value=[[0.1, 0.2]])
+        self.query = AsyncMock()
+        self.db = MagicMock()
+        self.db.vector_index_type = "HNSW"
+
+        @asynccontextmanager
+        async def _acquire():
+            yield connection
+
+        self.db.pool.acquire = _acquire
+
+
+def _connection(rows: list[dict]) -> AsyncMock:
+    connection = AsyncMock()
+    connection.transaction = MagicMock(return_value=AsyncMock())
+    connection.fetch.return_value = rows
+    return connection
+
+
+class TestQueryVectors:
+    async def test_default_settings_use_storage_query(self) -> None:
+        vdb = MagicMock()
+        vdb.query = AsyncMock(return_value=[{"id": "a"}])
+
+        rows = await query_vectors(vdb, "q", 5, settings=VectorSearchSettings())
+
+        assert rows == [{"id": "a"}]
+        vdb.query.assert_awaited_once_with("q", top_k=5)
+
+    async def test_non_pgvector_storage_ignores_settings(self) -> None:
+        vdb = MagicMock()
+        vdb.query = AsyncMock(return_value=[])
+
+        await query_vectors(
+            vdb, "q", 5, query_embedding=[1.0], settings=VectorSearchSettings(probes=8)
+        )
+
+        vdb.query.assert_awaited_once_with("q", top_k=5, query_embedding=[1.0])
+
+    async def test_default_settings_without_managed_index_use_storage_query(
+        self,
+    ) -> None:
+        connection = _connection([])
+        connection.fetchval.return_value = False
+        vdb = PGVectorStorage(connection)
+
+        await query_vectors(vdb, "q", 5, settings=VectorSearchSettings())
+        await query_vectors(vdb, "q", 5)
+
+        assert vdb.query.await_count == 2
+        # The index lookup is cached between queries.
+        connection.fetchval.assert_awaited_once()
+        assert connection.fetchval.await_args.args[1:] == (
+            "lightrag_vdb_chunks",
+            "vidx_ws_",
+        )
+        connection.fetch.assert_not_awaited()
+
+    async def test_managed_index_forces_custom_plan_with_default_settings(
+        self,
+    ) -> None:
+        connection = _connection([{"id": "a", "distance": 0.9}])
+        connection.fetchval.return_value = True
+        vdb = PGVectorStorage(connection)
+
+        rows = await query_vectors(vdb, "q", 3, query_embedding=[0.1, 0.2])
+
+        assert rows == [{"id": "a", "distance": 0.9}]
+        vdb.query.assert_not_awaited()
+        connection.execute.assert_awaited_once_with(
+            "SET LOCAL plan_cache_mode = force_custom_plan"
+        )
+        assert connection.fetch.await_args.args[1:] == ("ws", 0.8, 3, [0.1, 0.2])
+
+    async def test_failed_index_lookup_falls_back_to_storage_query(self) -> None:
+        connection = _connection([])
+        connection.fetchval.side_effect = OSError("connection reset")
+        vdb = PGVectorStorage(connection)
+
+        await query_vectors(vdb, "q", 5)
+
+        vdb.query.assert_awaited_once_with("q", top_k=5)
+
+    async def test_pgvector_sets_knobs_locally_before_search(self) -> None:
+        connection = _connection([{"id": "a", "distance": 0.9}])
+        vdb = PGVectorStorage(connection)
+
+        rows = await query_vectors(
+            vdb, "q", 3, settings=VectorSearchSettings(ef_search=100, probes=10)
+        )
+
+        assert rows == [{"id": "a", "distance": 0.9}]
+        vdb.query.assert_not_awaited()
+        vdb.embedding_func.assert_awaited_once_with(["q"])
+        connection.execute.assert_awaited_once_with(
+            "SET LOCAL plan_cache_mode = force_custom_plan; "
+            "SET LOCAL hnsw.ef_search = 100; SET LOCAL ivfflat.probes = 10"
+        )
+        args = connection.fetch.await_args.args
+        assert "LIGHTRAG_VDB_CHUNKS" in args[0]
+        assert args[1:] == ("ws", 0.8, 3, [0.1, 0.2])
+
+    async def test_quantized_search_rescores_candidates(self) -> None:
+        connection = _connection([{"id": "a", "distance": 0.9}])
+        vdb = PGVectorStorage(connection)
+
+        await query_vectors(
+            vdb,
+            "q",
+            5,
+            query_embedding=[0.1, 0.2],
+            settings=VectorSearchSettings(
+                quantization=VectorQuantization.HALFVEC, rescore_factor=10
+            ),
+        )
+
+        connection.execute.assert_awaited_once_with(
+            "SET LOCAL plan_cache_mode = force_custom_plan; "
+            "SET LOCAL hnsw.ef_search = 50"
+        )
+        sql, *args = connection.fetch.await_args.args
+        assert sql.startswith(
+            "WITH candidates AS MATERIALIZED (SELECT * FROM LIGHTRAG_VDB_CHUNKS "
+            "WHERE workspace = $1 ORDER BY (content_vector)::halfvec(2) <=> "
+            "($4::vector)::halfvec(2) LIMIT $5)"
+        )
+        assert "FROM candidates" in sql
+        assert args == ["ws", 0.8, 5, [0.1, 0.2], 50]
@@ -0,0 +1,59 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from application.use_cases.run_indexing_job_use_case import RunIndexingJobUseCase
+from domain.entities.indexing_job import (
+    IndexingJob,
+    IndexingJobStatus,
+    IndexingJobType,
+)
+from domain.entities.indexing_result import FileIndexingResult, IndexingStatus
+from worker import run_job
+
+
+@pytest.fixture
+def job() -> IndexingJob:
+    return IndexingJob(
+        id="job-1",
+        job_type=IndexingJobType.FILE,
+        working_dir="project",
+        payload={"file_name": "project/a.pdf", "working_dir": "project"},
+        status=IndexingJobStatus.RUNNING,
+    )
+
+
+async def _run(queue: AsyncMock, job: IndexingJob, result: FileIndexingResult) -> None:
+    use_case = AsyncMock(spec=RunIndexingJobUseCase)
+    use_case.execute.return_value = result
+    await run_job(queue, use_case, job, worker_id="w1", heartbeat_interval=60)
+
+
+class TestRunJob:
+    async def test_successful_result_completes_the_job(
+        self,
+        mock_job_queue: AsyncMock,
+        job: IndexingJob,
+        sample_file_indexing_result: FileIndexingResult,
+    ) -> None:
+        await _run(mock_job_queue, job, sample_file_indexing_result)
+
+        job_id, worker_id, outcome = mock_job_queue.complete.await_args.args
+        assert (job_id, worker_id) == ("job-1", "w1")
+        assert outcome["status"] == "success"
+        mock_job_queue.fail.assert_not_awaited()
+
+    async def test_failed_result_fails_the_job(
+        self,
+        mock_job_queue: AsyncMock,
+        job: IndexingJob,
+        sample_file_indexing_result: FileIndexingResult,
+    ) -> None:
+        failed = sample_file_indexing_result.model_copy(
+            update={"status": IndexingStatus.FAILED, "message": "parser crashed"}
+        )
+
+        await _run(mock_job_queue, job, failed)
+
+        mock_job_queue.fail.assert_awaited_once_with("job-1", "w1", "parser crashed")
+        mock_job_queue.complete.assert_not_awaited()
@@ -0,0 +1,130 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from application.requests.snapshot_request import (
+    ExportSnapshotRequest,
+    ImportSnapshotRequest,
+)
+from application.use_cases.export_workspace_snapshot_use_case import (
+    ExportWorkspaceSnapshotUseCase,
+)
+from application.use_cases.import_workspace_snapshot_use_case import (
+    ImportWorkspaceSnapshotUseCase,
+)
+from domain.entities.workspace_snapshot import WorkspaceSnapshot
+
+
+def _snapshot(**kwargs) -> WorkspaceSnapshot:
+    return WorkspaceSnapshot(
+        format_version=1,
+        working_dir="src",
+        workspace="ws_src",
+        embedding_model=kwargs.pop("embedding_model", "text-embedding-3-small"),
+        embedding_dim=kwargs.pop("embedding_dim", 1536),
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def snapshotter() -> AsyncMock:
+    mock = AsyncMock()
+    mock.export_workspace.return_value = _snapshot()
+    mock.read_snapshot.return_value = _snapshot(embedding_dim=512)
+    mock.import_workspace.return_value = _snapshot(embedding_dim=512)
+    mock.has_data.return_value = False
+    return mock
+
+
+class TestExportWorkspaceSnapshotUseCase:
+    async def test_exports_and_uploads_under_workspace_prefix(
+        self,
+        snapshotter: AsyncMock,
+        mock_rag_engine: AsyncMock,
+        mock_storage: AsyncMock,
+    ) -> None:
+        use_case = ExportWorkspaceSnapshotUseCase(
+            snapshotter,
+            mock_rag_engine,
+            mock_storage,
+            "bucket",
+            "snapshots/",
+            embedding_model="text-embedding-3-small",
+        )
+        key = use_case.snapshot_key("/project/a")
+
+        snapshot = await use_case.execute(
+            ExportSnapshotRequest(working_dir="/project/a"), key
+        )
+
+        assert key.startswith("snapshots/project/a/") and key.endswith(".tar.gz")
+        assert snapshot == snapshotter.export_workspace.return_value
+        assert snapshotter.export_workspace.await_args.kwargs == {
+            "embedding_model": "text-embedding-3-small",
+            "embedding_dim": 1536,
+        }
+        bucket, uploaded_key, _ = mock_storage.upload_file.await_args.args
+        assert (bucket, uploaded_key) == ("bucket", key)
+
+
+class TestImportWorkspaceSnapshotUseCase:
+    def _use_case(
+        self, snapshotter: AsyncMock, rag: AsyncMock, storage: AsyncMock
+    ) -> ImportWorkspaceSnapshotUseCase:
+        return ImportWorkspaceSnapshotUseCase(
+            snapshotter,
+            rag,
+            storage,
+            "bucket",
+            embedding_model="text-embedding-3-small",
+        )
+
+    async def test_restores_at_snapshot_dimension(
+        self,
+        snapshotter: AsyncMock,
+        mock_rag_engine: AsyncMock,
+        mock_storage: AsyncMock,
+    ) -> None:
+        use_case = self._use_case(snapshotter, mock_rag_engine, mock_storage)
+
+        await use_case.execute(
+            ImportSnapshotRequest(
+                snapshot_key="snapshots/src/1.tar.gz", working_dir="dst"
+            )
+        )
+
+        mock_storage.download_file.assert_awaited_once()
+        mock_rag_engine.set_embedding_dim.assert_awaited_once_with("dst", 512)
+        assert snapshotter.import_workspace.await_args.args[1] == "dst"
+
+    async def test_refuses_non_empty_workspace(
+        self,
+        snapshotter: AsyncMock,
+        mock_rag_engine: AsyncMock,
+        mock_storage: AsyncMock,
+    ) -> None:
+        snapshotter.has_data.return_value = True
+        use_case = self._use_case(snapshotter, mock_rag_engine, mock_storage)
+
+        with pytest.raises(RuntimeError, match="already has data"):
+            await use_case.execute(
+                ImportSnapshotRequest(snapshot_key="k", working_dir="dst")
+            )
+        mock_storage.download_file.assert_not_awaited()
+
+    async def test_refuses_snapshot_from_other_model(
+        self,
+        snapshotter: AsyncMock,
+        mock_rag_engine: AsyncMock,
+        mock_storage: AsyncMock,
+    ) -> None:
+        snapshotter.read_snapshot.return_value = _snapshot(embedding_model="other")
+        use_case = self._use_case(snapshotter, mock_rag_engine, mock_storage)
+
+        with pytest.raises(ValueError, match="other"):
+            await use_case.execute(
+                ImportSnapshotRequest(snapshot_key="k", working_dir="dst")
+            )
+        snapshotter.import_workspace.assert_not_awaited()